@@ -31,6 +31,15 @@ Usage in Power BI:
 3. Select tables to import
 4. Click Load
 
+Usage from Python:
+------------------
+Importing a script generates nothing. Tables are built by build_tables() or
+on first access as a module attribute:
+
+    from POWER_BI import lcr_capital_return_powerbi as lcr
+    tables = lcr.build_tables(['LCR_010_SCR_Summary'])
+    coverage = lcr.LCR_100_Coverage_Ratios
+
 Note: Scripts are self-contained and require only pandas, numpy, datetime, random.
 """
 
@@ -25,9 +25,8 @@ import numpy as np
 from datetime import datetime, timedelta
 import random
 
-# Set random seed for reproducibility
-np.random.seed(42)
-random.seed(42)
+# Seed for reproducibility (build_tables reseeds every table from it)
+SEED = 42
 
 # Configuration
 SYNDICATES = [2987, 33, 1183, 2791, 623, 4242, 5000, 1910, 2010, 2525]
@@ -330,30 +329,93 @@ def generate_aad238_securities_lending():
 
     return pd.DataFrame(data)
 
-
 # =============================================================================
 # GENERATE ALL TABLES FOR POWER BI
 # =============================================================================
-print("Generating AAD Reports Data for Power BI...")
-print("=" * 60)
-
-# Generate AAD tables (these will be available in Power BI)
-AAD230_Open_Market_Value = generate_aad230_open_market_value()
-AAD230_Summary_By_Category = generate_aad230_summary_by_category(AAD230_Open_Market_Value)
-AAD233_Off_Balance_Sheet = generate_aad233_off_balance_sheet()
-AAD235_Derivatives = generate_aad235_derivatives()
-AAD235_Derivatives_Summary = generate_aad235_derivatives_summary(AAD235_Derivatives)
-AAD236_Collective_Investments = generate_aad236_collective_investments()
-AAD237_Structured_Products = generate_aad237_structured_products()
-AAD238_Securities_Lending = generate_aad238_securities_lending()
-
-print(f"AAD230_Open_Market_Value: {len(AAD230_Open_Market_Value)} records")
-print(f"AAD230_Summary_By_Category: {len(AAD230_Summary_By_Category)} records")
-print(f"AAD233_Off_Balance_Sheet: {len(AAD233_Off_Balance_Sheet)} records")
-print(f"AAD235_Derivatives: {len(AAD235_Derivatives)} records")
-print(f"AAD235_Derivatives_Summary: {len(AAD235_Derivatives_Summary)} records")
-print(f"AAD236_Collective_Investments: {len(AAD236_Collective_Investments)} records")
-print(f"AAD237_Structured_Products: {len(AAD237_Structured_Products)} records")
-print(f"AAD238_Securities_Lending: {len(AAD238_Securities_Lending)} records")
-print("=" * 60)
-print("AAD Reports data generated successfully!")
+# Nothing is generated on import. build_tables() generates a selection of
+# tables, a table accessed as a module attribute is built on first access,
+# and running the script (as Power BI does) generates every table.
+
+# Table name -> (generator, tables passed to it as arguments)
+TABLES = {
+    'AAD230_Open_Market_Value': (generate_aad230_open_market_value, []),
+    'AAD230_Summary_By_Category': (generate_aad230_summary_by_category, ['AAD230_Open_Market_Value']),
+    'AAD233_Off_Balance_Sheet': (generate_aad233_off_balance_sheet, []),
+    'AAD235_Derivatives': (generate_aad235_derivatives, []),
+    'AAD235_Derivatives_Summary': (generate_aad235_derivatives_summary, ['AAD235_Derivatives']),
+    'AAD236_Collective_Investments': (generate_aad236_collective_investments, []),
+    'AAD237_Structured_Products': (generate_aad237_structured_products, []),
+    'AAD238_Securities_Lending': (generate_aad238_securities_lending, []),
+}
+
+
+def table_seed(name):
+    """Seed of one table, derived from SEED and the table name"""
+    return int(np.random.SeedSequence([SEED, int.from_bytes(name.encode(), 'little')]).generate_state(1)[0])
+
+
+def build_tables(selected=None):
+    """
+    Generate Power BI tables.
+
+    The random generators are reseeded with table_seed before each table, so a
+    table has the same values whichever other tables are built with it.
+
+    Args:
+        selected: Table name or list of names (None: every table)
+
+    Returns:
+        Dictionary of table name to DataFrame for the selected tables, in
+        TABLES order (tables they are built from are generated, not returned)
+
+    Raises:
+        KeyError: If a table name is unknown
+    """
+    if selected is None:
+        selected = list(TABLES)
+    elif isinstance(selected, str):
+        selected = [selected]
+    unknown = [name for name in selected if name not in TABLES]
+    if unknown:
+        raise KeyError(f"Unknown table(s): {unknown}")
+
+    # Inputs come before the tables built from them
+    needed = set(selected)
+    for name in reversed(TABLES):
+        if name in needed:
+            needed.update(TABLES[name][1])
+
+    tables = {}
+    for name, (generator, inputs) in TABLES.items():
+        if name in needed:
+            np.random.seed(table_seed(name))
+            random.seed(table_seed(name))
+            tables[name] = generator(*(tables[table] for table in inputs))
+    return {name: table for name, table in tables.items() if name in selected}
+
+
+def __getattr__(name):
+    """Build a table the first time it is accessed as a module attribute"""
+    if name not in TABLES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = table = build_tables(name)[name]
+    return table
+
+
+if __name__ == '__main__':
+    # Power BI runs the pasted script and loads its top-level DataFrames
+    tables = build_tables()
+    globals().update(tables)
+
+    print("Generating AAD Reports Data for Power BI...")
+    print("=" * 60)
+    print(f"AAD230_Open_Market_Value: {len(tables['AAD230_Open_Market_Value'])} records")
+    print(f"AAD230_Summary_By_Category: {len(tables['AAD230_Summary_By_Category'])} records")
+    print(f"AAD233_Off_Balance_Sheet: {len(tables['AAD233_Off_Balance_Sheet'])} records")
+    print(f"AAD235_Derivatives: {len(tables['AAD235_Derivatives'])} records")
+    print(f"AAD235_Derivatives_Summary: {len(tables['AAD235_Derivatives_Summary'])} records")
+    print(f"AAD236_Collective_Investments: {len(tables['AAD236_Collective_Investments'])} records")
+    print(f"AAD237_Structured_Products: {len(tables['AAD237_Structured_Products'])} records")
+    print(f"AAD238_Securities_Lending: {len(tables['AAD238_Securities_Lending'])} records")
+    print("=" * 60)
+    print("AAD Reports data generated successfully!")
@@ -27,8 +27,8 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
-# Set seed for reproducibility
-np.random.seed(42)
+# Seed for reproducibility (build_tables reseeds every table from it)
+SEED = 42
 
 # Configuration
 SYNDICATES = [33, 623, 1183, 1910, 2010, 2525, 2791, 2987, 4242, 5000]
@@ -649,46 +649,105 @@ def generate_asr_110_qrt_s23():
 # =============================================================================
 # Generate all tables
 # =============================================================================
-
-# Control and metadata
-ASR_001_Control = generate_asr_001_control()
-
-# Balance sheet and assets
-ASR_010_Balance_Sheet = generate_asr_010_balance_sheet()
-ASR_020_Assets_Detail = generate_asr_020_assets_detail()
-
-# Technical provisions
-ASR_030_Technical_Provisions = generate_asr_030_technical_provisions()
-
-# Capital
-ASR_040_SCR_Summary = generate_asr_040_scr_summary()
-ASR_050_Own_Funds = generate_asr_050_own_funds()
-
-# Reconciliation and analysis
-ASR_060_Reconciliation = generate_asr_060_reconciliation_reserves()
-ASR_070_Variation = generate_asr_070_variation_analysis()
-ASR_080_Risk_Margin = generate_asr_080_risk_margin()
-
-# QRT templates
-ASR_090_QRT_S02 = generate_asr_090_qrt_s02()
-ASR_100_QRT_S05 = generate_asr_100_qrt_s05()
-ASR_110_QRT_S23 = generate_asr_110_qrt_s23()
-
-# Summary statistics
-print("=" * 70)
-print("ASR - Annual Solvency Return Data Generator")
-print("=" * 70)
-print(f"ASR_001_Control: {len(ASR_001_Control)} rows")
-print(f"ASR_010_Balance_Sheet: {len(ASR_010_Balance_Sheet)} rows")
-print(f"ASR_020_Assets_Detail: {len(ASR_020_Assets_Detail)} rows")
-print(f"ASR_030_Technical_Provisions: {len(ASR_030_Technical_Provisions)} rows")
-print(f"ASR_040_SCR_Summary: {len(ASR_040_SCR_Summary)} rows")
-print(f"ASR_050_Own_Funds: {len(ASR_050_Own_Funds)} rows")
-print(f"ASR_060_Reconciliation: {len(ASR_060_Reconciliation)} rows")
-print(f"ASR_070_Variation: {len(ASR_070_Variation)} rows")
-print(f"ASR_080_Risk_Margin: {len(ASR_080_Risk_Margin)} rows")
-print(f"ASR_090_QRT_S02: {len(ASR_090_QRT_S02)} rows")
-print(f"ASR_100_QRT_S05: {len(ASR_100_QRT_S05)} rows")
-print(f"ASR_110_QRT_S23: {len(ASR_110_QRT_S23)} rows")
-print("=" * 70)
-print("ASR data generated successfully!")
+# Nothing is generated on import. build_tables() generates a selection of
+# tables, a table accessed as a module attribute is built on first access,
+# and running the script (as Power BI does) generates every table.
+
+# Table name -> (generator, tables passed to it as arguments)
+TABLES = {
+    # Control and metadata
+    'ASR_001_Control': (generate_asr_001_control, []),
+    # Balance sheet and assets
+    'ASR_010_Balance_Sheet': (generate_asr_010_balance_sheet, []),
+    'ASR_020_Assets_Detail': (generate_asr_020_assets_detail, []),
+    # Technical provisions
+    'ASR_030_Technical_Provisions': (generate_asr_030_technical_provisions, []),
+    # Capital
+    'ASR_040_SCR_Summary': (generate_asr_040_scr_summary, []),
+    'ASR_050_Own_Funds': (generate_asr_050_own_funds, []),
+    # Reconciliation and analysis
+    'ASR_060_Reconciliation': (generate_asr_060_reconciliation_reserves, []),
+    'ASR_070_Variation': (generate_asr_070_variation_analysis, []),
+    'ASR_080_Risk_Margin': (generate_asr_080_risk_margin, []),
+    # QRT templates
+    'ASR_090_QRT_S02': (generate_asr_090_qrt_s02, []),
+    'ASR_100_QRT_S05': (generate_asr_100_qrt_s05, []),
+    'ASR_110_QRT_S23': (generate_asr_110_qrt_s23, []),
+}
+
+
+def table_seed(name):
+    """Seed of one table, derived from SEED and the table name"""
+    return int(np.random.SeedSequence([SEED, int.from_bytes(name.encode(), 'little')]).generate_state(1)[0])
+
+
+def build_tables(selected=None):
+    """
+    Generate Power BI tables.
+
+    The random generators are reseeded with table_seed before each table, so a
+    table has the same values whichever other tables are built with it.
+
+    Args:
+        selected: Table name or list of names (None: every table)
+
+    Returns:
+        Dictionary of table name to DataFrame for the selected tables, in
+        TABLES order (tables they are built from are generated, not returned)
+
+    Raises:
+        KeyError: If a table name is unknown
+    """
+    if selected is None:
+        selected = list(TABLES)
+    elif isinstance(selected, str):
+        selected = [selected]
+    unknown = [name for name in selected if name not in TABLES]
+    if unknown:
+        raise KeyError(f"Unknown table(s): {unknown}")
+
+    # Inputs come before the tables built from them
+    needed = set(selected)
+    for name in reversed(TABLES):
+        if name in needed:
+            needed.update(TABLES[name][1])
+
+    tables = {}
+    for name, (generator, inputs) in TABLES.items():
+        if name in needed:
+            np.random.seed(table_seed(name))
+            tables[name] = generator(*(tables[table] for table in inputs))
+    return {name: table for name, table in tables.items() if name in selected}
+
+
+def __getattr__(name):
+    """Build a table the first time it is accessed as a module attribute"""
+    if name not in TABLES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = table = build_tables(name)[name]
+    return table
+
+
+if __name__ == '__main__':
+    # Power BI runs the pasted script and loads its top-level DataFrames
+    tables = build_tables()
+    globals().update(tables)
+
+    # Summary statistics
+    print("=" * 70)
+    print("ASR - Annual Solvency Return Data Generator")
+    print("=" * 70)
+    print(f"ASR_001_Control: {len(tables['ASR_001_Control'])} rows")
+    print(f"ASR_010_Balance_Sheet: {len(tables['ASR_010_Balance_Sheet'])} rows")
+    print(f"ASR_020_Assets_Detail: {len(tables['ASR_020_Assets_Detail'])} rows")
+    print(f"ASR_030_Technical_Provisions: {len(tables['ASR_030_Technical_Provisions'])} rows")
+    print(f"ASR_040_SCR_Summary: {len(tables['ASR_040_SCR_Summary'])} rows")
+    print(f"ASR_050_Own_Funds: {len(tables['ASR_050_Own_Funds'])} rows")
+    print(f"ASR_060_Reconciliation: {len(tables['ASR_060_Reconciliation'])} rows")
+    print(f"ASR_070_Variation: {len(tables['ASR_070_Variation'])} rows")
+    print(f"ASR_080_Risk_Margin: {len(tables['ASR_080_Risk_Margin'])} rows")
+    print(f"ASR_090_QRT_S02: {len(tables['ASR_090_QRT_S02'])} rows")
+    print(f"ASR_100_QRT_S05: {len(tables['ASR_100_QRT_S05'])} rows")
+    print(f"ASR_110_QRT_S23: {len(tables['ASR_110_QRT_S23'])} rows")
+    print("=" * 70)
+    print("ASR data generated successfully!")
@@ -26,9 +26,8 @@ from datetime import datetime, timedelta
 import random
 import string
 
-# Set seed for reproducibility
-np.random.seed(42)
-random.seed(42)
+# Seed for reproducibility (build_tables reseeds every table from it)
+SEED = 42
 
 # Configuration
 SYNDICATES = [33, 623, 1183, 1910, 2010, 2525, 2791, 2987, 4242, 5000]
@@ -448,19 +447,83 @@ def generate_contract_performance():
 # =============================================================================
 # Generate all tables
 # =============================================================================
-
-# Main bordereaux
-Premium_Bordereaux = generate_premium_bordereaux()
-Claims_Bordereaux = generate_claims_bordereaux()
-Risk_Bordereaux = generate_risk_bordereaux()
-
-# Summary tables
-Coverholder_Summary = generate_coverholder_summary()
-Contract_Performance = generate_contract_performance()
-
-# Summary statistics
-print(f"Premium_Bordereaux: {len(Premium_Bordereaux)} rows")
-print(f"Claims_Bordereaux: {len(Claims_Bordereaux)} rows")
-print(f"Risk_Bordereaux: {len(Risk_Bordereaux)} rows")
-print(f"Coverholder_Summary: {len(Coverholder_Summary)} rows")
-print(f"Contract_Performance: {len(Contract_Performance)} rows")
+# Nothing is generated on import. build_tables() generates a selection of
+# tables, a table accessed as a module attribute is built on first access,
+# and running the script (as Power BI does) generates every table.
+
+# Table name -> (generator, tables passed to it as arguments)
+TABLES = {
+    # Main bordereaux
+    'Premium_Bordereaux': (generate_premium_bordereaux, []),
+    'Claims_Bordereaux': (generate_claims_bordereaux, []),
+    'Risk_Bordereaux': (generate_risk_bordereaux, []),
+    # Summary tables
+    'Coverholder_Summary': (generate_coverholder_summary, []),
+    'Contract_Performance': (generate_contract_performance, []),
+}
+
+
+def table_seed(name):
+    """Seed of one table, derived from SEED and the table name"""
+    return int(np.random.SeedSequence([SEED, int.from_bytes(name.encode(), 'little')]).generate_state(1)[0])
+
+
+def build_tables(selected=None):
+    """
+    Generate Power BI tables.
+
+    The random generators are reseeded with table_seed before each table, so a
+    table has the same values whichever other tables are built with it.
+
+    Args:
+        selected: Table name or list of names (None: every table)
+
+    Returns:
+        Dictionary of table name to DataFrame for the selected tables, in
+        TABLES order (tables they are built from are generated, not returned)
+
+    Raises:
+        KeyError: If a table name is unknown
+    """
+    if selected is None:
+        selected = list(TABLES)
+    elif isinstance(selected, str):
+        selected = [selected]
+    unknown = [name for name in selected if name not in TABLES]
+    if unknown:
+        raise KeyError(f"Unknown table(s): {unknown}")
+
+    # Inputs come before the tables built from them
+    needed = set(selected)
+    for name in reversed(TABLES):
+        if name in needed:
+            needed.update(TABLES[name][1])
+
+    tables = {}
+    for name, (generator, inputs) in TABLES.items():
+        if name in needed:
+            np.random.seed(table_seed(name))
+            random.seed(table_seed(name))
+            tables[name] = generator(*(tables[table] for table in inputs))
+    return {name: table for name, table in tables.items() if name in selected}
+
+
+def __getattr__(name):
+    """Build a table the first time it is accessed as a module attribute"""
+    if name not in TABLES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = table = build_tables(name)[name]
+    return table
+
+
+if __name__ == '__main__':
+    # Power BI runs the pasted script and loads its top-level DataFrames
+    tables = build_tables()
+    globals().update(tables)
+
+    # Summary statistics
+    print(f"Premium_Bordereaux: {len(tables['Premium_Bordereaux'])} rows")
+    print(f"Claims_Bordereaux: {len(tables['Claims_Bordereaux'])} rows")
+    print(f"Risk_Bordereaux: {len(tables['Risk_Bordereaux'])} rows")
+    print(f"Coverholder_Summary: {len(tables['Coverholder_Summary'])} rows")
+    print(f"Contract_Performance: {len(tables['Contract_Performance'])} rows")
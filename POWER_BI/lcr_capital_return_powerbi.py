@@ -19,8 +19,8 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
-# Set seed for reproducibility
-np.random.seed(42)
+# Seed for reproducibility (build_tables reseeds every table from it)
+SEED = 42
 
 # Configuration
 SYNDICATES = [33, 623, 1183, 1910, 2010, 2525, 2791, 2987, 4242, 5000]
@@ -67,6 +67,38 @@ MARKET_RISK_TYPES = [
     ('CONC', 'Concentration Risk')
 ]
 
+# SCR risk modules and their base correlations (typical values)
+LCR_RISK_MODULES = ['Premium', 'Reserve', 'Cat', 'Market', 'Credit', 'Operational']
+LCR_BASE_CORRELATIONS = {
+    ('Premium', 'Reserve'): 0.50,
+    ('Premium', 'Cat'): 0.25,
+    ('Premium', 'Market'): 0.25,
+    ('Premium', 'Credit'): 0.50,
+    ('Premium', 'Operational'): 0.00,
+    ('Reserve', 'Cat'): 0.25,
+    ('Reserve', 'Market'): 0.25,
+    ('Reserve', 'Credit'): 0.50,
+    ('Reserve', 'Operational'): 0.00,
+    ('Cat', 'Market'): 0.25,
+    ('Cat', 'Credit'): 0.25,
+    ('Cat', 'Operational'): 0.00,
+    ('Market', 'Credit'): 0.25,
+    ('Market', 'Operational'): 0.00,
+    ('Credit', 'Operational'): 0.00
+}
+
+# =============================================================================
+# SCR aggregation - sqrt(v.C.v) with the module correlations
+# =============================================================================
+def lcr_base_matrix(default=0.25):
+    """LCR_BASE_CORRELATIONS as a matrix in LCR_RISK_MODULES order (unlisted pairs: default)"""
+    index = {name: i for i, name in enumerate(LCR_RISK_MODULES)}
+    matrix = np.full((len(LCR_RISK_MODULES), len(LCR_RISK_MODULES)), float(default))
+    for (first, second), value in LCR_BASE_CORRELATIONS.items():
+        matrix[index[first], index[second]] = matrix[index[second], index[first]] = value
+    np.fill_diagonal(matrix, 1.0)
+    return matrix
+
 # =============================================================================
 # LCR_001_Control - Submission metadata and control
 # =============================================================================
@@ -90,54 +122,83 @@ def generate_lcr_001_control():
     return pd.DataFrame(records)
 
 # =============================================================================
-# LCR_010_SCR_Summary - Overall SCR calculation
+# SCR correlation matrices - one per syndicate, shared by LCR_010 and LCR_120
 # =============================================================================
-def generate_lcr_010_scr_summary():
-    records = []
-    for syn in SYNDICATES:
-        # Base SCR components (GBP millions)
-        premium_risk = np.random.uniform(30, 80)
-        reserve_risk = np.random.uniform(40, 100)
-        cat_risk = np.random.uniform(50, 150)
-        market_risk = np.random.uniform(20, 60)
-        credit_risk = np.random.uniform(10, 40)
-        operational_risk = np.random.uniform(5, 25)
+def generate_lcr_correlations(seed=None):
+    """
+    Correlation matrices of LCR_RISK_MODULES for every syndicate.
+
+    About 30% of the off-diagonal pairs are LIM calibrated: the base
+    correlation is scaled by 0.9-1.1. The rest keep the standard value.
+    The draws come from a generator of their own (seed default: SEED), so
+    LCR_010 and LCR_120 see the same matrices whether built together or not.
+
+    Returns (matrices, calibrated): arrays of shape syndicates x modules x
+    modules, with the correlations (to 3 dp) and the LIM calibrated flags.
+    """
+    n, k = len(SYNDICATES), len(LCR_RISK_MODULES)
+    base = lcr_base_matrix()
+    rows, cols = np.triu_indices(k, 1)
+
+    rng = np.random.default_rng(SEED if seed is None else seed)
+    lim = rng.random((n, len(rows))) >= 0.7
+    scaling = np.where(lim, rng.uniform(0.9, 1.1, (n, len(rows))), 1.0)
+
+    matrices = np.repeat(base[np.newaxis], n, axis=0)
+    matrices[:, rows, cols] = np.round(np.clip(base[rows, cols] * scaling, 0, 1), 3)
+    matrices[:, cols, rows] = matrices[:, rows, cols]
+
+    calibrated = np.zeros((n, k, k), dtype=bool)
+    calibrated[:, rows, cols] = calibrated[:, cols, rows] = lim
+    return matrices, calibrated
 
-        # Pre-diversification SCR
-        pre_div_scr = premium_risk + reserve_risk + cat_risk + market_risk + credit_risk + operational_risk
-
-        # Diversification benefit (typically 20-35%)
-        div_benefit_pct = np.random.uniform(0.20, 0.35)
-        div_benefit = pre_div_scr * div_benefit_pct
-
-        # Post-diversification SCR
-        post_div_scr = pre_div_scr - div_benefit
-
-        # Loss absorbing capacity of deferred taxes
-        lac_dt = post_div_scr * np.random.uniform(0.02, 0.08)
-
-        # Final SCR
-        final_scr = post_div_scr - lac_dt
-
-        records.append({
-            'Syndicate': syn,
-            'ReportingYear': REPORTING_YEAR,
-            'PremiumRisk_GBP_M': round(premium_risk, 2),
-            'ReserveRisk_GBP_M': round(reserve_risk, 2),
-            'CatRisk_GBP_M': round(cat_risk, 2),
-            'MarketRisk_GBP_M': round(market_risk, 2),
-            'CreditRisk_GBP_M': round(credit_risk, 2),
-            'OperationalRisk_GBP_M': round(operational_risk, 2),
-            'PreDiversification_SCR_GBP_M': round(pre_div_scr, 2),
-            'DiversificationBenefit_GBP_M': round(div_benefit, 2),
-            'DiversificationBenefit_Pct': round(div_benefit_pct * 100, 1),
-            'PostDiversification_SCR_GBP_M': round(post_div_scr, 2),
-            'LAC_DT_GBP_M': round(lac_dt, 2),
-            'Final_SCR_GBP_M': round(final_scr, 2),
-            'MCR_GBP_M': round(final_scr * np.random.uniform(0.25, 0.35), 2),
-            'Currency': 'GBP'
-        })
-    return pd.DataFrame(records)
+# =============================================================================
+# LCR_010_SCR_Summary - Overall SCR calculation
+# =============================================================================
+def generate_lcr_010_scr_summary(correlations=None):
+    """SCR summary, with the modules of all syndicates aggregated in one matrix operation"""
+    matrices, _ = correlations if correlations is not None else generate_lcr_correlations()
+    n = len(SYNDICATES)
+
+    # Base SCR components (GBP millions), in LCR_RISK_MODULES order
+    modules = np.column_stack([
+        np.random.uniform(30, 80, n),    # Premium
+        np.random.uniform(40, 100, n),   # Reserve
+        np.random.uniform(50, 150, n),   # Cat
+        np.random.uniform(20, 60, n),    # Market
+        np.random.uniform(10, 40, n),    # Credit
+        np.random.uniform(5, 25, n),     # Operational
+    ])
+
+    # Pre- and post-diversification SCR: sum and sqrt(v.C.v) per syndicate
+    pre_div_scr = modules.sum(axis=1)
+    post_div_scr = np.sqrt(np.einsum('si,sij,sj->s', modules, matrices, modules))
+    div_benefit = pre_div_scr - post_div_scr
+
+    # Loss absorbing capacity of deferred taxes
+    lac_dt = post_div_scr * np.random.uniform(0.02, 0.08, n)
+
+    # Final SCR
+    final_scr = post_div_scr - lac_dt
+
+    return pd.DataFrame({
+        'Syndicate': SYNDICATES,
+        'ReportingYear': REPORTING_YEAR,
+        'PremiumRisk_GBP_M': np.round(modules[:, 0], 2),
+        'ReserveRisk_GBP_M': np.round(modules[:, 1], 2),
+        'CatRisk_GBP_M': np.round(modules[:, 2], 2),
+        'MarketRisk_GBP_M': np.round(modules[:, 3], 2),
+        'CreditRisk_GBP_M': np.round(modules[:, 4], 2),
+        'OperationalRisk_GBP_M': np.round(modules[:, 5], 2),
+        'PreDiversification_SCR_GBP_M': np.round(pre_div_scr, 2),
+        'DiversificationBenefit_GBP_M': np.round(div_benefit, 2),
+        'DiversificationBenefit_Pct': np.round(div_benefit / pre_div_scr * 100, 1),
+        'PostDiversification_SCR_GBP_M': np.round(post_div_scr, 2),
+        'LAC_DT_GBP_M': np.round(lac_dt, 2),
+        'Final_SCR_GBP_M': np.round(final_scr, 2),
+        'MCR_GBP_M': np.round(final_scr * np.random.uniform(0.25, 0.35, n), 2),
+        'Currency': 'GBP'
+    })
 
 # =============================================================================
 # LCR_020_Premium_Risk - Premium risk by line of business
@@ -302,7 +363,7 @@ def generate_lcr_060_credit_risk():
             weight = base_weight * np.random.uniform(0.8, 1.2)
             exposure = np.random.uniform(20, 150)
             lgd = np.random.uniform(0.4, 0.6)  # Loss Given Default
-            pd = np.random.uniform(0.001, 0.05)  # Probability of Default
+            prob_default = np.random.uniform(0.001, 0.05)  # Probability of Default
             risk_charge = total_credit_risk * weight
 
             records.append({
@@ -313,7 +374,7 @@ def generate_lcr_060_credit_risk():
                 'Exposure_GBP_M': round(exposure, 2),
                 'AvgCreditRating': np.random.choice(['AAA', 'AA', 'A', 'BBB', 'BB']),
                 'LGD_Pct': round(lgd * 100, 1),
-                'PD_Pct': round(pd * 100, 3),
+                'PD_Pct': round(prob_default * 100, 3),
                 'RiskCharge_GBP_M': round(risk_charge, 2),
                 'Collateral_GBP_M': round(exposure * np.random.uniform(0.1, 0.4), 2),
                 'Currency': 'GBP'
@@ -527,92 +588,124 @@ def generate_lcr_110_yoa_capital():
 # =============================================================================
 # LCR_120_Diversification - Risk diversification matrix
 # =============================================================================
-def generate_lcr_120_diversification():
+def generate_lcr_120_diversification(correlations=None):
+    """Upper triangle (diagonal included) of each syndicate's correlation matrix used in LCR_010"""
+    matrices, calibrated = correlations if correlations is not None else generate_lcr_correlations()
     records = []
-    risk_modules = ['Premium', 'Reserve', 'Cat', 'Market', 'Credit', 'Operational']
-
-    # Correlation matrix (typical values)
-    base_correlations = {
-        ('Premium', 'Reserve'): 0.50,
-        ('Premium', 'Cat'): 0.25,
-        ('Premium', 'Market'): 0.25,
-        ('Premium', 'Credit'): 0.50,
-        ('Premium', 'Operational'): 0.00,
-        ('Reserve', 'Cat'): 0.25,
-        ('Reserve', 'Market'): 0.25,
-        ('Reserve', 'Credit'): 0.50,
-        ('Reserve', 'Operational'): 0.00,
-        ('Cat', 'Market'): 0.25,
-        ('Cat', 'Credit'): 0.25,
-        ('Cat', 'Operational'): 0.00,
-        ('Market', 'Credit'): 0.25,
-        ('Market', 'Operational'): 0.00,
-        ('Credit', 'Operational'): 0.00
-    }
+    rows, cols = np.triu_indices(len(LCR_RISK_MODULES))
 
-    for syn in SYNDICATES:
-        for i, risk1 in enumerate(risk_modules):
-            for j, risk2 in enumerate(risk_modules):
-                if i <= j:  # Upper triangle including diagonal
-                    if risk1 == risk2:
-                        correlation = 1.0
-                    else:
-                        key = (risk1, risk2) if (risk1, risk2) in base_correlations else (risk2, risk1)
-                        correlation = base_correlations.get(key, 0.25)
-                        # Add some random variation
-                        correlation = correlation * np.random.uniform(0.9, 1.1)
-                        correlation = min(max(correlation, 0), 1)
-
-                    records.append({
-                        'Syndicate': syn,
-                        'ReportingYear': REPORTING_YEAR,
-                        'RiskModule_1': risk1,
-                        'RiskModule_2': risk2,
-                        'Correlation': round(correlation, 3),
-                        'CorrelationType': 'EIOPA_Standard' if np.random.random() < 0.7 else 'LIM_Calibrated'
-                    })
+    for s, syn in enumerate(SYNDICATES):
+        for i, j in zip(rows, cols):
+            records.append({
+                'Syndicate': syn,
+                'ReportingYear': REPORTING_YEAR,
+                'RiskModule_1': LCR_RISK_MODULES[i],
+                'RiskModule_2': LCR_RISK_MODULES[j],
+                'Correlation': round(float(matrices[s, i, j]), 3),
+                'CorrelationType': 'LIM_Calibrated' if calibrated[s, i, j] else 'EIOPA_Standard'
+            })
     return pd.DataFrame(records)
 
 # =============================================================================
 # Generate all tables
 # =============================================================================
-
-# Control and metadata
-LCR_001_Control = generate_lcr_001_control()
-
-# SCR calculation
-LCR_010_SCR_Summary = generate_lcr_010_scr_summary()
-
-# Risk modules
-LCR_020_Premium_Risk = generate_lcr_020_premium_risk()
-LCR_030_Reserve_Risk = generate_lcr_030_reserve_risk()
-LCR_040_Cat_Risk_Summary = generate_lcr_040_cat_risk_summary()
-LCR_041_Cat_By_Peril = generate_lcr_041_cat_by_peril()
-LCR_050_Market_Risk = generate_lcr_050_market_risk()
-LCR_060_Credit_Risk = generate_lcr_060_credit_risk()
-LCR_070_Operational_Risk = generate_lcr_070_operational_risk()
-
-# Technical provisions and own funds
-LCR_080_Technical_Provisions = generate_lcr_080_technical_provisions()
-LCR_090_Own_Funds = generate_lcr_090_own_funds()
-
-# Coverage and analysis
-LCR_100_Coverage_Ratios = generate_lcr_100_coverage_ratios()
-LCR_110_YOA_Capital = generate_lcr_110_yoa_capital()
-LCR_120_Diversification = generate_lcr_120_diversification()
-
-# Summary statistics
-print(f"LCR_001_Control: {len(LCR_001_Control)} rows")
-print(f"LCR_010_SCR_Summary: {len(LCR_010_SCR_Summary)} rows")
-print(f"LCR_020_Premium_Risk: {len(LCR_020_Premium_Risk)} rows")
-print(f"LCR_030_Reserve_Risk: {len(LCR_030_Reserve_Risk)} rows")
-print(f"LCR_040_Cat_Risk_Summary: {len(LCR_040_Cat_Risk_Summary)} rows")
-print(f"LCR_041_Cat_By_Peril: {len(LCR_041_Cat_By_Peril)} rows")
-print(f"LCR_050_Market_Risk: {len(LCR_050_Market_Risk)} rows")
-print(f"LCR_060_Credit_Risk: {len(LCR_060_Credit_Risk)} rows")
-print(f"LCR_070_Operational_Risk: {len(LCR_070_Operational_Risk)} rows")
-print(f"LCR_080_Technical_Provisions: {len(LCR_080_Technical_Provisions)} rows")
-print(f"LCR_090_Own_Funds: {len(LCR_090_Own_Funds)} rows")
-print(f"LCR_100_Coverage_Ratios: {len(LCR_100_Coverage_Ratios)} rows")
-print(f"LCR_110_YOA_Capital: {len(LCR_110_YOA_Capital)} rows")
-print(f"LCR_120_Diversification: {len(LCR_120_Diversification)} rows")
+# Nothing is generated on import. build_tables() generates a selection of
+# tables, a table accessed as a module attribute is built on first access,
+# and running the script (as Power BI does) generates every table.
+
+# Table name -> (generator, tables passed to it as arguments)
+TABLES = {
+    # Control and metadata
+    'LCR_001_Control': (generate_lcr_001_control, []),
+    # SCR calculation
+    'LCR_010_SCR_Summary': (generate_lcr_010_scr_summary, []),
+    # Risk modules
+    'LCR_020_Premium_Risk': (generate_lcr_020_premium_risk, []),
+    'LCR_030_Reserve_Risk': (generate_lcr_030_reserve_risk, []),
+    'LCR_040_Cat_Risk_Summary': (generate_lcr_040_cat_risk_summary, []),
+    'LCR_041_Cat_By_Peril': (generate_lcr_041_cat_by_peril, []),
+    'LCR_050_Market_Risk': (generate_lcr_050_market_risk, []),
+    'LCR_060_Credit_Risk': (generate_lcr_060_credit_risk, []),
+    'LCR_070_Operational_Risk': (generate_lcr_070_operational_risk, []),
+    # Technical provisions and own funds
+    'LCR_080_Technical_Provisions': (generate_lcr_080_technical_provisions, []),
+    'LCR_090_Own_Funds': (generate_lcr_090_own_funds, []),
+    # Coverage and analysis
+    'LCR_100_Coverage_Ratios': (generate_lcr_100_coverage_ratios, []),
+    'LCR_110_YOA_Capital': (generate_lcr_110_yoa_capital, []),
+    'LCR_120_Diversification': (generate_lcr_120_diversification, []),
+}
+
+
+def table_seed(name):
+    """Seed of one table, derived from SEED and the table name"""
+    return int(np.random.SeedSequence([SEED, int.from_bytes(name.encode(), 'little')]).generate_state(1)[0])
+
+
+def build_tables(selected=None):
+    """
+    Generate Power BI tables.
+
+    The random generators are reseeded with table_seed before each table, so a
+    table has the same values whichever other tables are built with it.
+
+    Args:
+        selected: Table name or list of names (None: every table)
+
+    Returns:
+        Dictionary of table name to DataFrame for the selected tables, in
+        TABLES order (tables they are built from are generated, not returned)
+
+    Raises:
+        KeyError: If a table name is unknown
+    """
+    if selected is None:
+        selected = list(TABLES)
+    elif isinstance(selected, str):
+        selected = [selected]
+    unknown = [name for name in selected if name not in TABLES]
+    if unknown:
+        raise KeyError(f"Unknown table(s): {unknown}")
+
+    # Inputs come before the tables built from them
+    needed = set(selected)
+    for name in reversed(TABLES):
+        if name in needed:
+            needed.update(TABLES[name][1])
+
+    tables = {}
+    for name, (generator, inputs) in TABLES.items():
+        if name in needed:
+            np.random.seed(table_seed(name))
+            tables[name] = generator(*(tables[table] for table in inputs))
+    return {name: table for name, table in tables.items() if name in selected}
+
+
+def __getattr__(name):
+    """Build a table the first time it is accessed as a module attribute"""
+    if name not in TABLES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = table = build_tables(name)[name]
+    return table
+
+
+if __name__ == '__main__':
+    # Power BI runs the pasted script and loads its top-level DataFrames
+    tables = build_tables()
+    globals().update(tables)
+
+    # Summary statistics
+    print(f"LCR_001_Control: {len(tables['LCR_001_Control'])} rows")
+    print(f"LCR_010_SCR_Summary: {len(tables['LCR_010_SCR_Summary'])} rows")
+    print(f"LCR_020_Premium_Risk: {len(tables['LCR_020_Premium_Risk'])} rows")
+    print(f"LCR_030_Reserve_Risk: {len(tables['LCR_030_Reserve_Risk'])} rows")
+    print(f"LCR_040_Cat_Risk_Summary: {len(tables['LCR_040_Cat_Risk_Summary'])} rows")
+    print(f"LCR_041_Cat_By_Peril: {len(tables['LCR_041_Cat_By_Peril'])} rows")
+    print(f"LCR_050_Market_Risk: {len(tables['LCR_050_Market_Risk'])} rows")
+    print(f"LCR_060_Credit_Risk: {len(tables['LCR_060_Credit_Risk'])} rows")
+    print(f"LCR_070_Operational_Risk: {len(tables['LCR_070_Operational_Risk'])} rows")
+    print(f"LCR_080_Technical_Provisions: {len(tables['LCR_080_Technical_Provisions'])} rows")
+    print(f"LCR_090_Own_Funds: {len(tables['LCR_090_Own_Funds'])} rows")
+    print(f"LCR_100_Coverage_Ratios: {len(tables['LCR_100_Coverage_Ratios'])} rows")
+    print(f"LCR_110_YOA_Capital: {len(tables['LCR_110_YOA_Capital'])} rows")
+    print(f"LCR_120_Diversification: {len(tables['LCR_120_Diversification'])} rows")
@@ -24,9 +24,8 @@ import numpy as np
 from datetime import datetime, timedelta
 import random
 
-# Set random seed for reproducibility
-np.random.seed(42)
-random.seed(42)
+# Seed for reproducibility (build_tables reseeds every table from it)
+SEED = 42
 
 # Configuration
 NUM_SYNDICATES = 10
@@ -432,28 +431,91 @@ def generate_us_funding_requirements():
 
     return pd.DataFrame(data)
 
-
 # =============================================================================
 # GENERATE ALL TABLES FOR POWER BI
 # =============================================================================
-print("Generating Liquidity Stress Test Data for Power BI...")
-print("=" * 60)
-
-# Generate tables (these will be available in Power BI)
-capital_position = generate_capital_position()
-liquidity_breakdown = generate_liquidity_breakdown()
-cashflow_summary = generate_cashflow_summary()
-stress_impact = generate_stress_impact()
-dashboard_summary = generate_dashboard_summary()
-qualitative_questionnaire = generate_qualitative_questionnaire()
-us_funding_requirements = generate_us_funding_requirements()
-
-print(f"capital_position: {len(capital_position)} records")
-print(f"liquidity_breakdown: {len(liquidity_breakdown)} records")
-print(f"cashflow_summary: {len(cashflow_summary)} records")
-print(f"stress_impact: {len(stress_impact)} records")
-print(f"dashboard_summary: {len(dashboard_summary)} records")
-print(f"qualitative_questionnaire: {len(qualitative_questionnaire)} records")
-print(f"us_funding_requirements: {len(us_funding_requirements)} records")
-print("=" * 60)
-print("Liquidity Stress Test data generated successfully!")
+# Nothing is generated on import. build_tables() generates a selection of
+# tables, a table accessed as a module attribute is built on first access,
+# and running the script (as Power BI does) generates every table.
+
+# Table name -> (generator, tables passed to it as arguments)
+TABLES = {
+    'capital_position': (generate_capital_position, []),
+    'liquidity_breakdown': (generate_liquidity_breakdown, []),
+    'cashflow_summary': (generate_cashflow_summary, []),
+    'stress_impact': (generate_stress_impact, []),
+    'dashboard_summary': (generate_dashboard_summary, []),
+    'qualitative_questionnaire': (generate_qualitative_questionnaire, []),
+    'us_funding_requirements': (generate_us_funding_requirements, []),
+}
+
+
+def table_seed(name):
+    """Seed of one table, derived from SEED and the table name"""
+    return int(np.random.SeedSequence([SEED, int.from_bytes(name.encode(), 'little')]).generate_state(1)[0])
+
+
+def build_tables(selected=None):
+    """
+    Generate Power BI tables.
+
+    The random generators are reseeded with table_seed before each table, so a
+    table has the same values whichever other tables are built with it.
+
+    Args:
+        selected: Table name or list of names (None: every table)
+
+    Returns:
+        Dictionary of table name to DataFrame for the selected tables, in
+        TABLES order (tables they are built from are generated, not returned)
+
+    Raises:
+        KeyError: If a table name is unknown
+    """
+    if selected is None:
+        selected = list(TABLES)
+    elif isinstance(selected, str):
+        selected = [selected]
+    unknown = [name for name in selected if name not in TABLES]
+    if unknown:
+        raise KeyError(f"Unknown table(s): {unknown}")
+
+    # Inputs come before the tables built from them
+    needed = set(selected)
+    for name in reversed(TABLES):
+        if name in needed:
+            needed.update(TABLES[name][1])
+
+    tables = {}
+    for name, (generator, inputs) in TABLES.items():
+        if name in needed:
+            np.random.seed(table_seed(name))
+            random.seed(table_seed(name))
+            tables[name] = generator(*(tables[table] for table in inputs))
+    return {name: table for name, table in tables.items() if name in selected}
+
+
+def __getattr__(name):
+    """Build a table the first time it is accessed as a module attribute"""
+    if name not in TABLES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = table = build_tables(name)[name]
+    return table
+
+
+if __name__ == '__main__':
+    # Power BI runs the pasted script and loads its top-level DataFrames
+    tables = build_tables()
+    globals().update(tables)
+
+    print("Generating Liquidity Stress Test Data for Power BI...")
+    print("=" * 60)
+    print(f"capital_position: {len(tables['capital_position'])} records")
+    print(f"liquidity_breakdown: {len(tables['liquidity_breakdown'])} records")
+    print(f"cashflow_summary: {len(tables['cashflow_summary'])} records")
+    print(f"stress_impact: {len(tables['stress_impact'])} records")
+    print(f"dashboard_summary: {len(tables['dashboard_summary'])} records")
+    print(f"qualitative_questionnaire: {len(tables['qualitative_questionnaire'])} records")
+    print(f"us_funding_requirements: {len(tables['us_funding_requirements'])} records")
+    print("=" * 60)
+    print("Liquidity Stress Test data generated successfully!")
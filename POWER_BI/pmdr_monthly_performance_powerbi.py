@@ -25,8 +25,8 @@ import numpy as np
 from datetime import datetime, timedelta
 import string
 
-# Set seed for reproducibility
-np.random.seed(42)
+# Seed for reproducibility (build_tables reseeds every table from it)
+SEED = 42
 
 # Configuration
 SYNDICATES = [33, 623, 1183, 1910, 2010, 2525, 2791, 2987, 4242, 5000]
@@ -489,34 +489,95 @@ def generate_pmdr_070_sbf_comparison():
 # =============================================================================
 # Generate all tables
 # =============================================================================
-
-# Control
-PMDR_001_Control = generate_pmdr_001_control()
-
-# Contract and premium data
-PMDR_010_Contract_Summary = generate_pmdr_010_contract_summary()
-PMDR_020_Monthly_Aggregation = generate_pmdr_020_monthly_aggregation()
-PMDR_030_YTD_Premium = generate_pmdr_030_ytd_premium()
-
-# Rate and mix analysis
-PMDR_040_Rate_Change_Detail = generate_pmdr_040_rate_change_detail()
-PMDR_050_Business_Mix = generate_pmdr_050_business_mix()
-
-# Performance indicators
-PMDR_060_Early_Loss_Indicators = generate_pmdr_060_early_loss_indicators()
-PMDR_070_SBF_Comparison = generate_pmdr_070_sbf_comparison()
-
-# Summary statistics
-print("=" * 70)
-print("PMDR - Performance Management Data Return (Monthly) Generator")
-print("=" * 70)
-print(f"PMDR_001_Control: {len(PMDR_001_Control)} rows")
-print(f"PMDR_010_Contract_Summary: {len(PMDR_010_Contract_Summary)} rows")
-print(f"PMDR_020_Monthly_Aggregation: {len(PMDR_020_Monthly_Aggregation)} rows")
-print(f"PMDR_030_YTD_Premium: {len(PMDR_030_YTD_Premium)} rows")
-print(f"PMDR_040_Rate_Change_Detail: {len(PMDR_040_Rate_Change_Detail)} rows")
-print(f"PMDR_050_Business_Mix: {len(PMDR_050_Business_Mix)} rows")
-print(f"PMDR_060_Early_Loss_Indicators: {len(PMDR_060_Early_Loss_Indicators)} rows")
-print(f"PMDR_070_SBF_Comparison: {len(PMDR_070_SBF_Comparison)} rows")
-print("=" * 70)
-print("PMDR data generated successfully!")
+# Nothing is generated on import. build_tables() generates a selection of
+# tables, a table accessed as a module attribute is built on first access,
+# and running the script (as Power BI does) generates every table.
+
+# Table name -> (generator, tables passed to it as arguments)
+TABLES = {
+    # Control
+    'PMDR_001_Control': (generate_pmdr_001_control, []),
+    # Contract and premium data
+    'PMDR_010_Contract_Summary': (generate_pmdr_010_contract_summary, []),
+    'PMDR_020_Monthly_Aggregation': (generate_pmdr_020_monthly_aggregation, []),
+    'PMDR_030_YTD_Premium': (generate_pmdr_030_ytd_premium, []),
+    # Rate and mix analysis
+    'PMDR_040_Rate_Change_Detail': (generate_pmdr_040_rate_change_detail, []),
+    'PMDR_050_Business_Mix': (generate_pmdr_050_business_mix, []),
+    # Performance indicators
+    'PMDR_060_Early_Loss_Indicators': (generate_pmdr_060_early_loss_indicators, []),
+    'PMDR_070_SBF_Comparison': (generate_pmdr_070_sbf_comparison, []),
+}
+
+
+def table_seed(name):
+    """Seed of one table, derived from SEED and the table name"""
+    return int(np.random.SeedSequence([SEED, int.from_bytes(name.encode(), 'little')]).generate_state(1)[0])
+
+
+def build_tables(selected=None):
+    """
+    Generate Power BI tables.
+
+    The random generators are reseeded with table_seed before each table, so a
+    table has the same values whichever other tables are built with it.
+
+    Args:
+        selected: Table name or list of names (None: every table)
+
+    Returns:
+        Dictionary of table name to DataFrame for the selected tables, in
+        TABLES order (tables they are built from are generated, not returned)
+
+    Raises:
+        KeyError: If a table name is unknown
+    """
+    if selected is None:
+        selected = list(TABLES)
+    elif isinstance(selected, str):
+        selected = [selected]
+    unknown = [name for name in selected if name not in TABLES]
+    if unknown:
+        raise KeyError(f"Unknown table(s): {unknown}")
+
+    # Inputs come before the tables built from them
+    needed = set(selected)
+    for name in reversed(TABLES):
+        if name in needed:
+            needed.update(TABLES[name][1])
+
+    tables = {}
+    for name, (generator, inputs) in TABLES.items():
+        if name in needed:
+            np.random.seed(table_seed(name))
+            tables[name] = generator(*(tables[table] for table in inputs))
+    return {name: table for name, table in tables.items() if name in selected}
+
+
+def __getattr__(name):
+    """Build a table the first time it is accessed as a module attribute"""
+    if name not in TABLES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = table = build_tables(name)[name]
+    return table
+
+
+if __name__ == '__main__':
+    # Power BI runs the pasted script and loads its top-level DataFrames
+    tables = build_tables()
+    globals().update(tables)
+
+    # Summary statistics
+    print("=" * 70)
+    print("PMDR - Performance Management Data Return (Monthly) Generator")
+    print("=" * 70)
+    print(f"PMDR_001_Control: {len(tables['PMDR_001_Control'])} rows")
+    print(f"PMDR_010_Contract_Summary: {len(tables['PMDR_010_Contract_Summary'])} rows")
+    print(f"PMDR_020_Monthly_Aggregation: {len(tables['PMDR_020_Monthly_Aggregation'])} rows")
+    print(f"PMDR_030_YTD_Premium: {len(tables['PMDR_030_YTD_Premium'])} rows")
+    print(f"PMDR_040_Rate_Change_Detail: {len(tables['PMDR_040_Rate_Change_Detail'])} rows")
+    print(f"PMDR_050_Business_Mix: {len(tables['PMDR_050_Business_Mix'])} rows")
+    print(f"PMDR_060_Early_Loss_Indicators: {len(tables['PMDR_060_Early_Loss_Indicators'])} rows")
+    print(f"PMDR_070_SBF_Comparison: {len(tables['PMDR_070_SBF_Comparison'])} rows")
+    print("=" * 70)
+    print("PMDR data generated successfully!")
@@ -22,8 +22,8 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
-# Set seed for reproducibility
-np.random.seed(42)
+# Seed for reproducibility (build_tables reseeds every table from it)
+SEED = 42
 
 # Configuration
 SYNDICATES = [33, 623, 1183, 1910, 2010, 2525, 2791, 2987, 4242, 5000]
@@ -556,38 +556,99 @@ def generate_qad_090_qrt_s06():
 # =============================================================================
 # Generate all tables
 # =============================================================================
+# Nothing is generated on import. build_tables() generates a selection of
+# tables, a table accessed as a module attribute is built on first access,
+# and running the script (as Power BI does) generates every table.
+
+# Table name -> (generator, tables passed to it as arguments)
+TABLES = {
+    # Control and metadata
+    'QAD_001_Control': (generate_qad_001_control, []),
+    # Asset analysis
+    'QAD_010_Asset_Summary': (generate_qad_010_asset_summary, []),
+    'QAD_020_Asset_By_CIC': (generate_qad_020_asset_by_cic, []),
+    'QAD_030_Credit_Quality': (generate_qad_030_credit_quality, []),
+    'QAD_040_Currency_Exposure': (generate_qad_040_currency_exposure, []),
+    'QAD_050_Duration_Analysis': (generate_qad_050_duration_analysis, []),
+    'QAD_060_Geographic_Exposure': (generate_qad_060_geographic_exposure, []),
+    # Look-through and concentration
+    'QAD_070_Look_Through': (generate_qad_070_look_through, []),
+    'QAD_080_Concentration_Risk': (generate_qad_080_concentration_risk, []),
+    # QRT format
+    'QAD_090_QRT_S06': (generate_qad_090_qrt_s06, []),
+}
+
 
-# Control and metadata
-QAD_001_Control = generate_qad_001_control()
-
-# Asset analysis
-QAD_010_Asset_Summary = generate_qad_010_asset_summary()
-QAD_020_Asset_By_CIC = generate_qad_020_asset_by_cic()
-QAD_030_Credit_Quality = generate_qad_030_credit_quality()
-QAD_040_Currency_Exposure = generate_qad_040_currency_exposure()
-QAD_050_Duration_Analysis = generate_qad_050_duration_analysis()
-QAD_060_Geographic_Exposure = generate_qad_060_geographic_exposure()
-
-# Look-through and concentration
-QAD_070_Look_Through = generate_qad_070_look_through()
-QAD_080_Concentration_Risk = generate_qad_080_concentration_risk()
-
-# QRT format
-QAD_090_QRT_S06 = generate_qad_090_qrt_s06()
-
-# Summary statistics
-print("=" * 70)
-print("QAD - Quarterly Asset Data Generator")
-print("=" * 70)
-print(f"QAD_001_Control: {len(QAD_001_Control)} rows")
-print(f"QAD_010_Asset_Summary: {len(QAD_010_Asset_Summary)} rows")
-print(f"QAD_020_Asset_By_CIC: {len(QAD_020_Asset_By_CIC)} rows")
-print(f"QAD_030_Credit_Quality: {len(QAD_030_Credit_Quality)} rows")
-print(f"QAD_040_Currency_Exposure: {len(QAD_040_Currency_Exposure)} rows")
-print(f"QAD_050_Duration_Analysis: {len(QAD_050_Duration_Analysis)} rows")
-print(f"QAD_060_Geographic_Exposure: {len(QAD_060_Geographic_Exposure)} rows")
-print(f"QAD_070_Look_Through: {len(QAD_070_Look_Through)} rows")
-print(f"QAD_080_Concentration_Risk: {len(QAD_080_Concentration_Risk)} rows")
-print(f"QAD_090_QRT_S06: {len(QAD_090_QRT_S06)} rows")
-print("=" * 70)
-print("QAD data generated successfully!")
+def table_seed(name):
+    """Seed of one table, derived from SEED and the table name"""
+    return int(np.random.SeedSequence([SEED, int.from_bytes(name.encode(), 'little')]).generate_state(1)[0])
+
+
+def build_tables(selected=None):
+    """
+    Generate Power BI tables.
+
+    The random generators are reseeded with table_seed before each table, so a
+    table has the same values whichever other tables are built with it.
+
+    Args:
+        selected: Table name or list of names (None: every table)
+
+    Returns:
+        Dictionary of table name to DataFrame for the selected tables, in
+        TABLES order (tables they are built from are generated, not returned)
+
+    Raises:
+        KeyError: If a table name is unknown
+    """
+    if selected is None:
+        selected = list(TABLES)
+    elif isinstance(selected, str):
+        selected = [selected]
+    unknown = [name for name in selected if name not in TABLES]
+    if unknown:
+        raise KeyError(f"Unknown table(s): {unknown}")
+
+    # Inputs come before the tables built from them
+    needed = set(selected)
+    for name in reversed(TABLES):
+        if name in needed:
+            needed.update(TABLES[name][1])
+
+    tables = {}
+    for name, (generator, inputs) in TABLES.items():
+        if name in needed:
+            np.random.seed(table_seed(name))
+            tables[name] = generator(*(tables[table] for table in inputs))
+    return {name: table for name, table in tables.items() if name in selected}
+
+
+def __getattr__(name):
+    """Build a table the first time it is accessed as a module attribute"""
+    if name not in TABLES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = table = build_tables(name)[name]
+    return table
+
+
+if __name__ == '__main__':
+    # Power BI runs the pasted script and loads its top-level DataFrames
+    tables = build_tables()
+    globals().update(tables)
+
+    # Summary statistics
+    print("=" * 70)
+    print("QAD - Quarterly Asset Data Generator")
+    print("=" * 70)
+    print(f"QAD_001_Control: {len(tables['QAD_001_Control'])} rows")
+    print(f"QAD_010_Asset_Summary: {len(tables['QAD_010_Asset_Summary'])} rows")
+    print(f"QAD_020_Asset_By_CIC: {len(tables['QAD_020_Asset_By_CIC'])} rows")
+    print(f"QAD_030_Credit_Quality: {len(tables['QAD_030_Credit_Quality'])} rows")
+    print(f"QAD_040_Currency_Exposure: {len(tables['QAD_040_Currency_Exposure'])} rows")
+    print(f"QAD_050_Duration_Analysis: {len(tables['QAD_050_Duration_Analysis'])} rows")
+    print(f"QAD_060_Geographic_Exposure: {len(tables['QAD_060_Geographic_Exposure'])} rows")
+    print(f"QAD_070_Look_Through: {len(tables['QAD_070_Look_Through'])} rows")
+    print(f"QAD_080_Concentration_Risk: {len(tables['QAD_080_Concentration_Risk'])} rows")
+    print(f"QAD_090_QRT_S06: {len(tables['QAD_090_QRT_S06'])} rows")
+    print("=" * 70)
+    print("QAD data generated successfully!")
@@ -21,8 +21,8 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
-# Set seed for reproducibility
-np.random.seed(42)
+# Seed for reproducibility (build_tables reseeds every table from it)
+SEED = 42
 
 # Configuration
 SYNDICATES = [33, 623, 1183, 1910, 2010, 2525, 2791, 2987, 4242, 5000]
@@ -514,33 +514,94 @@ def generate_qma_090_key_ratios():
 # =============================================================================
 # Generate all tables
 # =============================================================================
+# Nothing is generated on import. build_tables() generates a selection of
+# tables, a table accessed as a module attribute is built on first access,
+# and running the script (as Power BI does) generates every table.
+
+# Table name -> (generator, tables passed to it as arguments)
+TABLES = {
+    # Control
+    'QMA_001_Control': (generate_qma_001_control, []),
+    # Financial statements
+    'QMA_010_Balance_Sheet': (generate_qma_010_balance_sheet, []),
+    'QMA_020_PL_Statement': (generate_qma_020_pl_statement, []),
+    'QMA_030_Cash_Flow': (generate_qma_030_cash_flow, []),
+    'QMA_040_Technical_Account': (generate_qma_040_technical_account, []),
+    # Assets and liabilities detail
+    'QMA_050_Investment_Portfolio': (generate_qma_050_investment_portfolio, []),
+    'QMA_060_Reinsurance_Assets': (generate_qma_060_reinsurance_assets, []),
+    'QMA_070_Creditors': (generate_qma_070_creditors, []),
+    # Capital and performance
+    'QMA_080_Capital_Position': (generate_qma_080_capital_position, []),
+    'QMA_090_Key_Ratios': (generate_qma_090_key_ratios, []),
+}
+
 
-# Control
-QMA_001_Control = generate_qma_001_control()
-
-# Financial statements
-QMA_010_Balance_Sheet = generate_qma_010_balance_sheet()
-QMA_020_PL_Statement = generate_qma_020_pl_statement()
-QMA_030_Cash_Flow = generate_qma_030_cash_flow()
-QMA_040_Technical_Account = generate_qma_040_technical_account()
-
-# Assets and liabilities detail
-QMA_050_Investment_Portfolio = generate_qma_050_investment_portfolio()
-QMA_060_Reinsurance_Assets = generate_qma_060_reinsurance_assets()
-QMA_070_Creditors = generate_qma_070_creditors()
-
-# Capital and performance
-QMA_080_Capital_Position = generate_qma_080_capital_position()
-QMA_090_Key_Ratios = generate_qma_090_key_ratios()
-
-# Summary statistics
-print(f"QMA_001_Control: {len(QMA_001_Control)} rows")
-print(f"QMA_010_Balance_Sheet: {len(QMA_010_Balance_Sheet)} rows")
-print(f"QMA_020_PL_Statement: {len(QMA_020_PL_Statement)} rows")
-print(f"QMA_030_Cash_Flow: {len(QMA_030_Cash_Flow)} rows")
-print(f"QMA_040_Technical_Account: {len(QMA_040_Technical_Account)} rows")
-print(f"QMA_050_Investment_Portfolio: {len(QMA_050_Investment_Portfolio)} rows")
-print(f"QMA_060_Reinsurance_Assets: {len(QMA_060_Reinsurance_Assets)} rows")
-print(f"QMA_070_Creditors: {len(QMA_070_Creditors)} rows")
-print(f"QMA_080_Capital_Position: {len(QMA_080_Capital_Position)} rows")
-print(f"QMA_090_Key_Ratios: {len(QMA_090_Key_Ratios)} rows")
+def table_seed(name):
+    """Seed of one table, derived from SEED and the table name"""
+    return int(np.random.SeedSequence([SEED, int.from_bytes(name.encode(), 'little')]).generate_state(1)[0])
+
+
+def build_tables(selected=None):
+    """
+    Generate Power BI tables.
+
+    The random generators are reseeded with table_seed before each table, so a
+    table has the same values whichever other tables are built with it.
+
+    Args:
+        selected: Table name or list of names (None: every table)
+
+    Returns:
+        Dictionary of table name to DataFrame for the selected tables, in
+        TABLES order (tables they are built from are generated, not returned)
+
+    Raises:
+        KeyError: If a table name is unknown
+    """
+    if selected is None:
+        selected = list(TABLES)
+    elif isinstance(selected, str):
+        selected = [selected]
+    unknown = [name for name in selected if name not in TABLES]
+    if unknown:
+        raise KeyError(f"Unknown table(s): {unknown}")
+
+    # Inputs come before the tables built from them
+    needed = set(selected)
+    for name in reversed(TABLES):
+        if name in needed:
+            needed.update(TABLES[name][1])
+
+    tables = {}
+    for name, (generator, inputs) in TABLES.items():
+        if name in needed:
+            np.random.seed(table_seed(name))
+            tables[name] = generator(*(tables[table] for table in inputs))
+    return {name: table for name, table in tables.items() if name in selected}
+
+
+def __getattr__(name):
+    """Build a table the first time it is accessed as a module attribute"""
+    if name not in TABLES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = table = build_tables(name)[name]
+    return table
+
+
+if __name__ == '__main__':
+    # Power BI runs the pasted script and loads its top-level DataFrames
+    tables = build_tables()
+    globals().update(tables)
+
+    # Summary statistics
+    print(f"QMA_001_Control: {len(tables['QMA_001_Control'])} rows")
+    print(f"QMA_010_Balance_Sheet: {len(tables['QMA_010_Balance_Sheet'])} rows")
+    print(f"QMA_020_PL_Statement: {len(tables['QMA_020_PL_Statement'])} rows")
+    print(f"QMA_030_Cash_Flow: {len(tables['QMA_030_Cash_Flow'])} rows")
+    print(f"QMA_040_Technical_Account: {len(tables['QMA_040_Technical_Account'])} rows")
+    print(f"QMA_050_Investment_Portfolio: {len(tables['QMA_050_Investment_Portfolio'])} rows")
+    print(f"QMA_060_Reinsurance_Assets: {len(tables['QMA_060_Reinsurance_Assets'])} rows")
+    print(f"QMA_070_Creditors: {len(tables['QMA_070_Creditors'])} rows")
+    print(f"QMA_080_Capital_Position: {len(tables['QMA_080_Capital_Position'])} rows")
+    print(f"QMA_090_Key_Ratios: {len(tables['QMA_090_Key_Ratios'])} rows")
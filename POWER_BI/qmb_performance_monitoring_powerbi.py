@@ -25,8 +25,8 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
-# Set seed for reproducibility
-np.random.seed(42)
+# Seed for reproducibility (build_tables reseeds every table from it)
+SEED = 42
 
 # Configuration
 SYNDICATES = [33, 623, 1183, 1910, 2010, 2525, 2791, 2987, 4242, 5000]
@@ -563,34 +563,96 @@ def generate_qmb_080_action_tracker():
 # =============================================================================
 # Generate all tables
 # =============================================================================
+# Nothing is generated on import. build_tables() generates a selection of
+# tables, a table accessed as a module attribute is built on first access,
+# and running the script (as Power BI does) generates every table.
+
+# Table name -> (generator, tables passed to it as arguments)
+TABLES = {
+    # Control
+    'QMB_001_Control': (generate_qmb_001_control, []),
+    # Performance analysis
+    'QMB_010_Performance_Summary': (generate_qmb_010_performance_summary, []),
+    'QMB_020_Class_Performance': (generate_qmb_020_class_performance, []),
+    'QMB_030_ULR_Movement': (generate_qmb_030_ulr_movement, []),
+    'QMB_040_Premium_Movement': (generate_qmb_040_premium_movement, []),
+    'QMB_050_Rate_Adequacy': (generate_qmb_050_rate_adequacy, []),
+    # Monitoring and actions
+    'QMB_060_Early_Warning': (generate_qmb_060_early_warning, []),
+    'QMB_070_Prior_Year_Development': (generate_qmb_070_prior_year_development, []),
+    'QMB_080_Action_Tracker': (generate_qmb_080_action_tracker, []),
+}
+
 
-# Control
-QMB_001_Control = generate_qmb_001_control()
-
-# Performance analysis
-QMB_010_Performance_Summary = generate_qmb_010_performance_summary()
-QMB_020_Class_Performance = generate_qmb_020_class_performance()
-QMB_030_ULR_Movement = generate_qmb_030_ulr_movement()
-QMB_040_Premium_Movement = generate_qmb_040_premium_movement()
-QMB_050_Rate_Adequacy = generate_qmb_050_rate_adequacy()
-
-# Monitoring and actions
-QMB_060_Early_Warning = generate_qmb_060_early_warning()
-QMB_070_Prior_Year_Development = generate_qmb_070_prior_year_development()
-QMB_080_Action_Tracker = generate_qmb_080_action_tracker()
-
-# Summary statistics
-print("=" * 70)
-print("QMB - Quarterly Monitoring Part B (Performance) Data Generator")
-print("=" * 70)
-print(f"QMB_001_Control: {len(QMB_001_Control)} rows")
-print(f"QMB_010_Performance_Summary: {len(QMB_010_Performance_Summary)} rows")
-print(f"QMB_020_Class_Performance: {len(QMB_020_Class_Performance)} rows")
-print(f"QMB_030_ULR_Movement: {len(QMB_030_ULR_Movement)} rows")
-print(f"QMB_040_Premium_Movement: {len(QMB_040_Premium_Movement)} rows")
-print(f"QMB_050_Rate_Adequacy: {len(QMB_050_Rate_Adequacy)} rows")
-print(f"QMB_060_Early_Warning: {len(QMB_060_Early_Warning)} rows")
-print(f"QMB_070_Prior_Year_Development: {len(QMB_070_Prior_Year_Development)} rows")
-print(f"QMB_080_Action_Tracker: {len(QMB_080_Action_Tracker)} rows")
-print("=" * 70)
-print("QMB data generated successfully!")
+def table_seed(name):
+    """Seed of one table, derived from SEED and the table name"""
+    return int(np.random.SeedSequence([SEED, int.from_bytes(name.encode(), 'little')]).generate_state(1)[0])
+
+
+def build_tables(selected=None):
+    """
+    Generate Power BI tables.
+
+    The random generators are reseeded with table_seed before each table, so a
+    table has the same values whichever other tables are built with it.
+
+    Args:
+        selected: Table name or list of names (None: every table)
+
+    Returns:
+        Dictionary of table name to DataFrame for the selected tables, in
+        TABLES order (tables they are built from are generated, not returned)
+
+    Raises:
+        KeyError: If a table name is unknown
+    """
+    if selected is None:
+        selected = list(TABLES)
+    elif isinstance(selected, str):
+        selected = [selected]
+    unknown = [name for name in selected if name not in TABLES]
+    if unknown:
+        raise KeyError(f"Unknown table(s): {unknown}")
+
+    # Inputs come before the tables built from them
+    needed = set(selected)
+    for name in reversed(TABLES):
+        if name in needed:
+            needed.update(TABLES[name][1])
+
+    tables = {}
+    for name, (generator, inputs) in TABLES.items():
+        if name in needed:
+            np.random.seed(table_seed(name))
+            tables[name] = generator(*(tables[table] for table in inputs))
+    return {name: table for name, table in tables.items() if name in selected}
+
+
+def __getattr__(name):
+    """Build a table the first time it is accessed as a module attribute"""
+    if name not in TABLES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = table = build_tables(name)[name]
+    return table
+
+
+if __name__ == '__main__':
+    # Power BI runs the pasted script and loads its top-level DataFrames
+    tables = build_tables()
+    globals().update(tables)
+
+    # Summary statistics
+    print("=" * 70)
+    print("QMB - Quarterly Monitoring Part B (Performance) Data Generator")
+    print("=" * 70)
+    print(f"QMB_001_Control: {len(tables['QMB_001_Control'])} rows")
+    print(f"QMB_010_Performance_Summary: {len(tables['QMB_010_Performance_Summary'])} rows")
+    print(f"QMB_020_Class_Performance: {len(tables['QMB_020_Class_Performance'])} rows")
+    print(f"QMB_030_ULR_Movement: {len(tables['QMB_030_ULR_Movement'])} rows")
+    print(f"QMB_040_Premium_Movement: {len(tables['QMB_040_Premium_Movement'])} rows")
+    print(f"QMB_050_Rate_Adequacy: {len(tables['QMB_050_Rate_Adequacy'])} rows")
+    print(f"QMB_060_Early_Warning: {len(tables['QMB_060_Early_Warning'])} rows")
+    print(f"QMB_070_Prior_Year_Development: {len(tables['QMB_070_Prior_Year_Development'])} rows")
+    print(f"QMB_080_Action_Tracker: {len(tables['QMB_080_Action_Tracker'])} rows")
+    print("=" * 70)
+    print("QMB data generated successfully!")
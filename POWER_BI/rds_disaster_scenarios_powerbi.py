@@ -28,8 +28,8 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
-# Set seed for reproducibility
-np.random.seed(42)
+# Seed for reproducibility (build_tables reseeds every table from it)
+SEED = 42
 
 # Configuration
 SYNDICATES = [33, 623, 1183, 1910, 2010, 2525, 2791, 2987, 4242, 5000]
@@ -498,32 +498,94 @@ def generate_rds_070_aggregate_exposure():
 # =============================================================================
 # Generate all tables
 # =============================================================================
-
-# Control
-RDS_001_Control = generate_rds_001_control()
-
-# Scenario data
-RDS_010_Scenario_Summary = generate_rds_010_scenario_summary()
-RDS_020_Scenario_By_LOB = generate_rds_020_scenario_by_lob()
-RDS_030_Cat_Scenarios = generate_rds_030_cat_scenarios()
-RDS_040_Cyber_Scenarios = generate_rds_040_cyber_scenarios()
-RDS_050_Syndicate_Defined = generate_rds_050_syndicate_defined()
-
-# Monitoring
-RDS_060_Lite_Thresholds = generate_rds_060_lite_thresholds()
-RDS_070_Aggregate_Exposure = generate_rds_070_aggregate_exposure()
-
-# Summary statistics
-print("=" * 70)
-print("RDS - Realistic Disaster Scenarios Data Generator")
-print("=" * 70)
-print(f"RDS_001_Control: {len(RDS_001_Control)} rows")
-print(f"RDS_010_Scenario_Summary: {len(RDS_010_Scenario_Summary)} rows")
-print(f"RDS_020_Scenario_By_LOB: {len(RDS_020_Scenario_By_LOB)} rows")
-print(f"RDS_030_Cat_Scenarios: {len(RDS_030_Cat_Scenarios)} rows")
-print(f"RDS_040_Cyber_Scenarios: {len(RDS_040_Cyber_Scenarios)} rows")
-print(f"RDS_050_Syndicate_Defined: {len(RDS_050_Syndicate_Defined)} rows")
-print(f"RDS_060_Lite_Thresholds: {len(RDS_060_Lite_Thresholds)} rows")
-print(f"RDS_070_Aggregate_Exposure: {len(RDS_070_Aggregate_Exposure)} rows")
-print("=" * 70)
-print("RDS data generated successfully!")
+# Nothing is generated on import. build_tables() generates a selection of
+# tables, a table accessed as a module attribute is built on first access,
+# and running the script (as Power BI does) generates every table.
+
+# Table name -> (generator, tables passed to it as arguments)
+TABLES = {
+    # Control
+    'RDS_001_Control': (generate_rds_001_control, []),
+    # Scenario data
+    'RDS_010_Scenario_Summary': (generate_rds_010_scenario_summary, []),
+    'RDS_020_Scenario_By_LOB': (generate_rds_020_scenario_by_lob, []),
+    'RDS_030_Cat_Scenarios': (generate_rds_030_cat_scenarios, []),
+    'RDS_040_Cyber_Scenarios': (generate_rds_040_cyber_scenarios, []),
+    'RDS_050_Syndicate_Defined': (generate_rds_050_syndicate_defined, []),
+    # Monitoring
+    'RDS_060_Lite_Thresholds': (generate_rds_060_lite_thresholds, []),
+    'RDS_070_Aggregate_Exposure': (generate_rds_070_aggregate_exposure, []),
+}
+
+
+def table_seed(name):
+    """Seed of one table, derived from SEED and the table name"""
+    return int(np.random.SeedSequence([SEED, int.from_bytes(name.encode(), 'little')]).generate_state(1)[0])
+
+
+def build_tables(selected=None):
+    """
+    Generate Power BI tables.
+
+    The random generators are reseeded with table_seed before each table, so a
+    table has the same values whichever other tables are built with it.
+
+    Args:
+        selected: Table name or list of names (None: every table)
+
+    Returns:
+        Dictionary of table name to DataFrame for the selected tables, in
+        TABLES order (tables they are built from are generated, not returned)
+
+    Raises:
+        KeyError: If a table name is unknown
+    """
+    if selected is None:
+        selected = list(TABLES)
+    elif isinstance(selected, str):
+        selected = [selected]
+    unknown = [name for name in selected if name not in TABLES]
+    if unknown:
+        raise KeyError(f"Unknown table(s): {unknown}")
+
+    # Inputs come before the tables built from them
+    needed = set(selected)
+    for name in reversed(TABLES):
+        if name in needed:
+            needed.update(TABLES[name][1])
+
+    tables = {}
+    for name, (generator, inputs) in TABLES.items():
+        if name in needed:
+            np.random.seed(table_seed(name))
+            tables[name] = generator(*(tables[table] for table in inputs))
+    return {name: table for name, table in tables.items() if name in selected}
+
+
+def __getattr__(name):
+    """Build a table the first time it is accessed as a module attribute"""
+    if name not in TABLES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = table = build_tables(name)[name]
+    return table
+
+
+if __name__ == '__main__':
+    # Power BI runs the pasted script and loads its top-level DataFrames
+    tables = build_tables()
+    globals().update(tables)
+
+    # Summary statistics
+    print("=" * 70)
+    print("RDS - Realistic Disaster Scenarios Data Generator")
+    print("=" * 70)
+    print(f"RDS_001_Control: {len(tables['RDS_001_Control'])} rows")
+    print(f"RDS_010_Scenario_Summary: {len(tables['RDS_010_Scenario_Summary'])} rows")
+    print(f"RDS_020_Scenario_By_LOB: {len(tables['RDS_020_Scenario_By_LOB'])} rows")
+    print(f"RDS_030_Cat_Scenarios: {len(tables['RDS_030_Cat_Scenarios'])} rows")
+    print(f"RDS_040_Cyber_Scenarios: {len(tables['RDS_040_Cyber_Scenarios'])} rows")
+    print(f"RDS_050_Syndicate_Defined: {len(tables['RDS_050_Syndicate_Defined'])} rows")
+    print(f"RDS_060_Lite_Thresholds: {len(tables['RDS_060_Lite_Thresholds'])} rows")
+    print(f"RDS_070_Aggregate_Exposure: {len(tables['RDS_070_Aggregate_Exposure'])} rows")
+    print("=" * 70)
+    print("RDS data generated successfully!")
@@ -31,9 +31,8 @@ import numpy as np
 from datetime import datetime, timedelta
 import random
 
-# Set random seed for reproducibility
-np.random.seed(42)
-random.seed(42)
+# Seed for reproducibility (build_tables reseeds every table from it)
+SEED = 42
 
 # Configuration
 NUM_SYNDICATES = 10
@@ -512,42 +511,105 @@ def generate_rra_990():
 
     return pd.DataFrame(rra_990_data)
 
-
 # =============================================================================
 # GENERATE ALL TABLES FOR POWER BI
 # =============================================================================
-print("Generating RRA Forms Data for Power BI...")
-print("=" * 60)
-
-# Generate all tables (these will be available in Power BI)
-rra_010 = generate_rra_010()
-rra_020 = generate_rra_020()
-rra_071 = generate_rra_071()
-rra_081 = generate_rra_081()
-rra_091 = generate_rra_091()
-rra_193 = generate_rra_193()
-rra_291 = generate_rra_291()
-rra_292 = generate_rra_292()
-rra_293 = generate_rra_293()
-rra_294 = generate_rra_294()
-rra_295 = generate_rra_295()
-rra_391 = generate_rra_391()
-rra_910 = generate_rra_910()
-rra_990 = generate_rra_990()
-
-print(f"rra_010 (Control): {len(rra_010)} records")
-print(f"rra_020 (Exchange Rates): {len(rra_020)} records")
-print(f"rra_071 (SCOB Mapping): {len(rra_071)} records")
-print(f"rra_081 (Reserving Class): {len(rra_081)} records")
-print(f"rra_091 (LPT): {len(rra_091)} records")
-print(f"rra_193 (Net Claims): {len(rra_193)} records")
-print(f"rra_291 (Gross Premium IBNR): {len(rra_291)} records")
-print(f"rra_292 (Net Premium IBNR): {len(rra_292)} records")
-print(f"rra_293 (OS IBNR PYOA): {len(rra_293)} records")
-print(f"rra_294 (Cat IBNR): {len(rra_294)} records")
-print(f"rra_295 (ULAE): {len(rra_295)} records")
-print(f"rra_391 (IELR): {len(rra_391)} records")
-print(f"rra_910 (Additional Info): {len(rra_910)} records")
-print(f"rra_990 (Validation): {len(rra_990)} records")
-print("=" * 60)
-print("All 14 RRA forms generated successfully!")
+# Nothing is generated on import. build_tables() generates a selection of
+# tables, a table accessed as a module attribute is built on first access,
+# and running the script (as Power BI does) generates every table.
+
+# Table name -> (generator, tables passed to it as arguments)
+TABLES = {
+    'rra_010': (generate_rra_010, []),
+    'rra_020': (generate_rra_020, []),
+    'rra_071': (generate_rra_071, []),
+    'rra_081': (generate_rra_081, []),
+    'rra_091': (generate_rra_091, []),
+    'rra_193': (generate_rra_193, []),
+    'rra_291': (generate_rra_291, []),
+    'rra_292': (generate_rra_292, []),
+    'rra_293': (generate_rra_293, []),
+    'rra_294': (generate_rra_294, []),
+    'rra_295': (generate_rra_295, []),
+    'rra_391': (generate_rra_391, []),
+    'rra_910': (generate_rra_910, []),
+    'rra_990': (generate_rra_990, []),
+}
+
+
+def table_seed(name):
+    """Seed of one table, derived from SEED and the table name"""
+    return int(np.random.SeedSequence([SEED, int.from_bytes(name.encode(), 'little')]).generate_state(1)[0])
+
+
+def build_tables(selected=None):
+    """
+    Generate Power BI tables.
+
+    The random generators are reseeded with table_seed before each table, so a
+    table has the same values whichever other tables are built with it.
+
+    Args:
+        selected: Table name or list of names (None: every table)
+
+    Returns:
+        Dictionary of table name to DataFrame for the selected tables, in
+        TABLES order (tables they are built from are generated, not returned)
+
+    Raises:
+        KeyError: If a table name is unknown
+    """
+    if selected is None:
+        selected = list(TABLES)
+    elif isinstance(selected, str):
+        selected = [selected]
+    unknown = [name for name in selected if name not in TABLES]
+    if unknown:
+        raise KeyError(f"Unknown table(s): {unknown}")
+
+    # Inputs come before the tables built from them
+    needed = set(selected)
+    for name in reversed(TABLES):
+        if name in needed:
+            needed.update(TABLES[name][1])
+
+    tables = {}
+    for name, (generator, inputs) in TABLES.items():
+        if name in needed:
+            np.random.seed(table_seed(name))
+            random.seed(table_seed(name))
+            tables[name] = generator(*(tables[table] for table in inputs))
+    return {name: table for name, table in tables.items() if name in selected}
+
+
+def __getattr__(name):
+    """Build a table the first time it is accessed as a module attribute"""
+    if name not in TABLES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = table = build_tables(name)[name]
+    return table
+
+
+if __name__ == '__main__':
+    # Power BI runs the pasted script and loads its top-level DataFrames
+    tables = build_tables()
+    globals().update(tables)
+
+    print("Generating RRA Forms Data for Power BI...")
+    print("=" * 60)
+    print(f"rra_010 (Control): {len(tables['rra_010'])} records")
+    print(f"rra_020 (Exchange Rates): {len(tables['rra_020'])} records")
+    print(f"rra_071 (SCOB Mapping): {len(tables['rra_071'])} records")
+    print(f"rra_081 (Reserving Class): {len(tables['rra_081'])} records")
+    print(f"rra_091 (LPT): {len(tables['rra_091'])} records")
+    print(f"rra_193 (Net Claims): {len(tables['rra_193'])} records")
+    print(f"rra_291 (Gross Premium IBNR): {len(tables['rra_291'])} records")
+    print(f"rra_292 (Net Premium IBNR): {len(tables['rra_292'])} records")
+    print(f"rra_293 (OS IBNR PYOA): {len(tables['rra_293'])} records")
+    print(f"rra_294 (Cat IBNR): {len(tables['rra_294'])} records")
+    print(f"rra_295 (ULAE): {len(tables['rra_295'])} records")
+    print(f"rra_391 (IELR): {len(tables['rra_391'])} records")
+    print(f"rra_910 (Additional Info): {len(tables['rra_910'])} records")
+    print(f"rra_990 (Validation): {len(tables['rra_990'])} records")
+    print("=" * 60)
+    print("All 14 RRA forms generated successfully!")
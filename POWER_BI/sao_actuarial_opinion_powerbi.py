@@ -33,8 +33,8 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
-# Set seed for reproducibility
-np.random.seed(42)
+# Seed for reproducibility (build_tables reseeds every table from it)
+SEED = 42
 
 # Configuration
 SYNDICATES = [33, 623, 1183, 1910, 2010, 2525, 2791, 2987, 4242, 5000]
@@ -583,32 +583,95 @@ def generate_sao_080_sensitivity():
 # =============================================================================
 # Generate all tables
 # =============================================================================
-
-# Control
-SAO_001_Control = generate_sao_001_control()
-
-# Opinion and analysis
-SAO_010_Opinion_Summary = generate_sao_010_opinion_summary()
-SAO_020_Class_Analysis = generate_sao_020_class_analysis()
-SAO_030_UW_Year_Analysis = generate_sao_030_uw_year_analysis()
-SAO_040_Actual_vs_Expected = generate_sao_040_actual_vs_expected()
-SAO_050_Specific_IBNR = generate_sao_050_specific_ibnr()
-SAO_060_Assumptions = generate_sao_060_assumptions()
-SAO_070_Movement_Analysis = generate_sao_070_movement_analysis()
-SAO_080_Sensitivity = generate_sao_080_sensitivity()
-
-# Summary statistics
-print("=" * 70)
-print("SAO - Statement of Actuarial Opinion Data Generator")
-print("=" * 70)
-print(f"SAO_001_Control: {len(SAO_001_Control)} rows")
-print(f"SAO_010_Opinion_Summary: {len(SAO_010_Opinion_Summary)} rows")
-print(f"SAO_020_Class_Analysis: {len(SAO_020_Class_Analysis)} rows")
-print(f"SAO_030_UW_Year_Analysis: {len(SAO_030_UW_Year_Analysis)} rows")
-print(f"SAO_040_Actual_vs_Expected: {len(SAO_040_Actual_vs_Expected)} rows")
-print(f"SAO_050_Specific_IBNR: {len(SAO_050_Specific_IBNR)} rows")
-print(f"SAO_060_Assumptions: {len(SAO_060_Assumptions)} rows")
-print(f"SAO_070_Movement_Analysis: {len(SAO_070_Movement_Analysis)} rows")
-print(f"SAO_080_Sensitivity: {len(SAO_080_Sensitivity)} rows")
-print("=" * 70)
-print("SAO data generated successfully!")
+# Nothing is generated on import. build_tables() generates a selection of
+# tables, a table accessed as a module attribute is built on first access,
+# and running the script (as Power BI does) generates every table.
+
+# Table name -> (generator, tables passed to it as arguments)
+TABLES = {
+    # Control
+    'SAO_001_Control': (generate_sao_001_control, []),
+    # Opinion and analysis
+    'SAO_010_Opinion_Summary': (generate_sao_010_opinion_summary, []),
+    'SAO_020_Class_Analysis': (generate_sao_020_class_analysis, []),
+    'SAO_030_UW_Year_Analysis': (generate_sao_030_uw_year_analysis, []),
+    'SAO_040_Actual_vs_Expected': (generate_sao_040_actual_vs_expected, []),
+    'SAO_050_Specific_IBNR': (generate_sao_050_specific_ibnr, []),
+    'SAO_060_Assumptions': (generate_sao_060_assumptions, []),
+    'SAO_070_Movement_Analysis': (generate_sao_070_movement_analysis, []),
+    'SAO_080_Sensitivity': (generate_sao_080_sensitivity, []),
+}
+
+
+def table_seed(name):
+    """Seed of one table, derived from SEED and the table name"""
+    return int(np.random.SeedSequence([SEED, int.from_bytes(name.encode(), 'little')]).generate_state(1)[0])
+
+
+def build_tables(selected=None):
+    """
+    Generate Power BI tables.
+
+    The random generators are reseeded with table_seed before each table, so a
+    table has the same values whichever other tables are built with it.
+
+    Args:
+        selected: Table name or list of names (None: every table)
+
+    Returns:
+        Dictionary of table name to DataFrame for the selected tables, in
+        TABLES order (tables they are built from are generated, not returned)
+
+    Raises:
+        KeyError: If a table name is unknown
+    """
+    if selected is None:
+        selected = list(TABLES)
+    elif isinstance(selected, str):
+        selected = [selected]
+    unknown = [name for name in selected if name not in TABLES]
+    if unknown:
+        raise KeyError(f"Unknown table(s): {unknown}")
+
+    # Inputs come before the tables built from them
+    needed = set(selected)
+    for name in reversed(TABLES):
+        if name in needed:
+            needed.update(TABLES[name][1])
+
+    tables = {}
+    for name, (generator, inputs) in TABLES.items():
+        if name in needed:
+            np.random.seed(table_seed(name))
+            tables[name] = generator(*(tables[table] for table in inputs))
+    return {name: table for name, table in tables.items() if name in selected}
+
+
+def __getattr__(name):
+    """Build a table the first time it is accessed as a module attribute"""
+    if name not in TABLES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = table = build_tables(name)[name]
+    return table
+
+
+if __name__ == '__main__':
+    # Power BI runs the pasted script and loads its top-level DataFrames
+    tables = build_tables()
+    globals().update(tables)
+
+    # Summary statistics
+    print("=" * 70)
+    print("SAO - Statement of Actuarial Opinion Data Generator")
+    print("=" * 70)
+    print(f"SAO_001_Control: {len(tables['SAO_001_Control'])} rows")
+    print(f"SAO_010_Opinion_Summary: {len(tables['SAO_010_Opinion_Summary'])} rows")
+    print(f"SAO_020_Class_Analysis: {len(tables['SAO_020_Class_Analysis'])} rows")
+    print(f"SAO_030_UW_Year_Analysis: {len(tables['SAO_030_UW_Year_Analysis'])} rows")
+    print(f"SAO_040_Actual_vs_Expected: {len(tables['SAO_040_Actual_vs_Expected'])} rows")
+    print(f"SAO_050_Specific_IBNR: {len(tables['SAO_050_Specific_IBNR'])} rows")
+    print(f"SAO_060_Assumptions: {len(tables['SAO_060_Assumptions'])} rows")
+    print(f"SAO_070_Movement_Analysis: {len(tables['SAO_070_Movement_Analysis'])} rows")
+    print(f"SAO_080_Sensitivity: {len(tables['SAO_080_Sensitivity'])} rows")
+    print("=" * 70)
+    print("SAO data generated successfully!")
@@ -20,9 +20,8 @@ import numpy as np
 from datetime import datetime
 import random
 
-# Set random seed for reproducibility
-np.random.seed(42)
-random.seed(42)
+# Seed for reproducibility (build_tables reseeds every table from it)
+SEED = 42
 
 
 def _get_year_weights(years):
@@ -213,24 +212,89 @@ def generate_movements_ave_summary(movements_ave_df):
 
     return pd.DataFrame(summary_data)
 
-
 # =============================================================================
 # GENERATE ALL TABLES FOR POWER BI
 # =============================================================================
-print("Generating SAO Addendum Data for Power BI...")
-print("=" * 60)
-
-# Generate SAO Addendum tables (these will be available in Power BI)
-specific_ibnr = generate_specific_ibnr_data(num_records=50)
-movements_ave = generate_movements_ave_data(num_classes=10)
-movements_ave_summary = generate_movements_ave_summary(movements_ave)
-
-print(f"specific_ibnr (Form 090): {len(specific_ibnr)} records")
-print(f"movements_ave (Form 100): {len(movements_ave)} records")
-print(f"movements_ave_summary (Form 100 Summary): {len(movements_ave_summary)} records")
-print("=" * 60)
-print(f"Total Gross IBNR: GBP {specific_ibnr['Gross IBNR (GBP 000s)'].sum():,.0f}k")
-print(f"Total Net IBNR: GBP {specific_ibnr['Net IBNR (GBP 000s)'].sum():,.0f}k")
-print(f"Total Ultimate Premium: GBP {movements_ave['Ultimate Premium (GBP 000s)'].sum():,.0f}k")
-print("=" * 60)
-print("SAO Addendum data generated successfully!")
+# Nothing is generated on import. build_tables() generates a selection of
+# tables, a table accessed as a module attribute is built on first access,
+# and running the script (as Power BI does) generates every table.
+
+# Table name -> (generator, tables passed to it as arguments)
+TABLES = {
+    'specific_ibnr': (lambda: generate_specific_ibnr_data(num_records=50), []),
+    'movements_ave': (lambda: generate_movements_ave_data(num_classes=10), []),
+    'movements_ave_summary': (generate_movements_ave_summary, ['movements_ave']),
+}
+
+
+def table_seed(name):
+    """Seed of one table, derived from SEED and the table name"""
+    return int(np.random.SeedSequence([SEED, int.from_bytes(name.encode(), 'little')]).generate_state(1)[0])
+
+
+def build_tables(selected=None):
+    """
+    Generate Power BI tables.
+
+    The random generators are reseeded with table_seed before each table, so a
+    table has the same values whichever other tables are built with it.
+
+    Args:
+        selected: Table name or list of names (None: every table)
+
+    Returns:
+        Dictionary of table name to DataFrame for the selected tables, in
+        TABLES order (tables they are built from are generated, not returned)
+
+    Raises:
+        KeyError: If a table name is unknown
+    """
+    if selected is None:
+        selected = list(TABLES)
+    elif isinstance(selected, str):
+        selected = [selected]
+    unknown = [name for name in selected if name not in TABLES]
+    if unknown:
+        raise KeyError(f"Unknown table(s): {unknown}")
+
+    # Inputs come before the tables built from them
+    needed = set(selected)
+    for name in reversed(TABLES):
+        if name in needed:
+            needed.update(TABLES[name][1])
+
+    tables = {}
+    for name, (generator, inputs) in TABLES.items():
+        if name in needed:
+            np.random.seed(table_seed(name))
+            random.seed(table_seed(name))
+            tables[name] = generator(*(tables[table] for table in inputs))
+    return {name: table for name, table in tables.items() if name in selected}
+
+
+def __getattr__(name):
+    """Build a table the first time it is accessed as a module attribute"""
+    if name not in TABLES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = table = build_tables(name)[name]
+    return table
+
+
+if __name__ == '__main__':
+    # Power BI runs the pasted script and loads its top-level DataFrames
+    tables = build_tables()
+    globals().update(tables)
+
+    print("Generating SAO Addendum Data for Power BI...")
+    print("=" * 60)
+    print(f"specific_ibnr (Form 090): {len(tables['specific_ibnr'])} records")
+    print(f"movements_ave (Form 100): {len(tables['movements_ave'])} records")
+    print(f"movements_ave_summary (Form 100 Summary): "
+          f"{len(tables['movements_ave_summary'])} records")
+    print("=" * 60)
+    specific_ibnr, movements_ave = tables['specific_ibnr'], tables['movements_ave']
+    print(f"Total Gross IBNR: GBP {specific_ibnr['Gross IBNR (GBP 000s)'].sum():,.0f}k")
+    print(f"Total Net IBNR: GBP {specific_ibnr['Net IBNR (GBP 000s)'].sum():,.0f}k")
+    print(f"Total Ultimate Premium: GBP {movements_ave['Ultimate Premium (GBP 000s)'].sum():,.0f}k")
+    print("=" * 60)
+    print("SAO Addendum data generated successfully!")
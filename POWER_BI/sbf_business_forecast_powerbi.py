@@ -18,8 +18,8 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
-# Set seed for reproducibility
-np.random.seed(42)
+# Seed for reproducibility (build_tables reseeds every table from it)
+SEED = 42
 
 # Configuration
 SYNDICATES = [33, 623, 1183, 1910, 2010, 2525, 2791, 2987, 4242, 5000]
@@ -449,33 +449,94 @@ def generate_sbf_090_stress_scenarios():
 # =============================================================================
 # Generate all tables
 # =============================================================================
-
-# Control
-SBF_001_Control = generate_sbf_001_control()
-
-# Income and forecasts
-SBF_010_Income_Statement = generate_sbf_010_income_statement()
-SBF_020_Premium_Forecast = generate_sbf_020_premium_forecast()
-SBF_030_Claims_Forecast = generate_sbf_030_claims_forecast()
-SBF_040_Expense_Budget = generate_sbf_040_expense_budget()
-
-# Capacity and strategy
-SBF_050_Capacity_Plan = generate_sbf_050_capacity_plan()
-SBF_060_Reinsurance_Strategy = generate_sbf_060_reinsurance_strategy()
-SBF_070_Investment_Income = generate_sbf_070_investment_income()
-
-# Performance targets
-SBF_080_Combined_Ratios = generate_sbf_080_combined_ratios()
-SBF_090_Stress_Scenarios = generate_sbf_090_stress_scenarios()
-
-# Summary statistics
-print(f"SBF_001_Control: {len(SBF_001_Control)} rows")
-print(f"SBF_010_Income_Statement: {len(SBF_010_Income_Statement)} rows")
-print(f"SBF_020_Premium_Forecast: {len(SBF_020_Premium_Forecast)} rows")
-print(f"SBF_030_Claims_Forecast: {len(SBF_030_Claims_Forecast)} rows")
-print(f"SBF_040_Expense_Budget: {len(SBF_040_Expense_Budget)} rows")
-print(f"SBF_050_Capacity_Plan: {len(SBF_050_Capacity_Plan)} rows")
-print(f"SBF_060_Reinsurance_Strategy: {len(SBF_060_Reinsurance_Strategy)} rows")
-print(f"SBF_070_Investment_Income: {len(SBF_070_Investment_Income)} rows")
-print(f"SBF_080_Combined_Ratios: {len(SBF_080_Combined_Ratios)} rows")
-print(f"SBF_090_Stress_Scenarios: {len(SBF_090_Stress_Scenarios)} rows")
+# Nothing is generated on import. build_tables() generates a selection of
+# tables, a table accessed as a module attribute is built on first access,
+# and running the script (as Power BI does) generates every table.
+
+# Table name -> (generator, tables passed to it as arguments)
+TABLES = {
+    # Control
+    'SBF_001_Control': (generate_sbf_001_control, []),
+    # Income and forecasts
+    'SBF_010_Income_Statement': (generate_sbf_010_income_statement, []),
+    'SBF_020_Premium_Forecast': (generate_sbf_020_premium_forecast, []),
+    'SBF_030_Claims_Forecast': (generate_sbf_030_claims_forecast, []),
+    'SBF_040_Expense_Budget': (generate_sbf_040_expense_budget, []),
+    # Capacity and strategy
+    'SBF_050_Capacity_Plan': (generate_sbf_050_capacity_plan, []),
+    'SBF_060_Reinsurance_Strategy': (generate_sbf_060_reinsurance_strategy, []),
+    'SBF_070_Investment_Income': (generate_sbf_070_investment_income, []),
+    # Performance targets
+    'SBF_080_Combined_Ratios': (generate_sbf_080_combined_ratios, []),
+    'SBF_090_Stress_Scenarios': (generate_sbf_090_stress_scenarios, []),
+}
+
+
+def table_seed(name):
+    """Seed of one table, derived from SEED and the table name"""
+    return int(np.random.SeedSequence([SEED, int.from_bytes(name.encode(), 'little')]).generate_state(1)[0])
+
+
+def build_tables(selected=None):
+    """
+    Generate Power BI tables.
+
+    The random generators are reseeded with table_seed before each table, so a
+    table has the same values whichever other tables are built with it.
+
+    Args:
+        selected: Table name or list of names (None: every table)
+
+    Returns:
+        Dictionary of table name to DataFrame for the selected tables, in
+        TABLES order (tables they are built from are generated, not returned)
+
+    Raises:
+        KeyError: If a table name is unknown
+    """
+    if selected is None:
+        selected = list(TABLES)
+    elif isinstance(selected, str):
+        selected = [selected]
+    unknown = [name for name in selected if name not in TABLES]
+    if unknown:
+        raise KeyError(f"Unknown table(s): {unknown}")
+
+    # Inputs come before the tables built from them
+    needed = set(selected)
+    for name in reversed(TABLES):
+        if name in needed:
+            needed.update(TABLES[name][1])
+
+    tables = {}
+    for name, (generator, inputs) in TABLES.items():
+        if name in needed:
+            np.random.seed(table_seed(name))
+            tables[name] = generator(*(tables[table] for table in inputs))
+    return {name: table for name, table in tables.items() if name in selected}
+
+
+def __getattr__(name):
+    """Build a table the first time it is accessed as a module attribute"""
+    if name not in TABLES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = table = build_tables(name)[name]
+    return table
+
+
+if __name__ == '__main__':
+    # Power BI runs the pasted script and loads its top-level DataFrames
+    tables = build_tables()
+    globals().update(tables)
+
+    # Summary statistics
+    print(f"SBF_001_Control: {len(tables['SBF_001_Control'])} rows")
+    print(f"SBF_010_Income_Statement: {len(tables['SBF_010_Income_Statement'])} rows")
+    print(f"SBF_020_Premium_Forecast: {len(tables['SBF_020_Premium_Forecast'])} rows")
+    print(f"SBF_030_Claims_Forecast: {len(tables['SBF_030_Claims_Forecast'])} rows")
+    print(f"SBF_040_Expense_Budget: {len(tables['SBF_040_Expense_Budget'])} rows")
+    print(f"SBF_050_Capacity_Plan: {len(tables['SBF_050_Capacity_Plan'])} rows")
+    print(f"SBF_060_Reinsurance_Strategy: {len(tables['SBF_060_Reinsurance_Strategy'])} rows")
+    print(f"SBF_070_Investment_Income: {len(tables['SBF_070_Investment_Income'])} rows")
+    print(f"SBF_080_Combined_Ratios: {len(tables['SBF_080_Combined_Ratios'])} rows")
+    print(f"SBF_090_Stress_Scenarios: {len(tables['SBF_090_Stress_Scenarios'])} rows")
@@ -27,9 +27,8 @@ import numpy as np
 from datetime import datetime
 import random
 
-# Set random seed for reproducibility
-np.random.seed(42)
-random.seed(42)
+# Seed for reproducibility (build_tables reseeds every table from it)
+SEED = 42
 
 # Configuration
 SYNDICATE_NUMBER = '1234'
@@ -148,6 +147,58 @@ def generate_asb_248_data(num_records=200):
     return df.reset_index(drop=True)
 
 
+def generate_metadata(claims_df, inflation_df):
+    """Generate the metadata table"""
+    return pd.DataFrame([{
+        'SyndicateNumber': SYNDICATE_NUMBER,
+        'SyndicateName': SYNDICATE_NAME,
+        'StartYear': START_YEAR,
+        'EndYear': END_YEAR,
+        'GenerationDate': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'ClaimsRecords': len(claims_df),
+        'InflationRecords': len(inflation_df)
+    }])
+
+
+def generate_lines_of_business():
+    """Generate the Lines of Business reference table"""
+    return pd.DataFrame([
+        {'LineOfBusiness': k, 'LineOfBusinessName': v}
+        for k, v in LINES_OF_BUSINESS.items()
+    ])
+
+
+def generate_claims_summary(claims_df):
+    """Summarise claims by underwriting year, line of business and currency"""
+    return claims_df.groupby(
+        ['UnderwritingYear', 'LineOfBusiness', 'Currency']
+    ).agg({
+        'GrossClaimPaid': 'sum',
+        'ReinsuranceRecoveries': 'sum',
+        'NetClaimPaid': 'sum',
+        'GrossRBNS': 'sum',
+        'NetRBNS': 'sum'
+    }).reset_index()
+
+
+def generate_development_analysis(claims_df):
+    """Summarise claims by development year and line of business"""
+    df = claims_df.groupby(
+        ['DevelopmentYear', 'LineOfBusiness']
+    ).agg({
+        'GrossClaimPaid': ['mean', 'sum', 'count'],
+        'ReinsuranceRecoveries': ['mean', 'sum']
+    }).reset_index()
+
+    df.columns = [
+        'DevelopmentYear', 'LineOfBusiness',
+        'AvgGrossClaimPaid', 'TotalGrossClaimPaid', 'ClaimCount',
+        'AvgReinsuranceRecoveries', 'TotalReinsuranceRecoveries'
+    ]
+
+    return df
+
+
 def generate_asb245_claims_gross(claims_df):
     """Generate ASB 245 - Claims Information Gross"""
     return claims_df[[
@@ -208,76 +259,101 @@ def generate_development_factors(claims_df):
 
     return dev_factors
 
-
 # =============================================================================
 # GENERATE ALL TABLES FOR POWER BI
 # =============================================================================
-print("Generating Solvency II ASB Data for Power BI...")
-print("=" * 60)
-
-# Generate base claims data
-ASB_245_246_247_Claims = generate_asb_245_246_247_data(CLAIMS_RECORDS)
-
-# Generate inflation rates
-ASB_248_InflationRates = generate_asb_248_data(INFLATION_RECORDS)
-
-# Metadata table
-Metadata = pd.DataFrame([{
-    'SyndicateNumber': SYNDICATE_NUMBER,
-    'SyndicateName': SYNDICATE_NAME,
-    'StartYear': START_YEAR,
-    'EndYear': END_YEAR,
-    'GenerationDate': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-    'ClaimsRecords': len(ASB_245_246_247_Claims),
-    'InflationRecords': len(ASB_248_InflationRates)
-}])
-
-# Lines of Business reference table
-LinesOfBusiness = pd.DataFrame([
-    {'LineOfBusiness': k, 'LineOfBusinessName': v}
-    for k, v in LINES_OF_BUSINESS.items()
-])
-
-# Claims Summary
-Claims_Summary = ASB_245_246_247_Claims.groupby(
-    ['UnderwritingYear', 'LineOfBusiness', 'Currency']
-).agg({
-    'GrossClaimPaid': 'sum',
-    'ReinsuranceRecoveries': 'sum',
-    'NetClaimPaid': 'sum',
-    'GrossRBNS': 'sum',
-    'NetRBNS': 'sum'
-}).reset_index()
-
-# Development Analysis
-Development_Analysis = ASB_245_246_247_Claims.groupby(
-    ['DevelopmentYear', 'LineOfBusiness']
-).agg({
-    'GrossClaimPaid': ['mean', 'sum', 'count'],
-    'ReinsuranceRecoveries': ['mean', 'sum']
-}).reset_index()
-
-Development_Analysis.columns = [
-    'DevelopmentYear', 'LineOfBusiness',
-    'AvgGrossClaimPaid', 'TotalGrossClaimPaid', 'ClaimCount',
-    'AvgReinsuranceRecoveries', 'TotalReinsuranceRecoveries'
-]
-
-# Detailed ASB tables
-ASB245_Claims_Gross = generate_asb245_claims_gross(ASB_245_246_247_Claims)
-ASB246_Claims_Reinsurance = generate_asb246_claims_reinsurance(ASB_245_246_247_Claims)
-ASB247_Claims_Net = generate_asb247_claims_net(ASB_245_246_247_Claims)
-ASB_Development_Factors = generate_development_factors(ASB_245_246_247_Claims)
-
-print(f"ASB_245_246_247_Claims: {len(ASB_245_246_247_Claims)} records")
-print(f"ASB_248_InflationRates: {len(ASB_248_InflationRates)} records")
-print(f"Claims_Summary: {len(Claims_Summary)} records")
-print(f"Development_Analysis: {len(Development_Analysis)} records")
-print(f"Metadata: {len(Metadata)} records")
-print(f"LinesOfBusiness: {len(LinesOfBusiness)} records")
-print(f"ASB245_Claims_Gross: {len(ASB245_Claims_Gross)} records")
-print(f"ASB246_Claims_Reinsurance: {len(ASB246_Claims_Reinsurance)} records")
-print(f"ASB247_Claims_Net: {len(ASB247_Claims_Net)} records")
-print(f"ASB_Development_Factors: {len(ASB_Development_Factors)} records")
-print("=" * 60)
-print("Solvency II ASB data generated successfully!")
+# Nothing is generated on import. build_tables() generates a selection of
+# tables, a table accessed as a module attribute is built on first access,
+# and running the script (as Power BI does) generates every table.
+
+# Table name -> (generator, tables passed to it as arguments)
+TABLES = {
+    # Base data
+    'ASB_245_246_247_Claims': (lambda: generate_asb_245_246_247_data(CLAIMS_RECORDS), []),
+    'ASB_248_InflationRates': (lambda: generate_asb_248_data(INFLATION_RECORDS), []),
+    # Reference tables
+    'Metadata': (generate_metadata, ['ASB_245_246_247_Claims', 'ASB_248_InflationRates']),
+    'LinesOfBusiness': (generate_lines_of_business, []),
+    # Summaries
+    'Claims_Summary': (generate_claims_summary, ['ASB_245_246_247_Claims']),
+    'Development_Analysis': (generate_development_analysis, ['ASB_245_246_247_Claims']),
+    # Detailed ASB tables
+    'ASB245_Claims_Gross': (generate_asb245_claims_gross, ['ASB_245_246_247_Claims']),
+    'ASB246_Claims_Reinsurance': (generate_asb246_claims_reinsurance, ['ASB_245_246_247_Claims']),
+    'ASB247_Claims_Net': (generate_asb247_claims_net, ['ASB_245_246_247_Claims']),
+    'ASB_Development_Factors': (generate_development_factors, ['ASB_245_246_247_Claims']),
+}
+
+
+def table_seed(name):
+    """Seed of one table, derived from SEED and the table name"""
+    return int(np.random.SeedSequence([SEED, int.from_bytes(name.encode(), 'little')]).generate_state(1)[0])
+
+
+def build_tables(selected=None):
+    """
+    Generate Power BI tables.
+
+    The random generators are reseeded with table_seed before each table, so a
+    table has the same values whichever other tables are built with it.
+
+    Args:
+        selected: Table name or list of names (None: every table)
+
+    Returns:
+        Dictionary of table name to DataFrame for the selected tables, in
+        TABLES order (tables they are built from are generated, not returned)
+
+    Raises:
+        KeyError: If a table name is unknown
+    """
+    if selected is None:
+        selected = list(TABLES)
+    elif isinstance(selected, str):
+        selected = [selected]
+    unknown = [name for name in selected if name not in TABLES]
+    if unknown:
+        raise KeyError(f"Unknown table(s): {unknown}")
+
+    # Inputs come before the tables built from them
+    needed = set(selected)
+    for name in reversed(TABLES):
+        if name in needed:
+            needed.update(TABLES[name][1])
+
+    tables = {}
+    for name, (generator, inputs) in TABLES.items():
+        if name in needed:
+            np.random.seed(table_seed(name))
+            random.seed(table_seed(name))
+            tables[name] = generator(*(tables[table] for table in inputs))
+    return {name: table for name, table in tables.items() if name in selected}
+
+
+def __getattr__(name):
+    """Build a table the first time it is accessed as a module attribute"""
+    if name not in TABLES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = table = build_tables(name)[name]
+    return table
+
+
+if __name__ == '__main__':
+    # Power BI runs the pasted script and loads its top-level DataFrames
+    tables = build_tables()
+    globals().update(tables)
+
+    print("Generating Solvency II ASB Data for Power BI...")
+    print("=" * 60)
+    print(f"ASB_245_246_247_Claims: {len(tables['ASB_245_246_247_Claims'])} records")
+    print(f"ASB_248_InflationRates: {len(tables['ASB_248_InflationRates'])} records")
+    print(f"Claims_Summary: {len(tables['Claims_Summary'])} records")
+    print(f"Development_Analysis: {len(tables['Development_Analysis'])} records")
+    print(f"Metadata: {len(tables['Metadata'])} records")
+    print(f"LinesOfBusiness: {len(tables['LinesOfBusiness'])} records")
+    print(f"ASB245_Claims_Gross: {len(tables['ASB245_Claims_Gross'])} records")
+    print(f"ASB246_Claims_Reinsurance: {len(tables['ASB246_Claims_Reinsurance'])} records")
+    print(f"ASB247_Claims_Net: {len(tables['ASB247_Claims_Net'])} records")
+    print(f"ASB_Development_Factors: {len(tables['ASB_Development_Factors'])} records")
+    print("=" * 60)
+    print("Solvency II ASB data generated successfully!")
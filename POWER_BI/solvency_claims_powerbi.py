@@ -28,9 +28,8 @@ import numpy as np
 from datetime import datetime, date
 import random
 
-# Set random seed for reproducibility
-np.random.seed(42)
-random.seed(42)
+# Seed for reproducibility (build_tables reseeds every table from it)
+SEED = 42
 
 # Configuration
 NUM_SYNDICATES = 10
@@ -252,30 +251,90 @@ def create_summary_report(df):
 
     return pd.DataFrame([summary_data])
 
-
 # =============================================================================
 # GENERATE ALL TABLES FOR POWER BI
 # =============================================================================
-print("Generating Solvency II Claims Data for Power BI...")
-print("=" * 60)
-
-# Generate base claims data
-raw_claims = generate_synthetic_claims()
-
-# Calculate derived amounts
-claims_with_calcs = calculate_incurred_amounts(raw_claims)
-
-# Generate all tables (these will be available in Power BI)
-detailed_claims = claims_with_calcs
-by_syndicate = aggregate_by_syndicate(claims_with_calcs)
-by_risk_code = aggregate_by_risk_code(claims_with_calcs)
-by_claim_status = aggregate_by_claim_status(claims_with_calcs)
-summary = create_summary_report(claims_with_calcs)
-
-print(f"detailed_claims: {len(detailed_claims)} records")
-print(f"by_syndicate: {len(by_syndicate)} records")
-print(f"by_risk_code: {len(by_risk_code)} records")
-print(f"by_claim_status: {len(by_claim_status)} records")
-print(f"summary: {len(summary)} records")
-print("=" * 60)
-print("Solvency II Claims data generated successfully!")
+# Nothing is generated on import. build_tables() generates a selection of
+# tables, a table accessed as a module attribute is built on first access,
+# and running the script (as Power BI does) generates every table.
+
+# Table name -> (generator, tables passed to it as arguments)
+TABLES = {
+    'raw_claims': (generate_synthetic_claims, []),
+    'claims_with_calcs': (calculate_incurred_amounts, ['raw_claims']),
+    # Full claims detail: the claims with calculated amounts under their table name
+    'detailed_claims': (lambda claims_with_calcs: claims_with_calcs, ['claims_with_calcs']),
+    'by_syndicate': (aggregate_by_syndicate, ['claims_with_calcs']),
+    'by_risk_code': (aggregate_by_risk_code, ['claims_with_calcs']),
+    'by_claim_status': (aggregate_by_claim_status, ['claims_with_calcs']),
+    'summary': (create_summary_report, ['claims_with_calcs']),
+}
+
+
+def table_seed(name):
+    """Seed of one table, derived from SEED and the table name"""
+    return int(np.random.SeedSequence([SEED, int.from_bytes(name.encode(), 'little')]).generate_state(1)[0])
+
+
+def build_tables(selected=None):
+    """
+    Generate Power BI tables.
+
+    The random generators are reseeded with table_seed before each table, so a
+    table has the same values whichever other tables are built with it.
+
+    Args:
+        selected: Table name or list of names (None: every table)
+
+    Returns:
+        Dictionary of table name to DataFrame for the selected tables, in
+        TABLES order (tables they are built from are generated, not returned)
+
+    Raises:
+        KeyError: If a table name is unknown
+    """
+    if selected is None:
+        selected = list(TABLES)
+    elif isinstance(selected, str):
+        selected = [selected]
+    unknown = [name for name in selected if name not in TABLES]
+    if unknown:
+        raise KeyError(f"Unknown table(s): {unknown}")
+
+    # Inputs come before the tables built from them
+    needed = set(selected)
+    for name in reversed(TABLES):
+        if name in needed:
+            needed.update(TABLES[name][1])
+
+    tables = {}
+    for name, (generator, inputs) in TABLES.items():
+        if name in needed:
+            np.random.seed(table_seed(name))
+            random.seed(table_seed(name))
+            tables[name] = generator(*(tables[table] for table in inputs))
+    return {name: table for name, table in tables.items() if name in selected}
+
+
+def __getattr__(name):
+    """Build a table the first time it is accessed as a module attribute"""
+    if name not in TABLES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = table = build_tables(name)[name]
+    return table
+
+
+if __name__ == '__main__':
+    # Power BI runs the pasted script and loads its top-level DataFrames
+    tables = build_tables()
+    globals().update(tables)
+
+    print("Generating Solvency II Claims Data for Power BI...")
+    print("=" * 60)
+    print(f"detailed_claims: {len(tables['detailed_claims'])} records")
+    print(f"by_syndicate: {len(tables['by_syndicate'])} records")
+    print(f"by_risk_code: {len(tables['by_risk_code'])} records")
+    print(f"by_claim_status: {len(tables['by_claim_status'])} records")
+    print(f"summary: {len(tables['summary'])} records")
+    print("=" * 60)
+    print("Solvency II Claims data generated successfully!")
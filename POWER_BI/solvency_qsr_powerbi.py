@@ -31,9 +31,8 @@ import numpy as np
 from datetime import datetime
 import random
 
-# Set random seed for reproducibility
-np.random.seed(42)
-random.seed(42)
+# Seed for reproducibility (build_tables reseeds every table from it)
+SEED = 42
 
 # Configuration
 SYNDICATES = [2987, 33, 1183, 2791, 623, 4242, 5000, 1910, 2010, 2525]
@@ -619,53 +618,111 @@ def generate_solvency_ratio_report():
 
     return pd.DataFrame(data)
 
-
 # =============================================================================
 # GENERATE ALL TABLES FOR POWER BI
 # =============================================================================
-print("Generating Solvency II QSR Data for Power BI...")
-print("=" * 60)
-
-# Generate all QSR tables (these will be available in Power BI)
-# Control Forms
-QSR030_Basic_Information = generate_qsr030_basic_information()
-QSR031_Content_Of_Submission = generate_qsr031_content_of_submission()
-
-# Balance Sheet and Reconciliation
-QSR002_Balance_Sheet = generate_qsr002_balance_sheet()
-QSR210_Reconciliation = generate_qsr210_reconciliation()
-
-# Own Funds and Capital
-QSR220_Own_Funds = generate_qsr220_own_funds()
-QSR240_Technical_Provisions = generate_qsr240_technical_provisions()
-QSR440_Premiums_Claims = generate_qsr440_premiums_claims()
-
-# Risk Modules
-QSR291_Operational_Risk = generate_qsr291_operational_risk()
-QSR292_Market_Risk = generate_qsr292_market_risk()
-QSR293_Counterparty_Risk = generate_qsr293_counterparty_risk()
-QSR510_MCR = generate_qsr510_mcr()
-
-# Cash Transfer (Q4)
-QSR923_Cash_Transfer = generate_qsr923_cash_transfer()
-
-# Summaries
-SCR_Summary = generate_scr_summary()
-Solvency_Ratio_Report = generate_solvency_ratio_report()
-
-print(f"QSR030_Basic_Information: {len(QSR030_Basic_Information)} records")
-print(f"QSR031_Content_Of_Submission: {len(QSR031_Content_Of_Submission)} records")
-print(f"QSR002_Balance_Sheet: {len(QSR002_Balance_Sheet)} records")
-print(f"QSR210_Reconciliation: {len(QSR210_Reconciliation)} records")
-print(f"QSR220_Own_Funds: {len(QSR220_Own_Funds)} records")
-print(f"QSR240_Technical_Provisions: {len(QSR240_Technical_Provisions)} records")
-print(f"QSR440_Premiums_Claims: {len(QSR440_Premiums_Claims)} records")
-print(f"QSR291_Operational_Risk: {len(QSR291_Operational_Risk)} records")
-print(f"QSR292_Market_Risk: {len(QSR292_Market_Risk)} records")
-print(f"QSR293_Counterparty_Risk: {len(QSR293_Counterparty_Risk)} records")
-print(f"QSR510_MCR: {len(QSR510_MCR)} records")
-print(f"QSR923_Cash_Transfer: {len(QSR923_Cash_Transfer)} records")
-print(f"SCR_Summary: {len(SCR_Summary)} records")
-print(f"Solvency_Ratio_Report: {len(Solvency_Ratio_Report)} records")
-print("=" * 60)
-print("Solvency II QSR data generated successfully!")
+# Nothing is generated on import. build_tables() generates a selection of
+# tables, a table accessed as a module attribute is built on first access,
+# and running the script (as Power BI does) generates every table.
+
+# Table name -> (generator, tables passed to it as arguments)
+TABLES = {
+    # Control Forms
+    'QSR030_Basic_Information': (generate_qsr030_basic_information, []),
+    'QSR031_Content_Of_Submission': (generate_qsr031_content_of_submission, []),
+    # Balance Sheet and Reconciliation
+    'QSR002_Balance_Sheet': (generate_qsr002_balance_sheet, []),
+    'QSR210_Reconciliation': (generate_qsr210_reconciliation, []),
+    # Own Funds and Capital
+    'QSR220_Own_Funds': (generate_qsr220_own_funds, []),
+    'QSR240_Technical_Provisions': (generate_qsr240_technical_provisions, []),
+    'QSR440_Premiums_Claims': (generate_qsr440_premiums_claims, []),
+    # Risk Modules
+    'QSR291_Operational_Risk': (generate_qsr291_operational_risk, []),
+    'QSR292_Market_Risk': (generate_qsr292_market_risk, []),
+    'QSR293_Counterparty_Risk': (generate_qsr293_counterparty_risk, []),
+    'QSR510_MCR': (generate_qsr510_mcr, []),
+    # Cash Transfer (Q4)
+    'QSR923_Cash_Transfer': (generate_qsr923_cash_transfer, []),
+    # Summaries
+    'SCR_Summary': (generate_scr_summary, []),
+    'Solvency_Ratio_Report': (generate_solvency_ratio_report, []),
+}
+
+
+def table_seed(name):
+    """Seed of one table, derived from SEED and the table name"""
+    return int(np.random.SeedSequence([SEED, int.from_bytes(name.encode(), 'little')]).generate_state(1)[0])
+
+
+def build_tables(selected=None):
+    """
+    Generate Power BI tables.
+
+    The random generators are reseeded with table_seed before each table, so a
+    table has the same values whichever other tables are built with it.
+
+    Args:
+        selected: Table name or list of names (None: every table)
+
+    Returns:
+        Dictionary of table name to DataFrame for the selected tables, in
+        TABLES order (tables they are built from are generated, not returned)
+
+    Raises:
+        KeyError: If a table name is unknown
+    """
+    if selected is None:
+        selected = list(TABLES)
+    elif isinstance(selected, str):
+        selected = [selected]
+    unknown = [name for name in selected if name not in TABLES]
+    if unknown:
+        raise KeyError(f"Unknown table(s): {unknown}")
+
+    # Inputs come before the tables built from them
+    needed = set(selected)
+    for name in reversed(TABLES):
+        if name in needed:
+            needed.update(TABLES[name][1])
+
+    tables = {}
+    for name, (generator, inputs) in TABLES.items():
+        if name in needed:
+            np.random.seed(table_seed(name))
+            random.seed(table_seed(name))
+            tables[name] = generator(*(tables[table] for table in inputs))
+    return {name: table for name, table in tables.items() if name in selected}
+
+
+def __getattr__(name):
+    """Build a table the first time it is accessed as a module attribute"""
+    if name not in TABLES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = table = build_tables(name)[name]
+    return table
+
+
+if __name__ == '__main__':
+    # Power BI runs the pasted script and loads its top-level DataFrames
+    tables = build_tables()
+    globals().update(tables)
+
+    print("Generating Solvency II QSR Data for Power BI...")
+    print("=" * 60)
+    print(f"QSR030_Basic_Information: {len(tables['QSR030_Basic_Information'])} records")
+    print(f"QSR031_Content_Of_Submission: {len(tables['QSR031_Content_Of_Submission'])} records")
+    print(f"QSR002_Balance_Sheet: {len(tables['QSR002_Balance_Sheet'])} records")
+    print(f"QSR210_Reconciliation: {len(tables['QSR210_Reconciliation'])} records")
+    print(f"QSR220_Own_Funds: {len(tables['QSR220_Own_Funds'])} records")
+    print(f"QSR240_Technical_Provisions: {len(tables['QSR240_Technical_Provisions'])} records")
+    print(f"QSR440_Premiums_Claims: {len(tables['QSR440_Premiums_Claims'])} records")
+    print(f"QSR291_Operational_Risk: {len(tables['QSR291_Operational_Risk'])} records")
+    print(f"QSR292_Market_Risk: {len(tables['QSR292_Market_Risk'])} records")
+    print(f"QSR293_Counterparty_Risk: {len(tables['QSR293_Counterparty_Risk'])} records")
+    print(f"QSR510_MCR: {len(tables['QSR510_MCR'])} records")
+    print(f"QSR923_Cash_Transfer: {len(tables['QSR923_Cash_Transfer'])} records")
+    print(f"SCR_Summary: {len(tables['SCR_Summary'])} records")
+    print(f"Solvency_Ratio_Report: {len(tables['Solvency_Ratio_Report'])} records")
+    print("=" * 60)
+    print("Solvency II QSR data generated successfully!")
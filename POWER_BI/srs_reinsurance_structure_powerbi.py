@@ -25,8 +25,8 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
-# Set seed for reproducibility
-np.random.seed(42)
+# Seed for reproducibility (build_tables reseeds every table from it)
+SEED = 42
 
 # Configuration
 SYNDICATES = [33, 623, 1183, 1910, 2010, 2525, 2791, 2987, 4242, 5000]
@@ -474,34 +474,95 @@ def generate_srs_070_concentration_analysis():
 # =============================================================================
 # Generate all tables
 # =============================================================================
-
-# Control
-SRS_001_Control = generate_srs_001_control()
-
-# Programme structure
-SRS_010_Programme_Summary = generate_srs_010_programme_summary()
-SRS_020_Programme_Detail = generate_srs_020_programme_detail()
-
-# Counterparty exposure
-SRS_030_Counterparty_Exposure = generate_srs_030_counterparty_exposure()
-SRS_040_Collateral_Detail = generate_srs_040_collateral_detail()
-SRS_050_Layer_Participation = generate_srs_050_layer_participation()
-
-# Analysis
-SRS_060_Recovery_Analysis = generate_srs_060_recovery_analysis()
-SRS_070_Concentration_Analysis = generate_srs_070_concentration_analysis()
-
-# Summary statistics
-print("=" * 70)
-print("SRS - Syndicate Reinsurance Structure Data Generator")
-print("=" * 70)
-print(f"SRS_001_Control: {len(SRS_001_Control)} rows")
-print(f"SRS_010_Programme_Summary: {len(SRS_010_Programme_Summary)} rows")
-print(f"SRS_020_Programme_Detail: {len(SRS_020_Programme_Detail)} rows")
-print(f"SRS_030_Counterparty_Exposure: {len(SRS_030_Counterparty_Exposure)} rows")
-print(f"SRS_040_Collateral_Detail: {len(SRS_040_Collateral_Detail)} rows")
-print(f"SRS_050_Layer_Participation: {len(SRS_050_Layer_Participation)} rows")
-print(f"SRS_060_Recovery_Analysis: {len(SRS_060_Recovery_Analysis)} rows")
-print(f"SRS_070_Concentration_Analysis: {len(SRS_070_Concentration_Analysis)} rows")
-print("=" * 70)
-print("SRS data generated successfully!")
+# Nothing is generated on import. build_tables() generates a selection of
+# tables, a table accessed as a module attribute is built on first access,
+# and running the script (as Power BI does) generates every table.
+
+# Table name -> (generator, tables passed to it as arguments)
+TABLES = {
+    # Control
+    'SRS_001_Control': (generate_srs_001_control, []),
+    # Programme structure
+    'SRS_010_Programme_Summary': (generate_srs_010_programme_summary, []),
+    'SRS_020_Programme_Detail': (generate_srs_020_programme_detail, []),
+    # Counterparty exposure
+    'SRS_030_Counterparty_Exposure': (generate_srs_030_counterparty_exposure, []),
+    'SRS_040_Collateral_Detail': (generate_srs_040_collateral_detail, []),
+    'SRS_050_Layer_Participation': (generate_srs_050_layer_participation, []),
+    # Analysis
+    'SRS_060_Recovery_Analysis': (generate_srs_060_recovery_analysis, []),
+    'SRS_070_Concentration_Analysis': (generate_srs_070_concentration_analysis, []),
+}
+
+
+def table_seed(name):
+    """Seed of one table, derived from SEED and the table name"""
+    return int(np.random.SeedSequence([SEED, int.from_bytes(name.encode(), 'little')]).generate_state(1)[0])
+
+
+def build_tables(selected=None):
+    """
+    Generate Power BI tables.
+
+    The random generators are reseeded with table_seed before each table, so a
+    table has the same values whichever other tables are built with it.
+
+    Args:
+        selected: Table name or list of names (None: every table)
+
+    Returns:
+        Dictionary of table name to DataFrame for the selected tables, in
+        TABLES order (tables they are built from are generated, not returned)
+
+    Raises:
+        KeyError: If a table name is unknown
+    """
+    if selected is None:
+        selected = list(TABLES)
+    elif isinstance(selected, str):
+        selected = [selected]
+    unknown = [name for name in selected if name not in TABLES]
+    if unknown:
+        raise KeyError(f"Unknown table(s): {unknown}")
+
+    # Inputs come before the tables built from them
+    needed = set(selected)
+    for name in reversed(TABLES):
+        if name in needed:
+            needed.update(TABLES[name][1])
+
+    tables = {}
+    for name, (generator, inputs) in TABLES.items():
+        if name in needed:
+            np.random.seed(table_seed(name))
+            tables[name] = generator(*(tables[table] for table in inputs))
+    return {name: table for name, table in tables.items() if name in selected}
+
+
+def __getattr__(name):
+    """Build a table the first time it is accessed as a module attribute"""
+    if name not in TABLES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = table = build_tables(name)[name]
+    return table
+
+
+if __name__ == '__main__':
+    # Power BI runs the pasted script and loads its top-level DataFrames
+    tables = build_tables()
+    globals().update(tables)
+
+    # Summary statistics
+    print("=" * 70)
+    print("SRS - Syndicate Reinsurance Structure Data Generator")
+    print("=" * 70)
+    print(f"SRS_001_Control: {len(tables['SRS_001_Control'])} rows")
+    print(f"SRS_010_Programme_Summary: {len(tables['SRS_010_Programme_Summary'])} rows")
+    print(f"SRS_020_Programme_Detail: {len(tables['SRS_020_Programme_Detail'])} rows")
+    print(f"SRS_030_Counterparty_Exposure: {len(tables['SRS_030_Counterparty_Exposure'])} rows")
+    print(f"SRS_040_Collateral_Detail: {len(tables['SRS_040_Collateral_Detail'])} rows")
+    print(f"SRS_050_Layer_Participation: {len(tables['SRS_050_Layer_Participation'])} rows")
+    print(f"SRS_060_Recovery_Analysis: {len(tables['SRS_060_Recovery_Analysis'])} rows")
+    print(f"SRS_070_Concentration_Analysis: {len(tables['SRS_070_Concentration_Analysis'])} rows")
+    print("=" * 70)
+    print("SRS data generated successfully!")
@@ -48,10 +48,26 @@ Usage:
 from QRTs import generate_all_qrts
 all_data = generate_all_qrts()
 
+Build only some templates (and the templates they take inputs from):
+from QRTs import generate_qrts
+scr_data = generate_qrts(['IR2504', 'IR2301'])
+
 Or import specific generators:
 from QRTs.qrt_balance_sheet import generate_ir0201_balance_sheet
+
+Templates are built through a dependency graph (QRT_INPUTS, see
+qrt_build_graph) and shared inputs such as the IR2504 SCR are generated once.
+Builds run in-process by default; pass max_workers (None for one per CPU) to
+run independent templates in parallel worker processes. That needs an
+``if __name__ == '__main__':`` guard in the calling script on platforms that
+spawn workers (Windows, Power BI). When run in-process, each template is
+generated inside an instrumentation span, so with tracing
+enabled (lloyds_reporting.instrumentation) the slowest templates of a run
+can be listed with instrumentation.summary(category='qrt').
 """
 
+from .qrt_build_graph import QRTBuildGraph
+
 # Balance Sheet (IR02)
 from .qrt_balance_sheet import (
     generate_ir0201_balance_sheet,
@@ -128,89 +144,144 @@ from .qrt_group import (
 )
 
 
-def generate_all_qrts():
-    """
-    Generate all actuarial-focused QRT templates and return as a dictionary of DataFrames.
-
-    Returns:
-        dict: Dictionary with template names as keys and DataFrames as values.
-    """
-    templates = {}
-
+# Template name -> generator, in generation order
+QRT_GENERATORS = {
     # Balance Sheet (IR02)
-    templates['IR0201_Balance_Sheet'] = generate_ir0201_balance_sheet()
-    templates['IR0202_Assets_Liabilities_Currency'] = generate_ir0202_assets_liabilities_by_currency()
-    templates['IR0203_Branch_Balance_Sheet'] = generate_ir0203_branch_balance_sheet()
+    'IR0201_Balance_Sheet': generate_ir0201_balance_sheet,
+    'IR0202_Assets_Liabilities_Currency': generate_ir0202_assets_liabilities_by_currency,
+    'IR0203_Branch_Balance_Sheet': generate_ir0203_branch_balance_sheet,
 
     # Premiums, Claims, Expenses (IR05)
-    templates['IR0502_Premiums_Claims_Country'] = generate_ir0502_premiums_claims_by_country()
-    templates['IR0503_Life_Income_Expenditure'] = generate_ir0503_life_income_expenditure()
-    templates['IR0504_Non_Life_Income_Expenditure'] = generate_ir0504_non_life_income_expenditure()
-    templates['IR0505_Life_Premiums_Claims_Country'] = generate_ir0505_life_premiums_claims_by_country()
-    templates['IR0506_Non_Life_Premiums_Claims_Country'] = generate_ir0506_non_life_premiums_claims_by_country()
+    'IR0502_Premiums_Claims_Country': generate_ir0502_premiums_claims_by_country,
+    'IR0503_Life_Income_Expenditure': generate_ir0503_life_income_expenditure,
+    'IR0504_Non_Life_Income_Expenditure': generate_ir0504_non_life_income_expenditure,
+    'IR0505_Life_Premiums_Claims_Country': generate_ir0505_life_premiums_claims_by_country,
+    'IR0506_Non_Life_Premiums_Claims_Country': generate_ir0506_non_life_premiums_claims_by_country,
 
     # Life Technical Provisions (IR12)
-    templates['IR1201_Life_Technical_Provisions'] = generate_ir1201_life_technical_provisions()
-    templates['IR1203_Life_BEL_By_Country'] = generate_ir1203_life_bel_by_country()
-    templates['IR1204_Life_BE_Assumptions'] = generate_ir1204_life_be_assumptions()
-    templates['IR1205_With_Profits_Bonus'] = generate_ir1205_with_profits_bonus()
-    templates['IR1206_With_Profits_Liabilities_Assets'] = generate_ir1206_with_profits_liabilities_assets()
+    'IR1201_Life_Technical_Provisions': generate_ir1201_life_technical_provisions,
+    'IR1203_Life_BEL_By_Country': generate_ir1203_life_bel_by_country,
+    'IR1204_Life_BE_Assumptions': generate_ir1204_life_be_assumptions,
+    'IR1205_With_Profits_Bonus': generate_ir1205_with_profits_bonus,
+    'IR1206_With_Profits_Liabilities_Assets': generate_ir1206_with_profits_liabilities_assets,
 
     # Life Obligations (IR14)
-    templates['IR1401_Life_Obligations'] = generate_ir1401_life_obligations()
+    'IR1401_Life_Obligations': generate_ir1401_life_obligations,
 
     # Non-Life Annuities (IR16)
-    templates['IR1601_Non_Life_Annuities'] = generate_ir1601_non_life_annuities()
-    templates['IR1602_Non_Life_Annuities_Cash_Flows'] = generate_ir1602_non_life_annuities_cash_flows()
+    'IR1601_Non_Life_Annuities': generate_ir1601_non_life_annuities,
+    'IR1602_Non_Life_Annuities_Cash_Flows': generate_ir1602_non_life_annuities_cash_flows,
 
     # Non-Life Technical Provisions (IR17)
-    templates['IR1701_Non_Life_Technical_Provisions'] = generate_ir1701_non_life_technical_provisions()
-    templates['IR1703_Non_Life_BEL_By_Country'] = generate_ir1703_non_life_bel_by_country()
+    'IR1701_Non_Life_Technical_Provisions': generate_ir1701_non_life_technical_provisions,
+    'IR1703_Non_Life_BEL_By_Country': generate_ir1703_non_life_bel_by_country,
 
     # Non-Life Cash Flows (IR18)
-    templates['IR1801_Non_Life_Cash_Flows'] = generate_ir1801_non_life_cash_flows()
-    templates['IR1802_Non_Life_Liability_Cash_Flows'] = generate_ir1802_non_life_liability_cash_flows()
+    'IR1801_Non_Life_Cash_Flows': generate_ir1801_non_life_cash_flows,
+    'IR1802_Non_Life_Liability_Cash_Flows': generate_ir1802_non_life_liability_cash_flows,
 
     # Claims (IR19-20)
-    templates['IR1901_Non_Life_Claims'] = generate_ir1901_non_life_claims()
-    templates['IR1902_GL_Claims_Development'] = generate_ir1902_gl_claims_development()
-    templates['IR2001_Claims_Distribution'] = generate_ir2001_claims_distribution()
+    'IR1901_Non_Life_Claims': generate_ir1901_non_life_claims,
+    'IR1902_GL_Claims_Development': generate_ir1902_gl_claims_development,
+    'IR2001_Claims_Distribution': generate_ir2001_claims_distribution,
 
     # Own Funds (IR23)
-    templates['IR2301_Own_Funds'] = generate_ir2301_own_funds()
-    templates['IR2302_Own_Funds_By_Tier'] = generate_ir2302_own_funds_by_tier()
-    templates['IR2303_Own_Funds_Movements'] = generate_ir2303_own_funds_movements()
-    templates['IR2304_Own_Funds_Items'] = generate_ir2304_own_funds_items()
-    templates['IR2305_Lloyds_Capital'] = generate_ir2305_lloyds_capital()
+    'IR2301_Own_Funds': generate_ir2301_own_funds,
+    'IR2302_Own_Funds_By_Tier': generate_ir2302_own_funds_by_tier,
+    'IR2303_Own_Funds_Movements': generate_ir2303_own_funds_movements,
+    'IR2304_Own_Funds_Items': generate_ir2304_own_funds_items,
+    'IR2305_Lloyds_Capital': generate_ir2305_lloyds_capital,
 
     # SCR Overview (IR25)
-    templates['IR2504_SCR'] = generate_ir2504_scr()
-    templates['IR2505_SCR_Internal_Model'] = generate_ir2505_scr_internal_model()
-    templates['IR2506_SCR_LAC_DT'] = generate_ir2506_scr_lac_dt()
+    'IR2504_SCR': generate_ir2504_scr,
+    'IR2505_SCR_Internal_Model': generate_ir2505_scr_internal_model,
+    'IR2506_SCR_LAC_DT': generate_ir2506_scr_lac_dt,
 
     # SCR Risk Modules (IR26)
-    templates['IR2601_SCR_Market_Risk'] = generate_ir2601_scr_market_risk()
-    templates['IR2602_SCR_Counterparty_Risk'] = generate_ir2602_scr_counterparty_risk()
-    templates['IR2603_SCR_Life_Risk'] = generate_ir2603_scr_life_risk()
-    templates['IR2604_SCR_Health_Risk'] = generate_ir2604_scr_health_risk()
-    templates['IR2605_SCR_Non_Life_Risk'] = generate_ir2605_scr_non_life_risk()
-    templates['IR2606_SCR_Operational_Risk'] = generate_ir2606_scr_operational_risk()
-    templates['IR2607_SCR_Simplifications'] = generate_ir2607_scr_simplifications()
+    'IR2601_SCR_Market_Risk': generate_ir2601_scr_market_risk,
+    'IR2602_SCR_Counterparty_Risk': generate_ir2602_scr_counterparty_risk,
+    'IR2603_SCR_Life_Risk': generate_ir2603_scr_life_risk,
+    'IR2604_SCR_Health_Risk': generate_ir2604_scr_health_risk,
+    'IR2605_SCR_Non_Life_Risk': generate_ir2605_scr_non_life_risk,
+    'IR2606_SCR_Operational_Risk': generate_ir2606_scr_operational_risk,
+    'IR2607_SCR_Simplifications': generate_ir2607_scr_simplifications,
 
     # Catastrophe Risk (IR27)
-    templates['IR2701_SCR_Catastrophe'] = generate_ir2701_scr_catastrophe()
+    'IR2701_SCR_Catastrophe': generate_ir2701_scr_catastrophe,
 
     # MCR (IR28)
-    templates['IR2801_MCR_Non_Life'] = generate_ir2801_mcr_non_life()
-    templates['IR2802_MCR_Composite'] = generate_ir2802_mcr_composite()
+    'IR2801_MCR_Non_Life': generate_ir2801_mcr_non_life,
+    'IR2802_MCR_Composite': generate_ir2802_mcr_composite,
 
     # Group (IR32-35)
-    templates['IR3201_Group_Scope'] = generate_ir3201_group_scope()
-    templates['IR3301_Individual_Requirements'] = generate_ir3301_individual_requirements()
-    templates['IR3401_Other_Undertakings'] = generate_ir3401_other_undertakings()
-    templates['IR3501_Group_TP_Contribution'] = generate_ir3501_group_tp_contribution()
+    'IR3201_Group_Scope': generate_ir3201_group_scope,
+    'IR3301_Individual_Requirements': generate_ir3301_individual_requirements,
+    'IR3401_Other_Undertakings': generate_ir3401_other_undertakings,
+    'IR3501_Group_TP_Contribution': generate_ir3501_group_tp_contribution,
+}
+
+
+# Template name -> {generator argument: upstream template}; templates not
+# listed take no inputs
+QRT_INPUTS = {
+    # Technical provisions feed the balance sheet
+    'IR0201_Balance_Sheet': {
+        'ir1201': 'IR1201_Life_Technical_Provisions',
+        'ir1701': 'IR1701_Non_Life_Technical_Provisions',
+    },
+    # SCR risk modules feed the SCR summary
+    'IR2504_SCR': {
+        'ir2601': 'IR2601_SCR_Market_Risk',
+        'ir2602': 'IR2602_SCR_Counterparty_Risk',
+        'ir2603': 'IR2603_SCR_Life_Risk',
+        'ir2604': 'IR2604_SCR_Health_Risk',
+        'ir2605': 'IR2605_SCR_Non_Life_Risk',
+        'ir2606': 'IR2606_SCR_Operational_Risk',
+    },
+    # The SCR feeds own funds ratios, Lloyd's capital and LAC DT
+    'IR2301_Own_Funds': {'ir2504': 'IR2504_SCR'},
+    'IR2305_Lloyds_Capital': {'ir2504': 'IR2504_SCR'},
+    'IR2506_SCR_LAC_DT': {'ir2504': 'IR2504_SCR'},
+    # SCR and eligible own funds feed the MCR
+    'IR2801_MCR_Non_Life': {'ir2504': 'IR2504_SCR', 'ir2301': 'IR2301_Own_Funds'},
+    'IR2802_MCR_Composite': {'ir2504': 'IR2504_SCR', 'ir2301': 'IR2301_Own_Funds'},
+}
+
+QRT_BUILD_GRAPH = QRTBuildGraph(QRT_GENERATORS, QRT_INPUTS)
+
 
-    return templates
+def generate_qrts(templates=None, seed=42, max_workers=1):
+    """
+    Generate the requested QRT templates.
+
+    Only the requested templates and the templates they take inputs from are
+    built and each upstream template is generated once. Independent templates
+    run in parallel worker processes when max_workers is not 1.
+
+    Args:
+        templates: Template names or codes, e.g. ['IR2504', 'IR2301_Own_Funds']
+            (None: all templates)
+        seed: Random seed; each template is seeded from it and its code
+        max_workers: Worker processes (default 1: in-process; None: CPU count)
+
+    Returns:
+        dict: Requested template names as keys and DataFrames as values.
+    """
+    return QRT_BUILD_GRAPH.build(templates, seed=seed, max_workers=max_workers)
+
+
+def generate_all_qrts(seed=42, max_workers=1):
+    """
+    Generate all actuarial-focused QRT templates and return as a dictionary of DataFrames.
+
+    Args:
+        seed: Random seed
+        max_workers: Worker processes (default 1: in-process; None: CPU count)
+
+    Returns:
+        dict: Dictionary with template names as keys and DataFrames as values.
+    """
+    return generate_qrts(None, seed=seed, max_workers=max_workers)
 
 
 # Actuarial-focused template mapping
@@ -279,6 +350,11 @@ QRT_TEMPLATE_MAP = {
 
 __all__ = [
     'generate_all_qrts',
+    'generate_qrts',
+    'QRT_GENERATORS',
+    'QRT_INPUTS',
+    'QRT_BUILD_GRAPH',
+    'QRTBuildGraph',
     'QRT_TEMPLATE_MAP',
     # Shared configuration
     'UNDERTAKINGS',
@@ -7,18 +7,18 @@ Templates:
 - IR0201: Balance Sheet
 - IR0202: Assets and Liabilities by Currency
 - IR0203: Branch Balance Sheet Information
+
+Every generator takes an optional numpy Generator (rng). Without one it uses
+template_rng(<template code>), so a template's output does not depend on
+import order or on which other templates were generated first.
 """
 
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import random
 from typing import Dict, List, Optional
 import string
 
-# Set random seed for reproducibility
-np.random.seed(42)
-random.seed(42)
 
 # ============================================================================
 # Configuration
@@ -32,10 +32,14 @@ UNDERTAKINGS = [
     {'lei': '549300ABCDE678901F2', 'name': "Lloyd's Syndicate 623", 'type': 'Non-Life'},
 ]
 
+# Root seed of the per-template random generators (see template_rng)
+DEFAULT_SEED = 42
+
 REPORTING_DATE = '2024-12-31'
 PREVIOUS_REPORTING_DATE = '2023-12-31'
 CURRENCIES = ['GBP', 'USD', 'EUR', 'JPY', 'CHF', 'AUD', 'CAD']
 COUNTRIES = ['GB', 'US', 'DE', 'FR', 'JP', 'CH', 'AU', 'CA', 'IE', 'LU', 'NL', 'IT', 'ES']
+LEI_CHARACTERS = string.ascii_uppercase + string.digits
 
 NON_LIFE_LOB = [
     'Medical expense insurance',
@@ -69,94 +73,134 @@ LIFE_LOB = [
 # Helper Functions
 # ============================================================================
 
-def generate_lei():
+def template_rng(template: str, seed: int = DEFAULT_SEED) -> np.random.Generator:
+    """
+    Random generator of one template, derived from a root seed and the template
+    code (e.g. 'IR0201') via SeedSequence, so every template has its own stream
+    whatever else is generated before, after or alongside it.
+    """
+    return np.random.default_rng(np.random.SeedSequence([seed, int.from_bytes(template.encode(), 'little')]))
+
+def random_choice(rng: np.random.Generator, options):
+    """Pick one of the options (keeps the option's own Python type)"""
+    return options[rng.integers(len(options))]
+
+def random_int(rng: np.random.Generator, min_val: int, max_val: int) -> int:
+    """Generate a random integer between min_val and max_val inclusive"""
+    return int(rng.integers(min_val, max_val + 1))
+
+def generate_lei(rng: np.random.Generator):
     """Generate a random LEI code"""
-    return '549300' + ''.join(random.choices(string.ascii_uppercase + string.digits, k=14))
+    return '549300' + ''.join(random_choice(rng, LEI_CHARACTERS) for _ in range(14))
 
-def random_amount(min_val: float, max_val: float, precision: int = 2) -> float:
+def random_amount(rng: np.random.Generator, min_val: float, max_val: float, precision: int = 2) -> float:
     """Generate a random monetary amount"""
-    return round(np.random.uniform(min_val, max_val), precision)
+    return round(rng.uniform(min_val, max_val), precision)
 
-def random_percentage(min_val: float = 0, max_val: float = 100) -> float:
+def random_percentage(rng: np.random.Generator, min_val: float = 0, max_val: float = 100) -> float:
     """Generate a random percentage"""
-    return round(np.random.uniform(min_val, max_val), 4)
+    return round(rng.uniform(min_val, max_val), 4)
+
+def values_by_lei(df: Optional[pd.DataFrame], column: str) -> Optional[Dict[str, float]]:
+    """Per-undertaking total of an upstream template column (None without the template)"""
+    if df is None:
+        return None
+    return df.groupby('LEI')[column].sum().to_dict()
 
 
 # ============================================================================
 # IR0201 - Balance Sheet
 # ============================================================================
 
-def generate_ir0201_balance_sheet():
+def generate_ir0201_balance_sheet(ir1201: Optional[pd.DataFrame] = None,
+                                  ir1701: Optional[pd.DataFrame] = None,
+                                  rng: Optional[np.random.Generator] = None):
     """
     IR0201 - Balance Sheet
     Solvency II balance sheet with assets and liabilities at fair value.
+
+    Life and non-life technical provisions are taken from IR1201 and IR1701
+    when those templates are given.
     """
+    rng = rng if rng is not None else template_rng('IR0201')
     data = []
+    tp_life = values_by_lei(ir1201, 'TP_Gross')
+    rm_life = values_by_lei(ir1201, 'Risk_Margin')
+    tp_non_life = values_by_lei(ir1701, 'TP_Gross')
+    rm_non_life = values_by_lei(ir1701, 'Risk_Margin')
 
     for undertaking in UNDERTAKINGS:
         # Assets
-        total_investments = random_amount(500_000_000, 2_000_000_000)
+        total_investments = random_amount(rng, 500_000_000, 2_000_000_000)
 
         row = {
             'LEI': undertaking['lei'],
             'Undertaking_Name': undertaking['name'],
             'Reporting_Date': REPORTING_DATE,
             # Assets
-            'Goodwill': random_amount(0, 5_000_000),
-            'Deferred_Acquisition_Costs': random_amount(10_000_000, 50_000_000),
-            'Intangible_Assets': random_amount(1_000_000, 20_000_000),
-            'Deferred_Tax_Assets': random_amount(5_000_000, 30_000_000),
-            'Pension_Benefit_Surplus': random_amount(0, 10_000_000),
-            'Property_Plant_Equipment': random_amount(5_000_000, 50_000_000),
-            'Investments_Property': random_amount(20_000_000, 100_000_000),
-            'Holdings_Related_Undertakings': random_amount(0, 50_000_000),
-            'Equities_Listed': random_amount(50_000_000, 200_000_000),
-            'Equities_Unlisted': random_amount(10_000_000, 50_000_000),
-            'Bonds_Government': random_amount(100_000_000, 500_000_000),
-            'Bonds_Corporate': random_amount(100_000_000, 400_000_000),
-            'Bonds_Structured_Notes': random_amount(20_000_000, 100_000_000),
-            'Bonds_Collateralised': random_amount(10_000_000, 50_000_000),
-            'Collective_Investment_Undertakings': random_amount(50_000_000, 200_000_000),
-            'Derivatives': random_amount(5_000_000, 50_000_000),
-            'Deposits_Other_Than_Cash': random_amount(10_000_000, 50_000_000),
-            'Other_Investments': random_amount(5_000_000, 30_000_000),
-            'Assets_Index_Unit_Linked': random_amount(0, 100_000_000),
-            'Loans_And_Mortgages': random_amount(10_000_000, 50_000_000),
-            'Reinsurance_Recoverables_Non_Life': random_amount(50_000_000, 200_000_000),
-            'Reinsurance_Recoverables_Life': random_amount(10_000_000, 50_000_000),
-            'Reinsurance_Recoverables_Health': random_amount(5_000_000, 20_000_000),
-            'Deposits_To_Cedants': random_amount(5_000_000, 30_000_000),
-            'Insurance_Receivables': random_amount(50_000_000, 150_000_000),
-            'Reinsurance_Receivables': random_amount(20_000_000, 80_000_000),
-            'Receivables_Trade': random_amount(5_000_000, 30_000_000),
-            'Own_Shares': random_amount(0, 5_000_000),
-            'Amounts_Due_Own_Fund_Items': random_amount(0, 10_000_000),
-            'Cash_And_Cash_Equivalents': random_amount(20_000_000, 100_000_000),
-            'Any_Other_Assets': random_amount(5_000_000, 30_000_000),
+            'Goodwill': random_amount(rng, 0, 5_000_000),
+            'Deferred_Acquisition_Costs': random_amount(rng, 10_000_000, 50_000_000),
+            'Intangible_Assets': random_amount(rng, 1_000_000, 20_000_000),
+            'Deferred_Tax_Assets': random_amount(rng, 5_000_000, 30_000_000),
+            'Pension_Benefit_Surplus': random_amount(rng, 0, 10_000_000),
+            'Property_Plant_Equipment': random_amount(rng, 5_000_000, 50_000_000),
+            'Investments_Property': random_amount(rng, 20_000_000, 100_000_000),
+            'Holdings_Related_Undertakings': random_amount(rng, 0, 50_000_000),
+            'Equities_Listed': random_amount(rng, 50_000_000, 200_000_000),
+            'Equities_Unlisted': random_amount(rng, 10_000_000, 50_000_000),
+            'Bonds_Government': random_amount(rng, 100_000_000, 500_000_000),
+            'Bonds_Corporate': random_amount(rng, 100_000_000, 400_000_000),
+            'Bonds_Structured_Notes': random_amount(rng, 20_000_000, 100_000_000),
+            'Bonds_Collateralised': random_amount(rng, 10_000_000, 50_000_000),
+            'Collective_Investment_Undertakings': random_amount(rng, 50_000_000, 200_000_000),
+            'Derivatives': random_amount(rng, 5_000_000, 50_000_000),
+            'Deposits_Other_Than_Cash': random_amount(rng, 10_000_000, 50_000_000),
+            'Other_Investments': random_amount(rng, 5_000_000, 30_000_000),
+            'Assets_Index_Unit_Linked': random_amount(rng, 0, 100_000_000),
+            'Loans_And_Mortgages': random_amount(rng, 10_000_000, 50_000_000),
+            'Reinsurance_Recoverables_Non_Life': random_amount(rng, 50_000_000, 200_000_000),
+            'Reinsurance_Recoverables_Life': random_amount(rng, 10_000_000, 50_000_000),
+            'Reinsurance_Recoverables_Health': random_amount(rng, 5_000_000, 20_000_000),
+            'Deposits_To_Cedants': random_amount(rng, 5_000_000, 30_000_000),
+            'Insurance_Receivables': random_amount(rng, 50_000_000, 150_000_000),
+            'Reinsurance_Receivables': random_amount(rng, 20_000_000, 80_000_000),
+            'Receivables_Trade': random_amount(rng, 5_000_000, 30_000_000),
+            'Own_Shares': random_amount(rng, 0, 5_000_000),
+            'Amounts_Due_Own_Fund_Items': random_amount(rng, 0, 10_000_000),
+            'Cash_And_Cash_Equivalents': random_amount(rng, 20_000_000, 100_000_000),
+            'Any_Other_Assets': random_amount(rng, 5_000_000, 30_000_000),
             # Liabilities
-            'Technical_Provisions_Non_Life': random_amount(200_000_000, 800_000_000),
-            'Technical_Provisions_Non_Life_Gross': random_amount(250_000_000, 900_000_000),
-            'Technical_Provisions_Non_Life_RM': random_amount(20_000_000, 80_000_000),
-            'Technical_Provisions_Life': random_amount(50_000_000, 300_000_000),
-            'Technical_Provisions_Life_Gross': random_amount(60_000_000, 350_000_000),
-            'Technical_Provisions_Life_RM': random_amount(5_000_000, 30_000_000),
-            'Technical_Provisions_Index_Linked': random_amount(0, 100_000_000),
-            'Technical_Provisions_Health': random_amount(10_000_000, 50_000_000),
-            'Contingent_Liabilities': random_amount(0, 20_000_000),
-            'Provisions_Other_Than_TP': random_amount(5_000_000, 30_000_000),
-            'Pension_Benefit_Obligations': random_amount(10_000_000, 50_000_000),
-            'Deposits_From_Reinsurers': random_amount(10_000_000, 50_000_000),
-            'Deferred_Tax_Liabilities': random_amount(5_000_000, 40_000_000),
-            'Derivatives_Liabilities': random_amount(2_000_000, 20_000_000),
-            'Debts_Owed_Credit_Institutions': random_amount(0, 50_000_000),
-            'Financial_Liabilities_Other': random_amount(5_000_000, 30_000_000),
-            'Insurance_Payables': random_amount(20_000_000, 80_000_000),
-            'Reinsurance_Payables': random_amount(10_000_000, 50_000_000),
-            'Payables_Trade': random_amount(10_000_000, 40_000_000),
-            'Subordinated_Liabilities': random_amount(0, 100_000_000),
-            'Any_Other_Liabilities': random_amount(5_000_000, 30_000_000),
+            'Technical_Provisions_Non_Life': random_amount(rng, 200_000_000, 800_000_000),
+            'Technical_Provisions_Non_Life_Gross': random_amount(rng, 250_000_000, 900_000_000),
+            'Technical_Provisions_Non_Life_RM': random_amount(rng, 20_000_000, 80_000_000),
+            'Technical_Provisions_Life': random_amount(rng, 50_000_000, 300_000_000),
+            'Technical_Provisions_Life_Gross': random_amount(rng, 60_000_000, 350_000_000),
+            'Technical_Provisions_Life_RM': random_amount(rng, 5_000_000, 30_000_000),
+            'Technical_Provisions_Index_Linked': random_amount(rng, 0, 100_000_000),
+            'Technical_Provisions_Health': random_amount(rng, 10_000_000, 50_000_000),
+            'Contingent_Liabilities': random_amount(rng, 0, 20_000_000),
+            'Provisions_Other_Than_TP': random_amount(rng, 5_000_000, 30_000_000),
+            'Pension_Benefit_Obligations': random_amount(rng, 10_000_000, 50_000_000),
+            'Deposits_From_Reinsurers': random_amount(rng, 10_000_000, 50_000_000),
+            'Deferred_Tax_Liabilities': random_amount(rng, 5_000_000, 40_000_000),
+            'Derivatives_Liabilities': random_amount(rng, 2_000_000, 20_000_000),
+            'Debts_Owed_Credit_Institutions': random_amount(rng, 0, 50_000_000),
+            'Financial_Liabilities_Other': random_amount(rng, 5_000_000, 30_000_000),
+            'Insurance_Payables': random_amount(rng, 20_000_000, 80_000_000),
+            'Reinsurance_Payables': random_amount(rng, 10_000_000, 50_000_000),
+            'Payables_Trade': random_amount(rng, 10_000_000, 40_000_000),
+            'Subordinated_Liabilities': random_amount(rng, 0, 100_000_000),
+            'Any_Other_Liabilities': random_amount(rng, 5_000_000, 30_000_000),
         }
 
+        lei = undertaking['lei']
+        if tp_non_life is not None:
+            row['Technical_Provisions_Non_Life'] = tp_non_life.get(lei, 0.0)
+            row['Technical_Provisions_Non_Life_RM'] = rm_non_life.get(lei, 0.0)
+        if tp_life is not None:
+            row['Technical_Provisions_Life'] = tp_life.get(lei, 0.0)
+            row['Technical_Provisions_Life_RM'] = rm_life.get(lei, 0.0)
+
         # Calculate totals
         asset_cols = [c for c in row.keys() if c not in ['LEI', 'Undertaking_Name', 'Reporting_Date']
                       and not c.startswith('Technical_Provisions') and not c.startswith('Contingent')
@@ -188,16 +232,17 @@ def generate_ir0201_balance_sheet():
 # IR0202 - Assets and Liabilities by Currency
 # ============================================================================
 
-def generate_ir0202_assets_liabilities_by_currency():
+def generate_ir0202_assets_liabilities_by_currency(rng: Optional[np.random.Generator] = None):
     """
     IR0202 - Assets and Liabilities by Currency
     Breakdown of balance sheet items by reporting currency.
     """
+    rng = rng if rng is not None else template_rng('IR0202')
     data = []
 
     for undertaking in UNDERTAKINGS:
-        total_assets = random_amount(800_000_000, 2_500_000_000)
-        total_liabilities = random_amount(600_000_000, 2_000_000_000)
+        total_assets = random_amount(rng, 800_000_000, 2_500_000_000)
+        total_liabilities = random_amount(rng, 600_000_000, 2_000_000_000)
 
         # Distribute across currencies
         currency_weights = {
@@ -211,8 +256,8 @@ def generate_ir0202_assets_liabilities_by_currency():
         }
 
         for currency, weight in currency_weights.items():
-            currency_assets = total_assets * weight * np.random.uniform(0.8, 1.2)
-            currency_liabilities = total_liabilities * weight * np.random.uniform(0.8, 1.2)
+            currency_assets = total_assets * weight * rng.uniform(0.8, 1.2)
+            currency_liabilities = total_liabilities * weight * rng.uniform(0.8, 1.2)
 
             row = {
                 'LEI': undertaking['lei'],
@@ -220,21 +265,21 @@ def generate_ir0202_assets_liabilities_by_currency():
                 'Reporting_Date': REPORTING_DATE,
                 'Currency': currency,
                 'Currency_Weight': round(weight * 100, 2),
-                'Investments_Bonds': random_amount(currency_assets * 0.3, currency_assets * 0.5),
-                'Investments_Equity': random_amount(currency_assets * 0.1, currency_assets * 0.2),
-                'Investments_Property': random_amount(currency_assets * 0.02, currency_assets * 0.08),
-                'Investments_CIU': random_amount(currency_assets * 0.05, currency_assets * 0.15),
-                'Investments_Derivatives': random_amount(currency_assets * 0.01, currency_assets * 0.05),
-                'Investments_Other': random_amount(currency_assets * 0.02, currency_assets * 0.08),
-                'Reinsurance_Recoverables': random_amount(currency_assets * 0.05, currency_assets * 0.15),
-                'Cash_And_Equivalents': random_amount(currency_assets * 0.02, currency_assets * 0.08),
-                'Other_Assets': random_amount(currency_assets * 0.03, currency_assets * 0.1),
+                'Investments_Bonds': random_amount(rng, currency_assets * 0.3, currency_assets * 0.5),
+                'Investments_Equity': random_amount(rng, currency_assets * 0.1, currency_assets * 0.2),
+                'Investments_Property': random_amount(rng, currency_assets * 0.02, currency_assets * 0.08),
+                'Investments_CIU': random_amount(rng, currency_assets * 0.05, currency_assets * 0.15),
+                'Investments_Derivatives': random_amount(rng, currency_assets * 0.01, currency_assets * 0.05),
+                'Investments_Other': random_amount(rng, currency_assets * 0.02, currency_assets * 0.08),
+                'Reinsurance_Recoverables': random_amount(rng, currency_assets * 0.05, currency_assets * 0.15),
+                'Cash_And_Equivalents': random_amount(rng, currency_assets * 0.02, currency_assets * 0.08),
+                'Other_Assets': random_amount(rng, currency_assets * 0.03, currency_assets * 0.1),
                 'Total_Assets': round(currency_assets, 2),
-                'TP_Non_Life': random_amount(currency_liabilities * 0.4, currency_liabilities * 0.6),
-                'TP_Life': random_amount(currency_liabilities * 0.1, currency_liabilities * 0.2),
-                'TP_Health': random_amount(currency_liabilities * 0.02, currency_liabilities * 0.08),
-                'Financial_Liabilities': random_amount(currency_liabilities * 0.05, currency_liabilities * 0.15),
-                'Other_Liabilities': random_amount(currency_liabilities * 0.05, currency_liabilities * 0.15),
+                'TP_Non_Life': random_amount(rng, currency_liabilities * 0.4, currency_liabilities * 0.6),
+                'TP_Life': random_amount(rng, currency_liabilities * 0.1, currency_liabilities * 0.2),
+                'TP_Health': random_amount(rng, currency_liabilities * 0.02, currency_liabilities * 0.08),
+                'Financial_Liabilities': random_amount(rng, currency_liabilities * 0.05, currency_liabilities * 0.15),
+                'Other_Liabilities': random_amount(rng, currency_liabilities * 0.05, currency_liabilities * 0.15),
                 'Total_Liabilities': round(currency_liabilities, 2),
                 'Net_Position': round(currency_assets - currency_liabilities, 2),
             }
@@ -247,11 +292,12 @@ def generate_ir0202_assets_liabilities_by_currency():
 # IR0203 - Branch Balance Sheet Information
 # ============================================================================
 
-def generate_ir0203_branch_balance_sheet():
+def generate_ir0203_branch_balance_sheet(rng: Optional[np.random.Generator] = None):
     """
     IR0203 - Additional Branch Balance Sheet Information
     Balance sheet breakdown by branch/jurisdiction.
     """
+    rng = rng if rng is not None else template_rng('IR0203')
     data = []
 
     branches = [
@@ -264,7 +310,7 @@ def generate_ir0203_branch_balance_sheet():
 
     for undertaking in UNDERTAKINGS:
         for country_code, branch_name in branches:
-            weight = 0.6 if country_code == 'GB' else np.random.uniform(0.05, 0.15)
+            weight = 0.6 if country_code == 'GB' else rng.uniform(0.05, 0.15)
 
             row = {
                 'LEI': undertaking['lei'],
@@ -272,17 +318,17 @@ def generate_ir0203_branch_balance_sheet():
                 'Reporting_Date': REPORTING_DATE,
                 'Branch_Country': country_code,
                 'Branch_Name': branch_name,
-                'Branch_LEI': generate_lei() if country_code != 'GB' else undertaking['lei'],
-                'Assets_Investments': random_amount(50_000_000 * weight, 500_000_000 * weight),
-                'Assets_Reinsurance_Recoverables': random_amount(10_000_000 * weight, 100_000_000 * weight),
-                'Assets_Receivables': random_amount(5_000_000 * weight, 50_000_000 * weight),
-                'Assets_Cash': random_amount(2_000_000 * weight, 30_000_000 * weight),
-                'Assets_Other': random_amount(1_000_000 * weight, 20_000_000 * weight),
-                'Liabilities_TP': random_amount(30_000_000 * weight, 400_000_000 * weight),
-                'Liabilities_Other': random_amount(5_000_000 * weight, 50_000_000 * weight),
-                'Own_Funds_Allocated': random_amount(20_000_000 * weight, 150_000_000 * weight),
-                'SCR_Allocated': random_amount(15_000_000 * weight, 120_000_000 * weight),
-                'MCR_Allocated': random_amount(5_000_000 * weight, 40_000_000 * weight),
+                'Branch_LEI': generate_lei(rng) if country_code != 'GB' else undertaking['lei'],
+                'Assets_Investments': random_amount(rng, 50_000_000 * weight, 500_000_000 * weight),
+                'Assets_Reinsurance_Recoverables': random_amount(rng, 10_000_000 * weight, 100_000_000 * weight),
+                'Assets_Receivables': random_amount(rng, 5_000_000 * weight, 50_000_000 * weight),
+                'Assets_Cash': random_amount(rng, 2_000_000 * weight, 30_000_000 * weight),
+                'Assets_Other': random_amount(rng, 1_000_000 * weight, 20_000_000 * weight),
+                'Liabilities_TP': random_amount(rng, 30_000_000 * weight, 400_000_000 * weight),
+                'Liabilities_Other': random_amount(rng, 5_000_000 * weight, 50_000_000 * weight),
+                'Own_Funds_Allocated': random_amount(rng, 20_000_000 * weight, 150_000_000 * weight),
+                'SCR_Allocated': random_amount(rng, 15_000_000 * weight, 120_000_000 * weight),
+                'MCR_Allocated': random_amount(rng, 5_000_000 * weight, 40_000_000 * weight),
             }
 
             row['Total_Assets'] = (row['Assets_Investments'] + row['Assets_Reinsurance_Recoverables'] +
@@ -308,4 +354,9 @@ __all__ = [
     'generate_lei',
     'random_amount',
     'random_percentage',
+    'random_choice',
+    'random_int',
+    'template_rng',
+    'values_by_lei',
+    'DEFAULT_SEED',
 ]
@@ -12,28 +12,24 @@ Templates:
 import pandas as pd
 import numpy as np
 from datetime import datetime
-import random
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from .qrt_balance_sheet import (
-    UNDERTAKINGS, REPORTING_DATE, NON_LIFE_LOB,
-    random_amount, random_percentage
+    UNDERTAKINGS, REPORTING_DATE, NON_LIFE_LOB, random_amount, random_percentage,
+    random_choice, random_int, template_rng
 )
 
-# Set random seed for reproducibility
-np.random.seed(42)
-random.seed(42)
-
 
 # ============================================================================
 # IR1901 - Non-Life Insurance Claims
 # ============================================================================
 
-def generate_ir1901_non_life_claims():
+def generate_ir1901_non_life_claims(rng: Optional[np.random.Generator] = None):
     """
     IR1901 - Non-Life Insurance Claims
     Claims triangles and development analysis for non-life insurance.
     """
+    rng = rng if rng is not None else template_rng('IR1901')
     data = []
 
     accident_years = list(range(2014, 2025))  # 11 years of development
@@ -41,7 +37,7 @@ def generate_ir1901_non_life_claims():
 
     for undertaking in UNDERTAKINGS:
         for lob in NON_LIFE_LOB[:8]:
-            ultimate_by_ay = {ay: random_amount(20_000_000, 150_000_000) for ay in accident_years}
+            ultimate_by_ay = {ay: random_amount(rng, 20_000_000, 150_000_000) for ay in accident_years}
 
             for accident_year in accident_years:
                 ultimate = ultimate_by_ay[accident_year]
@@ -63,7 +59,7 @@ def generate_ir1901_non_life_claims():
                         cum_pct = min(1.0, 0.92 + 0.015 * (dev_year - 4))
 
                     # Add some randomness
-                    cum_pct *= np.random.uniform(0.95, 1.05)
+                    cum_pct *= rng.uniform(0.95, 1.05)
 
                     row = {
                         'LEI': undertaking['lei'],
@@ -79,12 +75,12 @@ def generate_ir1901_non_life_claims():
                         'IBNR': round(ultimate * (1 - cum_pct) * 0.4, 2),
                         'Incurred_Claims': round(ultimate * (cum_pct + (1 - cum_pct) * 0.7), 2),
                         'Ultimate_Claims': round(ultimate, 2),
-                        'Reinsurance_Recoveries_Paid': round(ultimate * cum_pct * np.random.uniform(0.15, 0.30), 2),
-                        'Reinsurance_Recoveries_Outstanding': round(ultimate * (1 - cum_pct) * np.random.uniform(0.15, 0.30), 2),
-                        'Net_Claims_Paid': round(ultimate * cum_pct * np.random.uniform(0.70, 0.85), 2),
-                        'Net_Ultimate': round(ultimate * np.random.uniform(0.70, 0.85), 2),
-                        'Claim_Count': random.randint(50, 2000),
-                        'Average_Claim_Size': round(ultimate * cum_pct / max(1, random.randint(50, 2000)), 2),
+                        'Reinsurance_Recoveries_Paid': round(ultimate * cum_pct * rng.uniform(0.15, 0.30), 2),
+                        'Reinsurance_Recoveries_Outstanding': round(ultimate * (1 - cum_pct) * rng.uniform(0.15, 0.30), 2),
+                        'Net_Claims_Paid': round(ultimate * cum_pct * rng.uniform(0.70, 0.85), 2),
+                        'Net_Ultimate': round(ultimate * rng.uniform(0.70, 0.85), 2),
+                        'Claim_Count': random_int(rng, 50, 2000),
+                        'Average_Claim_Size': round(ultimate * cum_pct / max(1, random_int(rng, 50, 2000)), 2),
                     }
                     data.append(row)
 
@@ -95,11 +91,12 @@ def generate_ir1901_non_life_claims():
 # IR1902 - Non-Life Claim Development - General Liability Sub-classes
 # ============================================================================
 
-def generate_ir1902_gl_claims_development():
+def generate_ir1902_gl_claims_development(rng: Optional[np.random.Generator] = None):
     """
     IR1902 - Non-Life Claim Development - General Liability Sub-classes
     Detailed claims triangles for general liability lines.
     """
+    rng = rng if rng is not None else template_rng('IR1902')
     data = []
 
     gl_subclasses = [
@@ -115,7 +112,7 @@ def generate_ir1902_gl_claims_development():
 
     for undertaking in UNDERTAKINGS:
         for subclass in gl_subclasses:
-            ultimate_by_ay = {ay: random_amount(10_000_000, 80_000_000) for ay in accident_years}
+            ultimate_by_ay = {ay: random_amount(rng, 10_000_000, 80_000_000) for ay in accident_years}
 
             for accident_year in accident_years:
                 ultimate = ultimate_by_ay[accident_year]
@@ -146,7 +143,7 @@ def generate_ir1902_gl_claims_development():
                     else:
                         cum_pct = min(1.0, 0.92 + 0.015 * (dev_year - 9))
 
-                    cum_pct *= np.random.uniform(0.93, 1.07)
+                    cum_pct *= rng.uniform(0.93, 1.07)
 
                     row = {
                         'LEI': undertaking['lei'],
@@ -164,20 +161,20 @@ def generate_ir1902_gl_claims_development():
                         'Gross_Incurred': round(ultimate * (cum_pct + (1 - cum_pct) * 0.65), 2),
                         'Gross_Ultimate': round(ultimate, 2),
                         # Reinsurance
-                        'RI_Paid': round(ultimate * cum_pct * np.random.uniform(0.20, 0.40), 2),
-                        'RI_Outstanding': round(ultimate * (1 - cum_pct) * np.random.uniform(0.20, 0.40), 2),
+                        'RI_Paid': round(ultimate * cum_pct * rng.uniform(0.20, 0.40), 2),
+                        'RI_Outstanding': round(ultimate * (1 - cum_pct) * rng.uniform(0.20, 0.40), 2),
                         # Net
-                        'Net_Paid_Cumulative': round(ultimate * cum_pct * np.random.uniform(0.60, 0.80), 2),
-                        'Net_Incurred': round(ultimate * (cum_pct + (1 - cum_pct) * 0.65) * np.random.uniform(0.60, 0.80), 2),
-                        'Net_Ultimate': round(ultimate * np.random.uniform(0.60, 0.80), 2),
+                        'Net_Paid_Cumulative': round(ultimate * cum_pct * rng.uniform(0.60, 0.80), 2),
+                        'Net_Incurred': round(ultimate * (cum_pct + (1 - cum_pct) * 0.65) * rng.uniform(0.60, 0.80), 2),
+                        'Net_Ultimate': round(ultimate * rng.uniform(0.60, 0.80), 2),
                         # Large Claims
-                        'Large_Claims_Count': random.randint(1, 20),
-                        'Large_Claims_Amount': round(ultimate * np.random.uniform(0.20, 0.50), 2),
+                        'Large_Claims_Count': random_int(rng, 1, 20),
+                        'Large_Claims_Amount': round(ultimate * rng.uniform(0.20, 0.50), 2),
                         'Large_Claims_Threshold': 1_000_000,
                         # Claim Stats
-                        'Total_Claim_Count': random.randint(100, 3000),
-                        'Open_Claims': random.randint(10, 500),
-                        'Closed_Claims': random.randint(90, 2500),
+                        'Total_Claim_Count': random_int(rng, 100, 3000),
+                        'Open_Claims': random_int(rng, 10, 500),
+                        'Closed_Claims': random_int(rng, 90, 2500),
                     }
                     data.append(row)
 
@@ -188,11 +185,12 @@ def generate_ir1902_gl_claims_development():
 # IR2001 - Development of the Distribution of the Claims Incurred
 # ============================================================================
 
-def generate_ir2001_claims_distribution():
+def generate_ir2001_claims_distribution(rng: Optional[np.random.Generator] = None):
     """
     IR2001 - Development of the Distribution of the Claims Incurred
     Statistical distribution analysis of claims development.
     """
+    rng = rng if rng is not None else template_rng('IR2001')
     data = []
 
     development_periods = list(range(0, 16))  # 16 development periods
@@ -200,7 +198,7 @@ def generate_ir2001_claims_distribution():
 
     for undertaking in UNDERTAKINGS:
         for lob in NON_LIFE_LOB[:6]:
-            base_ultimate = random_amount(50_000_000, 300_000_000)
+            base_ultimate = random_amount(rng, 50_000_000, 300_000_000)
 
             for dev_period in development_periods:
                 # Generate percentile distribution
@@ -225,23 +223,59 @@ def generate_ir2001_claims_distribution():
                     'CV': round(std_pct / mean_pct if mean_pct > 0 else 0, 4),
                     **percentile_values,
                     'IQR': percentile_values['P75'] - percentile_values['P25'],
-                    'Skewness': round(np.random.uniform(-0.5, 1.5), 4),
-                    'Kurtosis': round(np.random.uniform(2.5, 5.0), 4),
+                    'Skewness': round(rng.uniform(-0.5, 1.5), 4),
+                    'Kurtosis': round(rng.uniform(2.5, 5.0), 4),
                     'Number_Of_Simulations': 10000,
                     'Simulation_Method': 'Bootstrap',
                     # Distribution Parameters
-                    'Distribution_Type': random.choice(['LogNormal', 'Gamma', 'Weibull']),
-                    'Distribution_Param1': round(np.random.uniform(0.5, 2.0), 4),
-                    'Distribution_Param2': round(np.random.uniform(0.1, 1.0), 4),
+                    'Distribution_Type': random_choice(rng, ['LogNormal', 'Gamma', 'Weibull']),
+                    'Distribution_Param1': round(rng.uniform(0.5, 2.0), 4),
+                    'Distribution_Param2': round(rng.uniform(0.1, 1.0), 4),
                 }
                 data.append(row)
 
     return pd.DataFrame(data)
 
 
+# ============================================================================
+# Chain ladder projection of the IR19 triangles
+# ============================================================================
+
+def project_claims_chain_ladder(claims_df=None, value_col='Claims_Paid_Cumulative',
+                                segment_cols=('LEI', 'Line_Of_Business'),
+                                method='volume', n_years=None):
+    """
+    Chain ladder ultimates and IBNR for IR19 claims triangles.
+
+    Projects every undertaking / line of business triangle in one batched pass
+    using the shared chain ladder engine.
+
+    Args:
+        claims_df: IR1901 (or IR1902) output; generated when not supplied
+        value_col: Cumulative column to project
+        segment_cols: Columns identifying each triangle
+        method: LDF averaging method ('volume' or 'simple')
+        n_years: Restrict LDFs to the latest n accident years
+
+    Returns:
+        DataFrame of ultimates and IBNR by segment and accident year
+    """
+    from python_scripts.forms.chain_ladder import ChainLadderEngine
+
+    if claims_df is None:
+        claims_df = generate_ir1901_non_life_claims()
+
+    engine = ChainLadderEngine.from_frame(
+        claims_df, value_col, segment_cols,
+        origin_col='Accident_Year', dev_col='Development_Year'
+    )
+    return engine.ultimates(method, n_years)
+
+
 # Export all functions
 __all__ = [
     'generate_ir1901_non_life_claims',
     'generate_ir1902_gl_claims_development',
     'generate_ir2001_claims_distribution',
+    'project_claims_chain_ladder',
 ]
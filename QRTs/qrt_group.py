@@ -13,28 +13,24 @@ Templates:
 import pandas as pd
 import numpy as np
 from datetime import datetime
-import random
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from .qrt_balance_sheet import (
-    UNDERTAKINGS, REPORTING_DATE, COUNTRIES,
-    random_amount, random_percentage, generate_lei
+    UNDERTAKINGS, REPORTING_DATE, COUNTRIES, random_amount, random_percentage,
+    generate_lei, random_choice, template_rng
 )
 
-# Set random seed for reproducibility
-np.random.seed(42)
-random.seed(42)
-
 
 # ============================================================================
 # IR3201 - Undertakings in the Scope of the Group
 # ============================================================================
 
-def generate_ir3201_group_scope():
+def generate_ir3201_group_scope(rng: Optional[np.random.Generator] = None):
     """
     IR3201 - Undertakings in the Scope of the Group
     List of all undertakings within the group scope.
     """
+    rng = rng if rng is not None else template_rng('IR3201')
     data = []
 
     group_entities = [
@@ -56,7 +52,7 @@ def generate_ir3201_group_scope():
                 'Group_LEI': undertaking['lei'],
                 'Group_Name': undertaking['name'],
                 'Reporting_Date': REPORTING_DATE,
-                'Entity_LEI': generate_lei(),
+                'Entity_LEI': generate_lei(rng),
                 'Entity_Name': f"{undertaking['name']} - {entity_name}",
                 'Entity_Type': entity_type,
                 'Country_Of_Incorporation': country,
@@ -66,12 +62,12 @@ def generate_ir3201_group_scope():
                 'Consolidation_Method': consolidation,
                 'Inclusion_In_Group_SCR': 'Yes' if consolidation in ['Full', 'Proportional'] else 'No',
                 'Solvency_Regime': 'Solvency II' if country in ['GB', 'DE', 'FR', 'IE', 'LU'] else 'Equivalent',
-                'Total_Assets': random_amount(50_000_000, 500_000_000),
-                'Total_Liabilities': random_amount(30_000_000, 400_000_000),
-                'Own_Funds': random_amount(20_000_000, 150_000_000),
-                'SCR': random_amount(10_000_000, 100_000_000),
-                'MCR': random_amount(3_000_000, 35_000_000),
-                'Eligible_OF_For_Group': random_amount(15_000_000, 120_000_000),
+                'Total_Assets': random_amount(rng, 50_000_000, 500_000_000),
+                'Total_Liabilities': random_amount(rng, 30_000_000, 400_000_000),
+                'Own_Funds': random_amount(rng, 20_000_000, 150_000_000),
+                'SCR': random_amount(rng, 10_000_000, 100_000_000),
+                'MCR': random_amount(rng, 3_000_000, 35_000_000),
+                'Eligible_OF_For_Group': random_amount(rng, 15_000_000, 120_000_000),
             }
             data.append(row)
 
@@ -82,11 +78,12 @@ def generate_ir3201_group_scope():
 # IR3301 - Insurance and Reinsurance Individual Requirements
 # ============================================================================
 
-def generate_ir3301_individual_requirements():
+def generate_ir3301_individual_requirements(rng: Optional[np.random.Generator] = None):
     """
     IR3301 - Insurance and Reinsurance Individual Requirements
     Individual capital requirements for each group entity.
     """
+    rng = rng if rng is not None else template_rng('IR3301')
     data = []
 
     for undertaking in UNDERTAKINGS:
@@ -99,25 +96,25 @@ def generate_ir3301_individual_requirements():
         ]
 
         for entity_name, ownership in entities:
-            scr = random_amount(20_000_000, 150_000_000)
-            mcr = scr * np.random.uniform(0.25, 0.35)
-            of = scr * np.random.uniform(1.20, 1.80)
+            scr = random_amount(rng, 20_000_000, 150_000_000)
+            mcr = scr * rng.uniform(0.25, 0.35)
+            of = scr * rng.uniform(1.20, 1.80)
 
             row = {
                 'Group_LEI': undertaking['lei'],
                 'Group_Name': undertaking['name'],
                 'Reporting_Date': REPORTING_DATE,
-                'Entity_LEI': generate_lei(),
+                'Entity_LEI': generate_lei(rng),
                 'Entity_Name': f"{undertaking['name']} - {entity_name}",
                 'Ownership_Percentage': ownership,
                 # Own Funds
-                'Tier_1_Unrestricted': of * np.random.uniform(0.70, 0.85),
-                'Tier_1_Restricted': of * np.random.uniform(0.05, 0.10),
-                'Tier_2': of * np.random.uniform(0.05, 0.15),
-                'Tier_3': of * np.random.uniform(0, 0.05),
+                'Tier_1_Unrestricted': of * rng.uniform(0.70, 0.85),
+                'Tier_1_Restricted': of * rng.uniform(0.05, 0.10),
+                'Tier_2': of * rng.uniform(0.05, 0.15),
+                'Tier_3': of * rng.uniform(0, 0.05),
                 'Total_Own_Funds': of,
                 'Eligible_OF_For_SCR': of,
-                'Eligible_OF_For_MCR': of * np.random.uniform(0.90, 0.98),
+                'Eligible_OF_For_MCR': of * rng.uniform(0.90, 0.98),
                 # Capital Requirements
                 'SCR': scr,
                 'MCR': mcr,
@@ -140,11 +137,12 @@ def generate_ir3301_individual_requirements():
 # IR3401 - Other Regulated and Non-Regulated Financial Undertakings
 # ============================================================================
 
-def generate_ir3401_other_undertakings():
+def generate_ir3401_other_undertakings(rng: Optional[np.random.Generator] = None):
     """
     IR3401 - Other Regulated and Non-Regulated Financial Undertakings
     Capital requirements for non-insurance financial entities in the group.
     """
+    rng = rng if rng is not None else template_rng('IR3401')
     data = []
 
     other_entities = [
@@ -158,27 +156,27 @@ def generate_ir3401_other_undertakings():
 
     for undertaking in UNDERTAKINGS[:3]:
         for entity_type, entity_name, country, regime in other_entities:
-            capital_req = random_amount(5_000_000, 50_000_000) if regime != 'None' else 0
-            own_funds = capital_req * np.random.uniform(1.10, 1.50) if capital_req > 0 else random_amount(1_000_000, 10_000_000)
+            capital_req = random_amount(rng, 5_000_000, 50_000_000) if regime != 'None' else 0
+            own_funds = capital_req * rng.uniform(1.10, 1.50) if capital_req > 0 else random_amount(rng, 1_000_000, 10_000_000)
 
             row = {
                 'Group_LEI': undertaking['lei'],
                 'Group_Name': undertaking['name'],
                 'Reporting_Date': REPORTING_DATE,
-                'Entity_LEI': generate_lei(),
+                'Entity_LEI': generate_lei(rng),
                 'Entity_Name': f"{undertaking['name']} - {entity_name}",
                 'Entity_Type': entity_type,
                 'Country': country,
                 'Regulatory_Regime': regime,
-                'Ownership_Percentage': random.choice([100, 100, 100, 80, 75, 60]),
-                'Total_Assets': random_amount(20_000_000, 200_000_000),
-                'Total_Liabilities': random_amount(10_000_000, 150_000_000),
+                'Ownership_Percentage': random_choice(rng, [100, 100, 100, 80, 75, 60]),
+                'Total_Assets': random_amount(rng, 20_000_000, 200_000_000),
+                'Total_Liabilities': random_amount(rng, 10_000_000, 150_000_000),
                 'Own_Funds': own_funds,
                 'Sectoral_Capital_Requirement': capital_req,
                 'Surplus_Deficit': own_funds - capital_req,
-                'Contribution_To_Group_OF': own_funds * np.random.uniform(0.80, 1.0),
+                'Contribution_To_Group_OF': own_funds * rng.uniform(0.80, 1.0),
                 'Contribution_To_Group_SCR': capital_req,
-                'Deduction_From_Group_OF': random_amount(0, 5_000_000),
+                'Deduction_From_Group_OF': random_amount(rng, 0, 5_000_000),
                 'Treatment_In_Group_Solvency': 'Sectoral Rules' if regime != 'None' else 'Deduction',
             }
             data.append(row)
@@ -190,11 +188,12 @@ def generate_ir3401_other_undertakings():
 # IR3501 - Contribution to Group Technical Provisions
 # ============================================================================
 
-def generate_ir3501_group_tp_contribution():
+def generate_ir3501_group_tp_contribution(rng: Optional[np.random.Generator] = None):
     """
     IR3501 - Contribution to Group Technical Provisions
     Technical provisions contribution from each group entity.
     """
+    rng = rng if rng is not None else template_rng('IR3501')
     data = []
 
     for undertaking in UNDERTAKINGS:
@@ -208,18 +207,18 @@ def generate_ir3501_group_tp_contribution():
 
         for entity_name, ownership, business_type in entities:
             if business_type == 'Life':
-                tp = random_amount(50_000_000, 300_000_000)
+                tp = random_amount(rng, 50_000_000, 300_000_000)
             else:
-                tp = random_amount(100_000_000, 500_000_000)
+                tp = random_amount(rng, 100_000_000, 500_000_000)
 
-            bel = tp * np.random.uniform(0.90, 0.96)
+            bel = tp * rng.uniform(0.90, 0.96)
             rm = tp - bel
 
             row = {
                 'Group_LEI': undertaking['lei'],
                 'Group_Name': undertaking['name'],
                 'Reporting_Date': REPORTING_DATE,
-                'Entity_LEI': generate_lei(),
+                'Entity_LEI': generate_lei(rng),
                 'Entity_Name': f"{undertaking['name']} - {entity_name}",
                 'Business_Type': business_type,
                 'Ownership_Percentage': ownership,
@@ -228,22 +227,22 @@ def generate_ir3501_group_tp_contribution():
                 'Gross_BEL': bel,
                 'Gross_Risk_Margin': rm,
                 # Reinsurance Recoverables
-                'RI_Recoverables_BEL': bel * np.random.uniform(0.10, 0.25),
-                'RI_Recoverables_RM': rm * np.random.uniform(0.05, 0.15),
-                'Total_RI_Recoverables': (bel + rm) * np.random.uniform(0.10, 0.23),
+                'RI_Recoverables_BEL': bel * rng.uniform(0.10, 0.25),
+                'RI_Recoverables_RM': rm * rng.uniform(0.05, 0.15),
+                'Total_RI_Recoverables': (bel + rm) * rng.uniform(0.10, 0.23),
                 # Net TP
-                'Net_TP': tp * np.random.uniform(0.75, 0.88),
-                'Net_BEL': bel * np.random.uniform(0.75, 0.90),
-                'Net_Risk_Margin': rm * np.random.uniform(0.85, 0.95),
+                'Net_TP': tp * rng.uniform(0.75, 0.88),
+                'Net_BEL': bel * rng.uniform(0.75, 0.90),
+                'Net_Risk_Margin': rm * rng.uniform(0.85, 0.95),
                 # Contribution
                 'Contribution_Percentage': ownership,
                 'Contribution_To_Group_Gross_TP': tp * ownership / 100,
-                'Contribution_To_Group_Net_TP': tp * np.random.uniform(0.75, 0.88) * ownership / 100,
+                'Contribution_To_Group_Net_TP': tp * rng.uniform(0.75, 0.88) * ownership / 100,
                 'Contribution_To_Group_RM': rm * ownership / 100,
                 # Intra-Group Eliminations
-                'Intra_Group_RI_Ceded': random_amount(0, tp * 0.15),
-                'Intra_Group_RI_Assumed': random_amount(0, tp * 0.10),
-                'Net_Intra_Group': random_amount(-tp * 0.05, tp * 0.05),
+                'Intra_Group_RI_Ceded': random_amount(rng, 0, tp * 0.15),
+                'Intra_Group_RI_Assumed': random_amount(rng, 0, tp * 0.10),
+                'Net_Intra_Group': random_amount(rng, -tp * 0.05, tp * 0.05),
             }
             data.append(row)
 
@@ -27,63 +27,71 @@ Templates:
 import pandas as pd
 import numpy as np
 from datetime import datetime
-import random
-from typing import Dict, List
+from typing import Dict, List, Optional
 
-from .qrt_balance_sheet import (
-    UNDERTAKINGS, REPORTING_DATE, PREVIOUS_REPORTING_DATE,
-    random_amount, random_percentage, generate_lei
+from lloyds_reporting.scr_aggregation import (
+    CAT_CORRELATION, EQUITY_CORRELATION, NON_LIFE_CORRELATION, PREMIUM_RESERVE_CORRELATION,
+    aggregate, market_risk, standard_formula_scr
 )
 
-# Set random seed for reproducibility
-np.random.seed(42)
-random.seed(42)
+from .qrt_balance_sheet import (
+    UNDERTAKINGS, REPORTING_DATE, PREVIOUS_REPORTING_DATE, random_amount,
+    random_percentage, generate_lei, values_by_lei, random_choice, random_int,
+    template_rng
+)
 
 
 # ============================================================================
 # IR2301 - Own Funds
 # ============================================================================
 
-def generate_ir2301_own_funds():
+def generate_ir2301_own_funds(ir2504: Optional[pd.DataFrame] = None,
+                              rng: Optional[np.random.Generator] = None):
     """
     IR2301 - Own Funds
     Summary of eligible own funds and capital composition.
+
+    The SCR (and so the SCR and MCR ratios) comes from IR2504 when given.
     """
+    rng = rng if rng is not None else template_rng('IR2301')
     data = []
+    scr_by_lei = values_by_lei(ir2504, 'SCR')
 
     for undertaking in UNDERTAKINGS:
-        total_of = random_amount(200_000_000, 800_000_000)
-        scr = random_amount(100_000_000, 400_000_000)
-        mcr = scr * np.random.uniform(0.25, 0.35)
+        total_of = random_amount(rng, 200_000_000, 800_000_000)
+        scr = random_amount(rng, 100_000_000, 400_000_000)
+        if scr_by_lei is not None:
+            scr = scr_by_lei[undertaking['lei']]
+        mcr = scr * rng.uniform(0.25, 0.35)
 
         row = {
             'LEI': undertaking['lei'],
             'Undertaking_Name': undertaking['name'],
             'Reporting_Date': REPORTING_DATE,
             # Basic Own Funds
-            'Ordinary_Share_Capital': random_amount(50_000_000, 200_000_000),
-            'Share_Premium': random_amount(10_000_000, 100_000_000),
-            'Initial_Funds': random_amount(0, 20_000_000),
-            'Subordinated_Mutual_Members_Accounts': random_amount(0, 10_000_000),
-            'Surplus_Funds': random_amount(0, 30_000_000),
-            'Preference_Shares': random_amount(0, 50_000_000),
-            'Reconciliation_Reserve': random_amount(50_000_000, 300_000_000),
-            'Subordinated_Liabilities': random_amount(0, 100_000_000),
-            'Deductions': random_amount(-50_000_000, 0),
-            'Total_Basic_Own_Funds': total_of * np.random.uniform(0.90, 1.0),
+            'Ordinary_Share_Capital': random_amount(rng, 50_000_000, 200_000_000),
+            'Share_Premium': random_amount(rng, 10_000_000, 100_000_000),
+            'Initial_Funds': random_amount(rng, 0, 20_000_000),
+            'Subordinated_Mutual_Members_Accounts': random_amount(rng, 0, 10_000_000),
+            'Surplus_Funds': random_amount(rng, 0, 30_000_000),
+            'Preference_Shares': random_amount(rng, 0, 50_000_000),
+            'Reconciliation_Reserve': random_amount(rng, 50_000_000, 300_000_000),
+            'Subordinated_Liabilities': random_amount(rng, 0, 100_000_000),
+            'Deductions': random_amount(rng, -50_000_000, 0),
+            'Total_Basic_Own_Funds': total_of * rng.uniform(0.90, 1.0),
             # Ancillary Own Funds
-            'Ancillary_Unpaid_Share_Capital': random_amount(0, 20_000_000),
-            'Ancillary_Letters_Of_Credit': random_amount(0, 30_000_000),
-            'Ancillary_Other': random_amount(0, 10_000_000),
-            'Total_Ancillary_Own_Funds': random_amount(0, 60_000_000),
+            'Ancillary_Unpaid_Share_Capital': random_amount(rng, 0, 20_000_000),
+            'Ancillary_Letters_Of_Credit': random_amount(rng, 0, 30_000_000),
+            'Ancillary_Other': random_amount(rng, 0, 10_000_000),
+            'Total_Ancillary_Own_Funds': random_amount(rng, 0, 60_000_000),
             # Eligible Own Funds
             'Eligible_OF_To_Meet_SCR': total_of,
-            'Eligible_OF_To_Meet_MCR': total_of * np.random.uniform(0.85, 0.95),
+            'Eligible_OF_To_Meet_MCR': total_of * rng.uniform(0.85, 0.95),
             # Tier Split
-            'Tier_1_Unrestricted': total_of * np.random.uniform(0.70, 0.85),
-            'Tier_1_Restricted': total_of * np.random.uniform(0.05, 0.15),
-            'Tier_2': total_of * np.random.uniform(0.05, 0.15),
-            'Tier_3': total_of * np.random.uniform(0, 0.05),
+            'Tier_1_Unrestricted': total_of * rng.uniform(0.70, 0.85),
+            'Tier_1_Restricted': total_of * rng.uniform(0.05, 0.15),
+            'Tier_2': total_of * rng.uniform(0.05, 0.15),
+            'Tier_3': total_of * rng.uniform(0, 0.05),
             # Capital Requirements
             'SCR': scr,
             'MCR': mcr,
@@ -100,11 +108,12 @@ def generate_ir2301_own_funds():
 # IR2302 - Detailed Information by Tiers on Own Funds
 # ============================================================================
 
-def generate_ir2302_own_funds_by_tier():
+def generate_ir2302_own_funds_by_tier(rng: Optional[np.random.Generator] = None):
     """
     IR2302 - Detailed Information by Tiers on Own Funds
     Breakdown of own funds by tier and item type.
     """
+    rng = rng if rng is not None else template_rng('IR2302')
     data = []
 
     tier_items = [
@@ -121,7 +130,7 @@ def generate_ir2302_own_funds_by_tier():
     ]
 
     for undertaking in UNDERTAKINGS:
-        total_of = random_amount(200_000_000, 800_000_000)
+        total_of = random_amount(rng, 200_000_000, 800_000_000)
 
         for tier_name, item_name, tier_num, restricted in tier_items:
             weight = {
@@ -137,7 +146,7 @@ def generate_ir2302_own_funds_by_tier():
                 'Subordinated Liabilities (Tier 3)': 0.02,
             }.get(item_name, 0.05)
 
-            amount = total_of * weight * np.random.uniform(0.8, 1.2)
+            amount = total_of * weight * rng.uniform(0.8, 1.2)
 
             row = {
                 'LEI': undertaking['lei'],
@@ -150,8 +159,8 @@ def generate_ir2302_own_funds_by_tier():
                 'Amount': round(amount, 2),
                 'Eligible_For_SCR': round(amount, 2),
                 'Eligible_For_MCR': round(amount * (1 if tier_num <= 2 else 0), 2),
-                'Limit_Applied': random.choice([True, False]),
-                'Limit_Amount': round(amount * 0.2, 2) if random.choice([True, False]) else 0,
+                'Limit_Applied': random_choice(rng, [True, False]),
+                'Limit_Amount': round(amount * 0.2, 2) if random_choice(rng, [True, False]) else 0,
             }
             data.append(row)
 
@@ -162,15 +171,16 @@ def generate_ir2302_own_funds_by_tier():
 # IR2303 - Annual Movements on Own Funds
 # ============================================================================
 
-def generate_ir2303_own_funds_movements():
+def generate_ir2303_own_funds_movements(rng: Optional[np.random.Generator] = None):
     """
     IR2303 - Annual Movements on Own Funds
     Reconciliation of opening to closing own funds.
     """
+    rng = rng if rng is not None else template_rng('IR2303')
     data = []
 
     for undertaking in UNDERTAKINGS:
-        opening_of = random_amount(180_000_000, 750_000_000)
+        opening_of = random_amount(rng, 180_000_000, 750_000_000)
 
         row = {
             'LEI': undertaking['lei'],
@@ -179,29 +189,29 @@ def generate_ir2303_own_funds_movements():
             'Previous_Reporting_Date': PREVIOUS_REPORTING_DATE,
             'Opening_Own_Funds': opening_of,
             # Movements
-            'Profit_Loss_Recognised': random_amount(-50_000_000, 100_000_000),
-            'Dividends_Paid': random_amount(-30_000_000, 0),
-            'Share_Capital_Issued': random_amount(0, 50_000_000),
-            'Share_Capital_Redeemed': random_amount(-20_000_000, 0),
-            'Subordinated_Liabilities_Issued': random_amount(0, 30_000_000),
-            'Subordinated_Liabilities_Redeemed': random_amount(-20_000_000, 0),
-            'Change_In_Revaluation_Reserve': random_amount(-20_000_000, 30_000_000),
-            'Change_In_Pension_Surplus': random_amount(-5_000_000, 5_000_000),
-            'Currency_Translation': random_amount(-10_000_000, 10_000_000),
-            'Change_In_Deferred_Taxes': random_amount(-15_000_000, 15_000_000),
-            'Change_In_TP_Valuation': random_amount(-30_000_000, 30_000_000),
-            'Other_Movements': random_amount(-10_000_000, 10_000_000),
-            'Closing_Own_Funds': opening_of * np.random.uniform(0.95, 1.15),
+            'Profit_Loss_Recognised': random_amount(rng, -50_000_000, 100_000_000),
+            'Dividends_Paid': random_amount(rng, -30_000_000, 0),
+            'Share_Capital_Issued': random_amount(rng, 0, 50_000_000),
+            'Share_Capital_Redeemed': random_amount(rng, -20_000_000, 0),
+            'Subordinated_Liabilities_Issued': random_amount(rng, 0, 30_000_000),
+            'Subordinated_Liabilities_Redeemed': random_amount(rng, -20_000_000, 0),
+            'Change_In_Revaluation_Reserve': random_amount(rng, -20_000_000, 30_000_000),
+            'Change_In_Pension_Surplus': random_amount(rng, -5_000_000, 5_000_000),
+            'Currency_Translation': random_amount(rng, -10_000_000, 10_000_000),
+            'Change_In_Deferred_Taxes': random_amount(rng, -15_000_000, 15_000_000),
+            'Change_In_TP_Valuation': random_amount(rng, -30_000_000, 30_000_000),
+            'Other_Movements': random_amount(rng, -10_000_000, 10_000_000),
+            'Closing_Own_Funds': opening_of * rng.uniform(0.95, 1.15),
             # Tier Movements
             'Tier_1_Opening': opening_of * 0.80,
-            'Tier_1_Movement': random_amount(-20_000_000, 40_000_000),
-            'Tier_1_Closing': opening_of * 0.80 * np.random.uniform(0.95, 1.10),
+            'Tier_1_Movement': random_amount(rng, -20_000_000, 40_000_000),
+            'Tier_1_Closing': opening_of * 0.80 * rng.uniform(0.95, 1.10),
             'Tier_2_Opening': opening_of * 0.15,
-            'Tier_2_Movement': random_amount(-10_000_000, 15_000_000),
-            'Tier_2_Closing': opening_of * 0.15 * np.random.uniform(0.90, 1.15),
+            'Tier_2_Movement': random_amount(rng, -10_000_000, 15_000_000),
+            'Tier_2_Closing': opening_of * 0.15 * rng.uniform(0.90, 1.15),
             'Tier_3_Opening': opening_of * 0.05,
-            'Tier_3_Movement': random_amount(-5_000_000, 5_000_000),
-            'Tier_3_Closing': opening_of * 0.05 * np.random.uniform(0.85, 1.20),
+            'Tier_3_Movement': random_amount(rng, -5_000_000, 5_000_000),
+            'Tier_3_Closing': opening_of * 0.05 * rng.uniform(0.85, 1.20),
         }
         data.append(row)
 
@@ -212,11 +222,12 @@ def generate_ir2303_own_funds_movements():
 # IR2304 - List of Items on Own Funds
 # ============================================================================
 
-def generate_ir2304_own_funds_items():
+def generate_ir2304_own_funds_items(rng: Optional[np.random.Generator] = None):
     """
     IR2304 - List of Items on Own Funds
     Detailed listing of individual own funds items.
     """
+    rng = rng if rng is not None else template_rng('IR2304')
     data = []
 
     item_types = [
@@ -232,26 +243,26 @@ def generate_ir2304_own_funds_items():
 
     for undertaking in UNDERTAKINGS:
         for category, item_name, tier, restricted in item_types:
-            issue_date = f'{random.randint(2010, 2023)}-{random.randint(1,12):02d}-{random.randint(1,28):02d}'
-            maturity_date = f'{random.randint(2025, 2050)}-{random.randint(1,12):02d}-{random.randint(1,28):02d}'
+            issue_date = f'{random_int(rng, 2010, 2023)}-{random_int(rng, 1,12):02d}-{random_int(rng, 1,28):02d}'
+            maturity_date = f'{random_int(rng, 2025, 2050)}-{random_int(rng, 1,12):02d}-{random_int(rng, 1,28):02d}'
 
             row = {
                 'LEI': undertaking['lei'],
                 'Undertaking_Name': undertaking['name'],
                 'Reporting_Date': REPORTING_DATE,
-                'Item_ID': f'OF_{undertaking["lei"][:8]}_{random.randint(1000, 9999)}',
+                'Item_ID': f'OF_{undertaking["lei"][:8]}_{random_int(rng, 1000, 9999)}',
                 'Category': category,
                 'Item_Name': item_name,
                 'Tier': tier,
                 'Restricted': restricted,
                 'Issue_Date': issue_date,
                 'Maturity_Date': maturity_date if 'Sub' in item_name or 'Letter' in item_name else 'Perpetual',
-                'Nominal_Amount': random_amount(10_000_000, 100_000_000),
-                'Solvency_II_Value': random_amount(10_000_000, 100_000_000),
-                'Coupon_Rate': random_percentage(3, 8) if 'Sub' in item_name else 0,
-                'Currency': random.choice(['GBP', 'USD', 'EUR']),
-                'Callable': random.choice([True, False]),
-                'First_Call_Date': maturity_date if random.choice([True, False]) else None,
+                'Nominal_Amount': random_amount(rng, 10_000_000, 100_000_000),
+                'Solvency_II_Value': random_amount(rng, 10_000_000, 100_000_000),
+                'Coupon_Rate': random_percentage(rng, 3, 8) if 'Sub' in item_name else 0,
+                'Currency': random_choice(rng, ['GBP', 'USD', 'EUR']),
+                'Callable': random_choice(rng, [True, False]),
+                'First_Call_Date': maturity_date if random_choice(rng, [True, False]) else None,
                 'Approved_By_PRA': True,
                 'Approval_Date': issue_date,
             }
@@ -264,16 +275,23 @@ def generate_ir2304_own_funds_items():
 # IR2305 - Society of Lloyd's Own Funds and Capital Requirements
 # ============================================================================
 
-def generate_ir2305_lloyds_capital():
+def generate_ir2305_lloyds_capital(ir2504: Optional[pd.DataFrame] = None,
+                                   rng: Optional[np.random.Generator] = None):
     """
     IR2305 - Society of Lloyd's Own Funds and Capital Requirements
     Lloyd's-specific capital requirements and funds at Lloyd's.
+
+    The SCR underlying the ECA comes from IR2504 when given.
     """
+    rng = rng if rng is not None else template_rng('IR2305')
     data = []
+    scr_by_lei = values_by_lei(ir2504, 'SCR')
 
     for undertaking in UNDERTAKINGS:
-        scr = random_amount(100_000_000, 400_000_000)
-        eca = scr * np.random.uniform(1.30, 1.50)
+        scr = random_amount(rng, 100_000_000, 400_000_000)
+        if scr_by_lei is not None:
+            scr = scr_by_lei[undertaking['lei']]
+        eca = scr * rng.uniform(1.30, 1.50)
 
         row = {
             'LEI': undertaking['lei'],
@@ -282,25 +300,25 @@ def generate_ir2305_lloyds_capital():
             'Syndicate_Number': undertaking['name'].split()[-1] if 'Syndicate' in undertaking['name'] else '0000',
             # Funds at Lloyd's
             'FAL_Required': eca,
-            'FAL_Provided': eca * np.random.uniform(1.0, 1.20),
-            'FAL_Surplus_Deficit': eca * np.random.uniform(0, 0.20),
-            'FAL_LOC': random_amount(0, 50_000_000),
-            'FAL_Cash': random_amount(10_000_000, 100_000_000),
-            'FAL_Other_Approved': random_amount(0, 30_000_000),
+            'FAL_Provided': eca * rng.uniform(1.0, 1.20),
+            'FAL_Surplus_Deficit': eca * rng.uniform(0, 0.20),
+            'FAL_LOC': random_amount(rng, 0, 50_000_000),
+            'FAL_Cash': random_amount(rng, 10_000_000, 100_000_000),
+            'FAL_Other_Approved': random_amount(rng, 0, 30_000_000),
             # Economic Capital
             'ECA': eca,
             'SCR': scr,
             'ECA_Over_SCR': round((eca / scr) * 100, 2),
             # Lloyd's Central Fund
-            'Central_Fund_Contribution': random_amount(1_000_000, 10_000_000),
-            'Callable_Layer': random_amount(5_000_000, 30_000_000),
+            'Central_Fund_Contribution': random_amount(rng, 1_000_000, 10_000_000),
+            'Callable_Layer': random_amount(rng, 5_000_000, 30_000_000),
             # Member Capital
-            'Member_Balances': random_amount(50_000_000, 200_000_000),
-            'Member_Deposits': random_amount(20_000_000, 80_000_000),
+            'Member_Balances': random_amount(rng, 50_000_000, 200_000_000),
+            'Member_Deposits': random_amount(rng, 20_000_000, 80_000_000),
             # Capacity
-            'Stamp_Capacity': random_amount(200_000_000, 1_000_000_000),
-            'Premium_Income_Limit': random_amount(150_000_000, 800_000_000),
-            'PIL_Utilisation': random_percentage(60, 95),
+            'Stamp_Capacity': random_amount(rng, 200_000_000, 1_000_000_000),
+            'Premium_Income_Limit': random_amount(rng, 150_000_000, 800_000_000),
+            'PIL_Utilisation': random_percentage(rng, 60, 95),
         }
         data.append(row)
 
@@ -311,56 +329,108 @@ def generate_ir2305_lloyds_capital():
 # IR2504 - Solvency Capital Requirement
 # ============================================================================
 
-def generate_ir2504_scr():
+# IR2504 risk module column -> (IR26 template argument, total column)
+SCR_MODULE_SOURCES = {
+    'Market_Risk': ('ir2601', 'Total_Market_Risk'),
+    'Counterparty_Default_Risk': ('ir2602', 'Total_Counterparty_Risk'),
+    'Life_Underwriting_Risk': ('ir2603', 'Total_Life_Risk'),
+    'Health_Underwriting_Risk': ('ir2604', 'Total_Health_Risk'),
+    'Non_Life_Underwriting_Risk': ('ir2605', 'Total_Non_Life_Risk'),
+    'Operational_Risk': ('ir2606', 'Operational_Risk_SCR'),
+}
+
+# IR2504 risk module columns in BSCR_MODULES order
+BSCR_MODULE_COLUMNS = ['Market_Risk', 'Counterparty_Default_Risk', 'Life_Underwriting_Risk',
+                       'Health_Underwriting_Risk', 'Non_Life_Underwriting_Risk']
+
+
+def generate_ir2504_scr(ir2601: Optional[pd.DataFrame] = None,
+                        ir2602: Optional[pd.DataFrame] = None,
+                        ir2603: Optional[pd.DataFrame] = None,
+                        ir2604: Optional[pd.DataFrame] = None,
+                        ir2605: Optional[pd.DataFrame] = None,
+                        ir2606: Optional[pd.DataFrame] = None,
+                        rng: Optional[np.random.Generator] = None):
     """
     IR2504 - Solvency Capital Requirement
     Summary SCR calculation using standard formula or internal model.
+
+    Risk module charges are taken from the IR26 templates that are given. The
+    Basic SCR aggregates the modules with the standard formula correlation
+    matrix (lloyds_reporting.scr_aggregation) for all undertakings at once;
+    the SCR adds operational risk, the loss-absorbing capacity adjustments
+    and any capital add-on.
     """
+    rng = rng if rng is not None else template_rng('IR2504')
     data = []
+    modules = {'ir2601': ir2601, 'ir2602': ir2602, 'ir2603': ir2603,
+               'ir2604': ir2604, 'ir2605': ir2605, 'ir2606': ir2606}
+    module_values = {
+        column: values_by_lei(modules[argument], source)
+        for column, (argument, source) in SCR_MODULE_SOURCES.items()
+        if modules[argument] is not None
+    }
 
     for undertaking in UNDERTAKINGS:
-        bscr = random_amount(80_000_000, 350_000_000)
+        bscr = random_amount(rng, 80_000_000, 350_000_000)
 
+        # Diversification_BSCR, Basic_SCR and SCR are replaced by the
+        # aggregation below (still drawn so the other columns keep their values)
         row = {
             'LEI': undertaking['lei'],
             'Undertaking_Name': undertaking['name'],
             'Reporting_Date': REPORTING_DATE,
-            'Calculation_Method': random.choice(['Standard Formula', 'Partial Internal Model', 'Full Internal Model']),
+            'Calculation_Method': random_choice(rng, ['Standard Formula', 'Partial Internal Model', 'Full Internal Model']),
             # Risk Modules
-            'Market_Risk': random_amount(30_000_000, 150_000_000),
-            'Counterparty_Default_Risk': random_amount(10_000_000, 50_000_000),
-            'Life_Underwriting_Risk': random_amount(5_000_000, 40_000_000),
-            'Health_Underwriting_Risk': random_amount(5_000_000, 30_000_000),
-            'Non_Life_Underwriting_Risk': random_amount(30_000_000, 150_000_000),
-            'Diversification_BSCR': random_amount(-40_000_000, -15_000_000),
-            'Intangible_Asset_Risk': random_amount(0, 5_000_000),
+            'Market_Risk': random_amount(rng, 30_000_000, 150_000_000),
+            'Counterparty_Default_Risk': random_amount(rng, 10_000_000, 50_000_000),
+            'Life_Underwriting_Risk': random_amount(rng, 5_000_000, 40_000_000),
+            'Health_Underwriting_Risk': random_amount(rng, 5_000_000, 30_000_000),
+            'Non_Life_Underwriting_Risk': random_amount(rng, 30_000_000, 150_000_000),
+            'Diversification_BSCR': random_amount(rng, -40_000_000, -15_000_000),
+            'Intangible_Asset_Risk': random_amount(rng, 0, 5_000_000),
             'Basic_SCR': bscr,
             # Adjustments
-            'Operational_Risk': random_amount(5_000_000, 30_000_000),
-            'LAC_Technical_Provisions': random_amount(-20_000_000, 0),
-            'LAC_Deferred_Taxes': random_amount(-30_000_000, -5_000_000),
+            'Operational_Risk': random_amount(rng, 5_000_000, 30_000_000),
+            'LAC_Technical_Provisions': random_amount(rng, -20_000_000, 0),
+            'LAC_Deferred_Taxes': random_amount(rng, -30_000_000, -5_000_000),
             # Capital Add-ons
-            'Capital_Add_On': random_amount(0, 10_000_000),
+            'Capital_Add_On': random_amount(rng, 0, 10_000_000),
             # Final SCR
-            'SCR': bscr * np.random.uniform(0.90, 1.15),
+            'SCR': bscr * rng.uniform(0.90, 1.15),
             # Other
-            'USP_Applied': random.choice([True, False]),
-            'Simplifications_Used': random.choice([True, False]),
+            'USP_Applied': random_choice(rng, [True, False]),
+            'Simplifications_Used': random_choice(rng, [True, False]),
         }
+
+        for column, values in module_values.items():
+            row[column] = values[undertaking['lei']]
         data.append(row)
 
-    return pd.DataFrame(data)
+    df = pd.DataFrame(data)
+    scr = standard_formula_scr(
+        df[BSCR_MODULE_COLUMNS],
+        operational=df['Operational_Risk'],
+        adjustments=df['LAC_Technical_Provisions'] + df['LAC_Deferred_Taxes'],
+        intangible=df['Intangible_Asset_Risk'],
+        add_on=df['Capital_Add_On'],
+    )
+    df['Diversification_BSCR'] = scr['Diversification']
+    df['Basic_SCR'] = scr['BSCR']
+    df['SCR'] = scr['SCR']
+    return df
 
 
 # ============================================================================
 # IR2505 - SCR - Partial or Full Internal Model Components
 # ============================================================================
 
-def generate_ir2505_scr_internal_model():
+def generate_ir2505_scr_internal_model(rng: Optional[np.random.Generator] = None):
     """
     IR2505 - SCR - Partial or Full Internal Model Components
     Internal model SCR components and comparison with standard formula.
     """
+    rng = rng if rng is not None else template_rng('IR2505')
     data = []
 
     risk_components = [
@@ -382,8 +452,8 @@ def generate_ir2505_scr_internal_model():
 
     for undertaking in UNDERTAKINGS:
         for component in risk_components:
-            im_value = random_amount(5_000_000, 80_000_000)
-            sf_value = im_value * np.random.uniform(0.8, 1.4)
+            im_value = random_amount(rng, 5_000_000, 80_000_000)
+            sf_value = im_value * rng.uniform(0.8, 1.4)
 
             row = {
                 'LEI': undertaking['lei'],
@@ -394,8 +464,8 @@ def generate_ir2505_scr_internal_model():
                 'Standard_Formula_SCR': sf_value,
                 'Difference': im_value - sf_value,
                 'Difference_Percentage': round((im_value / sf_value - 1) * 100, 2),
-                'Model_Change_Impact': random_amount(-5_000_000, 5_000_000),
-                'Validation_Status': random.choice(['Passed', 'Minor Issues', 'Under Review']),
+                'Model_Change_Impact': random_amount(rng, -5_000_000, 5_000_000),
+                'Validation_Status': random_choice(rng, ['Passed', 'Minor Issues', 'Under Review']),
                 'Last_Validation_Date': '2024-06-30',
             }
             data.append(row)
@@ -407,42 +477,53 @@ def generate_ir2505_scr_internal_model():
 # IR2506 - SCR - Loss Absorbing Capacity of Deferred Taxes
 # ============================================================================
 
-def generate_ir2506_scr_lac_dt():
+def generate_ir2506_scr_lac_dt(ir2504: Optional[pd.DataFrame] = None,
+                               rng: Optional[np.random.Generator] = None):
     """
     IR2506 - SCR - Loss Absorbing Capacity of Deferred Taxes
     Calculation of LAC DT adjustment to SCR.
+
+    The SCR before LAC DT is derived from IR2504 when given.
     """
+    rng = rng if rng is not None else template_rng('IR2506')
     data = []
+    scr_by_lei = values_by_lei(ir2504, 'SCR')
+    lac_dt_by_lei = values_by_lei(ir2504, 'LAC_Deferred_Taxes')
 
     for undertaking in UNDERTAKINGS:
-        loss_before_tax = random_amount(100_000_000, 500_000_000)
-        tax_rate = np.random.uniform(0.19, 0.25)
+        loss_before_tax = random_amount(rng, 100_000_000, 500_000_000)
+        tax_rate = rng.uniform(0.19, 0.25)
 
         row = {
             'LEI': undertaking['lei'],
             'Undertaking_Name': undertaking['name'],
             'Reporting_Date': REPORTING_DATE,
             # Notional SCR
-            'SCR_Before_LAC_DT': random_amount(100_000_000, 400_000_000),
+            'SCR_Before_LAC_DT': random_amount(rng, 100_000_000, 400_000_000),
             # DTA/DTL Position
-            'DTA_Balance_Sheet': random_amount(10_000_000, 50_000_000),
-            'DTL_Balance_Sheet': random_amount(20_000_000, 80_000_000),
-            'Net_DT_Position': random_amount(-30_000_000, 30_000_000),
+            'DTA_Balance_Sheet': random_amount(rng, 10_000_000, 50_000_000),
+            'DTL_Balance_Sheet': random_amount(rng, 20_000_000, 80_000_000),
+            'Net_DT_Position': random_amount(rng, -30_000_000, 30_000_000),
             # Loss Scenario
             'Notional_Loss_Pre_Tax': loss_before_tax,
             'Tax_Rate_Applied': round(tax_rate * 100, 2),
             'Maximum_LAC_DT': round(loss_before_tax * tax_rate, 2),
             # Recoverability
-            'Future_Taxable_Profits': random_amount(50_000_000, 200_000_000),
-            'Projection_Period_Years': random.randint(3, 10),
-            'Carry_Forward_Losses': random_amount(0, 50_000_000),
-            'Carry_Back_Available': random.choice([True, False]),
+            'Future_Taxable_Profits': random_amount(rng, 50_000_000, 200_000_000),
+            'Projection_Period_Years': random_int(rng, 3, 10),
+            'Carry_Forward_Losses': random_amount(rng, 0, 50_000_000),
+            'Carry_Back_Available': random_choice(rng, [True, False]),
             # Final LAC DT
-            'LAC_DT_Claimed': random_amount(10_000_000, 40_000_000),
-            'LAC_DT_Percentage_Of_Max': random_percentage(50, 100),
+            'LAC_DT_Claimed': random_amount(rng, 10_000_000, 40_000_000),
+            'LAC_DT_Percentage_Of_Max': random_percentage(rng, 50, 100),
             # Justification
-            'Justification_Method': random.choice(['Profit Projection', 'Stress Testing', 'Look-Back']),
+            'Justification_Method': random_choice(rng, ['Profit Projection', 'Stress Testing', 'Look-Back']),
         }
+
+        if scr_by_lei is not None:
+            lei = undertaking['lei']
+            row['SCR_Before_LAC_DT'] = scr_by_lei[lei] - lac_dt_by_lei[lei]
+            row['LAC_DT_Claimed'] = -lac_dt_by_lei[lei]
         data.append(row)
 
     return pd.DataFrame(data)
@@ -452,11 +533,21 @@ def generate_ir2506_scr_lac_dt():
 # IR2601 - SCR - Market Risk
 # ============================================================================
 
-def generate_ir2601_scr_market_risk():
+# IR2601 sub-module columns in MARKET_SUBMODULES order
+MARKET_SUBMODULE_COLUMNS = ['Interest_Rate_Risk', 'Equity_Risk', 'Property_Risk', 'Spread_Risk',
+                            'Currency_Risk', 'Concentration_Risk']
+
+
+def generate_ir2601_scr_market_risk(rng: Optional[np.random.Generator] = None):
     """
     IR2601 - SCR - Market Risk
     Detailed market risk SCR sub-modules.
+
+    The total market risk charge and its diversification are aggregated from
+    the sub-modules with the standard formula correlation matrix, using the
+    interest rate up or down matrix according to the binding shock.
     """
+    rng = rng if rng is not None else template_rng('IR2601')
     data = []
 
     for undertaking in UNDERTAKINGS:
@@ -465,41 +556,56 @@ def generate_ir2601_scr_market_risk():
             'Undertaking_Name': undertaking['name'],
             'Reporting_Date': REPORTING_DATE,
             # Sub-modules
-            'Interest_Rate_Risk_Up': random_amount(10_000_000, 60_000_000),
-            'Interest_Rate_Risk_Down': random_amount(15_000_000, 70_000_000),
-            'Interest_Rate_Risk': random_amount(15_000_000, 70_000_000),
-            'Equity_Risk_Type1': random_amount(20_000_000, 100_000_000),
-            'Equity_Risk_Type2': random_amount(10_000_000, 50_000_000),
-            'Equity_Risk': random_amount(25_000_000, 120_000_000),
-            'Property_Risk': random_amount(5_000_000, 40_000_000),
-            'Spread_Risk_Bonds': random_amount(15_000_000, 80_000_000),
-            'Spread_Risk_Securitisations': random_amount(2_000_000, 15_000_000),
-            'Spread_Risk_Derivatives': random_amount(1_000_000, 10_000_000),
-            'Spread_Risk': random_amount(18_000_000, 95_000_000),
-            'Currency_Risk': random_amount(10_000_000, 60_000_000),
-            'Concentration_Risk': random_amount(5_000_000, 30_000_000),
+            'Interest_Rate_Risk_Up': random_amount(rng, 10_000_000, 60_000_000),
+            'Interest_Rate_Risk_Down': random_amount(rng, 15_000_000, 70_000_000),
+            'Interest_Rate_Risk': random_amount(rng, 15_000_000, 70_000_000),
+            'Equity_Risk_Type1': random_amount(rng, 20_000_000, 100_000_000),
+            'Equity_Risk_Type2': random_amount(rng, 10_000_000, 50_000_000),
+            'Equity_Risk': random_amount(rng, 25_000_000, 120_000_000),
+            'Property_Risk': random_amount(rng, 5_000_000, 40_000_000),
+            'Spread_Risk_Bonds': random_amount(rng, 15_000_000, 80_000_000),
+            'Spread_Risk_Securitisations': random_amount(rng, 2_000_000, 15_000_000),
+            'Spread_Risk_Derivatives': random_amount(rng, 1_000_000, 10_000_000),
+            'Spread_Risk': random_amount(rng, 18_000_000, 95_000_000),
+            'Currency_Risk': random_amount(rng, 10_000_000, 60_000_000),
+            'Concentration_Risk': random_amount(rng, 5_000_000, 30_000_000),
             # Diversification
-            'Diversification_Market': random_amount(-30_000_000, -10_000_000),
+            'Diversification_Market': random_amount(rng, -30_000_000, -10_000_000),
             # Total
-            'Total_Market_Risk': random_amount(50_000_000, 200_000_000),
+            'Total_Market_Risk': random_amount(rng, 50_000_000, 200_000_000),
             # Symmetric Adjustment
-            'Equity_Dampener': random_percentage(-10, 10),
-            'Dampener_Impact': random_amount(-5_000_000, 5_000_000),
+            'Equity_Dampener': random_percentage(rng, -10, 10),
+            'Dampener_Impact': random_amount(rng, -5_000_000, 5_000_000),
         }
         data.append(row)
 
-    return pd.DataFrame(data)
+    df = pd.DataFrame(data)
+    # Sub-module charges: the binding interest rate shock, type 1 and type 2
+    # equities correlated, spread risk summed over bonds, securitisations and
+    # credit derivatives
+    interest_rate_down = df['Interest_Rate_Risk_Down'] > df['Interest_Rate_Risk_Up']
+    df['Interest_Rate_Risk'] = df[['Interest_Rate_Risk_Up', 'Interest_Rate_Risk_Down']].max(axis=1)
+    df['Equity_Risk'] = aggregate(df[['Equity_Risk_Type1', 'Equity_Risk_Type2']],
+                                  EQUITY_CORRELATION).diversified
+    df['Spread_Risk'] = df[['Spread_Risk_Bonds', 'Spread_Risk_Securitisations',
+                            'Spread_Risk_Derivatives']].sum(axis=1)
+
+    market = market_risk(df[MARKET_SUBMODULE_COLUMNS], interest_rate_down.to_numpy())
+    df['Diversification_Market'] = market.diversification
+    df['Total_Market_Risk'] = market.diversified
+    return df
 
 
 # ============================================================================
 # IR2602 - SCR - Counterparty Default Risk
 # ============================================================================
 
-def generate_ir2602_scr_counterparty_risk():
+def generate_ir2602_scr_counterparty_risk(rng: Optional[np.random.Generator] = None):
     """
     IR2602 - SCR - Counterparty Default Risk
     Counterparty default risk SCR calculation.
     """
+    rng = rng if rng is not None else template_rng('IR2602')
     data = []
 
     for undertaking in UNDERTAKINGS:
@@ -508,25 +614,25 @@ def generate_ir2602_scr_counterparty_risk():
             'Undertaking_Name': undertaking['name'],
             'Reporting_Date': REPORTING_DATE,
             # Type 1 Exposures
-            'Type1_Reinsurance': random_amount(20_000_000, 100_000_000),
-            'Type1_Derivatives': random_amount(5_000_000, 40_000_000),
-            'Type1_Cash_At_Banks': random_amount(5_000_000, 30_000_000),
-            'Type1_Other': random_amount(2_000_000, 15_000_000),
-            'Type1_Total_Exposure': random_amount(35_000_000, 180_000_000),
-            'Type1_LGD': random_amount(10_000_000, 80_000_000),
-            'Type1_SCR': random_amount(5_000_000, 40_000_000),
+            'Type1_Reinsurance': random_amount(rng, 20_000_000, 100_000_000),
+            'Type1_Derivatives': random_amount(rng, 5_000_000, 40_000_000),
+            'Type1_Cash_At_Banks': random_amount(rng, 5_000_000, 30_000_000),
+            'Type1_Other': random_amount(rng, 2_000_000, 15_000_000),
+            'Type1_Total_Exposure': random_amount(rng, 35_000_000, 180_000_000),
+            'Type1_LGD': random_amount(rng, 10_000_000, 80_000_000),
+            'Type1_SCR': random_amount(rng, 5_000_000, 40_000_000),
             # Type 2 Exposures
-            'Type2_Receivables_Intermediaries': random_amount(10_000_000, 50_000_000),
-            'Type2_Policyholder_Debtors': random_amount(5_000_000, 30_000_000),
-            'Type2_Other': random_amount(2_000_000, 15_000_000),
-            'Type2_Total_Exposure': random_amount(17_000_000, 95_000_000),
-            'Type2_Past_Due_3m': random_amount(1_000_000, 10_000_000),
-            'Type2_SCR': random_amount(2_000_000, 15_000_000),
+            'Type2_Receivables_Intermediaries': random_amount(rng, 10_000_000, 50_000_000),
+            'Type2_Policyholder_Debtors': random_amount(rng, 5_000_000, 30_000_000),
+            'Type2_Other': random_amount(rng, 2_000_000, 15_000_000),
+            'Type2_Total_Exposure': random_amount(rng, 17_000_000, 95_000_000),
+            'Type2_Past_Due_3m': random_amount(rng, 1_000_000, 10_000_000),
+            'Type2_SCR': random_amount(rng, 2_000_000, 15_000_000),
             # Total
-            'Total_Counterparty_Risk': random_amount(7_000_000, 55_000_000),
+            'Total_Counterparty_Risk': random_amount(rng, 7_000_000, 55_000_000),
             # Risk Mitigation
-            'Collateral_Held': random_amount(5_000_000, 50_000_000),
-            'Collateral_Impact': random_amount(-5_000_000, 0),
+            'Collateral_Held': random_amount(rng, 5_000_000, 50_000_000),
+            'Collateral_Impact': random_amount(rng, -5_000_000, 0),
         }
         data.append(row)
 
@@ -537,11 +643,12 @@ def generate_ir2602_scr_counterparty_risk():
 # IR2603 - SCR - Life Underwriting Risk
 # ============================================================================
 
-def generate_ir2603_scr_life_risk():
+def generate_ir2603_scr_life_risk(rng: Optional[np.random.Generator] = None):
     """
     IR2603 - SCR - Life Underwriting Risk
     Life underwriting risk SCR sub-modules.
     """
+    rng = rng if rng is not None else template_rng('IR2603')
     data = []
 
     for undertaking in UNDERTAKINGS:
@@ -550,20 +657,20 @@ def generate_ir2603_scr_life_risk():
             'Undertaking_Name': undertaking['name'],
             'Reporting_Date': REPORTING_DATE,
             # Sub-modules
-            'Mortality_Risk': random_amount(5_000_000, 30_000_000),
-            'Longevity_Risk': random_amount(3_000_000, 25_000_000),
-            'Disability_Morbidity_Risk': random_amount(2_000_000, 15_000_000),
-            'Lapse_Risk_Up': random_amount(5_000_000, 35_000_000),
-            'Lapse_Risk_Down': random_amount(3_000_000, 20_000_000),
-            'Lapse_Risk_Mass': random_amount(10_000_000, 60_000_000),
-            'Lapse_Risk': random_amount(10_000_000, 60_000_000),
-            'Expense_Risk': random_amount(3_000_000, 20_000_000),
-            'Revision_Risk': random_amount(1_000_000, 10_000_000),
-            'Catastrophe_Risk_Life': random_amount(5_000_000, 40_000_000),
+            'Mortality_Risk': random_amount(rng, 5_000_000, 30_000_000),
+            'Longevity_Risk': random_amount(rng, 3_000_000, 25_000_000),
+            'Disability_Morbidity_Risk': random_amount(rng, 2_000_000, 15_000_000),
+            'Lapse_Risk_Up': random_amount(rng, 5_000_000, 35_000_000),
+            'Lapse_Risk_Down': random_amount(rng, 3_000_000, 20_000_000),
+            'Lapse_Risk_Mass': random_amount(rng, 10_000_000, 60_000_000),
+            'Lapse_Risk': random_amount(rng, 10_000_000, 60_000_000),
+            'Expense_Risk': random_amount(rng, 3_000_000, 20_000_000),
+            'Revision_Risk': random_amount(rng, 1_000_000, 10_000_000),
+            'Catastrophe_Risk_Life': random_amount(rng, 5_000_000, 40_000_000),
             # Diversification
-            'Diversification_Life': random_amount(-15_000_000, -5_000_000),
+            'Diversification_Life': random_amount(rng, -15_000_000, -5_000_000),
             # Total
-            'Total_Life_Risk': random_amount(20_000_000, 120_000_000),
+            'Total_Life_Risk': random_amount(rng, 20_000_000, 120_000_000),
         }
         data.append(row)
 
@@ -574,11 +681,12 @@ def generate_ir2603_scr_life_risk():
 # IR2604 - SCR - Health Underwriting Risk
 # ============================================================================
 
-def generate_ir2604_scr_health_risk():
+def generate_ir2604_scr_health_risk(rng: Optional[np.random.Generator] = None):
     """
     IR2604 - SCR - Health Underwriting Risk
     Health underwriting risk SCR sub-modules.
     """
+    rng = rng if rng is not None else template_rng('IR2604')
     data = []
 
     for undertaking in UNDERTAKINGS:
@@ -587,24 +695,24 @@ def generate_ir2604_scr_health_risk():
             'Undertaking_Name': undertaking['name'],
             'Reporting_Date': REPORTING_DATE,
             # SLT Health
-            'SLT_Mortality': random_amount(1_000_000, 10_000_000),
-            'SLT_Longevity': random_amount(500_000, 5_000_000),
-            'SLT_Disability': random_amount(2_000_000, 15_000_000),
-            'SLT_Lapse': random_amount(1_000_000, 8_000_000),
-            'SLT_Expense': random_amount(500_000, 4_000_000),
-            'SLT_Revision': random_amount(200_000, 2_000_000),
-            'SLT_Diversification': random_amount(-3_000_000, -1_000_000),
-            'SLT_Health_Total': random_amount(3_000_000, 25_000_000),
+            'SLT_Mortality': random_amount(rng, 1_000_000, 10_000_000),
+            'SLT_Longevity': random_amount(rng, 500_000, 5_000_000),
+            'SLT_Disability': random_amount(rng, 2_000_000, 15_000_000),
+            'SLT_Lapse': random_amount(rng, 1_000_000, 8_000_000),
+            'SLT_Expense': random_amount(rng, 500_000, 4_000_000),
+            'SLT_Revision': random_amount(rng, 200_000, 2_000_000),
+            'SLT_Diversification': random_amount(rng, -3_000_000, -1_000_000),
+            'SLT_Health_Total': random_amount(rng, 3_000_000, 25_000_000),
             # NSLT Health
-            'NSLT_Premium_Reserve': random_amount(5_000_000, 30_000_000),
-            'NSLT_Lapse': random_amount(1_000_000, 8_000_000),
-            'NSLT_Health_Total': random_amount(6_000_000, 35_000_000),
+            'NSLT_Premium_Reserve': random_amount(rng, 5_000_000, 30_000_000),
+            'NSLT_Lapse': random_amount(rng, 1_000_000, 8_000_000),
+            'NSLT_Health_Total': random_amount(rng, 6_000_000, 35_000_000),
             # Catastrophe
-            'Health_Catastrophe': random_amount(2_000_000, 15_000_000),
+            'Health_Catastrophe': random_amount(rng, 2_000_000, 15_000_000),
             # Diversification
-            'Diversification_Health': random_amount(-5_000_000, -2_000_000),
+            'Diversification_Health': random_amount(rng, -5_000_000, -2_000_000),
             # Total
-            'Total_Health_Risk': random_amount(10_000_000, 60_000_000),
+            'Total_Health_Risk': random_amount(rng, 10_000_000, 60_000_000),
         }
         data.append(row)
 
@@ -615,11 +723,17 @@ def generate_ir2604_scr_health_risk():
 # IR2605 - SCR - Non-Life Underwriting Risk
 # ============================================================================
 
-def generate_ir2605_scr_non_life_risk():
+def generate_ir2605_scr_non_life_risk(rng: Optional[np.random.Generator] = None):
     """
     IR2605 - SCR - Non-Life Underwriting Risk
     Non-life underwriting risk SCR sub-modules.
+
+    Premium and reserve risk (after geographic diversification), lapse risk
+    and catastrophe risk are aggregated with the standard formula
+    correlations; each diversification column is the aggregated charge less
+    the sum of its inputs.
     """
+    rng = rng if rng is not None else template_rng('IR2605')
     data = []
 
     for undertaking in UNDERTAKINGS:
@@ -628,70 +742,84 @@ def generate_ir2605_scr_non_life_risk():
             'Undertaking_Name': undertaking['name'],
             'Reporting_Date': REPORTING_DATE,
             # Premium and Reserve Risk
-            'Premium_Risk': random_amount(30_000_000, 150_000_000),
-            'Reserve_Risk': random_amount(40_000_000, 200_000_000),
-            'Premium_Reserve_Diversification': random_amount(-25_000_000, -10_000_000),
-            'Premium_Reserve_Risk': random_amount(50_000_000, 280_000_000),
+            'Premium_Risk': random_amount(rng, 30_000_000, 150_000_000),
+            'Reserve_Risk': random_amount(rng, 40_000_000, 200_000_000),
+            'Premium_Reserve_Diversification': random_amount(rng, -25_000_000, -10_000_000),
+            'Premium_Reserve_Risk': random_amount(rng, 50_000_000, 280_000_000),
             # Geographic Diversification
-            'Geographic_Diversification': random_amount(-10_000_000, -3_000_000),
+            'Geographic_Diversification': random_amount(rng, -10_000_000, -3_000_000),
             # Lapse Risk
-            'Non_Life_Lapse_Risk': random_amount(5_000_000, 30_000_000),
+            'Non_Life_Lapse_Risk': random_amount(rng, 5_000_000, 30_000_000),
             # Catastrophe Risk
-            'Natural_Cat_Risk': random_amount(20_000_000, 100_000_000),
-            'Man_Made_Cat_Risk': random_amount(10_000_000, 60_000_000),
-            'Other_Cat_Risk': random_amount(5_000_000, 30_000_000),
-            'Cat_Diversification': random_amount(-15_000_000, -5_000_000),
-            'Total_Cat_Risk': random_amount(30_000_000, 160_000_000),
+            'Natural_Cat_Risk': random_amount(rng, 20_000_000, 100_000_000),
+            'Man_Made_Cat_Risk': random_amount(rng, 10_000_000, 60_000_000),
+            'Other_Cat_Risk': random_amount(rng, 5_000_000, 30_000_000),
+            'Cat_Diversification': random_amount(rng, -15_000_000, -5_000_000),
+            'Total_Cat_Risk': random_amount(rng, 30_000_000, 160_000_000),
             # Diversification
-            'Diversification_Non_Life': random_amount(-30_000_000, -10_000_000),
+            'Diversification_Non_Life': random_amount(rng, -30_000_000, -10_000_000),
             # Total
-            'Total_Non_Life_Risk': random_amount(60_000_000, 350_000_000),
+            'Total_Non_Life_Risk': random_amount(rng, 60_000_000, 350_000_000),
         }
         data.append(row)
 
-    return pd.DataFrame(data)
+    df = pd.DataFrame(data)
+    premium_reserve = aggregate(df[['Premium_Risk', 'Reserve_Risk']], PREMIUM_RESERVE_CORRELATION)
+    df['Premium_Reserve_Diversification'] = premium_reserve.diversification
+    df['Premium_Reserve_Risk'] = premium_reserve.diversified + df['Geographic_Diversification']
+
+    cat = aggregate(df[['Natural_Cat_Risk', 'Man_Made_Cat_Risk', 'Other_Cat_Risk']], CAT_CORRELATION)
+    df['Cat_Diversification'] = cat.diversification
+    df['Total_Cat_Risk'] = cat.diversified
+
+    non_life = aggregate(df[['Premium_Reserve_Risk', 'Non_Life_Lapse_Risk', 'Total_Cat_Risk']],
+                         NON_LIFE_CORRELATION)
+    df['Diversification_Non_Life'] = non_life.diversification
+    df['Total_Non_Life_Risk'] = non_life.diversified
+    return df
 
 
 # ============================================================================
 # IR2606 - SCR - Operational Risk
 # ============================================================================
 
-def generate_ir2606_scr_operational_risk():
+def generate_ir2606_scr_operational_risk(rng: Optional[np.random.Generator] = None):
     """
     IR2606 - SCR - Operational Risk
     Operational risk SCR calculation.
     """
+    rng = rng if rng is not None else template_rng('IR2606')
     data = []
 
     for undertaking in UNDERTAKINGS:
-        gep = random_amount(200_000_000, 800_000_000)
-        tp = random_amount(300_000_000, 1_200_000_000)
+        gep = random_amount(rng, 200_000_000, 800_000_000)
+        tp = random_amount(rng, 300_000_000, 1_200_000_000)
 
         row = {
             'LEI': undertaking['lei'],
             'Undertaking_Name': undertaking['name'],
             'Reporting_Date': REPORTING_DATE,
             # Inputs
-            'Gross_Earned_Premium_Life': random_amount(20_000_000, 100_000_000),
-            'Gross_Earned_Premium_Non_Life': random_amount(100_000_000, 500_000_000),
-            'Gross_Earned_Premium_Unit_Linked': random_amount(5_000_000, 50_000_000),
+            'Gross_Earned_Premium_Life': random_amount(rng, 20_000_000, 100_000_000),
+            'Gross_Earned_Premium_Non_Life': random_amount(rng, 100_000_000, 500_000_000),
+            'Gross_Earned_Premium_Unit_Linked': random_amount(rng, 5_000_000, 50_000_000),
             'Total_Gross_Earned_Premium': gep,
-            'TP_Life': random_amount(50_000_000, 300_000_000),
-            'TP_Non_Life': random_amount(150_000_000, 600_000_000),
-            'TP_Unit_Linked': random_amount(10_000_000, 100_000_000),
+            'TP_Life': random_amount(rng, 50_000_000, 300_000_000),
+            'TP_Non_Life': random_amount(rng, 150_000_000, 600_000_000),
+            'TP_Unit_Linked': random_amount(rng, 10_000_000, 100_000_000),
             'Total_TP': tp,
             # Calculation
             'Op_Premium_Component': gep * 0.04,
             'Op_TP_Component': tp * 0.0045,
             'Basic_Op_Risk': max(gep * 0.04, tp * 0.0045),
             # Expense Component (for Unit-Linked)
-            'Expense_Unit_Linked': random_amount(2_000_000, 20_000_000),
-            'Op_Expense_Component': random_amount(500_000, 5_000_000),
+            'Expense_Unit_Linked': random_amount(rng, 2_000_000, 20_000_000),
+            'Op_Expense_Component': random_amount(rng, 500_000, 5_000_000),
             # Cap
-            'BSCR': random_amount(80_000_000, 350_000_000),
-            'Op_Risk_Cap': random_amount(80_000_000, 350_000_000) * 0.30,
+            'BSCR': random_amount(rng, 80_000_000, 350_000_000),
+            'Op_Risk_Cap': random_amount(rng, 80_000_000, 350_000_000) * 0.30,
             # Final
-            'Operational_Risk_SCR': random_amount(5_000_000, 35_000_000),
+            'Operational_Risk_SCR': random_amount(rng, 5_000_000, 35_000_000),
         }
         data.append(row)
 
@@ -702,11 +830,12 @@ def generate_ir2606_scr_operational_risk():
 # IR2607 - SCR - Simplifications
 # ============================================================================
 
-def generate_ir2607_scr_simplifications():
+def generate_ir2607_scr_simplifications(rng: Optional[np.random.Generator] = None):
     """
     IR2607 - SCR - Simplifications
     Record of simplifications used in SCR calculation.
     """
+    rng = rng if rng is not None else template_rng('IR2607')
     data = []
 
     simplifications = [
@@ -722,7 +851,7 @@ def generate_ir2607_scr_simplifications():
 
     for undertaking in UNDERTAKINGS:
         for risk_module, simplification_name, used in simplifications:
-            impact = random_amount(-5_000_000, 10_000_000) if used else 0
+            impact = random_amount(rng, -5_000_000, 10_000_000) if used else 0
 
             row = {
                 'LEI': undertaking['lei'],
@@ -733,7 +862,7 @@ def generate_ir2607_scr_simplifications():
                 'Used': used,
                 'Justification': 'Proportionality - immaterial exposure' if used else 'Full calculation performed',
                 'Impact_On_SCR': impact,
-                'Impact_Percentage': round(impact / random_amount(100_000_000, 400_000_000) * 100, 2) if used else 0,
+                'Impact_Percentage': round(impact / random_amount(rng, 100_000_000, 400_000_000) * 100, 2) if used else 0,
                 'Last_Review_Date': '2024-06-30',
                 'Approved_By_Board': True,
             }
@@ -746,11 +875,12 @@ def generate_ir2607_scr_simplifications():
 # IR2701 - SCR - Non-Life and Health Catastrophe Risk
 # ============================================================================
 
-def generate_ir2701_scr_catastrophe():
+def generate_ir2701_scr_catastrophe(rng: Optional[np.random.Generator] = None):
     """
     IR2701 - SCR - Non-Life and Health Catastrophe Risk
     Detailed catastrophe risk SCR calculation.
     """
+    rng = rng if rng is not None else template_rng('IR2701')
     data = []
 
     cat_perils = [
@@ -767,8 +897,8 @@ def generate_ir2701_scr_catastrophe():
     for undertaking in UNDERTAKINGS:
         total_natural = 0
         for peril, region in cat_perils:
-            gross = random_amount(5_000_000, 50_000_000)
-            ri_recovery = gross * np.random.uniform(0.60, 0.90)
+            gross = random_amount(rng, 5_000_000, 50_000_000)
+            ri_recovery = gross * rng.uniform(0.60, 0.90)
             net = gross - ri_recovery
             total_natural += net
 
@@ -779,12 +909,12 @@ def generate_ir2701_scr_catastrophe():
                 'Category': 'Natural Catastrophe',
                 'Peril': peril,
                 'Region': region,
-                'Sum_Insured': random_amount(500_000_000, 3_000_000_000),
+                'Sum_Insured': random_amount(rng, 500_000_000, 3_000_000_000),
                 'Gross_Loss': gross,
                 'RI_Recovery': ri_recovery,
                 'Net_Loss': net,
-                'Reinstatement_Premiums': random_amount(500_000, 5_000_000),
-                'Scenario_Probability': random_percentage(0.1, 2.0),
+                'Reinstatement_Premiums': random_amount(rng, 500_000, 5_000_000),
+                'Scenario_Probability': random_percentage(rng, 0.1, 2.0),
             }
             data.append(row)
 
@@ -800,8 +930,8 @@ def generate_ir2701_scr_catastrophe():
         ]
 
         for scenario, risk_type in man_made:
-            gross = random_amount(2_000_000, 30_000_000)
-            ri_recovery = gross * np.random.uniform(0.50, 0.85)
+            gross = random_amount(rng, 2_000_000, 30_000_000)
+            ri_recovery = gross * rng.uniform(0.50, 0.85)
 
             row = {
                 'LEI': undertaking['lei'],
@@ -810,12 +940,12 @@ def generate_ir2701_scr_catastrophe():
                 'Category': 'Man-Made Catastrophe',
                 'Peril': scenario,
                 'Region': 'All',
-                'Sum_Insured': random_amount(100_000_000, 1_000_000_000),
+                'Sum_Insured': random_amount(rng, 100_000_000, 1_000_000_000),
                 'Gross_Loss': gross,
                 'RI_Recovery': ri_recovery,
                 'Net_Loss': gross - ri_recovery,
-                'Reinstatement_Premiums': random_amount(200_000, 2_000_000),
-                'Scenario_Probability': random_percentage(0.05, 1.0),
+                'Reinstatement_Premiums': random_amount(rng, 200_000, 2_000_000),
+                'Scenario_Probability': random_percentage(rng, 0.05, 1.0),
             }
             data.append(row)
 
@@ -826,17 +956,26 @@ def generate_ir2701_scr_catastrophe():
 # IR2801 - MCR - Only Life or Only Non-Life Activity
 # ============================================================================
 
-def generate_ir2801_mcr_non_life():
+def generate_ir2801_mcr_non_life(ir2504: Optional[pd.DataFrame] = None,
+                                 ir2301: Optional[pd.DataFrame] = None,
+                                 rng: Optional[np.random.Generator] = None):
     """
     IR2801 - MCR - Only Life or Only Non-Life Activity
     MCR calculation for mono-line undertakings.
+
+    The SCR comes from IR2504 and the eligible own funds from IR2301 when given.
     """
+    rng = rng if rng is not None else template_rng('IR2801')
     data = []
+    scr_by_lei = values_by_lei(ir2504, 'SCR')
+    eligible_by_lei = values_by_lei(ir2301, 'Eligible_OF_To_Meet_MCR')
 
     for undertaking in UNDERTAKINGS:
-        tp = random_amount(200_000_000, 800_000_000)
-        wp = random_amount(150_000_000, 600_000_000)
-        scr = random_amount(80_000_000, 350_000_000)
+        tp = random_amount(rng, 200_000_000, 800_000_000)
+        wp = random_amount(rng, 150_000_000, 600_000_000)
+        scr = random_amount(rng, 80_000_000, 350_000_000)
+        if scr_by_lei is not None:
+            scr = scr_by_lei[undertaking['lei']]
 
         linear_mcr_tp = tp * 0.085
         linear_mcr_wp = wp * 0.16
@@ -868,9 +1007,13 @@ def generate_ir2801_mcr_non_life():
             # Final MCR
             'MCR': max(min(max(linear_mcr, mcr_floor), mcr_cap), absolute_floor),
             # Eligible Own Funds
-            'Eligible_OF_For_MCR': random_amount(100_000_000, 400_000_000),
-            'MCR_Ratio': round(random_amount(100_000_000, 400_000_000) / max(min(max(linear_mcr, mcr_floor), mcr_cap), absolute_floor) * 100, 2),
+            'Eligible_OF_For_MCR': random_amount(rng, 100_000_000, 400_000_000),
+            'MCR_Ratio': round(random_amount(rng, 100_000_000, 400_000_000) / max(min(max(linear_mcr, mcr_floor), mcr_cap), absolute_floor) * 100, 2),
         }
+
+        if eligible_by_lei is not None:
+            row['Eligible_OF_For_MCR'] = eligible_by_lei[undertaking['lei']]
+            row['MCR_Ratio'] = round(row['Eligible_OF_For_MCR'] / row['MCR'] * 100, 2)
         data.append(row)
 
     return pd.DataFrame(data)
@@ -880,23 +1023,32 @@ def generate_ir2801_mcr_non_life():
 # IR2802 - MCR - Both Life and Non-Life Activity
 # ============================================================================
 
-def generate_ir2802_mcr_composite():
+def generate_ir2802_mcr_composite(ir2504: Optional[pd.DataFrame] = None,
+                                  ir2301: Optional[pd.DataFrame] = None,
+                                  rng: Optional[np.random.Generator] = None):
     """
     IR2802 - MCR - Both Life and Non-Life Activity
     MCR calculation for composite undertakings.
+
+    The SCR comes from IR2504 and the eligible own funds from IR2301 when given.
     """
+    rng = rng if rng is not None else template_rng('IR2802')
     data = []
+    scr_by_lei = values_by_lei(ir2504, 'SCR')
+    eligible_by_lei = values_by_lei(ir2301, 'Eligible_OF_To_Meet_MCR')
 
     for undertaking in UNDERTAKINGS:
         # Life component
-        tp_life = random_amount(50_000_000, 300_000_000)
-        car_life = random_amount(20_000_000, 150_000_000)
+        tp_life = random_amount(rng, 50_000_000, 300_000_000)
+        car_life = random_amount(rng, 20_000_000, 150_000_000)
 
         # Non-Life component
-        tp_non_life = random_amount(150_000_000, 600_000_000)
-        wp_non_life = random_amount(100_000_000, 400_000_000)
+        tp_non_life = random_amount(rng, 150_000_000, 600_000_000)
+        wp_non_life = random_amount(rng, 100_000_000, 400_000_000)
 
-        scr = random_amount(80_000_000, 350_000_000)
+        scr = random_amount(rng, 80_000_000, 350_000_000)
+        if scr_by_lei is not None:
+            scr = scr_by_lei[undertaking['lei']]
 
         # Linear MCR calculations
         linear_mcr_life = tp_life * 0.035 + car_life * 0.045
@@ -937,8 +1089,11 @@ def generate_ir2802_mcr_composite():
             # Final MCR
             'MCR': max(min(max(linear_mcr, mcr_floor), mcr_cap), max(absolute_floor_life, absolute_floor_non_life)),
             # Eligible Own Funds
-            'Eligible_OF_For_MCR': random_amount(100_000_000, 400_000_000),
+            'Eligible_OF_For_MCR': random_amount(rng, 100_000_000, 400_000_000),
         }
+
+        if eligible_by_lei is not None:
+            row['Eligible_OF_For_MCR'] = eligible_by_lei[undertaking['lei']]
         data.append(row)
 
     return pd.DataFrame(data)
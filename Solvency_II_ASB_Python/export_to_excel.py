@@ -5,8 +5,51 @@ Exports synthetic data to Excel format matching Lloyd's specifications
 
 import pandas as pd
 from datetime import datetime
+import sys
+from pathlib import Path
 from synthetic_data_generator import LloydsDataGenerator
 
+# Add repository root for the shared chain ladder engine
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from python_scripts.forms.chain_ladder import ChainLadderEngine
+
+# Streaming Excel writer shared with the integrations exporters
+try:
+    from integrations.shared.excel_format import write_workbook
+except ImportError:
+    write_workbook = None
+
+
+def calculate_development_factors(claims_df, n_years=None):
+    """
+    Chain ladder development factors by line of business from ASB claims.
+
+    Parameters:
+    -----------
+    claims_df : pd.DataFrame
+        ASB 245/246/247 claims records
+    n_years : int, optional
+        Also report factors over the latest n underwriting years
+
+    Returns:
+    --------
+    pd.DataFrame : Volume-weighted and simple LDFs plus CDFs per LOB
+    """
+    # Cumulative gross paid by LOB, underwriting year and development year
+    paid = claims_df.groupby(
+        ['LineOfBusiness', 'UnderwritingYear', 'DevelopmentYear']
+    )['GrossClaimPaid'].sum().reset_index()
+    paid = paid.sort_values(['LineOfBusiness', 'UnderwritingYear', 'DevelopmentYear'])
+    paid['CumulativeGrossClaimPaid'] = paid.groupby(
+        ['LineOfBusiness', 'UnderwritingYear']
+    )['GrossClaimPaid'].cumsum()
+
+    engine = ChainLadderEngine.from_frame(
+        paid, 'CumulativeGrossClaimPaid', ['LineOfBusiness'],
+        origin_col='UnderwritingYear', dev_col='DevelopmentYear'
+    )
+    return engine.development_factors(n_years=n_years)
+
 
 def export_asb_returns_to_excel(output_filename='ASB_Returns_Output.xlsx',
                                   syndicate_number='1234',
@@ -34,74 +77,85 @@ def export_asb_returns_to_excel(output_filename='ASB_Returns_Output.xlsx',
 
     all_data = generator.generate_all_data(claims_records=500, inflation_records=200)
 
-    # Create Excel writer
-    with pd.ExcelWriter(output_filename, engine='openpyxl') as writer:
-
-        # Cover sheet
-        cover_data = pd.DataFrame({
-            'Field': [
-                'Return Type',
-                'Syndicate Number',
-                'Syndicate Name',
-                'Reporting Period',
-                'Currency',
-                'Generation Date',
-                'Status'
-            ],
-            'Value': [
-                'Solvency II Pillar 3 - ASB Returns',
-                syndicate_number,
-                syndicate_name,
-                f'Annual {datetime.now().year}',
-                'Multi-currency',
-                datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'Synthetic Data for Testing'
-            ]
-        })
-        cover_data.to_excel(writer, sheet_name='Cover_Sheet', index=False)
-
-        # ASB 245/246/247 - Claims Data
-        claims_df = all_data['ASB_245_246_247']
-        claims_df.to_excel(writer, sheet_name='ASB_245_246_247_Claims', index=False)
-
-        # ASB 248 - Inflation Rates
-        inflation_df = all_data['ASB_248']
-        inflation_df.to_excel(writer, sheet_name='ASB_248_InflationRates', index=False)
-
-        # Summary by Line of Business
-        lob_summary = claims_df.groupby(['LineOfBusiness']).agg({
-            'GrossClaimPaid': 'sum',
-            'ReinsuranceRecoveries': 'sum',
-            'GrossUndiscountedBEClaimsProvisions': 'sum',
-            'GrossRBNS': 'sum'
-        }).reset_index()
-        lob_summary.to_excel(writer, sheet_name='Summary_by_LOB', index=False)
-
-        # Summary by Underwriting Year
-        year_summary = claims_df.groupby(['UnderwritingYear']).agg({
-            'GrossClaimPaid': 'sum',
-            'ReinsuranceRecoveries': 'sum',
-            'GrossUndiscountedBEClaimsProvisions': 'sum',
-            'GrossRBNS': 'sum'
-        }).reset_index()
-        year_summary.to_excel(writer, sheet_name='Summary_by_Year', index=False)
-
-        # Development year analysis
-        dev_analysis = claims_df.groupby(['DevelopmentYear']).agg({
-            'GrossClaimPaid': ['mean', 'sum', 'count'],
-            'ReinsuranceRecoveries': 'sum'
-        }).reset_index()
-        dev_analysis.columns = ['DevelopmentYear', 'AvgGrossClaimPaid',
-                                 'TotalGrossClaimPaid', 'ClaimCount',
-                                 'TotalReinsuranceRecoveries']
-        dev_analysis.to_excel(writer, sheet_name='Development_Analysis', index=False)
-
-        # Lines of Business reference
-        lob_ref = pd.DataFrame([
-            {'Code': k, 'Description': v}
-            for k, v in generator.LINES_OF_BUSINESS.items()
-        ])
-        lob_ref.to_excel(writer, sheet_name='LOB_Reference', index=False)
+    # Build all sheets, then write them in one streamed pass
+    sheets = {}
+
+    # Cover sheet
+    cover_data = pd.DataFrame({
+        'Field': [
+            'Return Type',
+            'Syndicate Number',
+            'Syndicate Name',
+            'Reporting Period',
+            'Currency',
+            'Generation Date',
+            'Status'
+        ],
+        'Value': [
+            'Solvency II Pillar 3 - ASB Returns',
+            syndicate_number,
+            syndicate_name,
+            f'Annual {datetime.now().year}',
+            'Multi-currency',
+            datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'Synthetic Data for Testing'
+        ]
+    })
+    sheets['Cover_Sheet'] = cover_data
+
+    # ASB 245/246/247 - Claims Data
+    claims_df = all_data['ASB_245_246_247']
+    sheets['ASB_245_246_247_Claims'] = claims_df
+
+    # ASB 248 - Inflation Rates
+    inflation_df = all_data['ASB_248']
+    sheets['ASB_248_InflationRates'] = inflation_df
+
+    # Summary by Line of Business
+    lob_summary = claims_df.groupby(['LineOfBusiness']).agg({
+        'GrossClaimPaid': 'sum',
+        'ReinsuranceRecoveries': 'sum',
+        'GrossUndiscountedBEClaimsProvisions': 'sum',
+        'GrossRBNS': 'sum'
+    }).reset_index()
+    sheets['Summary_by_LOB'] = lob_summary
+
+    # Summary by Underwriting Year
+    year_summary = claims_df.groupby(['UnderwritingYear']).agg({
+        'GrossClaimPaid': 'sum',
+        'ReinsuranceRecoveries': 'sum',
+        'GrossUndiscountedBEClaimsProvisions': 'sum',
+        'GrossRBNS': 'sum'
+    }).reset_index()
+    sheets['Summary_by_Year'] = year_summary
+
+    # Development year analysis
+    dev_analysis = claims_df.groupby(['DevelopmentYear']).agg({
+        'GrossClaimPaid': ['mean', 'sum', 'count'],
+        'ReinsuranceRecoveries': 'sum'
+    }).reset_index()
+    dev_analysis.columns = ['DevelopmentYear', 'AvgGrossClaimPaid',
+                             'TotalGrossClaimPaid', 'ClaimCount',
+                             'TotalReinsuranceRecoveries']
+    sheets['Development_Analysis'] = dev_analysis
+
+    # Chain ladder development factors
+    dev_factors = calculate_development_factors(claims_df, n_years=5)
+    sheets['Development_Factors'] = dev_factors
+
+    # Lines of Business reference
+    lob_ref = pd.DataFrame([
+        {'Code': k, 'Description': v}
+        for k, v in generator.LINES_OF_BUSINESS.items()
+    ])
+    sheets['LOB_Reference'] = lob_ref
+
+    if write_workbook is not None:
+        write_workbook(output_filename, sheets)
+    else:
+        with pd.ExcelWriter(output_filename, engine='openpyxl') as writer:
+            for sheet_name, df in sheets.items():
+                df.to_excel(writer, sheet_name=sheet_name, index=False)
 
     print(f"Excel file exported successfully: {output_filename}")
     print(f"Sheets created:")
@@ -111,6 +165,7 @@ def export_asb_returns_to_excel(output_filename='ASB_Returns_Output.xlsx',
     print("  - Summary_by_LOB")
     print("  - Summary_by_Year")
     print("  - Development_Analysis")
+    print("  - Development_Factors")
     print("  - LOB_Reference")
 
 
@@ -9,6 +9,15 @@ Lloyd's syndicate data into standardized QSR return formats.
 import pandas as pd
 import numpy as np
 from datetime import datetime
+import sys
+from pathlib import Path
+
+# Inputs are loaded through the storage layer (typed Parquet when converted)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+try:
+    from python_scripts.utils.table_storage import read_table
+except ImportError:
+    read_table = pd.read_csv
 
 
 class QSRReportGenerator:
@@ -34,7 +43,7 @@ class QSRReportGenerator:
         for dataset in datasets:
             try:
                 filepath = f'{self.data_dir}synthetic_{dataset}.csv'
-                self.data[dataset] = pd.read_csv(filepath)
+                self.data[dataset] = read_table(filepath)
                 print(f'Loaded {dataset}: {len(self.data[dataset])} rows')
             except FileNotFoundError:
                 print(f'Warning: {dataset} file not found')
@@ -12,6 +12,15 @@ Lloyd's syndicate data into standardized reporting formats.
 import pandas as pd
 import numpy as np
 from datetime import datetime
+import sys
+from pathlib import Path
+
+# Inputs are loaded through the storage layer (typed Parquet when converted)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+try:
+    from python_scripts.utils.table_storage import read_table
+except ImportError:
+    read_table = pd.read_csv
 
 
 class SolvencyReportGenerator:
@@ -48,7 +57,7 @@ class SolvencyReportGenerator:
         for dataset in qsr_datasets:
             try:
                 filepath = f'{self.data_dir}synthetic_{dataset}.csv'
-                self.qsr_data[dataset] = pd.read_csv(filepath)
+                self.qsr_data[dataset] = read_table(filepath)
                 print(f'Loaded QSR {dataset}: {len(self.qsr_data[dataset])} rows')
             except FileNotFoundError:
                 print(f'Warning: QSR {dataset} file not found')
@@ -58,7 +67,7 @@ class SolvencyReportGenerator:
         for dataset in aad_datasets:
             try:
                 filepath = f'{self.data_dir}synthetic_{dataset}.csv'
-                self.aad_data[dataset] = pd.read_csv(filepath)
+                self.aad_data[dataset] = read_table(filepath)
                 print(f'Loaded AAD {dataset}: {len(self.aad_data[dataset])} rows')
             except FileNotFoundError:
                 print(f'Warning: AAD {dataset} file not found')
@@ -68,7 +77,7 @@ class SolvencyReportGenerator:
         for dataset in asb_datasets:
             try:
                 filepath = f'{self.data_dir}synthetic_{dataset}.csv'
-                self.asb_data[dataset] = pd.read_csv(filepath)
+                self.asb_data[dataset] = read_table(filepath)
                 print(f'Loaded ASB {dataset}: {len(self.asb_data[dataset])} rows')
             except FileNotFoundError:
                 print(f'Warning: ASB {dataset} file not found')
@@ -152,7 +161,7 @@ class SolvencyReportGenerator:
         df = self.aad_data['aad230_open_market_value'].copy()
 
         # Aggregate by syndicate and asset category
-        summary = df.groupby(['Syndicate', 'Reporting_Date', 'Asset_Category']).agg({
+        summary = df.groupby(['Syndicate', 'Reporting_Date', 'Asset_Category'], observed=True).agg({
             'Total_Solvency_II_Value': 'sum',
             'Book_Value': 'sum',
             'Asset_ID': 'count'
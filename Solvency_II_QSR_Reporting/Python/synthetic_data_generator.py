@@ -10,6 +10,12 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import random
+import sys
+from pathlib import Path
+
+# Standard formula SCR aggregation is shared with the QRT generators
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from lloyds_reporting.scr_aggregation import NON_LIFE_CORRELATION, aggregate, market_risk, standard_formula_scr
 
 class LloydsDataGenerator:
     """Generate synthetic Lloyd's of London syndicate data"""
@@ -295,27 +301,31 @@ class LloydsDataGenerator:
                 'Loss_Absorbing_Capacity_DT': np.random.uniform(-10000000, -2000000),
             }
 
-            # Calculate BSCR (Basic SCR before operational risk and loss absorbing capacity)
-            bscr_before_diversification = (scr['Market_Risk'] +
-                                          scr['Counterparty_Default_Risk'] +
-                                          scr['Life_Underwriting_Risk'] +
-                                          scr['Health_Underwriting_Risk'] +
-                                          scr['Non_Life_Underwriting_Risk'])
-
-            # Apply diversification benefit (typically 10-30%)
-            diversification_benefit = bscr_before_diversification * np.random.uniform(-0.30, -0.10)
-            scr['Diversification'] = diversification_benefit
-            scr['BSCR'] = bscr_before_diversification + diversification_benefit
-
-            # Calculate final SCR
-            scr['SCR'] = scr['BSCR'] + scr['Operational_Risk'] + scr['Loss_Absorbing_Capacity_DT']
-
-            # Ensure SCR is positive
-            scr['SCR'] = max(scr['SCR'], 0)
-
             data.append(scr)
 
-        return pd.DataFrame(data)
+        # Aggregate every syndicate at once: market and non-life risk from
+        # their sub-modules, then the BSCR from the risk modules, each with the
+        # standard formula correlation matrix
+        df = pd.DataFrame(data)
+        df['Market_Risk'] = market_risk(df[['Interest_Rate_Risk', 'Equity_Risk', 'Property_Risk',
+                                            'Spread_Risk', 'Currency_Risk',
+                                            'Concentration_Risk']]).diversified
+        df['Non_Life_Underwriting_Risk'] = aggregate(df[['Premium_Reserve_Risk', 'Lapse_Risk', 'CAT_Risk']],
+                                                     NON_LIFE_CORRELATION).diversified
+
+        result = standard_formula_scr(
+            df[['Market_Risk', 'Counterparty_Default_Risk', 'Life_Underwriting_Risk',
+                'Health_Underwriting_Risk', 'Non_Life_Underwriting_Risk']],
+            operational=df['Operational_Risk'],
+            adjustments=df['Loss_Absorbing_Capacity_DT'],
+        )
+        df['Diversification'] = result['Diversification']
+        df['BSCR'] = result['BSCR']
+
+        # SCR = BSCR + operational risk + LAC DT, floored at zero
+        df['SCR'] = np.maximum(result['SCR'], 0)
+
+        return df
 
     def generate_mcr_calculation_data(self, num_syndicates=10):
         """Generate QSR 510/511 - MCR (Minimum Capital Requirement) data"""
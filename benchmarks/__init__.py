@@ -0,0 +1,20 @@
+"""
+Benchmarks
+==========
+
+Timing and memory benchmarks for the form processors, generators,
+validators and exporters, run at several synthetic data scales.
+
+Components:
+-----------
+- fixtures: Scaled synthetic inputs (replicated forms, liquidity data and
+  schema-driven V2 form files)
+- cases: Registry of benchmark cases, one per component
+- run_benchmarks: Runner writing results as JSON
+- compare: Compare two result files (e.g. two commits)
+
+Usage:
+------
+    python -m benchmarks.run_benchmarks --scales 1,10,50
+    python -m benchmarks.compare benchmarks/results/old.json benchmarks/results/new.json
+"""
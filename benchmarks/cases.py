@@ -0,0 +1,204 @@
+"""
+Benchmark Cases
+===============
+
+Registry of the components under benchmark.
+
+Each case is a setup function taking the scale's Fixtures and returning
+``(run, rows_in)``: the zero-argument callable that is timed, and the number
+of input rows it processes. Setup work (building frames, constructing
+objects) is not timed. reset_caches() runs before every timed call so
+memoized results never make a repeat look faster than a first run.
+
+Cases marked ``scaled=False`` do not read the fixtures (their size is fixed
+by the generator) and run at the first scale only.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Tuple
+
+import pandas as pd
+
+from .fixtures import Fixtures
+
+
+@dataclass
+class BenchmarkCase:
+    """One benchmarked component."""
+    name: str
+    component: str
+    setup: Callable[[Fixtures], Tuple[Callable[[], Any], int]]
+    scaled: bool = True
+
+
+CASES: List[BenchmarkCase] = []
+
+
+def benchmark(name: str, component: str, scaled: bool = True):
+    """Register a setup function as a benchmark case."""
+    def register(setup):
+        CASES.append(BenchmarkCase(name, component, setup, scaled))
+        return setup
+    return register
+
+
+def reset_caches():
+    """Drop every process-wide memo the components keep between calls."""
+    from python_scripts.forms.form_store import clear_form_cache
+    from python_scripts.forms.rra_990_validation import clear_validation_cache
+    from integrations.powerbi.catalog import invalidate_cache
+    from python_implementation.liquidity_stress_test import clear_dataset_cache
+
+    clear_form_cache()
+    clear_validation_cache()
+    invalidate_cache()
+    clear_dataset_cache()
+
+
+# =============================================================================
+# FORM PROCESSORS
+# =============================================================================
+
+def _register_form_processors():
+    """One case per process_rra_* / process_rrq_* exported by python_scripts.forms."""
+    import python_scripts.forms as forms
+
+    for attr in sorted(dir(forms)):
+        match = re.fullmatch(r'process_(rr[aq]_\d{3})', attr)
+        if not match:
+            continue
+        code = match.group(1)
+
+        def setup(fixtures: Fixtures, processor=getattr(forms, attr), code=code):
+            if code not in fixtures.form_files:
+                raise FileNotFoundError(f'No benchmark input for {code}')
+            path = str(fixtures.form_files[code])
+            return (lambda: processor(path)), fixtures.rows[code]
+
+        CASES.append(BenchmarkCase(attr, 'form_processor', setup))
+
+
+_register_form_processors()
+
+
+@benchmark('RRADataAggregator.load_all_forms', 'aggregator')
+def _load_all_forms(fixtures: Fixtures):
+    from python_scripts.utils.rra_aggregator import RRADataAggregator
+
+    rows = sum(n for code, n in fixtures.rows.items() if code.startswith('rra_'))
+    return (lambda: RRADataAggregator(fixtures.rra_dir).load_all_forms()), rows
+
+
+@benchmark('validate_all_forms', 'validator')
+def _validate_all_forms(fixtures: Fixtures):
+    from python_scripts.forms.rra_990_validation import validate_all_forms
+
+    rows = sum(n for code, n in fixtures.rows.items() if code.startswith('rra_'))
+    return (lambda: validate_all_forms(str(fixtures.rra_dir))), rows
+
+
+# =============================================================================
+# GENERATORS
+# =============================================================================
+
+@benchmark('generate_all_qrts', 'generator', scaled=False)
+def _generate_all_qrts(fixtures: Fixtures):
+    from QRTs import generate_all_qrts
+
+    return generate_all_qrts, 0
+
+
+@benchmark('PowerBIConnector.generate_all_datasets', 'generator', scaled=False)
+def _generate_all_datasets(fixtures: Fixtures):
+    from integrations.powerbi import PowerBIConnector
+
+    return (lambda: PowerBIConnector().generate_all_datasets()), 0
+
+
+@benchmark('DatasetGenerator.market_scale.generate_rra_forms', 'generator')
+def _market_scale_rra(fixtures: Fixtures):
+    from integrations.powerbi import DatasetGenerator
+
+    generator = DatasetGenerator.market_scale(n_syndicates=10 * fixtures.factor)
+    return generator.generate_rra_forms, 0
+
+
+# =============================================================================
+# EXPORTERS
+# =============================================================================
+
+def _export_frame(fixtures: Fixtures) -> pd.DataFrame:
+    return pd.read_csv(fixtures.form_files['rra_193'])
+
+
+def _export_manager(fixtures: Fixtures):
+    from integrations.shared.export_manager import ExportManager
+
+    return ExportManager(output_dir=str(fixtures.root / 'exports'))
+
+
+def _register_single_table_exports():
+    for fmt in ['csv', 'excel', 'json', 'parquet', 'arff']:
+        def setup(fixtures: Fixtures, fmt=fmt):
+            manager = _export_manager(fixtures)
+            df = _export_frame(fixtures)
+            export = getattr(manager, f'export_{fmt}')
+            return (lambda: export(df, 'rra_193_net_claims')), len(df)
+
+        CASES.append(BenchmarkCase(f'ExportManager.export_{fmt}', 'exporter', setup))
+
+
+_register_single_table_exports()
+
+
+def _rra_tables(fixtures: Fixtures) -> Dict[str, pd.DataFrame]:
+    return {path.stem: pd.read_csv(path) for path in sorted(fixtures.rra_dir.glob('rra_*.csv'))}
+
+
+@benchmark('ExportManager.export_multi_sheet_excel', 'exporter')
+def _export_multi_sheet_excel(fixtures: Fixtures):
+    manager = _export_manager(fixtures)
+    tables = _rra_tables(fixtures)
+    rows = sum(len(df) for df in tables.values())
+    return (lambda: manager.export_multi_sheet_excel(tables, 'rra_forms')), rows
+
+
+@benchmark('ExportManager.export_tables', 'exporter')
+def _export_tables(fixtures: Fixtures):
+    manager = _export_manager(fixtures)
+    tables = _rra_tables(fixtures)
+    rows = sum(len(df) for df in tables.values())
+    return (lambda: manager.export_tables(tables, ['csv', 'json'], subdir='tables', force=True)), rows
+
+
+# =============================================================================
+# LIQUIDITY
+# =============================================================================
+
+@benchmark('LiquidityStressTest.load_data', 'liquidity')
+def _liquidity_load(fixtures: Fixtures):
+    from python_implementation.liquidity_stress_test import LiquidityStressTest
+
+    rows = sum(n for name, n in fixtures.rows.items() if name.startswith('all_syndicates_'))
+    return (lambda: LiquidityStressTest(str(fixtures.liquidity_dir)).load_data()), rows
+
+
+@benchmark('LiquidityStressTest.calculate_rra_output_tables', 'liquidity')
+def _liquidity_rra_tables(fixtures: Fixtures):
+    from python_implementation.liquidity_stress_test import LiquidityStressTest
+
+    lst = LiquidityStressTest(str(fixtures.liquidity_dir))
+    lst.load_data()
+    rows = sum(n for name, n in fixtures.rows.items() if name.startswith('all_syndicates_'))
+    return lst.calculate_rra_output_tables, rows
+
+
+@benchmark('LiquidityStressTest.calculate_stress_simulation_table', 'liquidity')
+def _liquidity_simulation(fixtures: Fixtures):
+    from python_implementation.liquidity_stress_test import LiquidityStressTest
+
+    lst = LiquidityStressTest(str(fixtures.liquidity_dir))
+    lst.load_data()
+    rows = fixtures.rows.get('all_syndicates_cashflow', 0)
+    return (lambda: lst.calculate_stress_simulation_table(n_paths=10_000)), rows
@@ -0,0 +1,81 @@
+"""
+Benchmark Comparison
+====================
+
+Compare two result files from run_benchmarks, matching cases by name and
+scale. Prints the median time and peak memory ratios (new / old) and exits
+with status 1 if any case is slower or larger than the threshold.
+
+Usage:
+------
+    python -m benchmarks.compare old.json new.json
+    python -m benchmarks.compare old.json new.json --threshold 1.10
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Tuple
+
+DEFAULT_THRESHOLD = 1.25
+
+
+def load_results(path: str) -> Dict[Tuple[str, int], Dict[str, Any]]:
+    """Successful results of a file, keyed by (name, scale)."""
+    with open(path) as f:
+        document = json.load(f)
+    return {(r['name'], r['scale']): r for r in document['results'] if r.get('status') == 'ok'}
+
+
+def compare(old: Dict, new: Dict, threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Ratios of the cases present in both result sets.
+
+    Args:
+        old: Baseline results (from load_results)
+        new: Candidate results
+        threshold: Ratio above which a case counts as a regression
+
+    Returns:
+        One row per case, with time_ratio, memory_ratio and regression flag
+    """
+    rows = []
+    for key in sorted(set(old) & set(new)):
+        before, after = old[key], new[key]
+        time_ratio = after['median_s'] / before['median_s'] if before['median_s'] else float('inf')
+        memory_ratio = (after['peak_memory_mb'] / before['peak_memory_mb']
+                        if before['peak_memory_mb'] else 1.0)
+        rows.append({
+            'name': key[0],
+            'scale': key[1],
+            'old_s': before['median_s'],
+            'new_s': after['median_s'],
+            'time_ratio': time_ratio,
+            'memory_ratio': memory_ratio,
+            'regression': time_ratio > threshold or memory_ratio > threshold,
+        })
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare two benchmark result files')
+    parser.add_argument('old', help='Baseline results JSON')
+    parser.add_argument('new', help='Candidate results JSON')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Regression ratio threshold (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    rows = compare(load_results(args.old), load_results(args.new), args.threshold)
+    print(f"{'case':<55} {'scale':>5} {'old s':>10} {'new s':>10} {'time':>7} {'memory':>7}")
+    for row in rows:
+        flag = '  REGRESSION' if row['regression'] else ''
+        print(f"{row['name']:<55} {row['scale']:>5} {row['old_s']:>10.4f} {row['new_s']:>10.4f} "
+              f"{row['time_ratio']:>6.2f}x {row['memory_ratio']:>6.2f}x{flag}")
+
+    regressions = sum(row['regression'] for row in rows)
+    print(f"\n{len(rows)} cases compared, {regressions} regression(s) above {args.threshold:.2f}x")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,304 @@
+"""
+Benchmark Fixtures
+==================
+
+Synthetic inputs at a given scale factor.
+
+- RRA forms in synthetic_data/ and the liquidity inputs in data/ are
+  replicated ``factor`` times, each copy under new syndicate numbers, so
+  every row keeps realistic values and cross-form keys still join.
+- The V2 form processors whose inputs are not in the repository get files
+  generated from FORM_SPECS: BASE_ROWS x factor rows over a syndicate x year
+  of account grid.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Union
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Added to syndicate numbers per replicated copy
+SYNDICATE_OFFSET = 10_000
+
+# Rows of each schema-generated form at scale 1
+BASE_ROWS = 500
+
+SYNDICATE_COLUMNS = ('Syndicate_Number', 'syndicate_number')
+
+SCOB_CODES = ['A1', 'A2', 'D1', 'D2', 'E1', 'M1', 'P1', 'V1']
+CURRENCY_NAMES = {
+    'GBP': 'Pound Sterling', 'USD': 'US Dollar', 'EUR': 'Euro',
+    'CAD': 'Canadian Dollar', 'AUD': 'Australian Dollar', 'JPY': 'Japanese Yen',
+}
+RATINGS = ['AAA', 'AA+', 'AA', 'AA-', 'A+', 'A', 'A-', 'BBB+', 'BBB', 'BB']
+
+
+# Column generators: (rng, grid) -> values, where grid holds Syndicate_Number
+# and Year_of_Account for every row
+
+def choice(values) -> Callable:
+    return lambda rng, grid: rng.choice(values, len(grid))
+
+
+def uniform(low: float, high: float) -> Callable:
+    return lambda rng, grid: np.round(rng.uniform(low, high, len(grid)), 2)
+
+
+def integers(low: int, high: int) -> Callable:
+    return lambda rng, grid: rng.integers(low, high, len(grid), endpoint=True)
+
+
+def dates(start: str, end: str) -> Callable:
+    def generate(rng, grid):
+        first, last = np.datetime64(start), np.datetime64(end)
+        days = rng.integers(0, (last - first).astype(int) + 1, len(grid))
+        return np.datetime_as_string(first + days, unit='D')
+    return generate
+
+
+def joined(values, most: int = 3) -> Callable:
+    """Comma-separated lists of 1..most values."""
+    def generate(rng, grid):
+        counts = rng.integers(1, most + 1, len(grid))
+        return [','.join(map(str, rng.choice(values, k, replace=False))) for k in counts]
+    return generate
+
+
+def text(prefix: str) -> Callable:
+    return lambda rng, grid: prefix + pd.Series(rng.integers(1, 1000, len(grid))).astype(str).to_numpy()
+
+
+def prior_year(rng, grid):
+    return grid['Year_of_Account'].to_numpy() - rng.integers(1, 6, len(grid))
+
+
+def development_year(rng, grid):
+    return rng.integers(0, 10, len(grid))
+
+
+def triangle(columns: int = 11) -> Callable:
+    """Dev_Year_0..Dev_Year_n cumulative amounts, empty beyond maturity."""
+    def generate(rng, grid):
+        n = len(grid)
+        maturity = np.clip(2024 - grid['Year_of_Account'].to_numpy(), 0, columns - 1)
+        cumulative = np.cumsum(rng.uniform(1e5, 5e6, (n, columns)), axis=1)
+        cumulative[np.arange(columns)[None, :] > maturity[:, None]] = np.nan
+        return {f'Dev_Year_{d}': np.round(cumulative[:, d], 2) for d in range(columns)}
+    return generate
+
+
+# Form code -> (file name, column generators). Keys not found as columns are
+# multi-column generators returning a dict.
+FORM_SPECS: Dict[str, tuple] = {
+    'rra_020': ('rra_020_exchange_rates.csv', {
+        'Currency_Code': choice(list(CURRENCY_NAMES)),
+        'Currency_Name': choice(list(CURRENCY_NAMES.values())),
+        'Rate_Type': choice(['Spot', 'Average', 'Closing']),
+        'Exchange_Rate': uniform(0.5, 190.0),
+        'Effective_Date': dates('2018-01-01', '2024-12-31'),
+        'Source': choice(["Lloyd's", 'BoE']),
+    }),
+    'rra_071': ('rra_071_scob_mapping.csv', {
+        'SCOB_Code': choice(SCOB_CODES),
+        'SCOB_Description': text('SCOB '),
+        'SII_LOB_Code': integers(1, 12),
+        'SII_LOB_Description': text('SII LOB '),
+        'Allocation_Percentage': choice([25, 50, 75, 100]),
+    }),
+    'rra_081': ('rra_081_reserving_class.csv', {
+        'Reserving_Class_Code': text('RC'),
+        'Reserving_Class_Name': text('Reserving Class '),
+        'SCOB_Codes': joined(SCOB_CODES),
+        'Development_Pattern': choice(['Short Tail', 'Medium Tail', 'Long Tail']),
+        'Actuarial_Method': choice(['Chain Ladder', 'BF', 'ELR']),
+    }),
+    'rra_091': ('rra_091_lpt_data.csv', {
+        'Transaction_Type': choice(['LPT', 'ADC']),
+        'Counterparty': text('Reinsurer '),
+        'Effective_Date': dates('2018-01-01', '2024-12-31'),
+        'Years_of_Account': joined(list(range(2010, 2020))),
+        'Gross_Reserves_Transferred_GBP': uniform(1e6, 5e8),
+        'Net_Premium_GBP': uniform(1e5, 5e7),
+        'Cover_Limit_GBP': uniform(1e7, 1e9),
+        'Retention_GBP': uniform(1e6, 1e8),
+    }),
+    'rra_292': ('rra_292_net_premium_ibnr.csv', {
+        'Net_Written_Premium': uniform(1e6, 5e7),
+        'Net_Earned_Premium': uniform(1e6, 5e7),
+        'Paid_Claims_Net': uniform(1e5, 3e7),
+        'Case_Reserves_Net': uniform(1e5, 1e7),
+        'IBNR_Best_Estimate_Net': uniform(1e5, 1e7),
+        'IBNR_High_Net': uniform(1e7, 2e7),
+        'IBNR_Low_Net': uniform(1e4, 1e5),
+    }),
+    'rra_293': ('rra_293_outstanding_ibnr_pyoa.csv', {
+        'Prior_YoA': prior_year,
+        'Class_of_Business': choice(SCOB_CODES),
+        'Gross_Outstanding_GBP': uniform(1e5, 5e7),
+        'Gross_IBNR_GBP': uniform(1e5, 5e7),
+        'Net_Outstanding_GBP': uniform(1e5, 3e7),
+        'Net_IBNR_GBP': uniform(1e5, 3e7),
+        'Currency': choice(list(CURRENCY_NAMES)),
+    }),
+    'rra_294': ('rra_294_catastrophe_ibnr.csv', {
+        'Event_Code': text('CAT'),
+        'Event_Name': text('Event '),
+        'Event_Date': dates('2017-01-01', '2024-12-31'),
+        'Gross_IBNR_GBP': uniform(1e5, 1e8),
+        'Net_IBNR_GBP': uniform(1e5, 5e7),
+        'Expected_Recovery_GBP': uniform(1e5, 5e7),
+        'Confidence_Level': choice(['High', 'Medium', 'Low']),
+    }),
+    'rra_295': ('rra_295_ulae.csv', {
+        'ULAE_Category': choice(['Internal', 'External']),
+        'Expense_Type': text('Expense '),
+        'Gross_ULAE_GBP': uniform(1e4, 5e6),
+        'Net_ULAE_GBP': uniform(1e4, 4e6),
+        'Allocation_Method': choice(['Premium', 'Claims', 'Headcount']),
+        'Basis_Premium_GBP': uniform(1e6, 5e8),
+    }),
+    'rra_391': ('rra_391_ielr.csv', {
+        'Class_of_Business': choice(SCOB_CODES),
+        'Reserving_Class': text('RC'),
+        'Initial_ELR': uniform(40, 90),
+        'Current_ELR': uniform(40, 90),
+        'Gross_Premium_GBP': uniform(1e6, 5e8),
+        'Selected_Ultimate_GBP': uniform(1e6, 4e8),
+        'Method': choice(['Chain Ladder', 'BF', 'ELR']),
+    }),
+    'rra_591': ('rra_591_reinsurance_structure.csv', {
+        'Program_Type': choice(['Quota Share', 'XOL', 'Stop Loss', 'Surplus']),
+        'Reinsurer_Name': text('Reinsurer '),
+        'Reinsurer_Rating': choice(RATINGS),
+        'Coverage_Layer': text('Layer '),
+        'Attachment_Point_GBP': uniform(1e6, 1e8),
+        'Limit_GBP': uniform(1e6, 2e8),
+        'Premium_GBP': uniform(1e5, 2e7),
+        'Cession_Rate': uniform(0, 0.5),
+        'Effective_Date': dates('2018-01-01', '2018-12-31'),
+        'Expiry_Date': dates('2019-01-01', '2019-12-31'),
+        'Treaty_Reference': text('TR'),
+    }),
+    'rra_910': ('rra_910_additional_info.csv', {
+        'Section': choice(['Section A', 'Section B', 'Section C']),
+        'Question_Number': integers(1, 40),
+        'Question_Text': text('Question '),
+        'Response': text('Response text '),
+        'Supporting_Reference': text('Ref '),
+        'Response_Date': dates('2024-01-01', '2024-12-31'),
+    }),
+    'rrq_191': ('rrq_191_gross_claims.csv', {
+        'Development_Year': development_year,
+        'Class_of_Business': choice(SCOB_CODES),
+        'Currency': choice(list(CURRENCY_NAMES)),
+        'Gross_Paid_Claims': uniform(1e5, 5e7),
+        'Gross_Case_Reserves': uniform(1e5, 2e7),
+        'Gross_IBNR': uniform(1e5, 2e7),
+        'Gross_Incurred': uniform(1e6, 9e7),
+        'Reporting_Period': choice(['2024-03-31', '2024-06-30', '2024-09-30', '2024-12-31']),
+    }),
+    'rrq_192': ('rrq_192_claims_triangles.csv', {
+        'Triangle_Type': choice(['Paid', 'Incurred', 'Case']),
+        'Basis': choice(['Gross', 'Net']),
+        'Class_of_Business': choice(SCOB_CODES),
+        'Currency': choice(list(CURRENCY_NAMES)),
+        'Dev_Years': triangle(11),
+        'Ultimate_Estimate': uniform(1e6, 2e8),
+        'Selected_IBNR': uniform(1e5, 5e7),
+        'Method': choice(['Chain Ladder', 'BF', 'ELR']),
+        'Reporting_Period': choice(['2024-03-31', '2024-06-30', '2024-09-30', '2024-12-31']),
+    }),
+}
+
+
+@dataclass
+class Fixtures:
+    """Paths of the scaled inputs of one scale factor."""
+    factor: int
+    root: Path
+    rra_dir: Path
+    liquidity_dir: Path
+    form_files: Dict[str, Path] = field(default_factory=dict)
+    rows: Dict[str, int] = field(default_factory=dict)
+
+
+def replicate(df: pd.DataFrame, factor: int) -> pd.DataFrame:
+    """Stack ``factor`` copies of a frame, each under new syndicate numbers."""
+    copies = []
+    for copy in range(factor):
+        frame = df.copy()
+        for col in SYNDICATE_COLUMNS:
+            if col in frame.columns and pd.api.types.is_integer_dtype(frame[col]):
+                frame[col] = frame[col] + copy * SYNDICATE_OFFSET
+        copies.append(frame)
+    return pd.concat(copies, ignore_index=True)
+
+
+def form_grid(rows: int, factor: int) -> pd.DataFrame:
+    """Syndicate x year of account keys for ``rows`` rows."""
+    index = np.arange(rows)
+    syndicates = 10 * factor
+    return pd.DataFrame({
+        'Syndicate_Number': 1000 + index % syndicates,
+        'Year_of_Account': 2015 + (index // syndicates) % 10,
+    })
+
+
+def generate_form(code: str, rows: int, factor: int, seed: int = 0) -> pd.DataFrame:
+    """Generate a form file from its FORM_SPECS entry."""
+    _, spec = FORM_SPECS[code]
+    rng = np.random.default_rng(seed)
+    df = form_grid(rows, factor)
+    grid = df.copy()
+    for col, generate in spec.items():
+        values = generate(rng, grid)
+        if isinstance(values, dict):
+            for name, column in values.items():
+                df[name] = column
+        else:
+            df[col] = values
+    return df
+
+
+def build_fixtures(root: Union[str, Path], factor: int) -> Fixtures:
+    """
+    Write the scaled inputs for one scale factor.
+
+    Args:
+        root: Directory to write into
+        factor: Scale factor (1 = repository sample size)
+
+    Returns:
+        Fixtures with the written paths and row counts
+    """
+    root = Path(root)
+    fixtures = Fixtures(factor=factor, root=root, rra_dir=root / 'rra',
+                        liquidity_dir=root / 'liquidity')
+    for directory in (fixtures.rra_dir, fixtures.liquidity_dir, root / 'forms'):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    # Replicated repository samples
+    for source in sorted((REPO_ROOT / 'synthetic_data').glob('rra_*.csv')):
+        df = replicate(pd.read_csv(source), factor)
+        df.to_csv(fixtures.rra_dir / source.name, index=False)
+        fixtures.form_files[source.stem[:7]] = fixtures.rra_dir / source.name
+        fixtures.rows[source.stem[:7]] = len(df)
+
+    for source in sorted((REPO_ROOT / 'data').glob('all_syndicates_*.csv')):
+        df = replicate(pd.read_csv(source), factor)
+        df.to_csv(fixtures.liquidity_dir / source.name, index=False)
+        fixtures.rows[source.stem] = len(df)
+
+    # Schema-generated V2 forms
+    for seed, (code, (file_name, _)) in enumerate(FORM_SPECS.items()):
+        df = generate_form(code, BASE_ROWS * factor, factor, seed=seed)
+        path = root / 'forms' / file_name
+        df.to_csv(path, index=False)
+        fixtures.form_files[code] = path
+        fixtures.rows[code] = len(df)
+
+    return fixtures
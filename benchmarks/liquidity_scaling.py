@@ -0,0 +1,256 @@
+"""
+Liquidity Stress Test Scaling
+=============================
+
+Check that the LiquidityStressTest tables scale linearly with the number of
+syndicates.
+
+For each syndicate count a liquidity data directory is generated with
+``--periods`` monthly periods per syndicate (the four all_syndicates_*.csv
+files load_data reads). The RRA output tables and the dashboard summary are
+then timed on the loaded data. Time per input row should stay flat as the
+syndicate count grows. The run exits with status 1 if time per row at the
+largest size exceeds ``--max-ratio`` times that at the smallest.
+
+Usage:
+------
+    python -m benchmarks.liquidity_scaling
+    python -m benchmarks.liquidity_scaling --syndicates 50,100,250,500 --periods 60
+    python -m benchmarks.liquidity_scaling --output liquidity_scaling.json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from .run_benchmarks import environment
+
+DEFAULT_SYNDICATES = [50, 100, 250, 500]
+DEFAULT_PERIODS = 60
+DEFAULT_REPEAT = 3
+DEFAULT_MAX_RATIO = 2.0
+
+FIRST_SYNDICATE = 2001
+
+CASHFLOW_INFLOWS = {
+    'premium_income': (0.05, 0.10),
+    'reinsurance_recoveries': (0.02, 0.05),
+    'reinsurance_deposits': (-0.02, 0.02),
+    'trust_fund_flows': (-0.01, 0.01),
+}
+CASHFLOW_OUTFLOWS = {
+    'claims_paid': (0.03, 0.08),
+    'acquisition_costs': (0.01, 0.03),
+    'reinsurance_premium': (0.02, 0.04),
+    'operating_expenses': (0.005, 0.02),
+}
+NON_OPERATING_FLOWS = {
+    'investment_income': (0.005, 0.02),
+    'deposits_to_from_fal': (-0.02, 0.02),
+    'member_transactions': (-0.01, 0.01),
+}
+ASSET_SHARES = {
+    'us_trust_funds': (0.20, 0.30),
+    'other_trust_funds': (0.05, 0.10),
+    'other_restricted_assets': (0.02, 0.05),
+    'reinsurance_recoverables': (0.15, 0.25),
+    'reinsurer_urp_unearned': (0.08, 0.12),
+    'other_illiquid_assets': (0.02, 0.05),
+    'closing_free_funds': (0.15, 0.25),
+    'other_liquid_assets': (0.05, 0.15),
+}
+
+
+def build_liquidity_inputs(root: Path, n_syndicates: int, n_periods: int,
+                           seed: int = 42) -> Dict[str, int]:
+    """
+    Write all_syndicates_*.csv for n_syndicates x n_periods month ends.
+
+    Args:
+        root: Directory to write into
+        n_syndicates: Number of syndicates
+        n_periods: Monthly periods per syndicate
+        seed: Generator seed
+
+    Returns:
+        Rows written per file stem
+    """
+    rng = np.random.default_rng(seed)
+    root.mkdir(parents=True, exist_ok=True)
+    syndicates = np.arange(FIRST_SYNDICATE, FIRST_SYNDICATE + n_syndicates)
+    dates = pd.date_range('2024-12-31', periods=n_periods, freq='ME').strftime('%Y-%m-%d')
+    fal = rng.uniform(100_000_000, 500_000_000, n_syndicates).round()
+
+    gross_loss = (fal * rng.uniform(1.5, 2.5, n_syndicates)).round()
+    recovery = (gross_loss * rng.uniform(0.40, 0.70, n_syndicates)).round()
+    disputed = (recovery * rng.uniform(0.15, 0.30, n_syndicates)).round()
+    metadata = pd.DataFrame({
+        'syndicate_number': syndicates,
+        'syndicate_name': [f'Syndicate {n}' for n in syndicates],
+        'managing_agent': [f'Managing Agent {n}' for n in syndicates],
+        'qma_date': '2024-12-31',
+        'date_completed': '2025-11-21',
+        'syndicate_fal': fal,
+        'syndicate_fis': (fal * rng.uniform(0.80, 0.95, n_syndicates)).round(),
+        'syndicate_uscr': (fal * rng.uniform(0.60, 0.85, n_syndicates)).round(),
+        'syndicate_ueca': (fal * rng.uniform(0.10, 0.20, n_syndicates)).round(),
+        'scenario_type': 'US Windstorm',
+        'loss_occurrence_date': '2025-02-15',
+        'gross_loss_estimate': gross_loss,
+        'reinsurance_recovery_estimate': recovery,
+        'net_loss_estimate': gross_loss - recovery,
+        'us_funding_requirement': (recovery * 0.30).round(),
+        'total_disputed_recoveries': disputed,
+        'disputed_60_days': (disputed * 0.60).round(),
+        'disputed_90_days': (disputed * 0.40).round(),
+    })
+
+    # syndicates x periods grids, flattened syndicate-major
+    shape = (n_syndicates, n_periods)
+    grid_fal = np.repeat(fal[:, None], n_periods, axis=1)
+
+    def flows(ranges, sign=1):
+        return {name: sign * (grid_fal * rng.uniform(low, high, shape)).round()
+                for name, (low, high) in ranges.items()}
+
+    inflows, outflows = flows(CASHFLOW_INFLOWS), flows(CASHFLOW_OUTFLOWS, -1)
+    non_operating = flows(NON_OPERATING_FLOWS)
+    operating_total = sum(inflows.values()) + sum(outflows.values())
+    non_operating_total = sum(non_operating.values())
+    movements = operating_total + non_operating_total
+    opening_first = (fal * rng.uniform(0.15, 0.25, n_syndicates)).round()
+    closing = opening_first[:, None] + np.cumsum(movements, axis=1)
+    opening = np.column_stack([opening_first, closing[:, :-1]])
+
+    keys = {'syndicate_number': np.repeat(syndicates, n_periods), 'date': np.tile(dates, n_syndicates)}
+    cashflow = pd.DataFrame({
+        **keys,
+        'opening_free_funds': opening.ravel(),
+        **{name: values.ravel() for name, values in {**inflows, **outflows}.items()},
+        'total_operating_cashflow': operating_total.ravel(),
+        **{name: values.ravel() for name, values in non_operating.items()},
+        'total_non_operating_cashflow': non_operating_total.ravel(),
+        'total_movements': movements.ravel(),
+        'closing_free_funds': closing.ravel(),
+    })
+
+    assets = pd.DataFrame({**keys, **{name: values.ravel()
+                                      for name, values in flows(ASSET_SHARES).items()}})
+    assets.insert(5, 'restricted_assets_total',
+                  assets[['us_trust_funds', 'other_trust_funds', 'other_restricted_assets']].sum(axis=1))
+    assets.insert(9, 'illiquid_assets_total',
+                  assets[['reinsurance_recoverables', 'reinsurer_urp_unearned',
+                          'other_illiquid_assets']].sum(axis=1))
+    assets['liquid_assets_total'] = assets['closing_free_funds'] + assets['other_liquid_assets']
+
+    # Net loss paid evenly over the first year after the event
+    paid_months = min(12, n_periods)
+    impact = np.zeros(shape)
+    impact[:, :paid_months] = -(metadata['net_loss_estimate'].to_numpy()[:, None] / paid_months).round()
+    stress = pd.DataFrame({**keys, 'stress_scenario_impact': impact.ravel(),
+                           'cumulative_stress_impact': np.cumsum(impact, axis=1).ravel()})
+
+    tables = {'all_syndicates_metadata': metadata, 'all_syndicates_assets': assets,
+              'all_syndicates_cashflow': cashflow, 'all_syndicates_stress': stress}
+    for stem, df in tables.items():
+        df.to_csv(root / f'{stem}.csv', index=False)
+    return {stem: len(df) for stem, df in tables.items()}
+
+
+def time_tables(data_dir: Path, repeat: int) -> List[float]:
+    """Wall times of the RRA output tables plus the dashboard summary (data already loaded)."""
+    from python_implementation.liquidity_stress_test import LiquidityStressTest
+
+    lst = LiquidityStressTest(str(data_dir))
+    lst.load_data()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        lst.calculate_rra_output_tables()
+        lst.create_dashboard_summary()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def run_scaling(syndicate_counts: List[int] = None, n_periods: int = DEFAULT_PERIODS,
+                repeat: int = DEFAULT_REPEAT, verbose: bool = True) -> Dict[str, Any]:
+    """
+    Time the liquidity tables at each syndicate count.
+
+    Args:
+        syndicate_counts: Syndicate counts, smallest first
+        n_periods: Monthly periods per syndicate
+        repeat: Timed runs per size
+        verbose: Print one line per size
+
+    Returns:
+        Results document with one record per size and the per-row time ratio
+        of the largest to the smallest size
+    """
+    syndicate_counts = sorted(syndicate_counts or DEFAULT_SYNDICATES)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_syndicates in syndicate_counts:
+            data_dir = Path(tmp) / f'{n_syndicates}x{n_periods}'
+            rows = build_liquidity_inputs(data_dir, n_syndicates, n_periods)
+            times = time_tables(data_dir, repeat)
+            median = statistics.median(times)
+            cashflow_rows = rows['all_syndicates_cashflow']
+            results.append({
+                'syndicates': n_syndicates,
+                'periods': n_periods,
+                'cashflow_rows': cashflow_rows,
+                'times_s': [round(t, 6) for t in times],
+                'median_s': round(median, 6),
+                'us_per_row': round(median / cashflow_rows * 1e6, 3),
+            })
+            if verbose:
+                print(f"  {n_syndicates:>5} x {n_periods:<3} {cashflow_rows:>8,} rows "
+                      f"{median:>9.4f}s {results[-1]['us_per_row']:>9.2f} us/row")
+
+    ratio = results[-1]['us_per_row'] / results[0]['us_per_row'] if results[0]['us_per_row'] else 1.0
+    return {
+        'environment': environment(),
+        'config': {'syndicates': syndicate_counts, 'periods': n_periods, 'repeat': repeat},
+        'results': results,
+        'per_row_ratio': round(ratio, 3),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Check linear scaling of the liquidity stress tables')
+    parser.add_argument('--syndicates', default=','.join(map(str, DEFAULT_SYNDICATES)),
+                        help='Comma-separated syndicate counts (default: %(default)s)')
+    parser.add_argument('--periods', type=int, default=DEFAULT_PERIODS,
+                        help='Monthly periods per syndicate (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help='Timed runs per size (default: %(default)s)')
+    parser.add_argument('--max-ratio', type=float, default=DEFAULT_MAX_RATIO,
+                        help='Largest allowed per-row time ratio, largest / smallest size '
+                             '(default: %(default)s)')
+    parser.add_argument('--output', '-o', default=None, help='Write the results as JSON')
+    args = parser.parse_args(argv)
+
+    counts = [int(n) for n in args.syndicates.split(',') if n.strip()]
+    document = run_scaling(counts, args.periods, args.repeat)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(document, f, indent=2)
+
+    linear = document['per_row_ratio'] <= args.max_ratio
+    print(f"\nPer-row time ratio (largest / smallest): {document['per_row_ratio']:.2f}x "
+          f"({'linear' if linear else 'NOT linear'}, limit {args.max_ratio:.2f}x)")
+    sys.exit(0 if linear else 1)
+
+
+if __name__ == '__main__':
+    main()
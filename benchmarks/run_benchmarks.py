@@ -0,0 +1,203 @@
+"""
+Benchmark Runner
+================
+
+Time and memory-profile every registered case at several scales and write
+the results as JSON.
+
+For each case and scale the case is called ``--repeat`` times (wall time of
+each call is recorded), then once more under tracemalloc for the peak Python
+heap allocation (numpy and pandas buffers included). Component output is
+silenced. A failing case is recorded with its error and does not stop the run.
+
+Usage:
+------
+    python -m benchmarks.run_benchmarks
+    python -m benchmarks.run_benchmarks --scales 1,10,100 --repeat 5
+    python -m benchmarks.run_benchmarks --filter process_rra --output results.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .cases import CASES, BenchmarkCase, reset_caches
+from .fixtures import REPO_ROOT, build_fixtures
+
+DEFAULT_SCALES = [1, 10, 50]
+DEFAULT_REPEAT = 3
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+
+STATUS_OK = 'ok'
+STATUS_SKIPPED = 'skipped'
+STATUS_ERROR = 'error'
+
+
+def _git(*args) -> Optional[str]:
+    try:
+        return subprocess.run(['git', *args], cwd=REPO_ROOT, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment() -> Dict[str, Any]:
+    """Commit and runtime the results were produced with."""
+    return {
+        'commit': _git('rev-parse', 'HEAD'),
+        'dirty': bool(_git('status', '--porcelain', '--untracked-files=no')),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def _quiet(run):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return run()
+
+
+def measure(run, repeat: int) -> Dict[str, Any]:
+    """Wall times of ``repeat`` calls and the peak traced memory of one more."""
+    times = []
+    for _ in range(repeat):
+        reset_caches()
+        start = time.perf_counter()
+        _quiet(run)
+        times.append(time.perf_counter() - start)
+
+    reset_caches()
+    tracemalloc.start()
+    try:
+        _quiet(run)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'times_s': [round(t, 6) for t in times],
+        'min_s': round(min(times), 6),
+        'median_s': round(statistics.median(times), 6),
+        'peak_memory_mb': round(peak / 1024 / 1024, 3),
+    }
+
+
+def run_case(case: BenchmarkCase, fixtures, repeat: int) -> Dict[str, Any]:
+    """Set up and measure one case at one scale."""
+    record = {'name': case.name, 'component': case.component, 'scale': fixtures.factor}
+    try:
+        run, rows_in = _quiet(lambda: case.setup(fixtures))
+        record['rows_in'] = rows_in
+        record.update(measure(run, repeat))
+        record['status'] = STATUS_OK
+    except ImportError as exc:  # optional dependency (e.g. pyarrow) not installed
+        record['status'] = STATUS_SKIPPED
+        record['error'] = str(exc).splitlines()[0]
+    except Exception as exc:  # recorded, the run continues
+        record['status'] = STATUS_ERROR
+        record['error'] = f'{type(exc).__name__}: {exc}'
+    return record
+
+
+def run_benchmarks(scales: List[int] = None, repeat: int = DEFAULT_REPEAT,
+                   pattern: Optional[str] = None, workdir: Optional[str] = None,
+                   verbose: bool = True) -> Dict[str, Any]:
+    """
+    Run the selected cases at every scale.
+
+    Args:
+        scales: Scale factors (1 = repository sample size)
+        repeat: Timed calls per case and scale
+        pattern: Regular expression selecting case names
+        workdir: Directory for fixtures and export output (default: temporary)
+        verbose: Print one line per measurement
+
+    Returns:
+        Results document ({'environment': ..., 'config': ..., 'results': [...]})
+    """
+    scales = scales or DEFAULT_SCALES
+    cases = [case for case in CASES if pattern is None or re.search(pattern, case.name)]
+    results = []
+
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        for position, factor in enumerate(scales):
+            fixtures = build_fixtures(Path(tmp) / f'scale_{factor}', factor)
+            for case in cases:
+                if not case.scaled and position > 0:
+                    continue
+                record = run_case(case, fixtures, repeat)
+                results.append(record)
+                if verbose:
+                    if record['status'] == STATUS_OK:
+                        print(f"  x{factor:<4} {case.name:<55} {record['median_s']:>10.4f}s "
+                              f"{record['peak_memory_mb']:>10.1f} MB  ({record['rows_in']:,} rows)")
+                    else:
+                        print(f"  x{factor:<4} {case.name:<55} {record['status']}: {record['error']}")
+
+    return {
+        'environment': environment(),
+        'config': {'scales': scales, 'repeat': repeat, 'filter': pattern},
+        'results': results,
+    }
+
+
+def default_output_path(env: Dict[str, Any]) -> Path:
+    """benchmarks/results/<timestamp>_<commit>.json"""
+    stamp = env['timestamp'].replace(':', '').replace('-', '')
+    commit = (env['commit'] or 'nocommit')[:10] + ('-dirty' if env['dirty'] else '')
+    return RESULTS_DIR / f'{stamp}_{commit}.json'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run the timing and memory benchmarks')
+    parser.add_argument('--scales', default=','.join(map(str, DEFAULT_SCALES)),
+                        help='Comma-separated scale factors (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help='Timed calls per case and scale (default: %(default)s)')
+    parser.add_argument('--filter', dest='pattern', default=None,
+                        help='Regular expression selecting case names')
+    parser.add_argument('--output', '-o', default=None,
+                        help='Result file (default: benchmarks/results/<timestamp>_<commit>.json)')
+    parser.add_argument('--workdir', default=None,
+                        help='Directory for temporary fixtures (default: system temp)')
+    parser.add_argument('--list', action='store_true', help='List the cases and exit')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for case in CASES:
+            print(f"{case.component:<16} {case.name}{'' if case.scaled else '  (fixed size)'}")
+        return
+
+    scales = [int(s) for s in args.scales.split(',') if s.strip()]
+    document = run_benchmarks(scales, args.repeat, args.pattern, args.workdir)
+
+    output = Path(args.output) if args.output else default_output_path(document['environment'])
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(document, f, indent=2)
+
+    failed = [r for r in document['results'] if r['status'] == STATUS_ERROR]
+    print(f"\nWrote {len(document['results'])} results to {output}"
+          + (f" ({len(failed)} failed)" if failed else ''))
+
+
+if __name__ == '__main__':
+    main()
@@ -229,29 +229,34 @@ def generate_stress_scenario(capital_position, cashflow_baseline):
     # Net loss
     net_loss_estimate = gross_loss_estimate - reinsurance_recovery
 
+    # Settlement of the net loss over the quarters and US funding
+    # requirement (use config if available, as the stress simulation does)
+    if CONFIG_AVAILABLE:
+        payment_pattern = LiquidityRatios.LOSS_PAYMENT_PATTERN
+        us_funding_ratio = LiquidityRatios.US_FUNDING_RATIO
+        us_funding_period = LiquidityRatios.US_FUNDING_PERIOD
+    else:
+        payment_pattern = (0.20, 0.30, 0.25, 0.15, 0.10)
+        us_funding_ratio = 0.30
+        us_funding_period = 1
+
     # US funding requirement (varies by business type)
-    # For demonstration: 30% of estimated reserves
-    us_funding_requirement = int(reinsurance_recovery * 0.30)
+    # For demonstration: a share of the reinsurance recovery
+    us_funding_requirement = int(reinsurance_recovery * us_funding_ratio)
 
     # Disputed recoveries (3 largest reinsurers)
     total_disputed = int(reinsurance_recovery * np.random.uniform(0.15, 0.30))
     disputed_60_days = int(total_disputed * 0.60)
     disputed_90_days = int(total_disputed * 0.40)
 
-    # Impact on cashflow over quarters
+    # Impact on cashflow over quarters: the loss occurs in Feb 2025 (Q1) and
+    # the US funding requirement is called with the major payments (Q2)
     stress_cashflow = []
 
-    for i in range(5):  # 5 quarters
-        if i == 0:  # Loss occurs in Feb 2025 (Q1)
-            stress_impact = -int(net_loss_estimate * 0.20)  # Initial payments
-        elif i == 1:  # Q2 - major funding requirement
-            stress_impact = -(us_funding_requirement + int(net_loss_estimate * 0.30))
-        elif i == 2:  # Q3 - continued payments
-            stress_impact = -int(net_loss_estimate * 0.25)
-        elif i == 3:  # Q4
-            stress_impact = -int(net_loss_estimate * 0.15)
-        else:  # Q1 2026
-            stress_impact = -int(net_loss_estimate * 0.10)
+    for i, share in enumerate(payment_pattern):
+        stress_impact = -int(net_loss_estimate * share)
+        if i == us_funding_period:
+            stress_impact -= us_funding_requirement
 
         stress_cashflow.append(stress_impact)
 
@@ -17,6 +17,8 @@ import sys
 # Add parent paths for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from ..shared.arff_writer import write_arff, STYLE_TYPED
+
 try:
     from lloyds_reporting.config import RANDOM_SEED
     np.random.seed(RANDOM_SEED)
@@ -217,7 +219,7 @@ class KNIMEConnector:
 
         Args:
             output_dir: Output directory path
-            format: Output format ('csv', 'parquet', 'json', 'arff')
+            format: Output format ('csv', 'parquet', 'json', 'arff', 'arff.gz')
 
         Returns:
             List of exported file paths
@@ -240,6 +242,9 @@ class KNIMEConnector:
             elif format == 'arff':
                 file_path = output_path / f"{name}.arff"
                 self._export_arff(df, file_path, name)
+            elif format == 'arff.gz':
+                file_path = output_path / f"{name}.arff.gz"
+                self._export_arff(df, file_path, name, compress=True)
             else:
                 raise ValueError(f"Unsupported format: {format}")
 
@@ -263,34 +268,10 @@ class KNIMEConnector:
         print(f"Exported {len(exported_files)} files to {output_dir}")
         return exported_files
 
-    def _export_arff(self, df: pd.DataFrame, file_path: Path, relation_name: str):
+    def _export_arff(self, df: pd.DataFrame, file_path: Path, relation_name: str,
+                     compress: bool = False):
         """Export DataFrame in ARFF format for KNIME/Weka compatibility."""
-        with open(file_path, 'w') as f:
-            # Write header
-            f.write(f"@RELATION {relation_name}\n\n")
-
-            # Write attribute definitions
-            for col in df.columns:
-                dtype = str(df[col].dtype)
-                if dtype in ['int64', 'int32']:
-                    f.write(f"@ATTRIBUTE {col} INTEGER\n")
-                elif dtype in ['float64', 'float32']:
-                    f.write(f"@ATTRIBUTE {col} REAL\n")
-                else:
-                    f.write(f"@ATTRIBUTE {col} STRING\n")
-
-            # Write data
-            f.write("\n@DATA\n")
-            for _, row in df.iterrows():
-                values = []
-                for val in row:
-                    if pd.isna(val):
-                        values.append('?')
-                    elif isinstance(val, str):
-                        values.append(f"'{val}'")
-                    else:
-                        values.append(str(val))
-                f.write(','.join(values) + '\n')
+        write_arff(df, file_path, relation_name, style=STYLE_TYPED, compress=compress)
 
     def get_workflow_config(self) -> Dict[str, Any]:
         """
@@ -8,6 +8,7 @@ Components:
 -----------
 - PowerBIConnector: Main data connector class
 - DatasetGenerator: Generate Power BI-ready datasets
+- DatasetCatalog: Lazy, memoized mapping of every dataset
 - ScriptBuilder: Build Power BI Python/R scripts dynamically
 
 Usage in Power BI Desktop:
@@ -26,14 +27,21 @@ Usage from Python:
 
     # Export for Power BI
     connector.export_for_powerbi('output/')
+
+    # Generate only what is read
+    connector.list_datasets('qsr')           # names, no generation
+    connector.get_dataset('QSR_SCR_Summary') # generates QSR only
 """
 
 from .connector import PowerBIConnector
 from .dataset_generator import DatasetGenerator
+from .catalog import DatasetCatalog, invalidate_cache
 from .script_builder import ScriptBuilder
 
 __all__ = [
     'PowerBIConnector',
     'DatasetGenerator',
+    'DatasetCatalog',
+    'invalidate_cache',
     'ScriptBuilder',
 ]
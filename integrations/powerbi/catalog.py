@@ -0,0 +1,343 @@
+"""
+Dataset Catalog
+===============
+
+Lazy, memoized catalog of the Power BI datasets.
+
+Dataset names and column schemas are known without generating anything. A
+category's DataFrames are generated the first time one of its datasets is
+accessed and memoized per (category, seed), so a report page that reads one
+table pays for one category instead of all of them.
+
+Categories are the unit of generation because the tables of a category draw
+from one seeded random stream: generating a category as a whole keeps every
+table identical to eager generation.
+
+Usage:
+------
+    from integrations.powerbi.catalog import DatasetCatalog, invalidate_cache
+
+    catalog = DatasetCatalog(seed=42)
+    catalog.names()                       # no generation
+    catalog.schema('RRA_193_NetClaims')   # no generation
+    claims = catalog['RRA_193_NetClaims'] # generates the RRA category only
+
+    invalidate_cache('rra')               # next access regenerates RRA
+"""
+
+import threading
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from lloyds_reporting.instrumentation import count_rows, span
+
+
+# Category -> (dataset name prefix, DatasetGenerator method)
+CATEGORY_SOURCES = {
+    'rra': ('RRA', 'generate_rra_forms'),
+    'rrq': ('RRQ', 'generate_rrq_forms'),
+    'qsr': ('QSR', 'generate_qsr_data'),
+    'asb': ('ASB', 'generate_asb_data'),
+    'lcr': ('LCR', 'generate_lcr_data'),
+    'sbf': ('SBF', 'generate_sbf_data'),
+    'qma': ('QMA', 'generate_qma_data'),
+    'fscs': ('FSCS', 'generate_fscs_data'),
+    'liquidity': ('Liquidity', 'generate_liquidity_data'),
+    'qrt': ('QRT', None),  # QRTs.generate_all_qrts
+    'claims': ('Claims', 'generate_claims_data'),
+}
+
+_CONTROL = ['Syndicate_Number', 'Return_Type', 'Status', 'Managing_Agent', 'Reporting_Year', 'Submission_Date']
+_EXCHANGE_RATES = ['Year_of_Account', 'Currency', 'Exchange_Rate_GBP', 'Rate_Type']
+_NET_CLAIMS = ['Syndicate_Number', 'Year_of_Account', 'Development_Year', 'LOB_Code', 'LOB_Name', 'Currency',
+               'Cumulative_Paid', 'Case_Reserves', 'IBNR', 'Total_Incurred', 'As_At_Date']
+_GROSS_PREMIUM_IBNR = ['Syndicate_Number', 'Year_of_Account', 'LOB_Code', 'LOB_Name', 'Gross_Written_Premium',
+                       'Gross_Earned_Premium', 'Paid_Claims', 'Case_Reserves', 'IBNR_Best_Estimate', 'IBNR_High',
+                       'IBNR_Low', 'Ultimate_Loss_Ratio']
+_ASB_CLAIMS = ['Syndicate_Number', 'Claim_Type', 'Origin_Year', 'Development_Year', 'Cumulative_Paid',
+               'Cumulative_Incurred']
+
+# Column schema of every DatasetGenerator table, by category and table name.
+# QRT template columns are taken from the templates when first generated.
+DATASET_SCHEMAS: Dict[str, Dict[str, List[str]]] = {
+    'rra': {
+        '010_Control': _CONTROL,
+        '020_ExchangeRates': _EXCHANGE_RATES,
+        '193_NetClaims': _NET_CLAIMS,
+        '291_GrossPremiumIBNR': _GROSS_PREMIUM_IBNR,
+        '292_NetPremiumIBNR': ['Syndicate_Number', 'Year_of_Account', 'LOB_Code', 'Net_Written_Premium',
+                               'Net_Earned_Premium', 'Net_Paid_Claims', 'Net_Case_Reserves', 'Net_IBNR',
+                               'RI_Recoveries', 'Net_Ultimate_Loss_Ratio'],
+        '990_Validation': ['Syndicate_Number', 'Total_Forms', 'Forms_With_Errors', 'Forms_With_Warnings',
+                           'Validation_Status', 'Completeness_Score'],
+        'DevelopmentTriangle': ['Syndicate_Number', 'Origin_Year', 'Development_Year', 'Calendar_Year',
+                                'Cumulative_Paid', 'Cumulative_Incurred'],
+        'SyndicateSummary': ['Syndicate_Number', 'Managing_Agent', 'Capacity_GBP', 'Gross_Written_Premium',
+                             'Net_Written_Premium', 'Ultimate_Loss_Ratio', 'Combined_Ratio', 'Solvency_Ratio'],
+    },
+    'rrq': {
+        '010_Control': _CONTROL,
+        '020_ExchangeRates': _EXCHANGE_RATES,
+        '193_NetClaims': _NET_CLAIMS,
+        '291_GrossPremiumIBNR': _GROSS_PREMIUM_IBNR,
+    },
+    'qsr': {
+        'BalanceSheet': ['Syndicate_Number', 'Total_Assets', 'Investments', 'Reinsurance_Recoverables',
+                         'Cash_And_Equivalents', 'Other_Assets', 'Total_Liabilities', 'Technical_Provisions',
+                         'Other_Liabilities', 'Own_Funds'],
+        'OwnFunds': ['Syndicate_Number', 'Tier_1_Unrestricted', 'Tier_1_Restricted', 'Tier_2', 'Tier_3',
+                     'Total_Own_Funds', 'Eligible_Own_Funds_SCR', 'Eligible_Own_Funds_MCR'],
+        'TechnicalProvisions': ['Syndicate_Number', 'LOB_Code', 'Best_Estimate_Liabilities', 'Risk_Margin',
+                                'Total_Technical_Provisions', 'Reinsurance_Recoverables',
+                                'Net_Technical_Provisions'],
+        'SCR_Summary': ['Syndicate_Number', 'Market_Risk', 'Counterparty_Risk', 'Underwriting_Risk',
+                        'Operational_Risk', 'Diversification_Benefit', 'LAC_DT', 'Total_SCR'],
+        'MCR_Calculation': ['Syndicate_Number', 'Linear_MCR', 'SCR_Based_MCR', 'Absolute_Floor_MCR',
+                            'Combined_MCR', 'Final_MCR'],
+        'SolvencyRatio': ['Syndicate_Number', 'Own_Funds', 'SCR', 'MCR', 'SCR_Coverage_Ratio',
+                          'MCR_Coverage_Ratio', 'Excess_Own_Funds'],
+    },
+    'asb': {
+        'ClaimsGross': _ASB_CLAIMS,
+        'ClaimsNet': _ASB_CLAIMS,
+        'ClaimsReinsurance': _ASB_CLAIMS,
+        'DevelopmentFactors': ['LOB_Code', 'Development_Year', 'Paid_Development_Factor',
+                               'Incurred_Development_Factor'],
+        'InflationRates': ['LOB_Code', 'Claims_Inflation_Rate', 'Expense_Inflation_Rate', 'Wage_Inflation_Rate'],
+    },
+    'lcr': {
+        'SCR_Summary': ['Syndicate_Number', 'Premium_Risk_SCR', 'Reserve_Risk_SCR', 'Cat_Risk_SCR',
+                        'Market_Risk_SCR', 'Credit_Risk_SCR', 'Operational_Risk_SCR', 'Diversification',
+                        'Total_SCR'],
+        'PremiumRisk': ['Syndicate_Number', 'LOB_Code', 'Net_Earned_Premium', 'Volume_Measure',
+                        'Premium_Risk_Factor', 'Premium_Risk_SCR'],
+        'ReserveRisk': ['Syndicate_Number', 'LOB_Code', 'Net_Best_Estimate', 'Reserve_Risk_Factor',
+                        'Reserve_Risk_SCR'],
+        'CatRisk': ['Syndicate_Number', 'Peril', 'Gross_Loss', 'RI_Recovery', 'Net_Loss', 'Cat_Risk_SCR'],
+        'MarketRisk': ['Syndicate_Number', 'Risk_Type', 'Exposure', 'Shock_Factor', 'SCR_Contribution'],
+        'CoverageRatios': ['Syndicate_Number', 'Own_Funds', 'SCR', 'Coverage_Ratio', 'Excess_Capital',
+                           'Rating_Implied'],
+    },
+    'sbf': {
+        'IncomeStatement': ['Syndicate_Number', 'Forecast_Year', 'Gross_Written_Premium', 'Net_Earned_Premium',
+                            'Claims_Incurred', 'Acquisition_Costs', 'Operating_Expenses', 'Investment_Income',
+                            'Underwriting_Result'],
+        'PremiumForecast': ['Syndicate_Number', 'Forecast_Year', 'LOB_Code', 'Gross_Written_Premium',
+                            'Growth_Rate', 'Rate_Change'],
+        'ClaimsForecast': ['Syndicate_Number', 'Forecast_Year', 'LOB_Code', 'Expected_Loss_Ratio',
+                           'Claims_Estimate', 'IBNR_Assumption'],
+        'CombinedRatios': ['Syndicate_Number', 'Forecast_Year', 'Loss_Ratio', 'Expense_Ratio', 'Combined_Ratio',
+                           'Target_Combined_Ratio'],
+    },
+    'qma': {
+        'BalanceSheet': ['Syndicate_Number', 'Quarter', 'Total_Assets', 'Total_Liabilities', 'Net_Assets'],
+        'ProfitLoss': ['Syndicate_Number', 'Quarter', 'Net_Earned_Premium', 'Claims_Incurred',
+                       'Operating_Expenses', 'Investment_Return', 'Profit_Before_Tax'],
+        'TechnicalAccount': ['Syndicate_Number', 'LOB_Code', 'Net_Earned_Premium', 'Claims_Incurred',
+                             'Technical_Result'],
+        'KeyRatios': ['Syndicate_Number', 'Loss_Ratio', 'Expense_Ratio', 'Combined_Ratio', 'Investment_Yield',
+                      'Return_on_Capital'],
+    },
+    'fscs': {
+        'Summary': ['Syndicate_Number', 'Year', 'Protected_Liabilities', 'FSCS_Levy', 'Management_Expenses_Levy'],
+        'Detail': ['Syndicate_Number', 'LOB_Code', 'Protected_Liabilities', 'Eligible_Premium', 'Levy_Rate'],
+    },
+    'liquidity': {
+        'CapitalPosition': ['Syndicate_Number', 'FAL', 'FIS', 'uSCR', 'uECA', 'Excess_Capital'],
+        'AssetBreakdown': ['Syndicate_Number', 'Quarter', 'Liquid_Assets', 'Illiquid_Assets', 'Restricted_Assets',
+                           'Total_Assets'],
+        'CashflowSummary': ['Syndicate_Number', 'Quarter', 'Opening_Balance', 'Cash_Inflows', 'Cash_Outflows',
+                            'Net_Movement', 'Closing_Balance'],
+        'StressImpact': ['Syndicate_Number', 'Scenario', 'Gross_Loss', 'RI_Recovery', 'Net_Loss',
+                         'Liquidity_Impact'],
+    },
+    'claims': {
+        'DetailedClaims': ['Claim_Reference', 'Syndicate_Number', 'Year_of_Account', 'Risk_Code', 'Currency',
+                           'Status', 'Outstanding_Amount', 'Paid_Amount', 'Incurred_Amount'],
+        'BySyndicate': ['Syndicate_Number', 'Total_Claims', 'Open_Claims', 'Closed_Claims', 'Total_Outstanding',
+                        'Total_Paid', 'Total_Incurred'],
+        'ByRiskCode': ['Risk_Code', 'Risk_Description', 'Total_Claims', 'Average_Claim_Size', 'Total_Incurred'],
+        'ByStatus': ['Status', 'Claim_Count', 'Total_Outstanding', 'Total_Paid', 'Average_Age_Days'],
+    },
+}
+
+# Memoized category tables by (category, seed)
+_CACHE: Dict[Tuple[str, int], Dict[str, pd.DataFrame]] = {}
+_CACHE_LOCK = threading.RLock()
+
+
+def _qrt_names() -> List[str]:
+    """QRT template names (importing the QRTs package, without generating)."""
+    try:
+        from QRTs import QRT_GENERATORS
+    except ImportError:
+        return []
+    return list(QRT_GENERATORS)
+
+
+def category_tables(category: str) -> List[str]:
+    """
+    Table names of a category, without generating it.
+
+    Args:
+        category: Category key (see CATEGORY_SOURCES)
+
+    Returns:
+        Unprefixed table names in generation order
+    """
+    if category not in CATEGORY_SOURCES:
+        raise KeyError(f"Unknown category '{category}'. Available: {list(CATEGORY_SOURCES)}")
+    if category == 'qrt':
+        return _qrt_names()
+    return list(DATASET_SCHEMAS[category])
+
+
+def _generate_category(category: str, seed: int) -> Dict[str, pd.DataFrame]:
+    """Generate every table of one category, inside an instrumentation span."""
+    with span(f'powerbi_{category}', 'generator', seed=seed) as s:
+        tables = _build_category(category, seed)
+        s.rows_out = count_rows(tables)
+    return tables
+
+
+def _build_category(category: str, seed: int) -> Dict[str, pd.DataFrame]:
+    if category == 'qrt':
+        try:
+            from QRTs import generate_all_qrts
+        except ImportError:
+            print("  Warning: QRTs module not available")
+            return {}
+        # Each template is seeded from the seed and its code, so the result
+        # does not depend on which categories were generated before
+        return generate_all_qrts(seed=seed)
+
+    from .dataset_generator import DatasetGenerator
+    method = CATEGORY_SOURCES[category][1]
+    return getattr(DatasetGenerator(seed=seed), method)()
+
+
+def load_category(category: str, seed: int = 42) -> Dict[str, pd.DataFrame]:
+    """
+    Tables of a category, generated once per (category, seed).
+
+    Args:
+        category: Category key (see CATEGORY_SOURCES)
+        seed: Random seed
+
+    Returns:
+        Dictionary of unprefixed table name to DataFrame (shared; copy before
+        modifying)
+    """
+    if category not in CATEGORY_SOURCES:
+        raise KeyError(f"Unknown category '{category}'. Available: {list(CATEGORY_SOURCES)}")
+    key = (category, seed)
+    with _CACHE_LOCK:
+        if key not in _CACHE:
+            _CACHE[key] = _generate_category(category, seed)
+        return _CACHE[key]
+
+
+def is_cached(category: str, seed: int = 42) -> bool:
+    """Whether a category has been generated for a seed."""
+    return (category, seed) in _CACHE
+
+
+def invalidate_cache(category: Optional[str] = None, seed: Optional[int] = None) -> int:
+    """
+    Drop memoized categories so they are regenerated on next access.
+
+    Args:
+        category: Category to drop (None: all categories)
+        seed: Seed to drop (None: all seeds)
+
+    Returns:
+        Number of (category, seed) entries removed
+    """
+    with _CACHE_LOCK:
+        keys = [key for key in _CACHE
+                if (category is None or key[0] == category) and (seed is None or key[1] == seed)]
+        for key in keys:
+            del _CACHE[key]
+    return len(keys)
+
+
+class DatasetCatalog(Mapping):
+    """
+    Read-only mapping of dataset name to DataFrame, generated on first access.
+
+    Iterating, ``len`` and ``in`` only use the catalog; reading a value
+    generates (or reuses) that dataset's category.
+
+    Attributes:
+        seed (int): Random seed of the generated data
+        categories (List[str]): Categories included in the catalog
+    """
+
+    def __init__(self, seed: int = 42, categories: Optional[List[str]] = None):
+        """
+        Initialize the catalog.
+
+        Args:
+            seed: Random seed for reproducibility
+            categories: Categories to include (default: all)
+        """
+        self.seed = seed
+        self.categories = list(categories) if categories is not None else list(CATEGORY_SOURCES)
+        unknown = [c for c in self.categories if c not in CATEGORY_SOURCES]
+        if unknown:
+            raise KeyError(f"Unknown categories {unknown}. Available: {list(CATEGORY_SOURCES)}")
+
+        # Dataset name -> (category, table name)
+        self._index: Dict[str, Tuple[str, str]] = {}
+        for category in self.categories:
+            prefix = CATEGORY_SOURCES[category][0]
+            for table in category_tables(category):
+                self._index[f'{prefix}_{table}'] = (category, table)
+
+    def __getitem__(self, name: str) -> pd.DataFrame:
+        if name not in self._index:
+            raise KeyError(f"Dataset '{name}' not found. Available: {list(self._index)}")
+        category, table = self._index[name]
+        return load_category(category, self.seed)[table]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def names(self, category: Optional[str] = None) -> List[str]:
+        """Dataset names, optionally for one category."""
+        return [name for name, (cat, _) in self._index.items() if category is None or cat == category]
+
+    def category_of(self, name: str) -> str:
+        """Category that generates a dataset."""
+        return self._index[name][0]
+
+    def schema(self, name: str) -> List[str]:
+        """
+        Column names of a dataset.
+
+        Declared schemas are returned without generating; QRT templates are
+        generated to read their columns.
+        """
+        category, table = self._index[name]
+        declared = DATASET_SCHEMAS.get(category, {}).get(table)
+        if declared is not None:
+            return list(declared)
+        return list(self[name].columns)
+
+    def is_loaded(self, name: str) -> bool:
+        """Whether a dataset's category has already been generated."""
+        return is_cached(self._index[name][0], self.seed)
+
+    def invalidate(self, category: Optional[str] = None) -> int:
+        """Drop this seed's memoized categories (one, or all of the catalog's)."""
+        categories = [category] if category is not None else self.categories
+        return sum(invalidate_cache(c, self.seed) for c in categories)
+
+    def materialize(self, names: Optional[List[str]] = None) -> Dict[str, pd.DataFrame]:
+        """Generate and return datasets as a plain dictionary (default: all)."""
+        return {name: self[name] for name in (names if names is not None else self._index)}
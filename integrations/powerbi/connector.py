@@ -17,6 +17,11 @@ import sys
 # Add parent paths for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from lloyds_reporting import instrumentation
+
+from ..shared.export_scheduler import ExportScheduler, MANIFEST_NAME
+from .catalog import CATEGORY_SOURCES, DatasetCatalog, load_category
+
 try:
     from lloyds_reporting.config import RANDOM_SEED
     np.random.seed(RANDOM_SEED)
@@ -29,9 +34,12 @@ class PowerBIConnector:
     Power BI data connector for Lloyd's regulatory reporting.
 
     Generates and manages datasets optimized for Power BI consumption.
+    Dataset names and schemas are available up front; data is generated per
+    category on first access and memoized per (category, seed).
 
     Attributes:
         datasets (Dict[str, pd.DataFrame]): Generated datasets
+        catalog (DatasetCatalog): Lazy view of every available dataset
         metadata (Dict[str, Any]): Dataset metadata
 
     Example:
@@ -65,6 +73,7 @@ class PowerBIConnector:
         self.seed = seed
         np.random.seed(seed)
         self.datasets: Dict[str, pd.DataFrame] = {}
+        self.catalog = DatasetCatalog(seed=seed)
         self.metadata: Dict[str, Any] = {
             'generated_at': datetime.now().isoformat(),
             'seed': seed,
@@ -75,6 +84,8 @@ class PowerBIConnector:
         """
         Generate all datasets for Power BI.
 
+        Categories already generated for this seed are reused.
+
         Args:
             categories: List of categories to generate. If None, generates all.
 
@@ -91,173 +102,113 @@ class PowerBIConnector:
 
             print(f"Generating {self.CATEGORIES[category]}...")
 
-            if category == 'rra':
-                self._generate_rra_datasets()
-            elif category == 'rrq':
-                self._generate_rrq_datasets()
-            elif category == 'qsr':
-                self._generate_qsr_datasets()
-            elif category == 'asb':
-                self._generate_asb_datasets()
-            elif category == 'lcr':
-                self._generate_lcr_datasets()
-            elif category == 'sbf':
-                self._generate_sbf_datasets()
-            elif category == 'qma':
-                self._generate_qma_datasets()
-            elif category == 'fscs':
-                self._generate_fscs_datasets()
-            elif category == 'liquidity':
-                self._generate_liquidity_datasets()
-            elif category == 'qrt':
-                self._generate_qrt_datasets()
-            elif category == 'claims':
-                self._generate_claims_datasets()
+            prefix = CATEGORY_SOURCES[category][0]
+            for name, df in load_category(category, self.seed).items():
+                self.datasets[f'{prefix}_{name}'] = df
 
         self.metadata['datasets'] = list(self.datasets.keys())
         self.metadata['total_records'] = sum(len(df) for df in self.datasets.values())
+        if instrumentation.is_enabled():
+            self.metadata['timings'] = instrumentation.summary(category='generator')
 
         print(f"\nGenerated {len(self.datasets)} datasets with {self.metadata['total_records']:,} total records")
         return self.datasets
 
-    def _generate_rra_datasets(self):
-        """Generate RRA form datasets."""
-        from .dataset_generator import DatasetGenerator
-        gen = DatasetGenerator(seed=self.seed)
-
-        rra_data = gen.generate_rra_forms()
-        for name, df in rra_data.items():
-            self.datasets[f'RRA_{name}'] = df
-
-    def _generate_rrq_datasets(self):
-        """Generate RRQ form datasets."""
-        from .dataset_generator import DatasetGenerator
-        gen = DatasetGenerator(seed=self.seed)
-
-        rrq_data = gen.generate_rrq_forms()
-        for name, df in rrq_data.items():
-            self.datasets[f'RRQ_{name}'] = df
-
-    def _generate_qsr_datasets(self):
-        """Generate QSR datasets."""
-        from .dataset_generator import DatasetGenerator
-        gen = DatasetGenerator(seed=self.seed)
-
-        qsr_data = gen.generate_qsr_data()
-        for name, df in qsr_data.items():
-            self.datasets[f'QSR_{name}'] = df
-
-    def _generate_asb_datasets(self):
-        """Generate ASB datasets."""
-        from .dataset_generator import DatasetGenerator
-        gen = DatasetGenerator(seed=self.seed)
-
-        asb_data = gen.generate_asb_data()
-        for name, df in asb_data.items():
-            self.datasets[f'ASB_{name}'] = df
-
-    def _generate_lcr_datasets(self):
-        """Generate LCR datasets."""
-        from .dataset_generator import DatasetGenerator
-        gen = DatasetGenerator(seed=self.seed)
-
-        lcr_data = gen.generate_lcr_data()
-        for name, df in lcr_data.items():
-            self.datasets[f'LCR_{name}'] = df
-
-    def _generate_sbf_datasets(self):
-        """Generate SBF datasets."""
-        from .dataset_generator import DatasetGenerator
-        gen = DatasetGenerator(seed=self.seed)
-
-        sbf_data = gen.generate_sbf_data()
-        for name, df in sbf_data.items():
-            self.datasets[f'SBF_{name}'] = df
-
-    def _generate_qma_datasets(self):
-        """Generate QMA datasets."""
-        from .dataset_generator import DatasetGenerator
-        gen = DatasetGenerator(seed=self.seed)
-
-        qma_data = gen.generate_qma_data()
-        for name, df in qma_data.items():
-            self.datasets[f'QMA_{name}'] = df
-
-    def _generate_fscs_datasets(self):
-        """Generate FSCS datasets."""
-        from .dataset_generator import DatasetGenerator
-        gen = DatasetGenerator(seed=self.seed)
-
-        fscs_data = gen.generate_fscs_data()
-        for name, df in fscs_data.items():
-            self.datasets[f'FSCS_{name}'] = df
-
-    def _generate_liquidity_datasets(self):
-        """Generate liquidity stress testing datasets."""
-        from .dataset_generator import DatasetGenerator
-        gen = DatasetGenerator(seed=self.seed)
-
-        liq_data = gen.generate_liquidity_data()
-        for name, df in liq_data.items():
-            self.datasets[f'Liquidity_{name}'] = df
-
-    def _generate_qrt_datasets(self):
-        """Generate QRT template datasets."""
-        try:
-            from QRTs import generate_all_qrts
-            qrt_data = generate_all_qrts()
-            for name, df in qrt_data.items():
-                self.datasets[f'QRT_{name}'] = df
-        except ImportError:
-            print("  Warning: QRTs module not available")
-
-    def _generate_claims_datasets(self):
-        """Generate claims analysis datasets."""
-        from .dataset_generator import DatasetGenerator
-        gen = DatasetGenerator(seed=self.seed)
-
-        claims_data = gen.generate_claims_data()
-        for name, df in claims_data.items():
-            self.datasets[f'Claims_{name}'] = df
-
-    def export_for_powerbi(self, output_dir: str, format: str = 'csv') -> List[str]:
+    def list_datasets(self, category: Optional[str] = None) -> List[str]:
+        """
+        List dataset names without generating any data.
+
+        Args:
+            category: Only list datasets of this category
+
+        Returns:
+            List of dataset names
+        """
+        return self.catalog.names(category)
+
+    def get_schema(self, name: str) -> List[str]:
+        """
+        Get the column names of a dataset without generating it.
+
+        Args:
+            name: Dataset name (e.g. 'RRA_193_NetClaims')
+
+        Returns:
+            List of column names
+        """
+        return self.catalog.schema(name)
+
+    def get_dataset(self, name: str) -> pd.DataFrame:
+        """
+        Get one dataset, generating only its category on first access.
+
+        Generated categories are memoized per (category, seed) and shared
+        by every connector with the same seed.
+
+        Args:
+            name: Dataset name (e.g. 'RRA_193_NetClaims')
+
+        Returns:
+            Dataset DataFrame
+        """
+        df = self.catalog[name]
+        self.datasets[name] = df
+        return df
+
+    def invalidate(self, category: Optional[str] = None):
+        """
+        Drop memoized datasets so they are regenerated on next access.
+
+        Args:
+            category: Category to invalidate. If None, invalidates all.
+        """
+        self.catalog.invalidate(category)
+        if category is None:
+            self.datasets.clear()
+        else:
+            for name in self.catalog.names(category):
+                self.datasets.pop(name, None)
+
+    def export_for_powerbi(self, output_dir: str, format: str = 'csv',
+                           force: bool = False, max_workers: Optional[int] = None) -> List[str]:
         """
         Export datasets in Power BI-ready format.
 
+        Datasets are written concurrently and recorded in manifest.json
+        (size, rows, SHA-256, write duration). Datasets unchanged since the
+        last export are not rewritten unless ``force`` is set.
+
         Args:
             output_dir: Output directory path
             format: Output format ('csv', 'excel', 'json')
+            force: Rewrite unchanged datasets as well
+            max_workers: Concurrent writers (default: CPU count)
 
         Returns:
             List of exported file paths
         """
+        if format not in ('csv', 'excel', 'json'):
+            raise ValueError(f"Unsupported format: {format}")
+
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        exported_files = []
-
-        for name, df in self.datasets.items():
-            if format == 'csv':
-                file_path = output_path / f"{name}.csv"
-                df.to_csv(file_path, index=False)
-            elif format == 'excel':
-                file_path = output_path / f"{name}.xlsx"
-                df.to_excel(file_path, index=False)
-            elif format == 'json':
-                file_path = output_path / f"{name}.json"
-                df.to_json(file_path, orient='records', date_format='iso')
-            else:
-                raise ValueError(f"Unsupported format: {format}")
-
-            exported_files.append(str(file_path))
+        scheduler = ExportScheduler(max_workers=max_workers)
+        paths = scheduler.export(self.datasets, [format], output_path,
+                                 writer_options={'excel': {'sheet_name': 'Sheet1'}},
+                                 force=force)
+        exported_files = [str(formats[format]) for formats in paths.values()]
 
         # Export metadata
         meta_path = output_path / "_metadata.json"
         with open(meta_path, 'w') as f:
             json.dump(self.metadata, f, indent=2, default=str)
         exported_files.append(str(meta_path))
+        exported_files.append(str(output_path / MANIFEST_NAME))
 
-        print(f"Exported {len(exported_files)} files to {output_dir}")
+        manifest = scheduler.manifest
+        print(f"Exported {len(exported_files)} files to {output_dir} "
+              f"({manifest['files_written']} written, {manifest['files_unchanged']} unchanged)")
         return exported_files
 
     def get_dataset_info(self) -> pd.DataFrame:
@@ -294,14 +245,21 @@ class PowerBIConnector:
 
 
 # Convenience function for Power BI scripts
-def get_all_data() -> Dict[str, pd.DataFrame]:
+def get_all_data(seed: int = 42, categories: Optional[List[str]] = None) -> DatasetCatalog:
     """
     Convenience function to get all datasets.
 
+    Returns a lazy mapping: a report page that reads one dataset only
+    generates that dataset's category.
+
+    Args:
+        seed: Random seed for reproducibility
+        categories: Categories to include. If None, includes all.
+
     Usage in Power BI:
         # import pandas as pd
         # exec(open('path/to/connector.py').read())
         # datasets = get_all_data()
+        # claims = datasets['Claims_BySyndicate']
     """
-    connector = PowerBIConnector()
-    return connector.generate_all_datasets()
+    return DatasetCatalog(seed=seed, categories=categories)
@@ -3,12 +3,26 @@ Power BI Dataset Generator
 ==========================
 
 Generates synthetic datasets optimized for Power BI visualization.
+
+Vectorized mode:
+----------------
+``DatasetGenerator(vectorized=True)`` builds the (syndicate x YoA x LOB x
+development year) grids with ``MultiIndex.from_product`` and draws each random
+field as one array from a ``numpy.random.Generator`` instead of calling
+``random.*`` per field inside nested loops. Use it for market-scale load
+testing:
+
+    gen = DatasetGenerator.market_scale(n_syndicates=300, n_years=20, n_lobs=21)
+    rra = gen.generate_rra_forms()
+
+Vectorized output has the same columns and dtypes as the loop mode but
+different random values (the numpy stream is not the ``random`` stream).
 """
 
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import random
 import sys
 from pathlib import Path
@@ -43,19 +57,75 @@ class DatasetGenerator:
     All methods return dictionaries of DataFrames ready for Power BI.
     """
 
-    def __init__(self, seed: int = 42):
-        """Initialize with random seed for reproducibility."""
+    # Display limits of the loop-mode grids
+    GRID_LOBS = 5
+    TRIANGLE_SYNDICATES = 3
+    ASB_SYNDICATES = 5
+
+    def __init__(self, seed: int = 42, vectorized: bool = False,
+                 syndicates: Optional[List[int]] = None,
+                 years: Optional[List[int]] = None,
+                 lob_codes: Optional[List[str]] = None,
+                 full_grid: bool = False):
+        """
+        Initialize with random seed for reproducibility.
+
+        Args:
+            seed: Random seed
+            vectorized: Generate the claims / premium grids with numpy arrays
+            syndicates: Syndicate numbers (default: configured syndicates)
+            years: Years of account (default: configured years)
+            lob_codes: LOB codes (default: configured classes of business)
+            full_grid: In vectorized mode, span every syndicate, year and LOB
+                in the grids instead of the loop-mode display limits
+        """
         self.seed = seed
         np.random.seed(seed)
         random.seed(seed)
+        self.vectorized = vectorized
+        self.full_grid = full_grid
+        self.rng = np.random.default_rng(seed)
 
-        self.syndicates = SYNDICATES_PRIMARY
-        self.lob_codes = list(CLASSES_OF_BUSINESS.keys())
+        self.syndicates = list(syndicates) if syndicates is not None else SYNDICATES_PRIMARY
+        self.lob_codes = list(lob_codes) if lob_codes is not None else list(CLASSES_OF_BUSINESS.keys())
         self.lob_names = CLASSES_OF_BUSINESS
         self.currencies = CURRENCIES
-        self.years = YEARS_OF_ACCOUNT
+        self.years = list(years) if years is not None else YEARS_OF_ACCOUNT
         self.current_year = CURRENT_YEAR
 
+    @classmethod
+    def market_scale(cls, n_syndicates: int = 300, n_years: int = 20, n_lobs: int = 21,
+                     seed: int = 42) -> 'DatasetGenerator':
+        """
+        Vectorized generator sized like the whole market, for load testing.
+
+        Configured syndicates and LOBs are used first and padded with
+        synthetic ones. Years of account run up to the year after the
+        current year (the loop grids exclude the last year).
+
+        Args:
+            n_syndicates: Number of syndicates
+            n_years: Number of years of account
+            n_lobs: Number of lines of business
+            seed: Random seed
+
+        Returns:
+            DatasetGenerator in vectorized, full-grid mode
+        """
+        syndicates = list(SYNDICATES_PRIMARY[:n_syndicates])
+        next_number = max(syndicates, default=0) + 1
+        while len(syndicates) < n_syndicates:
+            if next_number not in syndicates:
+                syndicates.append(next_number)
+            next_number += 1
+
+        lob_codes = list(CLASSES_OF_BUSINESS.keys())[:n_lobs]
+        lob_codes += [f'X{i:02d}' for i in range(1, n_lobs - len(lob_codes) + 1)]
+
+        years = list(range(CURRENT_YEAR - n_years + 2, CURRENT_YEAR + 2))
+        return cls(seed=seed, vectorized=True, syndicates=syndicates, years=years,
+                   lob_codes=lob_codes, full_grid=True)
+
     # =========================================================================
     # RRA FORMS
     # =========================================================================
@@ -203,6 +273,8 @@ class DatasetGenerator:
 
     def _generate_net_claims(self, quarterly: bool = False) -> pd.DataFrame:
         """Generate net claims development data."""
+        if self.vectorized:
+            return self._vectorized_net_claims(quarterly)
         data = []
         for syn in self.syndicates:
             for year in self.years[:-1]:
@@ -229,6 +301,8 @@ class DatasetGenerator:
 
     def _generate_gross_premium_ibnr(self, quarterly: bool = False) -> pd.DataFrame:
         """Generate gross premium and IBNR data."""
+        if self.vectorized:
+            return self._vectorized_gross_premium_ibnr(quarterly)
         data = []
         for syn in self.syndicates:
             for year in self.years[:-1]:
@@ -253,6 +327,8 @@ class DatasetGenerator:
 
     def _generate_net_premium_ibnr(self) -> pd.DataFrame:
         """Generate net premium and IBNR data."""
+        if self.vectorized:
+            return self._vectorized_net_premium_ibnr()
         data = []
         for syn in self.syndicates:
             for year in self.years[:-1]:
@@ -289,6 +365,8 @@ class DatasetGenerator:
 
     def _generate_development_triangle(self) -> pd.DataFrame:
         """Generate claims development triangle."""
+        if self.vectorized:
+            return self._vectorized_development_triangle()
         data = []
         for syn in self.syndicates[:3]:  # Limit for performance
             for origin_year in range(2018, 2024):
@@ -322,6 +400,129 @@ class DatasetGenerator:
             })
         return pd.DataFrame(data)
 
+    # =========================================================================
+    # VECTORIZED GRID GENERATION
+    # =========================================================================
+
+    @staticmethod
+    def _grid(**levels) -> pd.DataFrame:
+        """Cartesian product of the given levels as columns, in loop order."""
+        index = pd.MultiIndex.from_product(list(levels.values()), names=list(levels))
+        return index.to_frame(index=False)
+
+    def _grid_lobs(self) -> List[str]:
+        return self.lob_codes if self.full_grid else self.lob_codes[:self.GRID_LOBS]
+
+    def _grid_syndicates(self, limit: int) -> List[int]:
+        return self.syndicates if self.full_grid else self.syndicates[:limit]
+
+    def _lob_name_column(self, lob_codes: pd.Series) -> pd.Series:
+        return lob_codes.map(self.lob_names).fillna(lob_codes)
+
+    def _uniform(self, low: float, high: float, n: int) -> np.ndarray:
+        return self.rng.uniform(low, high, n)
+
+    def _randint(self, low: int, high: int, n: int) -> np.ndarray:
+        """Integers in [low, high], like random.randint."""
+        return self.rng.integers(low, high, n, endpoint=True)
+
+    def _vectorized_net_claims(self, quarterly: bool = False) -> pd.DataFrame:
+        """Vectorized net claims development data."""
+        df = self._grid(Syndicate_Number=self.syndicates, Year_of_Account=self.years[:-1],
+                        LOB_Code=self._grid_lobs(), Development_Year=range(8))
+        df = df[df['Development_Year'] <= self.current_year - df['Year_of_Account']]
+        df = df[['Syndicate_Number', 'Year_of_Account', 'Development_Year', 'LOB_Code']].reset_index(drop=True)
+
+        n = len(df)
+        incurred = self._randint(1_000_000, 20_000_000, n) * self._uniform(0.45, 0.85, n)
+        dev_factor = np.minimum(1.0, 0.2 + df['Development_Year'].to_numpy() * 0.15)
+
+        df['LOB_Name'] = self._lob_name_column(df['LOB_Code'])
+        df['Currency'] = 'GBP'
+        df['Cumulative_Paid'] = (incurred * dev_factor).astype(np.int64)
+        df['Case_Reserves'] = (incurred * (1 - dev_factor) * 0.6).astype(np.int64)
+        df['IBNR'] = (incurred * (1 - dev_factor) * 0.4).astype(np.int64)
+        df['Total_Incurred'] = incurred.astype(np.int64)
+        df['As_At_Date'] = (df['Year_of_Account'] + df['Development_Year']).astype(str) + '-12-31'
+        return df
+
+    def _premium_grid(self) -> pd.DataFrame:
+        return self._grid(Syndicate_Number=self.syndicates, Year_of_Account=self.years[:-1],
+                          LOB_Code=self._grid_lobs())
+
+    def _vectorized_gross_premium_ibnr(self, quarterly: bool = False) -> pd.DataFrame:
+        """Vectorized gross premium and IBNR data."""
+        df = self._premium_grid()
+        n = len(df)
+        gwp = self._randint(5_000_000, 50_000_000, n)
+        ulr = self._uniform(0.55, 0.75, n)
+        claims = gwp * ulr
+
+        df['LOB_Name'] = self._lob_name_column(df['LOB_Code'])
+        df['Gross_Written_Premium'] = gwp
+        df['Gross_Earned_Premium'] = (gwp * self._uniform(0.85, 0.95, n)).astype(np.int64)
+        df['Paid_Claims'] = (claims * self._uniform(0.4, 0.7, n)).astype(np.int64)
+        df['Case_Reserves'] = (claims * self._uniform(0.1, 0.2, n)).astype(np.int64)
+        df['IBNR_Best_Estimate'] = (claims * self._uniform(0.15, 0.35, n)).astype(np.int64)
+        df['IBNR_High'] = (claims * self._uniform(0.20, 0.40, n)).astype(np.int64)
+        df['IBNR_Low'] = (claims * self._uniform(0.10, 0.25, n)).astype(np.int64)
+        df['Ultimate_Loss_Ratio'] = np.round(ulr, 4)
+        return df
+
+    def _vectorized_net_premium_ibnr(self) -> pd.DataFrame:
+        """Vectorized net premium and IBNR data."""
+        df = self._premium_grid()
+        n = len(df)
+        nwp = self._randint(3_000_000, 40_000_000, n)
+        ulr = self._uniform(0.50, 0.70, n)
+        claims = nwp * ulr
+
+        df['Net_Written_Premium'] = nwp
+        df['Net_Earned_Premium'] = (nwp * self._uniform(0.85, 0.95, n)).astype(np.int64)
+        df['Net_Paid_Claims'] = (claims * self._uniform(0.45, 0.75, n)).astype(np.int64)
+        df['Net_Case_Reserves'] = (claims * self._uniform(0.08, 0.18, n)).astype(np.int64)
+        df['Net_IBNR'] = (claims * self._uniform(0.12, 0.30, n)).astype(np.int64)
+        df['RI_Recoveries'] = (nwp * self._uniform(0.10, 0.25, n)).astype(np.int64)
+        df['Net_Ultimate_Loss_Ratio'] = np.round(ulr, 4)
+        return df
+
+    def _triangle_grid(self, syndicates: List[int], first_origin: int, valuation_year: int,
+                       origin_column: str, dev_column: str) -> pd.DataFrame:
+        """Syndicate x origin year x development year, upper-left triangle only."""
+        if self.full_grid:
+            first_origin, valuation_year = self.years[0], self.current_year
+        origins = range(first_origin, valuation_year)
+        df = self._grid(Syndicate_Number=syndicates, **{origin_column: origins},
+                        **{dev_column: range(valuation_year - first_origin + 1)})
+        df = df[df[dev_column] <= valuation_year - df[origin_column]]
+        return df.reset_index(drop=True)
+
+    def _vectorized_development_triangle(self) -> pd.DataFrame:
+        """Vectorized claims development triangle."""
+        df = self._triangle_grid(self._grid_syndicates(self.TRIANGLE_SYNDICATES), 2018, 2024,
+                                 'Origin_Year', 'Development_Year')
+        n = len(df)
+        base = self._randint(10_000_000, 100_000_000, n)
+        factor = np.minimum(1.0, 0.15 + df['Development_Year'].to_numpy() * 0.12)
+
+        df['Calendar_Year'] = df['Origin_Year'] + df['Development_Year']
+        df['Cumulative_Paid'] = (base * factor).astype(np.int64)
+        df['Cumulative_Incurred'] = (base * factor * 1.3).astype(np.int64)
+        return df
+
+    def _vectorized_asb_claims(self, claim_type: str) -> pd.DataFrame:
+        """Vectorized ASB claims triangle data."""
+        multiplier = {'Gross': 1.0, 'Net': 0.7, 'Reinsurance': 0.3}.get(claim_type, 1.0)
+        df = self._triangle_grid(self._grid_syndicates(self.ASB_SYNDICATES), 2015, 2024,
+                                 'Origin_Year', 'Development_Year')
+        base = self._randint(5_000_000, 50_000_000, len(df)) * multiplier
+        dev = df['Development_Year'].to_numpy()
+
+        df.insert(1, 'Claim_Type', claim_type)
+        df['Cumulative_Paid'] = (base * np.minimum(1, 0.1 + dev * 0.12)).astype(np.int64)
+        df['Cumulative_Incurred'] = (base * np.minimum(1, 0.15 + dev * 0.12)).astype(np.int64)
+        return df
+
     # =========================================================================
     # HELPER METHODS - SOLVENCY II
     # =========================================================================
@@ -431,6 +632,8 @@ class DatasetGenerator:
 
     def _generate_asb_claims(self, claim_type: str) -> pd.DataFrame:
         """Generate ASB claims triangle data."""
+        if self.vectorized:
+            return self._vectorized_asb_claims(claim_type)
         multiplier = {'Gross': 1.0, 'Net': 0.7, 'Reinsurance': 0.3}.get(claim_type, 1.0)
         data = []
         for syn in self.syndicates[:5]:
@@ -9,14 +9,20 @@ Components:
 - DataConnector: Base data connection class
 - DataValidator: Common validation utilities
 - ExportManager: Multi-format export utilities
+- write_arff: Column-wise ARFF encoder (optionally gzip)
+- ExportScheduler: Concurrent multi-format export with a hashed manifest
 """
 
 from .data_connector import DataConnector
 from .validator import DataValidator
 from .export_manager import ExportManager
+from .arff_writer import write_arff
+from .export_scheduler import ExportScheduler
 
 __all__ = [
     'DataConnector',
     'DataValidator',
     'ExportManager',
+    'write_arff',
+    'ExportScheduler',
 ]
@@ -13,6 +13,8 @@ from datetime import datetime
 import pandas as pd
 import numpy as np
 
+from lloyds_reporting import instrumentation
+
 
 class DataConnector:
     """
@@ -132,8 +134,13 @@ class DataConnector:
         return np.concatenate([factors, np.ones(years - len(factors))])
 
     def create_metadata(self, table_name: str, df: pd.DataFrame) -> Dict[str, Any]:
-        """Create metadata for a dataset."""
-        return {
+        """
+        Create metadata for a dataset.
+
+        With instrumentation enabled, 'timings' holds the per-generator
+        timing summary of the run, as in PowerBIConnector.metadata.
+        """
+        metadata = {
             'table_name': table_name,
             'row_count': len(df),
             'column_count': len(df.columns),
@@ -143,6 +150,9 @@ class DataConnector:
             'generated_at': datetime.now().isoformat(),
             'config': self.config,
         }
+        if instrumentation.is_enabled():
+            metadata['timings'] = instrumentation.summary(category='generator')
+        return metadata
 
     def get_schema(self, df: pd.DataFrame) -> Dict[str, str]:
         """Get schema (column types) for a DataFrame."""
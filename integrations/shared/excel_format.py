@@ -0,0 +1,252 @@
+"""
+Excel Formatting
+================
+
+Worksheet formatting and high-throughput workbook writing shared by the Excel
+exporters.
+
+``write_workbook`` streams DataFrames to disk in constant memory, using
+xlsxwriter's constant_memory mode when xlsxwriter is installed and openpyxl's
+write-only mode otherwise. Column widths are computed from the DataFrame with
+vectorized string lengths over a row sample instead of visiting every cell.
+
+Kept free of ExportManager state so it can run inside export worker
+processes.
+"""
+
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import xlsxwriter
+    HAS_XLSXWRITER = True
+except ImportError:
+    HAS_XLSXWRITER = False
+
+
+# Rows sampled when sizing columns
+DEFAULT_WIDTH_SAMPLE = 10_000
+
+# Column width bounds (characters)
+MAX_COLUMN_WIDTH = 50
+WIDTH_PADDING = 2
+
+HEADER_FONT_COLOR = 'FFFFFF'
+HEADER_FILL_COLOR = '003366'
+
+
+def _header_styles():
+    """Font, fill and alignment of the standard header row."""
+    from openpyxl.styles import Font, PatternFill, Alignment
+
+    return (Font(bold=True, color=HEADER_FONT_COLOR),
+            PatternFill(start_color=HEADER_FILL_COLOR, end_color=HEADER_FILL_COLOR, fill_type='solid'),
+            Alignment(horizontal='center'))
+
+
+def _sample(df: pd.DataFrame, sample_rows: Optional[int]) -> pd.DataFrame:
+    """Evenly spaced rows of a frame (the whole frame if it is small)."""
+    if sample_rows is None or len(df) <= sample_rows:
+        return df
+    positions = np.linspace(0, len(df) - 1, sample_rows).astype(np.int64)
+    return df.iloc[positions]
+
+
+def column_widths(df: pd.DataFrame, sample_rows: Optional[int] = DEFAULT_WIDTH_SAMPLE,
+                  max_width: int = MAX_COLUMN_WIDTH) -> Dict[int, float]:
+    """
+    Column widths from the longest header or value per column.
+
+    Args:
+        df: Sheet data
+        sample_rows: Rows sampled per column (None: all rows)
+        max_width: Width cap
+
+    Returns:
+        Dictionary of 1-based column index to width
+    """
+    sample = _sample(df, sample_rows)
+    widths = {}
+    for position, col in enumerate(df.columns, start=1):
+        longest = len(str(col))
+        values = sample.iloc[:, position - 1]
+        values = values[values.notna()]
+        if len(values):
+            longest = max(longest, int(values.astype(str).str.len().max()))
+        widths[position] = min(longest + WIDTH_PADDING, max_width)
+    return widths
+
+
+def format_header(worksheet, sample_rows: Optional[int] = DEFAULT_WIDTH_SAMPLE):
+    """
+    Apply the standard header style and auto-fit column widths.
+
+    Widths are taken from the header and the first ``sample_rows`` rows.
+
+    Args:
+        worksheet: openpyxl worksheet with the header in row 1
+        sample_rows: Data rows inspected for widths (None: all rows)
+    """
+    try:
+        header_font, header_fill, header_alignment = _header_styles()
+    except ImportError:
+        return  # openpyxl styles not available
+
+    for cell in worksheet[1]:
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = header_alignment
+
+    # Auto-adjust column widths
+    from openpyxl.utils import get_column_letter
+
+    max_row = worksheet.max_row if sample_rows is None else min(worksheet.max_row, sample_rows + 1)
+    lengths = {}
+    for row in worksheet.iter_rows(min_row=1, max_row=max_row, values_only=True):
+        for position, value in enumerate(row, start=1):
+            if value is not None:
+                lengths[position] = max(lengths.get(position, 0), len(str(value)))
+    for position, length in lengths.items():
+        worksheet.column_dimensions[get_column_letter(position)].width = min(length + WIDTH_PADDING,
+                                                                             MAX_COLUMN_WIDTH)
+
+
+def _cell_columns(df: pd.DataFrame):
+    """
+    Columns as object arrays of Excel-ready values.
+
+    Missing values become None (empty cells) and infinities the strings
+    'inf' / '-inf', as DataFrame.to_excel writes them: Excel has no infinite
+    number, and ratio columns divide by amounts that can be zero.
+    """
+    columns = []
+    for position in range(df.shape[1]):
+        series = df.iloc[:, position]
+        values = series.to_numpy(dtype=object)
+        missing = pd.isna(values)
+        if series.dtype.kind in 'fcO':
+            positive = series.isin([np.inf]).to_numpy()
+            negative = series.isin([-np.inf]).to_numpy()
+        else:
+            positive = negative = None
+        if missing.any() or (positive is not None and (positive.any() or negative.any())):
+            values = values.copy()
+            values[missing] = None
+            if positive is not None:
+                values[positive] = 'inf'
+                values[negative] = '-inf'
+        columns.append(values)
+    return columns
+
+
+def _write_xlsxwriter(path: Path, sheets: Dict[str, pd.DataFrame], format_header_row: bool,
+                      sample_rows: Optional[int], block_rows: int):
+    """Stream sheets with xlsxwriter's constant_memory mode."""
+    workbook = xlsxwriter.Workbook(str(path), {
+        'constant_memory': True,
+        'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+        'remove_timezone': True,
+    })
+    header_format = None
+    if format_header_row:
+        header_format = workbook.add_format({
+            'bold': True,
+            'font_color': f'#{HEADER_FONT_COLOR}',
+            'bg_color': f'#{HEADER_FILL_COLOR}',
+            'align': 'center',
+        })
+
+    try:
+        for sheet_name, df in sheets.items():
+            worksheet = workbook.add_worksheet(str(sheet_name)[:31])
+            if format_header_row:
+                for position, width in column_widths(df, sample_rows).items():
+                    worksheet.set_column(position - 1, position - 1, width)
+
+            worksheet.write_row(0, 0, [str(col) for col in df.columns], header_format)
+            row_number = 1
+            for start in range(0, len(df), block_rows):
+                for row in zip(*_cell_columns(df.iloc[start:start + block_rows])):
+                    worksheet.write_row(row_number, 0, row)
+                    row_number += 1
+    finally:
+        workbook.close()
+
+
+def _write_openpyxl(path: Path, sheets: Dict[str, pd.DataFrame], format_header_row: bool,
+                    sample_rows: Optional[int], block_rows: int):
+    """Stream sheets with openpyxl's write-only mode."""
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.utils import get_column_letter
+
+    workbook = Workbook(write_only=True)
+    styles = _header_styles() if format_header_row else None
+
+    for sheet_name, df in sheets.items():
+        worksheet = workbook.create_sheet(title=str(sheet_name)[:31])
+
+        # Column dimensions must be set before any row is written
+        if format_header_row:
+            for position, width in column_widths(df, sample_rows).items():
+                worksheet.column_dimensions[get_column_letter(position)].width = width
+
+        header = [str(col) for col in df.columns]
+        if styles is not None:
+            header_font, header_fill, header_alignment = styles
+            cells = []
+            for name in header:
+                cell = WriteOnlyCell(worksheet, value=name)
+                cell.font = header_font
+                cell.fill = header_fill
+                cell.alignment = header_alignment
+                cells.append(cell)
+            worksheet.append(cells)
+        else:
+            worksheet.append(header)
+
+        for start in range(0, len(df), block_rows):
+            for row in zip(*_cell_columns(df.iloc[start:start + block_rows])):
+                worksheet.append(row)
+
+    workbook.save(path)
+
+
+def write_workbook(path: Union[str, Path], sheets: Dict[str, pd.DataFrame],
+                   format_header_row: bool = True,
+                   sample_rows: Optional[int] = DEFAULT_WIDTH_SAMPLE,
+                   block_rows: int = 50_000,
+                   engine: Optional[str] = None) -> Path:
+    """
+    Write DataFrames to an .xlsx workbook in constant memory.
+
+    Rows are streamed to disk rather than held as cell objects. Column
+    widths come from the DataFrames (sampled, vectorized string lengths)
+    and the header row gets the standard style.
+
+    Args:
+        path: Output .xlsx path
+        sheets: Sheet name to DataFrame (names are truncated to 31 characters)
+        format_header_row: Style the header row and size the columns
+        sample_rows: Rows sampled per column for widths (None: all rows)
+        block_rows: Rows converted to cell values at a time
+        engine: 'xlsxwriter' or 'openpyxl' (default: xlsxwriter if installed)
+
+    Returns:
+        Path to the written workbook
+    """
+    path = Path(path)
+    engine = engine or ('xlsxwriter' if HAS_XLSXWRITER else 'openpyxl')
+
+    if engine == 'xlsxwriter':
+        if not HAS_XLSXWRITER:
+            raise ImportError("xlsxwriter engine requires xlsxwriter. Install with: pip install xlsxwriter")
+        _write_xlsxwriter(path, sheets, format_header_row, sample_rows, block_rows)
+    elif engine == 'openpyxl':
+        _write_openpyxl(path, sheets, format_header_row, sample_rows, block_rows)
+    else:
+        raise ValueError(f"Unsupported Excel engine: {engine}")
+    return path
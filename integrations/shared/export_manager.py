@@ -5,13 +5,17 @@ Export Manager
 Multi-format export utilities for Lloyd's regulatory data.
 """
 
-import json
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 
 import pandas as pd
-import numpy as np
+
+from lloyds_reporting.instrumentation import traced
+
+from .arff_writer import write_arff, STYLE_NOMINAL
+from .excel_format import format_header as format_sheet_header, write_workbook, DEFAULT_WIDTH_SAMPLE
+from .export_scheduler import ExportScheduler, MANIFEST_NAME
 
 
 class ExportManager:
@@ -46,6 +50,7 @@ class ExportManager:
         """Ensure directory exists."""
         path.mkdir(parents=True, exist_ok=True)
 
+    @traced('exporter')
     def export_csv(self, df: pd.DataFrame, filename: str,
                    subdir: Optional[str] = None, **kwargs) -> Path:
         """
@@ -65,6 +70,7 @@ class ExportManager:
         self._log_export('csv', output_path, len(df))
         return output_path
 
+    @traced('exporter')
     def export_excel(self, df: pd.DataFrame, filename: str,
                      sheet_name: str = 'Data',
                      subdir: Optional[str] = None,
@@ -72,28 +78,29 @@ class ExportManager:
         """
         Export DataFrame to Excel with optional formatting.
 
+        Rows are streamed through openpyxl's write-only mode and column
+        widths are sized from a sample of the data.
+
         Args:
             df: DataFrame to export
             filename: Output filename (without extension)
             sheet_name: Excel sheet name
             subdir: Optional subdirectory
             format_header: Apply header formatting
-            **kwargs: Additional arguments
+            **kwargs: Additional arguments (sample_rows for column sizing)
 
         Returns:
             Path to exported file
         """
         output_path = self._get_output_path(filename, 'xlsx', subdir)
 
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name=sheet_name, index=False)
-
-            if format_header:
-                self._format_excel_header(writer, sheet_name)
+        write_workbook(output_path, {sheet_name: df}, format_header_row=format_header,
+                       sample_rows=kwargs.get('sample_rows', DEFAULT_WIDTH_SAMPLE))
 
         self._log_export('excel', output_path, len(df))
         return output_path
 
+    @traced('exporter')
     def export_multi_sheet_excel(self, tables: Dict[str, pd.DataFrame],
                                   filename: str,
                                   subdir: Optional[str] = None) -> Path:
@@ -110,17 +117,14 @@ class ExportManager:
         """
         output_path = self._get_output_path(filename, 'xlsx', subdir)
 
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-            for sheet_name, df in tables.items():
-                # Truncate sheet name to Excel limit
-                safe_name = sheet_name[:31]
-                df.to_excel(writer, sheet_name=safe_name, index=False)
-                self._format_excel_header(writer, safe_name)
+        # Sheet names are truncated to the Excel limit by write_workbook
+        write_workbook(output_path, tables)
 
         total_rows = sum(len(df) for df in tables.values())
         self._log_export('excel_multi', output_path, total_rows, {'sheets': len(tables)})
         return output_path
 
+    @traced('exporter')
     def export_json(self, df: pd.DataFrame, filename: str,
                     subdir: Optional[str] = None,
                     orient: str = 'records') -> Path:
@@ -141,6 +145,7 @@ class ExportManager:
         self._log_export('json', output_path, len(df))
         return output_path
 
+    @traced('exporter')
     def export_parquet(self, df: pd.DataFrame, filename: str,
                        subdir: Optional[str] = None) -> Path:
         """
@@ -159,9 +164,11 @@ class ExportManager:
         self._log_export('parquet', output_path, len(df))
         return output_path
 
+    @traced('exporter')
     def export_arff(self, df: pd.DataFrame, filename: str,
                     relation_name: Optional[str] = None,
-                    subdir: Optional[str] = None) -> Path:
+                    subdir: Optional[str] = None,
+                    compress: bool = False) -> Path:
         """
         Export DataFrame to ARFF format for KNIME/WEKA.
 
@@ -170,126 +177,115 @@ class ExportManager:
             filename: Output filename (without extension)
             relation_name: ARFF relation name
             subdir: Optional subdirectory
+            compress: Write gzip-compressed ARFF (.arff.gz)
 
         Returns:
             Path to exported file
         """
-        output_path = self._get_output_path(filename, 'arff', subdir)
+        output_path = self._get_output_path(filename, 'arff.gz' if compress else 'arff', subdir)
         relation = relation_name or filename
 
-        with open(output_path, 'w') as f:
-            # Write header
-            f.write(f"@RELATION {relation}\n\n")
-
-            # Write attributes
-            for col in df.columns:
-                dtype = df[col].dtype
-                if np.issubdtype(dtype, np.number):
-                    f.write(f"@ATTRIBUTE {col} NUMERIC\n")
-                else:
-                    unique_vals = df[col].dropna().unique()
-                    if len(unique_vals) <= 50:
-                        vals = ','.join(f"'{v}'" for v in unique_vals)
-                        f.write(f"@ATTRIBUTE {col} {{{vals}}}\n")
-                    else:
-                        f.write(f"@ATTRIBUTE {col} STRING\n")
-
-            # Write data
-            f.write("\n@DATA\n")
-            for _, row in df.iterrows():
-                values = []
-                for val in row:
-                    if pd.isna(val):
-                        values.append('?')
-                    elif isinstance(val, str):
-                        values.append(f"'{val}'")
-                    else:
-                        values.append(str(val))
-                f.write(','.join(values) + '\n')
+        write_arff(df, output_path, relation, style=STYLE_NOMINAL, compress=compress)
 
         self._log_export('arff', output_path, len(df))
         return output_path
 
     def export_all_formats(self, df: pd.DataFrame, base_filename: str,
                            formats: Optional[List[str]] = None,
-                           subdir: Optional[str] = None) -> Dict[str, Path]:
+                           subdir: Optional[str] = None,
+                           max_workers: Optional[int] = None) -> Dict[str, Path]:
         """
-        Export DataFrame to multiple formats.
+        Export DataFrame to multiple formats concurrently.
 
         Args:
             df: DataFrame to export
             base_filename: Base filename (without extension)
             formats: List of formats to export (default: csv, excel, json)
             subdir: Optional subdirectory
+            max_workers: Concurrent writers (default: CPU count)
 
         Returns:
             Dictionary of format to output path
         """
-        formats = formats or ['csv', 'excel', 'json']
-        results = {}
+        formats = [fmt for fmt in (formats or ['csv', 'excel', 'json']) if fmt in self.FORMATS]
+        paths = self.export_tables({base_filename: df}, formats, subdir,
+                                   manifest=False, max_workers=max_workers)
+        return paths[base_filename]
+
+    @traced('exporter')
+    def export_tables(self, tables: Dict[str, pd.DataFrame],
+                      formats: Optional[List[str]] = None,
+                      subdir: Optional[str] = None,
+                      manifest: bool = True,
+                      force: bool = False,
+                      max_workers: Optional[int] = None) -> Dict[str, Dict[str, Path]]:
+        """
+        Export many tables in many formats concurrently.
 
-        for fmt in formats:
-            if fmt == 'csv':
-                results['csv'] = self.export_csv(df, base_filename, subdir)
-            elif fmt == 'excel':
-                results['excel'] = self.export_excel(df, base_filename, subdir=subdir)
-            elif fmt == 'json':
-                results['json'] = self.export_json(df, base_filename, subdir)
-            elif fmt == 'parquet':
-                results['parquet'] = self.export_parquet(df, base_filename, subdir)
-            elif fmt == 'arff':
-                results['arff'] = self.export_arff(df, base_filename, subdir=subdir)
+        CSV, JSON, Parquet and ARFF files are written on threads and Excel
+        workbooks in worker processes. With a manifest, each file's size, row
+        count, SHA-256 and write duration are recorded in manifest.json, and
+        tables whose content is unchanged since the last export are skipped.
 
-        return results
+        Args:
+            tables: Dictionary of table_name to DataFrame
+            formats: List of formats to export (default: csv)
+            subdir: Optional subdirectory
+            manifest: Write manifest.json and skip unchanged tables
+            force: Rewrite unchanged tables as well
+            max_workers: Concurrent writers (default: CPU count)
+
+        Returns:
+            Dictionary of table_name to {format: output path}
+        """
+        formats = formats or ['csv']
+        base_dir = self.output_dir / subdir if subdir else self.output_dir
+        writer_options = {
+            'excel': {'format_header_row': True},
+            'json': {'indent': 2},
+        }
+
+        scheduler = ExportScheduler(max_workers=max_workers)
+        paths = scheduler.export(tables, formats, base_dir, writer_options,
+                                 manifest=MANIFEST_NAME if manifest else None, force=force)
+
+        for entry in scheduler.manifest['tables']:
+            for fmt, record in entry['files'].items():
+                self._log_export(fmt, paths[entry['name']][fmt], entry['rows'],
+                                 {key: record[key] for key in ('sha256', 'write_seconds', 'status')})
+        return paths
 
     def export_for_powerbi(self, tables: Dict[str, pd.DataFrame],
-                           output_subdir: str = 'powerbi') -> Dict[str, Path]:
+                           output_subdir: str = 'powerbi',
+                           force: bool = False) -> Dict[str, Path]:
         """
         Export tables optimized for Power BI.
 
+        Tables are written as CSV concurrently; tables unchanged since the
+        last export (per manifest.json) are not rewritten.
+
         Args:
             tables: Dictionary of table_name to DataFrame
             output_subdir: Output subdirectory
+            force: Rewrite unchanged tables as well
 
         Returns:
             Dictionary of table_name to output path
         """
-        results = {}
-        subdir = output_subdir
-
-        for name, df in tables.items():
-            # Export as CSV (Power BI preferred format)
-            path = self.export_csv(df, name, subdir)
-            results[name] = path
-
-        # Create manifest file
-        manifest = {
-            'generated_at': datetime.now().isoformat(),
-            'tables': [
-                {
-                    'name': name,
-                    'file': str(path.name),
-                    'rows': len(tables[name]),
-                    'columns': tables[name].columns.tolist(),
-                }
-                for name, path in results.items()
-            ]
-        }
-
-        manifest_path = self.output_dir / subdir / 'manifest.json'
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
-
-        return results
+        # CSV is the Power BI preferred format
+        paths = self.export_tables(tables, ['csv'], output_subdir, manifest=True, force=force)
+        return {name: formats['csv'] for name, formats in paths.items()}
 
     def export_for_knime(self, tables: Dict[str, pd.DataFrame],
-                         output_subdir: str = 'knime') -> Dict[str, Path]:
+                         output_subdir: str = 'knime',
+                         compress: bool = False) -> Dict[str, Path]:
         """
         Export tables optimized for KNIME.
 
         Args:
             tables: Dictionary of table_name to DataFrame
             output_subdir: Output subdirectory
+            compress: Write gzip-compressed ARFF files
 
         Returns:
             Dictionary of table_name to output path
@@ -299,7 +295,7 @@ class ExportManager:
 
         for name, df in tables.items():
             # Export as ARFF (KNIME native format)
-            path = self.export_arff(df, name, subdir=subdir)
+            path = self.export_arff(df, name, subdir=subdir, compress=compress)
             results[name] = path
 
             # Also export CSV as alternative
@@ -316,33 +312,7 @@ class ExportManager:
 
     def _format_excel_header(self, writer, sheet_name: str):
         """Apply formatting to Excel header row."""
-        try:
-            from openpyxl.styles import Font, PatternFill, Alignment
-
-            workbook = writer.book
-            worksheet = writer.sheets[sheet_name]
-
-            header_font = Font(bold=True, color='FFFFFF')
-            header_fill = PatternFill(start_color='003366', end_color='003366', fill_type='solid')
-
-            for cell in worksheet[1]:
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = Alignment(horizontal='center')
-
-            # Auto-adjust column widths
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                worksheet.column_dimensions[column_letter].width = min(max_length + 2, 50)
-        except ImportError:
-            pass  # openpyxl styles not available
+        format_sheet_header(writer.sheets[sheet_name])
 
     def _log_export(self, format_type: str, path: Path, row_count: int,
                     extra: Optional[Dict[str, Any]] = None):
@@ -0,0 +1,328 @@
+"""
+Export Scheduler
+================
+
+Concurrent multi-table, multi-format export with a content-hashed manifest.
+
+Each (table, format) pair is an independent write job. I/O-bound formats
+(CSV, JSON, Parquet, ARFF) run on a thread pool; openpyxl Excel writes are
+CPU-bound and run on a process pool. Every written file is recorded in
+``manifest.json`` with its size, row count, SHA-256 and write duration.
+
+A table whose content hash matches the previous manifest, and whose files are
+still present with their recorded size and were written with the same writer
+options, is not rewritten.
+
+Usage:
+------
+    from integrations.shared.export_scheduler import ExportScheduler
+
+    scheduler = ExportScheduler()
+    paths = scheduler.export(tables, ['csv', 'parquet'], 'exports/powerbi',
+                             manifest='manifest.json')
+"""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Callable, Union
+
+import pandas as pd
+
+from lloyds_reporting.instrumentation import span, traced
+
+from .arff_writer import write_arff, STYLE_NOMINAL
+from .excel_format import write_workbook
+
+
+# Formats written in worker processes rather than threads
+PROCESS_FORMATS = frozenset(['excel'])
+
+# File extension per format
+FORMAT_EXTENSIONS = {
+    'csv': 'csv',
+    'excel': 'xlsx',
+    'json': 'json',
+    'parquet': 'parquet',
+    'arff': 'arff',
+}
+
+MANIFEST_NAME = 'manifest.json'
+
+STATUS_WRITTEN = 'written'
+STATUS_UNCHANGED = 'unchanged'
+
+
+def write_csv(df: pd.DataFrame, path: Path, **kwargs):
+    """Write a table as CSV."""
+    df.to_csv(path, index=False, **kwargs)
+
+
+def write_json(df: pd.DataFrame, path: Path, orient: str = 'records',
+               indent: Optional[int] = None):
+    """Write a table as JSON."""
+    df.to_json(path, orient=orient, indent=indent, date_format='iso')
+
+
+def write_parquet(df: pd.DataFrame, path: Path):
+    """Write a table as Parquet."""
+    df.to_parquet(path, index=False)
+
+
+def write_excel(df: pd.DataFrame, path: Path, sheet_name: str = 'Data',
+                format_header_row: bool = False):
+    """Write a table as a single-sheet Excel workbook (streamed, write-only)."""
+    write_workbook(path, {sheet_name: df}, format_header_row=format_header_row)
+
+
+def write_arff_file(df: pd.DataFrame, path: Path, relation: Optional[str] = None,
+                    style: str = STYLE_NOMINAL):
+    """Write a table as ARFF."""
+    write_arff(df, path, relation or path.stem, style=style)
+
+
+FORMAT_WRITERS: Dict[str, Callable] = {
+    'csv': write_csv,
+    'excel': write_excel,
+    'json': write_json,
+    'parquet': write_parquet,
+    'arff': write_arff_file,
+}
+
+
+def table_content_hash(df: pd.DataFrame) -> str:
+    """
+    SHA-256 of a table's columns, dtypes and values.
+
+    Args:
+        df: Table to hash
+
+    Returns:
+        Hex digest, stable across runs for identical content
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps([[str(col), str(dtype)] for col, dtype in df.dtypes.items()]).encode())
+    try:
+        digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    except TypeError:
+        # Unhashable cell values (lists, dicts); fall back to the CSV text
+        digest.update(df.to_csv(index=False).encode())
+    return digest.hexdigest()
+
+
+def options_hash(options: Dict[str, Any]) -> str:
+    """SHA-256 of a writer's keyword arguments (key order does not matter)."""
+    return hashlib.sha256(json.dumps(options, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def file_sha256(path: Union[str, Path], chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _run_job(writer: Callable, df: pd.DataFrame, path: Path, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Write one file and describe it (runs in a worker thread or process)."""
+    with span(path.name, 'exporter', rows_in=len(df), writer=writer.__name__):
+        start = time.perf_counter()
+        writer(df, path, **kwargs)
+        seconds = time.perf_counter() - start
+    return {
+        'file': path.name,
+        'rows': len(df),
+        'size_bytes': path.stat().st_size,
+        'sha256': file_sha256(path),
+        'write_seconds': round(seconds, 4),
+        'status': STATUS_WRITTEN,
+    }
+
+
+@dataclass
+class ExportJob:
+    """One file to write: a table in one format."""
+    table: str
+    format: str
+    path: Path
+    writer: Callable
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+
+class ExportScheduler:
+    """
+    Concurrent exporter for many tables in many formats.
+
+    Attributes:
+        max_workers (int): Worker count per pool
+        process_formats (frozenset): Formats written in worker processes
+        manifest (Dict[str, Any]): Manifest of the last export
+    """
+
+    def __init__(self, max_workers: Optional[int] = None,
+                 process_formats=PROCESS_FORMATS):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_workers: Threads / processes per pool (default: CPU count)
+            process_formats: Formats to write in a process pool; pass an
+                empty set to use threads only
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.process_formats = frozenset(process_formats)
+        self.manifest: Dict[str, Any] = {}
+
+    @staticmethod
+    def load_manifest(path: Union[str, Path]) -> Dict[str, Any]:
+        """Read a previous manifest (empty if missing or unreadable)."""
+        path = Path(path)
+        if not path.exists():
+            return {}
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _is_current(entry: Optional[Dict[str, Any]], content_hash: str, fmt: str,
+                    path: Path, writer_hash: str) -> bool:
+        """
+        Whether a previous manifest entry still describes the file on disk:
+        same table content, same writer options and the file unchanged.
+        """
+        if not entry or entry.get('content_sha256') != content_hash:
+            return False
+        previous = entry.get('files', {}).get(fmt)
+        return (previous is not None and previous.get('file') == path.name
+                and previous.get('options_sha256') == writer_hash
+                and path.exists() and path.stat().st_size == previous.get('size_bytes'))
+
+    def run(self, tables: Dict[str, pd.DataFrame], jobs: List[ExportJob]) -> Dict[tuple, Dict[str, Any]]:
+        """
+        Execute write jobs concurrently.
+
+        Args:
+            tables: Table name to DataFrame
+            jobs: Files to write
+
+        Returns:
+            Dictionary of (table, format) to file record
+        """
+        records = {}
+        if not jobs:
+            return records
+
+        thread_jobs = [job for job in jobs if job.format not in self.process_formats]
+        process_jobs = [job for job in jobs if job.format in self.process_formats]
+        futures = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as threads:
+            processes = (ProcessPoolExecutor(max_workers=min(self.max_workers, len(process_jobs)))
+                         if process_jobs else None)
+            try:
+                for job in process_jobs:
+                    future = processes.submit(_run_job, job.writer, tables[job.table], job.path, job.kwargs)
+                    futures[future] = job
+                for job in thread_jobs:
+                    future = threads.submit(_run_job, job.writer, tables[job.table], job.path, job.kwargs)
+                    futures[future] = job
+                for future, job in futures.items():
+                    records[(job.table, job.format)] = future.result()
+            finally:
+                if processes is not None:
+                    processes.shutdown()
+
+        return records
+
+    @traced('exporter')
+    def export(self, tables: Dict[str, pd.DataFrame], formats: List[str],
+               output_dir: Union[str, Path],
+               writer_options: Optional[Dict[str, Dict[str, Any]]] = None,
+               manifest: Optional[str] = MANIFEST_NAME,
+               force: bool = False) -> Dict[str, Dict[str, Path]]:
+        """
+        Export tables in several formats, skipping unchanged tables.
+
+        A file is skipped when its table content and its writer options match
+        the previous manifest and the file on disk has the recorded size.
+
+        Args:
+            tables: Table name to DataFrame
+            formats: Formats to write (keys of FORMAT_WRITERS)
+            output_dir: Output directory; files are named <table>.<extension>
+            writer_options: Extra writer keyword arguments per format
+            manifest: Manifest file name in output_dir (None: no manifest and
+                no change detection)
+            force: Rewrite every file even if its table is unchanged
+
+        Returns:
+            Dictionary of table name to {format: path}
+        """
+        unknown = [fmt for fmt in formats if fmt not in FORMAT_WRITERS]
+        if unknown:
+            raise ValueError(f"Unsupported format(s): {unknown}")
+
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        writer_options = writer_options or {}
+
+        manifest_path = output_dir / manifest if manifest else None
+        previous = {}
+        if manifest_path is not None and not force:
+            previous = {entry['name']: entry
+                        for entry in self.load_manifest(manifest_path).get('tables', [])}
+
+        hashes = {name: table_content_hash(df) for name, df in tables.items()} if manifest else {}
+        paths: Dict[str, Dict[str, Path]] = {}
+        jobs, records = [], {}
+
+        writer_hashes = {fmt: options_hash(writer_options.get(fmt, {})) for fmt in formats}
+
+        for name in tables:
+            paths[name] = {}
+            for fmt in formats:
+                path = output_dir / f"{name}.{FORMAT_EXTENSIONS[fmt]}"
+                paths[name][fmt] = path
+                if manifest and self._is_current(previous.get(name), hashes[name], fmt, path,
+                                                 writer_hashes[fmt]):
+                    record = dict(previous[name]['files'][fmt])
+                    record['status'] = STATUS_UNCHANGED
+                    records[(name, fmt)] = record
+                else:
+                    jobs.append(ExportJob(name, fmt, path, FORMAT_WRITERS[fmt],
+                                          dict(writer_options.get(fmt, {}))))
+
+        for key, record in self.run(tables, jobs).items():
+            record['options_sha256'] = writer_hashes[key[1]]
+            records[key] = record
+
+        self.manifest = {
+            'generated_at': datetime.now().isoformat(),
+            'files_written': sum(1 for r in records.values() if r['status'] == STATUS_WRITTEN),
+            'files_unchanged': sum(1 for r in records.values() if r['status'] == STATUS_UNCHANGED),
+            'tables': [
+                {
+                    'name': name,
+                    'file': paths[name][formats[0]].name if formats else None,
+                    'rows': len(df),
+                    'columns': [str(col) for col in df.columns],
+                    'content_sha256': hashes.get(name),
+                    'files': {fmt: records[(name, fmt)] for fmt in formats},
+                }
+                for name, df in tables.items()
+            ],
+        }
+
+        if manifest_path is not None:
+            with open(manifest_path, 'w') as f:
+                json.dump(self.manifest, f, indent=2)
+
+        return paths
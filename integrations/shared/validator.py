@@ -12,6 +12,8 @@ from enum import Enum
 import pandas as pd
 import numpy as np
 
+from lloyds_reporting.instrumentation import traced
+
 
 class ValidationLevel(Enum):
     """Validation result severity levels."""
@@ -72,6 +74,7 @@ class DataValidator:
         """Initialize validator."""
         self.results: List[ValidationResult] = []
 
+    @traced('validator')
     def validate(self, df: pd.DataFrame, data_type: Optional[str] = None) -> List[ValidationResult]:
         """
         Run all validation checks on a DataFrame.
@@ -217,6 +220,7 @@ class DataValidator:
                         row_count=invalid,
                     ))
 
+    @traced('validator')
     def check_cross_table_consistency(self, tables: Dict[str, pd.DataFrame]) -> List[ValidationResult]:
         """
         Check consistency across multiple tables.
@@ -7,6 +7,10 @@ A comprehensive regulatory reporting toolkit for Lloyd's of London insurance syn
 Modules:
 --------
 - config: Shared constants and configuration
+- instrumentation: Timing spans (wall/CPU time, rows, peak RSS) with JSON and
+  Chrome trace output
+- scr_aggregation: Standard formula SCR aggregation with correlation matrices,
+  batched over syndicates and scenarios
 - (additional modules to be added)
 
 Usage:
@@ -21,8 +25,12 @@ __version__ = "1.2.0"
 __author__ = "Lloyd's Development Team"
 
 from . import config
+from . import instrumentation
+from . import scr_aggregation
 
 __all__ = [
     "config",
+    "instrumentation",
+    "scr_aggregation",
     "__version__",
 ]
@@ -298,6 +298,13 @@ class LiquidityRatios:
     REINSURANCE_RECOVERY_RANGE: Tuple[float, float] = (0.40, 0.70)  # of gross loss
     DISPUTED_RECOVERY_RANGE: Tuple[float, float] = (0.15, 0.30)  # of RI recovery
 
+    # Settlement of the stress loss: share of the net loss paid in each
+    # period from the loss, and the US funding requirement (of RI recovery)
+    # called in the second period
+    LOSS_PAYMENT_PATTERN: Tuple[float, ...] = (0.20, 0.30, 0.25, 0.15, 0.10)
+    US_FUNDING_RATIO: float = 0.30
+    US_FUNDING_PERIOD: int = 1
+
 
 class ReserveRatios:
     """
@@ -0,0 +1,439 @@
+"""
+Pipeline Instrumentation
+========================
+
+Lightweight timing spans for the reporting pipeline.
+
+A span records the wall time, CPU time (of the calling thread), rows in and
+out and the process peak RSS of one unit of work: a form processor, a QRT
+generator, a validator or an exporter. Spans are collected in memory and can
+be summarised per name or written as JSON or as a Chrome trace (open in
+chrome://tracing or https://ui.perfetto.dev).
+
+Tracing is off by default. When disabled, traced functions make a single
+flag check before calling through and span() hands back a shared no-op span,
+so the hooks can stay on hot paths. Enable it with enable() or by setting
+LLOYDS_TRACE=1 in the environment. Spans are collected per process: work
+done in process pools (e.g. Excel exports) is recorded in the worker, not in
+the parent.
+
+Usage:
+------
+    from lloyds_reporting import instrumentation
+
+    instrumentation.enable()
+    all_qrts = generate_all_qrts()
+    for row in instrumentation.summary(category='qrt')[:10]:
+        print(row['name'], row['total_wall_s'])
+    instrumentation.to_chrome_trace('quarter_end_trace.json')
+
+    # Instrumenting code
+    from lloyds_reporting.instrumentation import span, traced
+
+    @traced('exporter')
+    def export(df, path): ...
+
+    with span('IR0201_Balance_Sheet', 'qrt') as s:
+        df = generate_ir0201_balance_sheet()
+        s.rows_out = len(df)
+"""
+
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Environment switch enabling tracing at import time
+TRACE_ENV_VAR = 'LLOYDS_TRACE'
+
+# ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+_RSS_UNIT = 1 if sys.platform == 'darwin' else 1024
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far, in MB (None if unavailable)."""
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _RSS_UNIT / 1024 / 1024
+
+
+def count_rows(obj) -> Optional[int]:
+    """
+    Number of rows in a DataFrame-like result.
+
+    Dictionaries of frames (e.g. generate_all_qrts) count the rows of all
+    values; anything without a shape counts as None.
+    """
+    shape = getattr(obj, 'shape', None)
+    if shape:
+        return int(shape[0])
+    if isinstance(obj, dict):
+        counts = [count_rows(value) for value in obj.values()]
+        counts = [n for n in counts if n is not None]
+        return sum(counts) if counts else None
+    return None
+
+
+@dataclass
+class Span:
+    """
+    One timed unit of work.
+
+    Attributes:
+        name (str): What ran (function or template name)
+        category (str): Component kind (form_processor, qrt, validator, exporter, ...)
+        start_s (float): Start, in seconds since the tracer was created
+        wall_s (float): Elapsed wall time
+        cpu_s (float): CPU time of the calling thread
+        rows_in (int): Input rows, if known
+        rows_out (int): Output rows, if known
+        peak_rss_mb (float): Process peak RSS when the span closed
+        depth (int): Nesting level within its thread
+        parent (str): Name of the enclosing span
+        thread (int): Thread identifier
+        pid (int): Process identifier
+        error (str): Exception raised inside the span
+        attrs (dict): Free-form annotations
+    """
+    name: str
+    category: str = 'default'
+    start_s: float = 0.0
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    rows_in: Optional[int] = None
+    rows_out: Optional[int] = None
+    peak_rss_mb: Optional[float] = None
+    depth: int = 0
+    parent: Optional[str] = None
+    thread: int = 0
+    pid: int = 0
+    error: Optional[str] = None
+    attrs: Dict[str, Any] = field(default_factory=dict)
+
+    def add_rows_in(self, rows: int):
+        """Accumulate input rows (e.g. once per file read)."""
+        self.rows_in = (self.rows_in or 0) + rows
+
+
+class _NullSpan:
+    """Stand-in yielded while tracing is disabled; ignores every update."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        pass
+
+    def add_rows_in(self, rows: int):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _ActiveSpan:
+    """Context manager timing a Span and recording it on exit."""
+
+    __slots__ = ('tracer', 'span', '_wall', '_cpu')
+
+    def __init__(self, tracer: 'Tracer', span: Span):
+        self.tracer = tracer
+        self.span = span
+
+    def __enter__(self) -> Span:
+        stack = self.tracer._stack()
+        if stack:
+            self.span.parent = stack[-1].name
+            self.span.depth = len(stack)
+        stack.append(self.span)
+        self._cpu = time.thread_time()
+        self._wall = time.perf_counter()
+        self.span.start_s = self._wall - self.tracer.epoch
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        span = self.span
+        span.wall_s = time.perf_counter() - self._wall
+        span.cpu_s = time.thread_time() - self._cpu
+        span.peak_rss_mb = peak_rss_mb()
+        if exc_type is not None:
+            span.error = f'{exc_type.__name__}: {exc}'
+        self.tracer._stack().pop()
+        self.tracer._record(span)
+        return False
+
+
+class Tracer:
+    """
+    In-memory span collector.
+
+    Attributes:
+        enabled (bool): Whether spans are recorded
+        epoch (float): perf_counter value span start times are relative to
+        started_at (str): Wall-clock time the tracer was created
+        spans (List[Span]): Completed spans, in completion order
+    """
+
+    def __init__(self, enabled: bool = False):
+        """
+        Initialize an empty tracer.
+
+        Args:
+            enabled: Start recording immediately
+        """
+        self.enabled = enabled
+        self.epoch = time.perf_counter()
+        self.started_at = datetime.now().isoformat()
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self) -> List[Span]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+
+    def span(self, name: str, category: str = 'default', rows_in: Optional[int] = None,
+             **attrs):
+        """
+        Time a block of code.
+
+        Args:
+            name: Span name
+            category: Component kind
+            rows_in: Input rows, if known up front
+            **attrs: Extra annotations stored on the span
+
+        Returns:
+            Context manager yielding the Span (a no-op span when disabled)
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _ActiveSpan(self, Span(name, category, rows_in=rows_in, attrs=attrs,
+                                      thread=threading.get_ident(), pid=os.getpid()))
+
+    def current(self):
+        """Innermost open span of the calling thread (a no-op span if none)."""
+        if not self.enabled:
+            return _NULL_SPAN
+        stack = self._stack()
+        return stack[-1] if stack else _NULL_SPAN
+
+    def clear(self):
+        """Discard recorded spans and restart the clock."""
+        with self._lock:
+            self.spans = []
+            self.epoch = time.perf_counter()
+            self.started_at = datetime.now().isoformat()
+
+    def summary(self, category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Aggregate spans by (category, name), slowest total first.
+
+        Args:
+            category: Only include spans of this category
+
+        Returns:
+            List of dicts with calls, total/mean/max wall time, total CPU time,
+            rows in/out and the highest peak RSS seen
+        """
+        groups: Dict[tuple, Dict[str, Any]] = {}
+        for span in list(self.spans):
+            if category is not None and span.category != category:
+                continue
+            row = groups.setdefault((span.category, span.name), {
+                'name': span.name, 'category': span.category, 'calls': 0,
+                'total_wall_s': 0.0, 'max_wall_s': 0.0, 'total_cpu_s': 0.0,
+                'rows_in': None, 'rows_out': None, 'peak_rss_mb': None, 'errors': 0,
+            })
+            row['calls'] += 1
+            row['total_wall_s'] += span.wall_s
+            row['max_wall_s'] = max(row['max_wall_s'], span.wall_s)
+            row['total_cpu_s'] += span.cpu_s
+            for key in ('rows_in', 'rows_out'):
+                if getattr(span, key) is not None:
+                    row[key] = (row[key] or 0) + getattr(span, key)
+            if span.peak_rss_mb is not None:
+                row['peak_rss_mb'] = max(row['peak_rss_mb'] or 0.0, span.peak_rss_mb)
+            row['errors'] += span.error is not None
+
+        rows = sorted(groups.values(), key=lambda r: r['total_wall_s'], reverse=True)
+        for row in rows:
+            row['mean_wall_s'] = row['total_wall_s'] / row['calls']
+        return rows
+
+    def to_dict(self) -> Dict[str, Any]:
+        """All spans and the summary as a JSON-serialisable dict."""
+        return {
+            'started_at': self.started_at,
+            'spans': [asdict(span) for span in list(self.spans)],
+            'summary': self.summary(),
+        }
+
+    def to_json(self, path: Optional[str] = None) -> str:
+        """
+        Serialise the spans as JSON.
+
+        Args:
+            path: Optional file to write
+
+        Returns:
+            JSON string
+        """
+        text = json.dumps(self.to_dict(), indent=2, default=str)
+        if path:
+            with open(path, 'w') as f:
+                f.write(text)
+        return text
+
+    def to_chrome_trace(self, path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Convert the spans to the Chrome trace event format.
+
+        Each span becomes a complete ('X') event; nesting is shown from the
+        timestamps of spans on the same thread.
+
+        Args:
+            path: Optional file to write
+
+        Returns:
+            Trace document ({'traceEvents': [...]})
+        """
+        events = []
+        for span in list(self.spans):
+            args = {'cpu_ms': round(span.cpu_s * 1000, 3)}
+            for key in ('rows_in', 'rows_out', 'peak_rss_mb', 'error'):
+                if getattr(span, key) is not None:
+                    args[key] = getattr(span, key)
+            args.update(span.attrs)
+            events.append({
+                'name': span.name,
+                'cat': span.category,
+                'ph': 'X',
+                'ts': round(span.start_s * 1e6, 3),
+                'dur': round(span.wall_s * 1e6, 3),
+                'pid': span.pid,
+                'tid': span.thread,
+                'args': args,
+            })
+        trace = {'traceEvents': events, 'displayTimeUnit': 'ms',
+                 'otherData': {'started_at': self.started_at}}
+        if path:
+            with open(path, 'w') as f:
+                json.dump(trace, f, default=str)
+        return trace
+
+
+_TRACER = Tracer(enabled=os.environ.get(TRACE_ENV_VAR, '').lower() in ('1', 'true', 'yes'))
+
+
+def get_tracer() -> Tracer:
+    """Return the process-wide tracer."""
+    return _TRACER
+
+
+def enable():
+    """Start recording spans."""
+    _TRACER.enabled = True
+
+
+def disable():
+    """Stop recording spans (recorded spans are kept)."""
+    _TRACER.enabled = False
+
+
+def is_enabled() -> bool:
+    """Whether spans are being recorded."""
+    return _TRACER.enabled
+
+
+def span(name: str, category: str = 'default', rows_in: Optional[int] = None, **attrs):
+    """Time a block of code on the process-wide tracer (see Tracer.span)."""
+    return _TRACER.span(name, category, rows_in, **attrs)
+
+
+def current_span():
+    """Innermost open span of the calling thread (a no-op span if none)."""
+    return _TRACER.current()
+
+
+def traced(category: str = 'default', name: Optional[str] = None) -> Callable:
+    """
+    Decorator recording a span per call.
+
+    Rows in are counted from the first DataFrame-like (or dict of frames)
+    argument, rows out from the return value. Code inside the call can add
+    rows in through current_span().add_rows_in(), as read_form does for
+    processors that take a file path.
+
+    Args:
+        category: Component kind
+        name: Span name (default: the function's qualified name)
+    """
+    def decorate(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _TRACER.enabled:
+                return func(*args, **kwargs)
+
+            rows_in = None
+            for arg in args:
+                rows_in = count_rows(arg)
+                if rows_in is not None:
+                    break
+
+            with _TRACER.span(span_name, category, rows_in) as s:
+                result = func(*args, **kwargs)
+                s.rows_out = count_rows(result)
+            return result
+
+        return wrapper
+
+    return decorate
+
+
+def clear_spans():
+    """Discard the spans recorded so far."""
+    _TRACER.clear()
+
+
+def get_spans() -> List[Span]:
+    """Completed spans, in completion order."""
+    return list(_TRACER.spans)
+
+
+def summary(category: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Per-name aggregate of the recorded spans, slowest first (see Tracer.summary)."""
+    return _TRACER.summary(category)
+
+
+def to_json(path: Optional[str] = None) -> str:
+    """Serialise the recorded spans as JSON (see Tracer.to_json)."""
+    return _TRACER.to_json(path)
+
+
+def to_chrome_trace(path: Optional[str] = None) -> Dict[str, Any]:
+    """Write the recorded spans as a Chrome trace (see Tracer.to_chrome_trace)."""
+    return _TRACER.to_chrome_trace(path)
@@ -22,6 +22,9 @@ Usage:
     stress = lst.calculate_stress_impact_table()
     summary = lst.create_dashboard_summary()
 
+    # Monte Carlo stress: minimum free funds distribution and shortfall probability
+    simulation = lst.calculate_stress_simulation_table(n_paths=10_000, max_workers=4)
+
     # Export to Excel
     lst.export_to_excel('liquidity_analysis.xlsx')
 """
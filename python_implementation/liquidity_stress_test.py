@@ -6,8 +6,205 @@ Processes Lloyd's syndicate data to generate RRA (Reserve Return Annual) form ou
 import pandas as pd
 import numpy as np
 from datetime import datetime
-import json
 import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Inputs are loaded through the storage layer (typed Parquet when converted)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    from python_scripts.utils.table_storage import read_table
+except ImportError:
+    read_table = pd.read_csv
+
+# Streaming Excel writer shared with the integrations exporters
+try:
+    from integrations.shared.excel_format import write_workbook
+except ImportError:
+    write_workbook = None
+
+from lloyds_reporting.config import LiquidityRatios
+
+# Monte Carlo defaults
+DEFAULT_PATHS = 10_000
+DEFAULT_CHUNK_PATHS = 1_000
+SHORTFALL_QUANTILE = 0.005  # 1-in-200
+
+
+def loss_payment_pattern(n_periods, pattern=LiquidityRatios.LOSS_PAYMENT_PATTERN):
+    """
+    Share of the net stress loss paid in each of n_periods
+
+    A pattern longer than the horizon pays its remaining share in the last
+    period; a shorter one is padded with zeros.
+    """
+    pattern = np.asarray(pattern, dtype=float)
+    if n_periods >= len(pattern):
+        return np.concatenate([pattern, np.zeros(n_periods - len(pattern))])
+    truncated = pattern[:n_periods].copy()
+    truncated[-1] += pattern[n_periods:].sum()
+    return truncated
+
+
+def simulate_min_free_funds(baseline, fal, n_paths, seed_sequences, pattern=None):
+    """
+    Minimum stressed free funds of one chunk of paths
+
+    Samples, per syndicate and path, the gross loss multiplier (x FAL), the
+    reinsurance recovery (of gross loss) and the disputed share of the
+    recovery (not collected) from the LiquidityRatios ranges. The net loss is
+    paid over the payment pattern and the US funding requirement is called in
+    LiquidityRatios.US_FUNDING_PERIOD. Cash paid out stays paid, so each
+    period's baseline closing free funds are reduced by the stress outflows
+    of that period and every period before it.
+
+    Args:
+        baseline (np.ndarray): Baseline closing free funds, syndicates x periods
+        fal (np.ndarray): Funds at Lloyd's per syndicate
+        n_paths (int): Paths in this chunk
+        seed_sequences (list): One np.random.SeedSequence per syndicate
+        pattern (np.ndarray, optional): Net loss payment share per period
+
+    Returns:
+        np.ndarray: Minimum free funds over the horizon, syndicates x paths
+    """
+    n_periods = baseline.shape[1]
+    pattern = loss_payment_pattern(n_periods) if pattern is None else pattern
+
+    # syndicates x 3 x paths: each syndicate draws from its own stream, so its
+    # paths do not depend on which other syndicates are simulated
+    draws = np.stack([
+        np.random.default_rng(seed_sequence).uniform(
+            [[LiquidityRatios.GROSS_LOSS_MULTIPLIER_RANGE[0]],
+             [LiquidityRatios.REINSURANCE_RECOVERY_RANGE[0]],
+             [LiquidityRatios.DISPUTED_RECOVERY_RANGE[0]]],
+            [[LiquidityRatios.GROSS_LOSS_MULTIPLIER_RANGE[1]],
+             [LiquidityRatios.REINSURANCE_RECOVERY_RANGE[1]],
+             [LiquidityRatios.DISPUTED_RECOVERY_RANGE[1]]],
+            (3, n_paths))
+        for seed_sequence in seed_sequences
+    ])
+    gross_loss = fal[:, None] * draws[:, 0]
+    recovery = gross_loss * draws[:, 1]
+    net_loss = gross_loss - recovery * (1 - draws[:, 2])
+
+    # syndicates x paths x periods
+    outflows = net_loss[:, :, None] * pattern[None, None, :]
+    if LiquidityRatios.US_FUNDING_PERIOD < n_periods:
+        outflows[:, :, LiquidityRatios.US_FUNDING_PERIOD] += recovery * LiquidityRatios.US_FUNDING_RATIO
+
+    stressed = baseline[:, None, :] - np.cumsum(outflows, axis=2)
+    return stressed.min(axis=2)
+
+
+# Index the loaded frames are kept on. It is named differently from the
+# syndicate_number column (which stays for grouping and output) so that
+# groupby('syndicate_number') is not ambiguous.
+SYNDICATE_INDEX = 'syndicate'
+
+
+def index_by_syndicate(df):
+    """
+    Frame sorted by syndicate number (row order kept within each syndicate)
+    and indexed on it, so one syndicate's rows are an index slice
+    """
+    if df is None or df.index.name == SYNDICATE_INDEX:
+        return df
+    indexed = df.set_index(pd.Index(df['syndicate_number'], name=SYNDICATE_INDEX))
+    return indexed.sort_index(kind='stable')
+
+
+def syndicate_rows(df, syndicate_number=None):
+    """
+    Rows of one syndicate (all rows if syndicate_number is None)
+
+    Uses the syndicate index slice when the frame has one; frames supplied
+    directly (e.g. by the Power BI wrappers) are filtered on the column.
+    """
+    if not syndicate_number:
+        return df
+    if df.index.name == SYNDICATE_INDEX:
+        return df.loc[syndicate_number:syndicate_number]
+    return df[df['syndicate_number'] == syndicate_number]
+
+
+# Combined input files of a data directory, by dataset name
+DATASET_FILES = {
+    'metadata': 'all_syndicates_metadata.csv',
+    'assets': 'all_syndicates_assets.csv',
+    'cashflow': 'all_syndicates_cashflow.csv',
+    'stress': 'all_syndicates_stress.csv',
+}
+
+# Loaded datasets shared by every instance: directory -> (file versions, frames)
+_DATASET_CACHE = {}
+_DATASET_LOCK = threading.Lock()
+
+
+def _file_version(path):
+    """mtime and size of a file, plus the mtime of the Parquet copy read_table prefers"""
+    stat = os.stat(path)
+    parquet = Path(path).with_suffix('.parquet')
+    return stat.st_mtime_ns, stat.st_size, parquet.stat().st_mtime_ns if parquet.exists() else None
+
+
+def load_dataset(data_path):
+    """
+    Combined syndicate frames of a data directory, loaded once per process
+
+    The frames are cached across LiquidityStressTest instances and re-read
+    when any input file's mtime or size changes. They are indexed by
+    syndicate (see index_by_syndicate) and shared, so treat them as
+    read-only: the table methods always build new frames from them.
+
+    Args:
+        data_path (str): Directory containing the all_syndicates_*.csv files
+
+    Returns:
+        dict: Frames keyed by dataset name (metadata, assets, cashflow, stress)
+    """
+    directory = os.path.abspath(data_path)
+    paths = {name: os.path.join(directory, file_name) for name, file_name in DATASET_FILES.items()}
+    version = tuple(_file_version(path) for path in paths.values())
+
+    with _DATASET_LOCK:
+        entry = _DATASET_CACHE.get(directory)
+        if entry is not None and entry[0] == version:
+            return dict(entry[1])
+
+    dataset = {name: index_by_syndicate(read_table(path)) for name, path in paths.items()}
+    with _DATASET_LOCK:
+        _DATASET_CACHE[directory] = (version, dataset)
+    return dict(dataset)
+
+
+def json_record(row):
+    """
+    One row as a dict of JSON-native values, as the per-syndicate
+    metadata.json files hold them
+
+    Dates (Timestamps) become ISO date strings, whole-number floats become
+    ints, other numpy scalars their Python equivalents and missing values None.
+    """
+    record = {}
+    for key, value in row.items():
+        if isinstance(value, (pd.Timestamp, datetime)):
+            value = value.strftime('%Y-%m-%d')
+        elif isinstance(value, np.generic):
+            value = value.item()
+        if isinstance(value, float):
+            value = None if np.isnan(value) else int(value) if value.is_integer() else value
+        record[key] = value
+    return record
+
+
+def clear_dataset_cache():
+    """Drop every cached dataset"""
+    with _DATASET_LOCK:
+        _DATASET_CACHE.clear()
+
 
 class LiquidityStressTest:
     """
@@ -33,36 +230,39 @@ class LiquidityStressTest:
         """
         Load data for analysis
 
+        The combined files are read through the shared dataset cache
+        (load_dataset), so repeated loads and new instances on the same
+        directory only re-read files that changed.
+
         Args:
             syndicate_number (int, optional): Specific syndicate to load.
                                              If None, loads all syndicates.
 
         Returns:
-            dict: Loaded data dictionary
+            dict: Loaded data dictionary (for one syndicate, the metadata is
+                a dict of JSON-native values, see json_record)
         """
-        if syndicate_number:
-            # Load individual syndicate
-            syndicate_path = os.path.join(self.data_path, f'syndicate_{syndicate_number}')
-
-            with open(os.path.join(syndicate_path, 'metadata.json'), 'r') as f:
-                metadata = json.load(f)
+        dataset = load_dataset(self.data_path)
 
-            assets = pd.read_csv(os.path.join(syndicate_path, 'assets_liquidity.csv'))
-            cashflow = pd.read_csv(os.path.join(syndicate_path, 'cashflow.csv'))
-            stress = pd.read_csv(os.path.join(syndicate_path, 'stress_scenario.csv'))
+        if syndicate_number:
+            # Individual syndicate: a view of the combined frames
+            rows = {name: syndicate_rows(df, syndicate_number).reset_index(drop=True)
+                    for name, df in dataset.items()}
+            if rows['metadata'].empty:
+                raise KeyError(f"Syndicate {syndicate_number} not found in {self.data_path}")
 
             return {
-                'metadata': metadata,
-                'assets': assets,
-                'cashflow': cashflow,
-                'stress': stress
+                'metadata': json_record(rows['metadata'].iloc[0]),
+                'assets': rows['assets'].drop(columns='syndicate_number'),
+                'cashflow': rows['cashflow'].drop(columns='syndicate_number'),
+                'stress': rows['stress'].drop(columns='syndicate_number')
             }
         else:
             # Load all syndicates combined
-            self.metadata = pd.read_csv(os.path.join(self.data_path, 'all_syndicates_metadata.csv'))
-            self.assets_data = pd.read_csv(os.path.join(self.data_path, 'all_syndicates_assets.csv'))
-            self.cashflow_data = pd.read_csv(os.path.join(self.data_path, 'all_syndicates_cashflow.csv'))
-            self.stress_data = pd.read_csv(os.path.join(self.data_path, 'all_syndicates_stress.csv'))
+            self.metadata = dataset['metadata']
+            self.assets_data = dataset['assets']
+            self.cashflow_data = dataset['cashflow']
+            self.stress_data = dataset['stress']
 
             return {
                 'metadata': self.metadata,
@@ -84,10 +284,7 @@ class LiquidityStressTest:
         if self.metadata is None:
             self.load_data()
 
-        df = self.metadata.copy()
-
-        if syndicate_number:
-            df = df[df['syndicate_number'] == syndicate_number]
+        df = syndicate_rows(self.metadata, syndicate_number).reset_index(drop=True)
 
         # Select relevant columns
         capital_position = df[[
@@ -133,10 +330,7 @@ class LiquidityStressTest:
         if self.assets_data is None:
             self.load_data()
 
-        df = self.assets_data.copy()
-
-        if syndicate_number:
-            df = df[df['syndicate_number'] == syndicate_number]
+        df = syndicate_rows(self.assets_data, syndicate_number).reset_index(drop=True)
 
         if date:
             df = df[df['date'] == date]
@@ -167,18 +361,15 @@ class LiquidityStressTest:
         if self.cashflow_data is None:
             self.load_data()
 
-        df = self.cashflow_data.copy()
-
-        if syndicate_number:
-            df = df[df['syndicate_number'] == syndicate_number]
-
-        # Add cumulative columns
-        for syndicate in df['syndicate_number'].unique():
-            mask = df['syndicate_number'] == syndicate
+        df = syndicate_rows(self.cashflow_data, syndicate_number).reset_index(drop=True)
 
-            df.loc[mask, 'cumulative_premium_income'] = df.loc[mask, 'premium_income'].cumsum()
-            df.loc[mask, 'cumulative_claims_paid'] = df.loc[mask, 'claims_paid'].cumsum()
-            df.loc[mask, 'cumulative_total_movements'] = df.loc[mask, 'total_movements'].cumsum()
+        # Add cumulative columns (running totals within each syndicate, as float)
+        cumulative = df.groupby('syndicate_number', sort=False)[
+            ['premium_income', 'claims_paid', 'total_movements']
+        ].cumsum().astype(float)
+        df['cumulative_premium_income'] = cumulative['premium_income']
+        df['cumulative_claims_paid'] = cumulative['claims_paid']
+        df['cumulative_total_movements'] = cumulative['total_movements']
 
         return df
 
@@ -186,6 +377,11 @@ class LiquidityStressTest:
         """
         Generate Stress Test Impact table for RRA forms
 
+        Each period's stressed closing free funds are the baseline closing
+        free funds less the cumulative stress impact to that period (cash
+        paid out stays paid), as in simulate_min_free_funds, so the
+        deterministic minimum is comparable with the simulated range.
+
         Args:
             syndicate_number (int, optional): Filter for specific syndicate
 
@@ -196,8 +392,8 @@ class LiquidityStressTest:
             self.load_data()
 
         # Merge baseline cashflow with stress scenario
-        baseline = self.cashflow_data.copy()
-        stress = self.stress_data.copy()
+        baseline = syndicate_rows(self.cashflow_data, syndicate_number)
+        stress = syndicate_rows(self.stress_data, syndicate_number)
 
         merged = baseline.merge(
             stress,
@@ -205,24 +401,113 @@ class LiquidityStressTest:
             how='left'
         )
 
-        if syndicate_number:
-            merged = merged[merged['syndicate_number'] == syndicate_number]
-
-        # Calculate stressed cashflow positions
+        # Calculate stressed cashflow positions from the cumulative impact
+        # (derived from the per-period impact when the data does not carry it)
+        if 'cumulative_stress_impact' not in merged.columns:
+            merged['cumulative_stress_impact'] = (
+                merged.sort_values('date', kind='stable')
+                .groupby('syndicate_number', sort=False)['stress_scenario_impact'].cumsum()
+            )
         merged['stressed_closing_funds'] = (
-            merged['closing_free_funds'] + merged['stress_scenario_impact']
+            merged['closing_free_funds'] + merged['cumulative_stress_impact']
         )
 
         merged['liquidity_gap'] = merged['closing_free_funds'] - merged['stressed_closing_funds']
 
-        # Calculate minimum liquidity position
-        for syndicate in merged['syndicate_number'].unique():
-            mask = merged['syndicate_number'] == syndicate
-            merged.loc[mask, 'min_liquidity_baseline'] = merged.loc[mask, 'closing_free_funds'].min()
-            merged.loc[mask, 'min_liquidity_stressed'] = merged.loc[mask, 'stressed_closing_funds'].min()
+        # Calculate minimum liquidity position (float, as the tables have always returned)
+        grouped = merged.groupby('syndicate_number', sort=False)
+        merged['min_liquidity_baseline'] = grouped['closing_free_funds'].transform('min').astype(float)
+        merged['min_liquidity_stressed'] = grouped['stressed_closing_funds'].transform('min').astype(float)
 
         return merged
 
+    def simulate_stress_paths(self, n_paths=DEFAULT_PATHS, seed=42, syndicate_number=None,
+                              chunk_paths=DEFAULT_CHUNK_PATHS, max_workers=1):
+        """
+        Monte Carlo liquidity stress: minimum free funds per syndicate and path
+
+        Paths are simulated in chunks of chunk_paths (syndicates x paths x
+        periods arrays, see simulate_min_free_funds) so memory stays bounded;
+        with max_workers > 1 the chunks run in worker processes. Every chunk
+        has its own seed spawned from seed, so results depend on seed and
+        chunk_paths but not on the worker count.
+
+        Args:
+            n_paths (int): Stress paths per syndicate
+            seed (int): Simulation seed
+            syndicate_number (int, optional): Filter for specific syndicate
+            chunk_paths (int): Paths per chunk
+            max_workers (int): Worker processes (1: run in this process)
+
+        Returns:
+            tuple: (syndicate numbers, np.ndarray of minimum free funds,
+                    syndicates x paths)
+        """
+        if self.metadata is None or self.cashflow_data is None:
+            self.load_data()
+
+        baseline = self.cashflow_data.pivot(index='syndicate_number', columns='date',
+                                            values='closing_free_funds').sort_index(axis=1)
+        if syndicate_number:
+            baseline = baseline.loc[[syndicate_number]]
+        baseline = baseline.ffill(axis=1)
+
+        fal = (self.metadata.set_index('syndicate_number')['syndicate_fal']
+               .reindex(baseline.index).to_numpy(dtype=float))
+        closing = baseline.to_numpy(dtype=float)
+
+        chunks = [min(chunk_paths, n_paths - start) for start in range(0, n_paths, chunk_paths)]
+        seeds = [np.random.SeedSequence([seed, int(syndicate)]).spawn(len(chunks))
+                 for syndicate in baseline.index]
+        args = [(closing, fal, size, [syndicate_seeds[c] for syndicate_seeds in seeds])
+                for c, size in enumerate(chunks)]
+
+        if max_workers > 1 and len(chunks) > 1:
+            with ProcessPoolExecutor(max_workers=min(max_workers, len(chunks))) as pool:
+                results = list(pool.map(simulate_min_free_funds, *zip(*args)))
+        else:
+            results = [simulate_min_free_funds(*chunk_args) for chunk_args in args]
+
+        return baseline.index.to_numpy(), np.concatenate(results, axis=1)
+
+    def calculate_stress_simulation_table(self, n_paths=DEFAULT_PATHS, seed=42, syndicate_number=None,
+                                          chunk_paths=DEFAULT_CHUNK_PATHS, max_workers=1):
+        """
+        Generate Monte Carlo Stress Simulation table
+
+        Summarises the distribution of each syndicate's minimum free funds
+        over the simulated stress paths (see simulate_stress_paths).
+
+        Args:
+            n_paths (int): Stress paths per syndicate
+            seed (int): Simulation seed
+            syndicate_number (int, optional): Filter for specific syndicate
+            chunk_paths (int): Paths per chunk
+            max_workers (int): Worker processes
+
+        Returns:
+            pd.DataFrame: One row per syndicate with the mean, percentiles and
+                          1-in-200 minimum free funds, the shortfall
+                          probability and the expected shortfall
+        """
+        syndicates, min_funds = self.simulate_stress_paths(
+            n_paths, seed, syndicate_number, chunk_paths, max_workers
+        )
+        percentiles = np.percentile(min_funds, [SHORTFALL_QUANTILE * 100, 5, 50, 95], axis=1)
+        shortfall = np.minimum(min_funds, 0)
+
+        return pd.DataFrame({
+            'syndicate_number': syndicates,
+            'n_paths': n_paths,
+            'mean_min_free_funds': min_funds.mean(axis=1),
+            'min_free_funds_1_in_200': percentiles[0],
+            'min_free_funds_p5': percentiles[1],
+            'min_free_funds_p50': percentiles[2],
+            'min_free_funds_p95': percentiles[3],
+            'shortfall_probability': (min_funds < 0).mean(axis=1),
+            'expected_shortfall': -shortfall.mean(axis=1),
+        })
+
     def calculate_rra_output_tables(self, syndicate_number=None):
         """
         Generate all RRA output tables
@@ -240,12 +525,15 @@ class LiquidityStressTest:
             'stress_impact': self.calculate_stress_impact_table(syndicate_number)
         }
 
-    def create_dashboard_summary(self, syndicate_number=None):
+    def create_dashboard_summary(self, syndicate_number=None, tables=None):
         """
         Create executive dashboard summary with key metrics
 
         Args:
             syndicate_number (int, optional): Filter for specific syndicate
+            tables (dict, optional): Output of calculate_rra_output_tables for
+                                     the same syndicate filter, to reuse its
+                                     capital position and stress impact tables
 
         Returns:
             pd.DataFrame: Dashboard summary metrics
@@ -253,38 +541,36 @@ class LiquidityStressTest:
         if self.metadata is None:
             self.load_data()
 
-        capital = self.calculate_capital_position_table(syndicate_number)
-        stress = self.calculate_stress_impact_table(syndicate_number)
-
-        summary_data = []
-
-        for _, synd_capital in capital.iterrows():
-            synd_num = synd_capital['syndicate_number']
-
-            synd_stress = stress[stress['syndicate_number'] == synd_num]
-
-            # Get stress scenario metadata
-            synd_meta = self.metadata[self.metadata['syndicate_number'] == synd_num].iloc[0]
-
-            summary = {
-                'syndicate_number': synd_num,
-                'syndicate_name': synd_capital['syndicate_name'],
-                'managing_agent': synd_capital['managing_agent'],
-                'total_fal': synd_capital['syndicate_fal'],
-                'solvency_ratio': synd_capital['solvency_ratio'],
-                'baseline_min_liquidity': synd_stress['min_liquidity_baseline'].iloc[0],
-                'stressed_min_liquidity': synd_stress['min_liquidity_stressed'].iloc[0],
-                'max_liquidity_gap': synd_stress['liquidity_gap'].max(),
-                'stress_scenario': synd_meta['scenario_type'],
-                'gross_loss_estimate': synd_meta['gross_loss_estimate'],
-                'net_loss_estimate': synd_meta['net_loss_estimate'],
-                'us_funding_requirement': synd_meta['us_funding_requirement'],
-                'stress_test_pass': synd_stress['stressed_closing_funds'].min() > 0
-            }
-
-            summary_data.append(summary)
-
-        return pd.DataFrame(summary_data)
+        if tables is not None:
+            capital, stress = tables['capital_position'], tables['stress_impact']
+        else:
+            capital = self.calculate_capital_position_table(syndicate_number)
+            stress = self.calculate_stress_impact_table(syndicate_number)
+
+        # One row of stress results per syndicate
+        stress_summary = stress.groupby('syndicate_number', sort=False).agg(
+            baseline_min_liquidity=('min_liquidity_baseline', 'first'),
+            stressed_min_liquidity=('min_liquidity_stressed', 'first'),
+            max_liquidity_gap=('liquidity_gap', 'max'),
+            min_stressed_closing_funds=('stressed_closing_funds', 'min'),
+        ).reset_index()
+
+        # Get stress scenario metadata
+        scenario = syndicate_rows(self.metadata, syndicate_number).drop_duplicates('syndicate_number')[[
+            'syndicate_number', 'scenario_type', 'gross_loss_estimate',
+            'net_loss_estimate', 'us_funding_requirement'
+        ]].rename(columns={'scenario_type': 'stress_scenario'})
+
+        summary = capital[[
+            'syndicate_number', 'syndicate_name', 'managing_agent', 'syndicate_fal', 'solvency_ratio'
+        ]].rename(columns={'syndicate_fal': 'total_fal'})
+        summary = (summary
+                   .merge(stress_summary, on='syndicate_number', how='left')
+                   .merge(scenario, on='syndicate_number', how='left'))
+
+        summary['stress_test_pass'] = summary.pop('min_stressed_closing_funds') > 0
+
+        return summary
 
     def export_to_excel(self, output_path, syndicate_number=None):
         """
@@ -295,14 +581,22 @@ class LiquidityStressTest:
             syndicate_number (int, optional): Filter for specific syndicate
         """
         tables = self.calculate_rra_output_tables(syndicate_number)
-        summary = self.create_dashboard_summary(syndicate_number)
-
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-            summary.to_excel(writer, sheet_name='Dashboard Summary', index=False)
-            tables['capital_position'].to_excel(writer, sheet_name='Capital Position', index=False)
-            tables['liquidity_breakdown'].to_excel(writer, sheet_name='Liquidity Breakdown', index=False)
-            tables['cashflow_summary'].to_excel(writer, sheet_name='Cashflow Summary', index=False)
-            tables['stress_impact'].to_excel(writer, sheet_name='Stress Impact Analysis', index=False)
+        summary = self.create_dashboard_summary(syndicate_number, tables=tables)
+
+        sheets = {
+            'Dashboard Summary': summary,
+            'Capital Position': tables['capital_position'],
+            'Liquidity Breakdown': tables['liquidity_breakdown'],
+            'Cashflow Summary': tables['cashflow_summary'],
+            'Stress Impact Analysis': tables['stress_impact'],
+        }
+
+        if write_workbook is not None:
+            write_workbook(output_path, sheets)
+        else:
+            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+                for sheet_name, df in sheets.items():
+                    df.to_excel(writer, sheet_name=sheet_name, index=False)
 
         print(f"✓ Exported to {output_path}")
 
@@ -15,6 +15,13 @@ The raw data consists of 8 optimal CSV files:
 7. reserve_movements.csv - Technical provisions/IBNR
 8. risk_exposures.csv - SCR risk components
 
+Load-test volumes:
+    python generate_raw_transactional_data.py --scale load --workers 8
+
+--scale generates policies, claims and premiums vectorized with
+numpy.random.Generator, one SeedSequence.spawn stream per syndicate, in
+parallel processes; the output is identical for any worker count.
+
 Author: Claude
 Date: 2025-11-28
 """
@@ -24,6 +31,9 @@ import numpy as np
 from datetime import datetime, timedelta
 import os
 import json
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 # Set random seed for reproducibility
@@ -678,6 +688,323 @@ def generate_risk_exposures(targets: dict) -> pd.DataFrame:
 # MAIN GENERATION FUNCTION
 # ============================================================================
 
+# ============================================================================
+# SCALED GENERATION - Vectorized, partitioned policy/claim/premium feeds
+# ============================================================================
+
+# --scale presets: (policies, syndicates, years). 'load' produces ~50M
+# premium rows (4 per policy) and ~19M claim transaction rows.
+SCALE_PRESETS = {
+    'default': (5000, 10, 9),
+    'market': (1_000_000, 300, 20),
+    'load': (12_500_000, 300, 20),
+}
+
+# Feeds generated per syndicate partition in scaled mode
+PARTITIONED_FEEDS = ['policies', 'claim_transactions', 'premium_transactions']
+
+POLICY_COUNTRIES = ['GB', 'US', 'DE', 'FR', 'JP', 'AU', 'CA']
+CLAIM_COUNTRIES = ['GB', 'US', 'DE', 'FR', 'JP']
+CLAIM_STATUS_PROBABILITIES = [0.3, 0.5, 0.15, 0.05]
+MAX_PAYMENTS = 4
+
+
+@dataclass(frozen=True)
+class GenerationScale:
+    """Size of a scaled raw data run."""
+    policies: int
+    syndicates: int
+    years: int
+
+
+def parse_scale(text: str) -> GenerationScale:
+    """
+    Parse a --scale value.
+
+    Accepts a preset name, comma-separated key=value overrides, or both:
+    ``market``, ``policies=2000000,syndicates=50``, ``load,years=10``.
+    """
+    policies, syndicates, years = SCALE_PRESETS['default']
+    values = {'policies': policies, 'syndicates': syndicates, 'years': years}
+    for part in filter(None, (p.strip() for p in text.split(','))):
+        if '=' in part:
+            key, value = (s.strip() for s in part.split('=', 1))
+            if key not in values:
+                raise ValueError(f"Unknown scale key '{key}' (expected policies, syndicates, years)")
+            values[key] = int(float(value))
+        elif part in SCALE_PRESETS:
+            values.update(zip(('policies', 'syndicates', 'years'), SCALE_PRESETS[part]))
+        else:
+            raise ValueError(f"Unknown scale preset '{part}'. Available: {list(SCALE_PRESETS)}")
+    if min(values.values()) < 1:
+        raise ValueError(f"Scale values must be positive: {values}")
+    return GenerationScale(**values)
+
+
+def scaled_syndicates(count: int) -> list:
+    """The reference syndicates, padded with synthetic syndicate numbers."""
+    syndicates = list(SYNDICATES[:count])
+    number = max(SYNDICATES) + 1
+    while len(syndicates) < count:
+        if number not in syndicates:
+            syndicates.append(number)
+        number += 1
+    return syndicates
+
+
+def scaled_years(count: int) -> list:
+    """The last ``count`` years of account, ending at the final configured year."""
+    return list(range(YEARS[-1] - count + 1, YEARS[-1] + 1))
+
+
+def _split_policies(total: int, partitions: int) -> list:
+    """Policy counts per partition (as even as possible, remainder first)."""
+    base, remainder = divmod(total, partitions)
+    return [base + (1 if i < remainder else 0) for i in range(partitions)]
+
+
+def _dates(years: np.ndarray, months: np.ndarray, days: np.ndarray) -> np.ndarray:
+    """Vectorized datetime64[D] from year, month and day arrays."""
+    return ((years - 1970).astype('datetime64[Y]').astype('datetime64[M]')
+            + (months - 1)).astype('datetime64[D]') + (days - 1)
+
+
+def _iso(dates: np.ndarray) -> np.ndarray:
+    return np.datetime_as_string(dates, unit='D')
+
+
+def _ids(prefix: str, numbers: np.ndarray, width: int) -> pd.Series:
+    return prefix + pd.Series(numbers).astype(str).str.zfill(width)
+
+
+def generate_policy_partition(rng: np.random.Generator, syndicate: int, num_policies: int,
+                              years: list, first_policy: int) -> pd.DataFrame:
+    """
+    Generate one syndicate's policies with one array draw per field.
+
+    Args:
+        rng: Random generator of the partition
+        syndicate: Syndicate number
+        num_policies: Number of policies
+        years: Years of account to draw from
+        first_policy: Number of the first policy (Policy_IDs are global)
+
+    Returns:
+        Policy frame with the generate_policies() columns
+    """
+    n = num_policies
+    lob_codes = np.array(list(LOB_CODES))
+    lob_names = np.array(list(LOB_CODES.values()))
+
+    year = rng.choice(np.asarray(years), n)
+    lob = rng.integers(0, len(lob_codes), n)
+    inception = _dates(year, rng.integers(1, 13, n), rng.integers(1, 29, n))
+    gross_premium = rng.uniform(10000, 5000000, n)
+
+    return pd.DataFrame({
+        'Policy_ID': _ids('POL', np.arange(first_policy, first_policy + n), 8),
+        'Syndicate_Number': np.full(n, syndicate),
+        'Year_of_Account': year,
+        'LOB_Code': lob_codes[lob],
+        'LOB_Name': lob_names[lob],
+        'Currency': rng.choice(CURRENCIES, n),
+        'Inception_Date': _iso(inception),
+        'Expiry_Date': _iso(inception + 365),
+        'Gross_Written_Premium': np.round(gross_premium, 2),
+        'Net_Written_Premium': np.round(gross_premium * rng.uniform(0.7, 0.95, n), 2),
+        'Broker': 'Broker_' + pd.Series(rng.integers(1, 51, n)).astype(str),
+        'Country': rng.choice(POLICY_COUNTRIES, n),
+        'Risk_Code': rng.integers(1, 10, n),
+    })
+
+
+def generate_claim_partition(rng: np.random.Generator, policies: pd.DataFrame,
+                             syndicate: int) -> pd.DataFrame:
+    """
+    Vectorized synthetic claim transactions for one syndicate's policies.
+
+    Same model as the synthetic fallback of generate_claim_transactions():
+    30% of policies have 1-3 claims, each paid in 1-4 payments that take
+    20-50% of the remaining paid amount (the last payment takes the rest).
+    Payments are laid out as a (claims x MAX_PAYMENTS) matrix and the
+    unused slots dropped.
+    """
+    has_claims = rng.random(len(policies)) < 0.3
+    claims_per_policy = np.where(has_claims, rng.integers(1, 4, len(policies)), 0)
+    policy_index = np.repeat(np.arange(len(policies)), claims_per_policy)
+    m = len(policy_index)
+
+    status = rng.choice(CLAIM_STATUSES, m, p=CLAIM_STATUS_PROBABILITIES)
+    closed = status == 'Closed'
+    incurred = rng.uniform(10000, 800000, m)
+    paid = incurred * np.where(closed, 0.8, rng.uniform(0.1, 0.6, m))
+    outstanding = np.where(closed, 0.0, incurred - paid)
+    inception = policies['Inception_Date'].to_numpy().astype('datetime64[D]')[policy_index]
+    loss_date = inception + rng.integers(0, 365, m)
+
+    # Remaining paid amount before each payment, then the payment itself
+    num_payments = rng.integers(1, MAX_PAYMENTS + 1, m)
+    share = rng.uniform(0.2, 0.5, (m, MAX_PAYMENTS))
+    slot = np.arange(MAX_PAYMENTS)
+    remaining = paid[:, None] * np.cumprod(
+        np.hstack([np.ones((m, 1)), 1 - share[:, :-1]]), axis=1)
+    amounts = np.where(slot == (num_payments - 1)[:, None], remaining, remaining * share)
+
+    used = slot < num_payments[:, None]
+    claim_index = np.repeat(np.arange(m), num_payments)
+    amount = amounts[used]
+    first = slot[None, :].repeat(m, axis=0)[used] == 0
+    t = len(claim_index)
+    claim_loss_date = loss_date[claim_index]
+    policy_rows = policy_index[claim_index]
+
+    return pd.DataFrame({
+        'Transaction_ID': _ids(f'TXN{syndicate:04d}', np.arange(1, t + 1), 9),
+        'Claim_Reference': _ids(f'CLM{syndicate:04d}', claim_index + 1, 7),
+        'Syndicate_Number': np.full(t, syndicate),
+        'Year_of_Account': policies['Year_of_Account'].to_numpy()[policy_rows],
+        'Risk_Code': policies['Risk_Code'].to_numpy()[policy_rows],
+        'Currency': policies['Currency'].to_numpy()[policy_rows],
+        'Status': status[claim_index],
+        'Transaction_Type': 'Payment',
+        'Transaction_Date': _iso(claim_loss_date + rng.integers(30, 365 * 2, t)),
+        'Loss_Date': _iso(claim_loss_date),
+        'Report_Date': _iso(claim_loss_date + rng.integers(1, 90, t)),
+        'Amount': np.round(amount, 2),
+        'Outstanding_Amount': np.where(first, np.round(outstanding[claim_index], 2), 0),
+        'Incurred_Amount': np.where(first, np.round(incurred[claim_index], 2), 0),
+        'LOB_Code': policies['LOB_Code'].to_numpy()[policy_rows],
+        'Country': policies['Country'].to_numpy()[policy_rows],
+        'Claim_Type': 'Gross',
+        'Reinsurance_Recovery': np.round(amount * rng.uniform(0, 0.3, t), 2),
+    })
+
+
+def generate_premium_partition(rng: np.random.Generator, policies: pd.DataFrame,
+                               syndicate: int) -> pd.DataFrame:
+    """
+    Vectorized quarterly premium instalments for one syndicate's policies.
+
+    Rows are ordered by year of account and LOB, then policy and quarter, as
+    generate_premium_transactions() orders them (uncalibrated: no target
+    scaling).
+    """
+    order = np.lexsort((policies['LOB_Code'].to_numpy(), policies['Year_of_Account'].to_numpy()))
+    policies = policies.iloc[order]
+    n = len(policies)
+    t = n * 4
+
+    quarter = np.tile(np.arange(1, 5), n)
+    rows = np.repeat(np.arange(n), 4)
+    year = policies['Year_of_Account'].to_numpy()[rows]
+    quarter_premium = policies['Gross_Written_Premium'].to_numpy()[rows] * 0.25
+
+    return pd.DataFrame({
+        'Transaction_ID': _ids(f'PRM{syndicate:04d}', np.arange(1, t + 1), 9),
+        'Policy_ID': policies['Policy_ID'].to_numpy()[rows],
+        'Syndicate_Number': np.full(t, syndicate),
+        'Year_of_Account': year,
+        'LOB_Code': policies['LOB_Code'].to_numpy()[rows],
+        'LOB_Name': policies['LOB_Name'].to_numpy()[rows],
+        'Currency': policies['Currency'].to_numpy()[rows],
+        'Transaction_Type': 'Written_Premium',
+        'Transaction_Date': _iso(_dates(year, quarter * 3, np.full(t, 15))),
+        'Quarter': np.array(['Q1', 'Q2', 'Q3', 'Q4'])[quarter - 1],
+        'Gross_Amount': np.round(quarter_premium, 2),
+        'Ceding_Commission': np.round(quarter_premium * rng.uniform(0.1, 0.2, t), 2),
+        'Net_Amount': np.round(quarter_premium * rng.uniform(0.75, 0.9, t), 2),
+        'Earned_Premium': np.round(quarter_premium * np.minimum(1.0, quarter / 4), 2),
+        'Unearned_Premium': np.round(quarter_premium * np.maximum(0, 1 - quarter / 4), 2),
+        'Country': policies['Country'].to_numpy()[rows],
+    })
+
+
+def _generate_partition(task: tuple) -> dict:
+    """
+    Generate and write one syndicate partition (runs in a worker process).
+
+    Each partition has its own SeedSequence child, so its data does not
+    depend on the number of workers or the order partitions run in.
+    """
+    index, syndicate, num_policies, first_policy, years, seed_sequence, parts_dir = task
+    rng = np.random.default_rng(seed_sequence)
+
+    policies = generate_policy_partition(rng, syndicate, num_policies, years, first_policy)
+    feeds = {
+        'policies': policies,
+        'claim_transactions': generate_claim_partition(rng, policies, syndicate),
+        'premium_transactions': generate_premium_partition(rng, policies, syndicate),
+    }
+
+    counts = {}
+    for name, df in feeds.items():
+        add_reporting_period(df).to_csv(Path(parts_dir) / name / f'part-{index:05d}.csv',
+                                        index=False, header=False)
+        counts[name] = len(df)
+    return counts
+
+
+def generate_scaled_feeds(output_dir: str, scale: GenerationScale, seed: int = 42,
+                          workers: int = None) -> dict:
+    """
+    Generate policies, claim and premium feeds at scale, in parallel partitions.
+
+    Policies are split evenly across syndicates. Each syndicate partition is
+    generated from an independent ``SeedSequence(seed).spawn`` stream in a
+    worker process and written to its own part file; the parts are then
+    concatenated in syndicate order, so the output is reproducible for any
+    worker count.
+
+    Args:
+        output_dir: Directory for policies.csv, claim_transactions.csv and
+            premium_transactions.csv
+        scale: Policies, syndicates and years to generate
+        seed: Root seed
+        workers: Worker processes (default: CPU count)
+
+    Returns:
+        Dictionary of feed name to record count
+    """
+    output_dir = Path(output_dir)
+    parts_dir = output_dir / '_parts'
+    if parts_dir.exists():
+        shutil.rmtree(parts_dir)
+    for name in PARTITIONED_FEEDS:
+        (parts_dir / name).mkdir(parents=True, exist_ok=True)
+
+    syndicates = scaled_syndicates(scale.syndicates)
+    years = scaled_years(scale.years)
+    counts = _split_policies(scale.policies, len(syndicates))
+    first_policies = np.concatenate([[1], np.cumsum(counts)[:-1] + 1]).tolist()
+    streams = np.random.SeedSequence(seed).spawn(len(syndicates))
+
+    tasks = [(i, syn, counts[i], first_policies[i], years, streams[i], str(parts_dir))
+             for i, syn in enumerate(syndicates)]
+
+    record_counts = dict.fromkeys(PARTITIONED_FEEDS, 0)
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        for partition_counts in executor.map(_generate_partition, tasks):
+            for name, count in partition_counts.items():
+                record_counts[name] += count
+
+    # Header from an empty frame of the same columns, then the parts in order
+    empty = generate_policy_partition(np.random.default_rng(0), 0, 0, years, 1)
+    headers = {
+        'policies': empty,
+        'claim_transactions': generate_claim_partition(np.random.default_rng(0), empty, 0),
+        'premium_transactions': generate_premium_partition(np.random.default_rng(0), empty, 0),
+    }
+    for name in PARTITIONED_FEEDS:
+        with open(output_dir / f'{name}.csv', 'wb') as out:
+            out.write(add_reporting_period(headers[name]).to_csv(index=False).encode())
+            for part in sorted((parts_dir / name).glob('part-*.csv')):
+                with open(part, 'rb') as f:
+                    shutil.copyfileobj(f, out)
+    shutil.rmtree(parts_dir)
+
+    return record_counts
+
+
 def add_reporting_period(df: pd.DataFrame) -> pd.DataFrame:
     """Add reporting_period as the first column of a DataFrame."""
     df = df.copy()
@@ -685,22 +1012,50 @@ def add_reporting_period(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def generate_all_raw_data(output_dir: str, exports_dir: str = None) -> dict:
+def generate_all_raw_data(output_dir: str, exports_dir: str = None,
+                          scale: GenerationScale = None, seed: int = 42,
+                          workers: int = None) -> dict:
     """
     Generate all raw transactional data files.
 
     Args:
         output_dir: Directory to save raw data files
         exports_dir: Optional directory containing Power BI exports for calibration
+        scale: Optional policies / syndicates / years for load-test volumes.
+            Policies, claims and premiums are then generated vectorized in
+            parallel syndicate partitions (uncalibrated) and not returned
+        seed: Seed of the run. The reference and position tables (and the
+            unscaled policies, claims and premiums) are drawn from the global
+            numpy stream reseeded with it, the scaled partitions from
+            SeedSequence(seed) streams, so repeated calls match
+        workers: Worker processes for the scaled partitions
 
     Returns:
         Dictionary with generated DataFrames and metadata
     """
+    global SYNDICATES, YEARS
+    if scale is not None:
+        # Reference and position tables follow the scaled syndicates and years
+        default_syndicates, default_years = SYNDICATES, YEARS
+        SYNDICATES, YEARS = scaled_syndicates(scale.syndicates), scaled_years(scale.years)
+        try:
+            return _generate_all_raw_data(output_dir, exports_dir, scale, seed, workers)
+        finally:
+            SYNDICATES, YEARS = default_syndicates, default_years
+    return _generate_all_raw_data(output_dir, exports_dir, scale, seed, workers)
+
+
+def _generate_all_raw_data(output_dir: str, exports_dir: str, scale: GenerationScale,
+                           seed: int, workers: int) -> dict:
     print("=" * 70)
     print("Lloyd's Regulatory Reporting - Raw Transactional Data Generator")
     print("=" * 70)
     print(f"Reporting Period: {REPORTING_PERIOD}")
 
+    # The tables drawn from the global stream depend on seed alone, not on
+    # what was generated before in this process
+    np.random.seed(seed)
+
     # Create output directory
     Path(output_dir).mkdir(parents=True, exist_ok=True)
 
@@ -727,26 +1082,36 @@ def generate_all_raw_data(output_dir: str, exports_dir: str = None) -> dict:
     results['exchange_rates'] = exchange_rates_df
     print(f"       Generated {len(exchange_rates_df)} exchange rate records")
 
-    # 3. Generate policies
-    print("\n[3/8] Generating policies.csv...")
-    policies_df = add_reporting_period(generate_policies(num_policies=5000))
-    policies_df.to_csv(os.path.join(output_dir, 'policies.csv'), index=False)
-    results['policies'] = policies_df
-    print(f"       Generated {len(policies_df)} policy records")
-
-    # 4. Generate claim transactions
-    print("\n[4/8] Generating claim_transactions.csv...")
-    claims_df = add_reporting_period(generate_claim_transactions(policies_df, targets))
-    claims_df.to_csv(os.path.join(output_dir, 'claim_transactions.csv'), index=False)
-    results['claim_transactions'] = claims_df
-    print(f"       Generated {len(claims_df)} claim transaction records")
-
-    # 5. Generate premium transactions
-    print("\n[5/8] Generating premium_transactions.csv...")
-    premiums_df = add_reporting_period(generate_premium_transactions(policies_df, targets))
-    premiums_df.to_csv(os.path.join(output_dir, 'premium_transactions.csv'), index=False)
-    results['premium_transactions'] = premiums_df
-    print(f"       Generated {len(premiums_df)} premium transaction records")
+    record_counts = {}
+
+    if scale is not None:
+        # 3-5. Scaled policies, claims and premiums (partitioned, streamed to disk)
+        print(f"\n[3-5/8] Generating policies, claim and premium transactions at scale "
+              f"({scale.policies:,} policies, {scale.syndicates} syndicates, {scale.years} years)...")
+        record_counts.update(generate_scaled_feeds(output_dir, scale, seed=seed, workers=workers))
+        for name in PARTITIONED_FEEDS:
+            print(f"       Generated {record_counts[name]:,} {name.replace('_', ' ')} records")
+    else:
+        # 3. Generate policies
+        print("\n[3/8] Generating policies.csv...")
+        policies_df = add_reporting_period(generate_policies(num_policies=5000))
+        policies_df.to_csv(os.path.join(output_dir, 'policies.csv'), index=False)
+        results['policies'] = policies_df
+        print(f"       Generated {len(policies_df)} policy records")
+
+        # 4. Generate claim transactions
+        print("\n[4/8] Generating claim_transactions.csv...")
+        claims_df = add_reporting_period(generate_claim_transactions(policies_df, targets))
+        claims_df.to_csv(os.path.join(output_dir, 'claim_transactions.csv'), index=False)
+        results['claim_transactions'] = claims_df
+        print(f"       Generated {len(claims_df)} claim transaction records")
+
+        # 5. Generate premium transactions
+        print("\n[5/8] Generating premium_transactions.csv...")
+        premiums_df = add_reporting_period(generate_premium_transactions(policies_df, targets))
+        premiums_df.to_csv(os.path.join(output_dir, 'premium_transactions.csv'), index=False)
+        results['premium_transactions'] = premiums_df
+        print(f"       Generated {len(premiums_df)} premium transaction records")
 
     # 6. Generate asset holdings
     print("\n[6/8] Generating asset_holdings.csv...")
@@ -769,16 +1134,20 @@ def generate_all_raw_data(output_dir: str, exports_dir: str = None) -> dict:
     results['risk_exposures'] = risk_df
     print(f"       Generated {len(risk_df)} risk exposure records")
 
+    # Scaled feeds are streamed to disk and only counted
+    record_counts = {**{name: len(df) for name, df in results.items()}, **record_counts}
+
     # Generate metadata
     metadata = {
         'generated_at': datetime.now().isoformat(),
         'reporting_period': REPORTING_PERIOD,
-        'seed': 42,
+        'seed': seed,
+        'scale': vars(scale) if scale is not None else None,
         'version': '1.1.0',
         'generator': 'generate_raw_transactional_data.py',
-        'datasets': list(results.keys()),
-        'record_counts': {name: len(df) for name, df in results.items()},
-        'total_records': sum(len(df) for df in results.values()),
+        'datasets': list(record_counts),
+        'record_counts': record_counts,
+        'total_records': sum(record_counts.values()),
         'target_outputs': 'exports/powerbi/*.csv',
         'etl_tools': ['KNIME', 'Alteryx'],
         'schema_description': {
@@ -859,6 +1228,26 @@ if __name__ == '__main__':
         default='exports/powerbi',
         help='Directory containing Power BI exports for calibration (default: exports/powerbi)'
     )
+    parser.add_argument(
+        '--scale', '-s',
+        type=parse_scale,
+        default=None,
+        help='Generate load-test volumes: a preset (' + ', '.join(SCALE_PRESETS) + ') and/or '
+             'policies=N,syndicates=N,years=N overrides, e.g. --scale load or '
+             '--scale market,policies=5000000'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=42,
+        help='Seed of every generated table (default: 42)'
+    )
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=None,
+        help='Worker processes for scaled generation (default: CPU count)'
+    )
 
     args = parser.parse_args()
 
@@ -869,4 +1258,5 @@ if __name__ == '__main__':
     output_dir = repo_root / args.output_dir
     exports_dir = repo_root / args.exports_dir
 
-    generate_all_raw_data(str(output_dir), str(exports_dir))
+    generate_all_raw_data(str(output_dir), str(exports_dir), scale=args.scale,
+                          seed=args.seed, workers=args.workers)
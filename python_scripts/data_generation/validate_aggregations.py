@@ -12,8 +12,16 @@ Date: 2025-11-28
 import pandas as pd
 import numpy as np
 import os
+import sys
 from pathlib import Path
 
+# Raw feeds are loaded through the storage layer (typed Parquet when converted)
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+try:
+    from python_scripts.utils.table_storage import read_table
+except ImportError:
+    read_table = pd.read_csv
+
 
 def validate_claims_aggregations(raw_dir: str, exports_dir: str) -> dict:
     """Validate claim transaction aggregations."""
@@ -24,7 +32,7 @@ def validate_claims_aggregations(raw_dir: str, exports_dir: str) -> dict:
     results = {'passed': [], 'failed': []}
 
     # Load raw claim transactions
-    claims_raw = pd.read_csv(os.path.join(raw_dir, 'claim_transactions.csv'))
+    claims_raw = read_table(os.path.join(raw_dir, 'claim_transactions.csv'))
 
     # Load target Claims_BySyndicate
     target_file = os.path.join(exports_dir, 'Claims_BySyndicate.csv')
@@ -32,7 +40,7 @@ def validate_claims_aggregations(raw_dir: str, exports_dir: str) -> dict:
         target = pd.read_csv(target_file)
 
         # Aggregate raw data by syndicate
-        agg = claims_raw.groupby('Syndicate_Number').agg({
+        agg = claims_raw.groupby('Syndicate_Number', observed=True).agg({
             'Claim_Reference': 'nunique',
             'Amount': 'sum',
             'Outstanding_Amount': 'sum',
@@ -58,7 +66,7 @@ def validate_claims_aggregations(raw_dir: str, exports_dir: str) -> dict:
         target = pd.read_csv(target_file)
 
         # Aggregate raw data by status
-        agg = claims_raw.groupby('Status').agg({
+        agg = claims_raw.groupby('Status', observed=True).agg({
             'Claim_Reference': 'nunique',
             'Amount': 'sum',
             'Outstanding_Amount': 'sum'
@@ -87,7 +95,7 @@ def validate_premium_aggregations(raw_dir: str, exports_dir: str) -> dict:
     results = {'passed': [], 'failed': []}
 
     # Load raw premium transactions
-    premiums_raw = pd.read_csv(os.path.join(raw_dir, 'premium_transactions.csv'))
+    premiums_raw = read_table(os.path.join(raw_dir, 'premium_transactions.csv'))
 
     # Load target RRA_291
     target_file = os.path.join(exports_dir, 'RRA_291_GrossPremiumIBNR.csv')
@@ -95,7 +103,7 @@ def validate_premium_aggregations(raw_dir: str, exports_dir: str) -> dict:
         target = pd.read_csv(target_file)
 
         # Aggregate raw data by syndicate/year/LOB
-        agg = premiums_raw.groupby(['Syndicate_Number', 'Year_of_Account', 'LOB_Code']).agg({
+        agg = premiums_raw.groupby(['Syndicate_Number', 'Year_of_Account', 'LOB_Code'], observed=True).agg({
             'Gross_Amount': 'sum'
         }).reset_index()
 
@@ -127,7 +135,7 @@ def validate_asset_aggregations(raw_dir: str, exports_dir: str) -> dict:
     results = {'passed': [], 'failed': []}
 
     # Load raw asset holdings
-    assets_raw = pd.read_csv(os.path.join(raw_dir, 'asset_holdings.csv'))
+    assets_raw = read_table(os.path.join(raw_dir, 'asset_holdings.csv'))
 
     # Load target Liquidity_AssetBreakdown
     target_file = os.path.join(exports_dir, 'Liquidity_AssetBreakdown.csv')
@@ -135,7 +143,7 @@ def validate_asset_aggregations(raw_dir: str, exports_dir: str) -> dict:
         target = pd.read_csv(target_file)
 
         # Aggregate raw data by syndicate/quarter
-        agg = assets_raw.groupby(['Syndicate_Number', 'Quarter']).agg({
+        agg = assets_raw.groupby(['Syndicate_Number', 'Quarter'], observed=True).agg({
             'Market_Value': 'sum'
         }).reset_index()
 
@@ -169,7 +177,7 @@ def validate_reserve_aggregations(raw_dir: str, exports_dir: str) -> dict:
     results = {'passed': [], 'failed': []}
 
     # Load raw reserve movements
-    reserves_raw = pd.read_csv(os.path.join(raw_dir, 'reserve_movements.csv'))
+    reserves_raw = read_table(os.path.join(raw_dir, 'reserve_movements.csv'))
 
     # Load target QSR_TechnicalProvisions
     target_file = os.path.join(exports_dir, 'QSR_TechnicalProvisions.csv')
@@ -178,7 +186,7 @@ def validate_reserve_aggregations(raw_dir: str, exports_dir: str) -> dict:
 
         # Aggregate raw data by syndicate/LOB
         bel_agg = reserves_raw[reserves_raw['Reserve_Type'] == 'Best_Estimate_Liabilities'].groupby(
-            ['Syndicate_Number', 'LOB_Code']
+            ['Syndicate_Number', 'LOB_Code'], observed=True
         ).agg({'Amount': 'sum'}).reset_index()
 
         print(f"\nQSR_TechnicalProvisions validation:")
@@ -210,7 +218,7 @@ def validate_risk_aggregations(raw_dir: str, exports_dir: str) -> dict:
     results = {'passed': [], 'failed': []}
 
     # Load raw risk exposures
-    risk_raw = pd.read_csv(os.path.join(raw_dir, 'risk_exposures.csv'))
+    risk_raw = read_table(os.path.join(raw_dir, 'risk_exposures.csv'))
 
     # Load target LCR_SCR_Summary
     target_file = os.path.join(exports_dir, 'LCR_SCR_Summary.csv')
@@ -218,7 +226,7 @@ def validate_risk_aggregations(raw_dir: str, exports_dir: str) -> dict:
         target = pd.read_csv(target_file)
 
         # Aggregate raw data by syndicate
-        agg = risk_raw.groupby(['Syndicate_Number', 'Risk_Type']).agg({
+        agg = risk_raw.groupby(['Syndicate_Number', 'Risk_Type'], observed=True).agg({
             'SCR_Contribution': 'sum'
         }).reset_index()
 
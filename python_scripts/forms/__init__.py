@@ -32,6 +32,15 @@ Unified Processor:
 ------------------
 - unified_form_processor: Auto-detection processor for RRQ/RRA
 
+Shared Infrastructure:
+----------------------
+- form_store: Process-wide cache of parsed form files (read_form)
+- triangle_matrix: Vectorized helper for wide Dev_Year_* triangle forms
+- chain_ladder: Batched chain ladder engine (LDFs, CDFs, ultimates, IBNR)
+- stochastic_reserving: Mack and ODP bootstrap reserve variability
+- quarter_diff: Keyed RRQ quarter-over-quarter diff engine
+- validation_rules: Declarative validation rule registry (vectorized masks)
+
 Usage:
 ------
     from python_scripts.forms import UnifiedFormProcessor
@@ -60,10 +69,20 @@ from .rra_081_reserving_class import process_rra_081, validate_rra_081, get_rese
 from .rra_091_lpt_data import process_rra_091, validate_rra_091, get_lpt_summary
 
 # Form 193 - Net Claims Development
-from .rra_193_net_claims import process_rra_193, create_development_triangle, calculate_chain_ladder
+from .rra_193_net_claims import (
+    process_rra_193,
+    create_development_triangle,
+    calculate_chain_ladder,
+    calculate_chain_ladder_by_segment
+)
 
 # Form 291 - Gross Premium and IBNR
-from .rra_291_gross_premium_ibnr import process_rra_291, get_ibnr_summary_by_yoa, get_ibnr_range_analysis
+from .rra_291_gross_premium_ibnr import (
+    process_rra_291,
+    get_ibnr_summary_by_yoa,
+    get_ibnr_range_analysis,
+    compare_ibnr_range_to_stochastic
+)
 
 # Form 292 - Net Premium and IBNR
 from .rra_292_net_premium_ibnr import process_rra_292, get_ri_recovery_analysis, compare_net_vs_gross
@@ -115,6 +134,28 @@ from .rrq_192_claims_triangles import (
 # Unified processor
 from .unified_form_processor import UnifiedFormProcessor
 
+# Shared parsed-form cache
+from .form_store import FormStore, get_form_store, read_form, clear_form_cache
+
+# Wide triangle helper
+from .triangle_matrix import TriangleMatrix
+
+# Batched chain ladder engine
+from .chain_ladder import ChainLadderEngine, build_triangle_cube, run_chain_ladder
+
+# Stochastic reserving
+from .stochastic_reserving import (
+    mack_reserve_variability,
+    bootstrap_reserve_variability,
+    calculate_reserve_variability
+)
+
+# Quarter-over-quarter diff
+from .quarter_diff import diff_quarters, chain_quarter_diffs
+
+# Declarative validation rules
+from .validation_rules import RULE_REGISTRY, register_rules, validate_form, validate_forms
+
 __all__ = [
     # Form 010
     'process_rra_010',
@@ -140,10 +181,12 @@ __all__ = [
     'process_rra_193',
     'create_development_triangle',
     'calculate_chain_ladder',
+    'calculate_chain_ladder_by_segment',
     # Form 291
     'process_rra_291',
     'get_ibnr_summary_by_yoa',
     'get_ibnr_range_analysis',
+    'compare_ibnr_range_to_stochastic',
     # Form 292
     'process_rra_292',
     'get_ri_recovery_analysis',
@@ -191,6 +234,29 @@ __all__ = [
     'compare_gross_net_triangles',
     # Unified processor
     'UnifiedFormProcessor',
+    # Form store
+    'FormStore',
+    'get_form_store',
+    'read_form',
+    'clear_form_cache',
+    # Triangle helper
+    'TriangleMatrix',
+    # Chain ladder engine
+    'ChainLadderEngine',
+    'build_triangle_cube',
+    'run_chain_ladder',
+    # Stochastic reserving
+    'mack_reserve_variability',
+    'bootstrap_reserve_variability',
+    'calculate_reserve_variability',
+    # Quarter diff
+    'diff_quarters',
+    'chain_quarter_diffs',
+    # Validation rules
+    'RULE_REGISTRY',
+    'register_rules',
+    'validate_form',
+    'validate_forms',
 ]
 
 # Module version
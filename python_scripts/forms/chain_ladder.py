@@ -0,0 +1,329 @@
+"""
+Chain Ladder Engine - Batched Array-Backed Reserving
+====================================================
+
+Deterministic chain ladder projections for many segments in one pass.
+
+Long-format claims data (one row per segment / origin year / development year)
+is pivoted once into a dense NumPy cube of shape
+(segments x origin years x development years). Link ratios, development
+factors (LDFs), cumulative development factors (CDFs), ultimates and IBNR are
+then computed for every segment with array operations, so a whole market of
+syndicate / LOB triangles is projected in a single call.
+
+LDF averaging methods:
+----------------------
+- volume: volume-weighted average, sum(C[j+1]) / sum(C[j])
+- simple: arithmetic mean of the individual link ratios
+- Either method can be restricted to the latest ``n_years`` origin years
+  that have an observed link ratio (n-year window).
+
+Usage:
+------
+    from python_scripts.forms.chain_ladder import ChainLadderEngine
+    engine = ChainLadderEngine.from_frame(
+        df, value_col='Cumulative_Paid_Claims',
+        segment_cols=['Syndicate_Number', 'LOB_Code']
+    )
+    factors = engine.development_factors(n_years=3)
+    ultimates = engine.ultimates(method='volume')
+"""
+
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Supported LDF averaging methods
+LDF_METHODS: Tuple[str, ...] = ('volume', 'simple')
+
+# Output column labels for each averaging method
+METHOD_LABELS: Dict[str, str] = {
+    'volume': 'Volume_Weighted',
+    'simple': 'Simple',
+}
+
+
+def build_triangle_cube(df: pd.DataFrame,
+                        value_col: str,
+                        segment_cols: Sequence[str] = (),
+                        origin_col: str = 'Year_of_Account',
+                        dev_col: str = 'Development_Year'
+                        ) -> Tuple[pd.DataFrame, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pivot long-format triangle data into a dense cube.
+
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        Long-format data with one row per segment / origin / development year
+    value_col : str
+        Cumulative amount to project
+    segment_cols : sequence of str
+        Columns identifying a triangle (e.g. syndicate and LOB). When empty the
+        whole frame is treated as one triangle.
+    origin_col : str
+        Origin (year of account / accident year) column
+    dev_col : str
+        Integer development year column
+
+    Returns:
+    --------
+    tuple
+        (segments, origins, dev_years, cube) where ``segments`` is a DataFrame
+        of segment keys and ``cube`` has shape (segments, origins, dev years).
+        Duplicate rows are summed; unobserved cells are NaN.
+    """
+    segment_cols = list(segment_cols)
+    n_rows = len(df)
+
+    if segment_cols:
+        seg_codes, seg_index = pd.MultiIndex.from_frame(df[segment_cols]).factorize(sort=True)
+        segments = seg_index.to_frame(index=False)
+        segments.columns = segment_cols
+    else:
+        seg_codes = np.zeros(n_rows, dtype=np.int64)
+        segments = pd.DataFrame(index=range(1 if n_rows else 0))
+
+    origin_codes, origins = pd.factorize(df[origin_col], sort=True)
+    origins = np.asarray(origins)
+
+    dev_values = df[dev_col].to_numpy(dtype=np.int64)
+    if n_rows:
+        dev_min, dev_max = int(dev_values.min()), int(dev_values.max())
+    else:
+        dev_min, dev_max = 0, -1
+    dev_years = np.arange(dev_min, dev_max + 1)
+    dev_codes = dev_values - dev_min
+
+    shape = (len(segments), len(origins), len(dev_years))
+    totals = np.zeros(shape)
+    counts = np.zeros(shape, dtype=np.int64)
+    values = pd.to_numeric(df[value_col], errors='coerce').to_numpy(dtype=np.float64)
+    present = ~np.isnan(values)
+
+    index = (seg_codes[present], origin_codes[present], dev_codes[present])
+    np.add.at(totals, index, values[present])
+    np.add.at(counts, index, 1)
+
+    cube = np.where(counts > 0, totals, np.nan)
+    return segments, origins, dev_years, cube
+
+
+class ChainLadderEngine:
+    """
+    Batched chain ladder over a cube of cumulative triangles.
+
+    Attributes:
+        cube (np.ndarray): Cumulative values, shape (segments, origins, dev years)
+        segments (pd.DataFrame): Segment keys, one row per cube segment
+        origins (np.ndarray): Origin years (ascending)
+        dev_years (np.ndarray): Development years (ascending, contiguous)
+        origin_col (str): Name used for the origin column in outputs
+    """
+
+    def __init__(self,
+                 cube: np.ndarray,
+                 segments: Optional[pd.DataFrame] = None,
+                 origins: Optional[np.ndarray] = None,
+                 dev_years: Optional[np.ndarray] = None,
+                 origin_col: str = 'Year_of_Account'):
+        self.cube = np.asarray(cube, dtype=np.float64)
+        if self.cube.ndim == 2:
+            self.cube = self.cube[np.newaxis, :, :]
+        if self.cube.ndim != 3:
+            raise ValueError("cube must have shape (segments, origins, dev years)")
+
+        n_seg, n_origin, n_dev = self.cube.shape
+        self.segments = segments if segments is not None else pd.DataFrame(index=range(n_seg))
+        self.origins = np.asarray(origins) if origins is not None else np.arange(n_origin)
+        self.dev_years = np.asarray(dev_years) if dev_years is not None else np.arange(n_dev)
+        self.origin_col = origin_col
+
+        # Link ratio inputs (segments, origins, dev years - 1)
+        current = self.cube[:, :, :-1]
+        following = self.cube[:, :, 1:]
+        self._valid = ~np.isnan(current) & ~np.isnan(following) & (current > 0)
+        self._current = np.where(self._valid, current, 0.0)
+        self._following = np.where(self._valid, following, 0.0)
+
+    @classmethod
+    def from_frame(cls,
+                   df: pd.DataFrame,
+                   value_col: str,
+                   segment_cols: Sequence[str] = (),
+                   origin_col: str = 'Year_of_Account',
+                   dev_col: str = 'Development_Year') -> 'ChainLadderEngine':
+        """Build an engine from long-format data (see ``build_triangle_cube``)."""
+        segments, origins, dev_years, cube = build_triangle_cube(
+            df, value_col, segment_cols, origin_col, dev_col
+        )
+        return cls(cube, segments, origins, dev_years, origin_col)
+
+    @property
+    def n_segments(self) -> int:
+        return self.cube.shape[0]
+
+    def _window_mask(self, n_years: Optional[int]) -> np.ndarray:
+        """Valid link ratios, limited to the latest ``n_years`` origins per column."""
+        if n_years is None:
+            return self._valid
+        if n_years < 1:
+            raise ValueError("n_years must be a positive integer")
+        # Count valid ratios from the most recent origin upwards
+        rank = np.cumsum(self._valid[:, ::-1, :], axis=1)[:, ::-1, :]
+        return self._valid & (rank <= n_years)
+
+    def sample_size(self, n_years: Optional[int] = None) -> np.ndarray:
+        """Number of link ratios used per segment and development year."""
+        return self._window_mask(n_years).sum(axis=1)
+
+    def link_ratios(self) -> np.ndarray:
+        """Individual age-to-age ratios, NaN where not observed."""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(self._valid, self._following / self._current, np.nan)
+
+    def ldf(self, method: str = 'volume', n_years: Optional[int] = None) -> np.ndarray:
+        """
+        Age-to-age development factors, shape (segments, dev years - 1).
+
+        Development years without any observed link ratio get a factor of 1.0.
+        """
+        if method not in LDF_METHODS:
+            raise ValueError(f"Unknown LDF method '{method}'. Use one of {LDF_METHODS}")
+
+        mask = self._window_mask(n_years)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if method == 'volume':
+                numerator = np.where(mask, self._following, 0.0).sum(axis=1)
+                denominator = np.where(mask, self._current, 0.0).sum(axis=1)
+                factors = numerator / denominator
+            else:
+                ratios = np.where(mask, self._following / np.where(mask, self._current, 1.0), 0.0)
+                factors = ratios.sum(axis=1) / mask.sum(axis=1)
+
+        return np.where(np.isfinite(factors), factors, 1.0)
+
+    def cdf(self, method: str = 'volume', n_years: Optional[int] = None,
+            tail: float = 1.0) -> np.ndarray:
+        """Cumulative development factors to ultimate, shape (segments, dev years)."""
+        factors = np.concatenate(
+            [self.ldf(method, n_years), np.full((self.n_segments, 1), tail)], axis=1
+        )
+        return np.cumprod(factors[:, ::-1], axis=1)[:, ::-1]
+
+    def latest(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Latest observed diagonal.
+
+        Returns:
+            (latest_index, latest_value) each of shape (segments, origins);
+            index is -1 and value NaN where an origin has no observation.
+        """
+        observed = ~np.isnan(self.cube)
+        n_dev = self.cube.shape[2]
+        if n_dev == 0:
+            empty = self.cube.shape[:2]
+            return np.full(empty, -1), np.full(empty, np.nan)
+        last = n_dev - 1 - np.argmax(observed[:, :, ::-1], axis=2)
+        latest_index = np.where(observed.any(axis=2), last, -1)
+        value = np.take_along_axis(self.cube, np.maximum(latest_index, 0)[..., np.newaxis], axis=2)
+        latest_value = np.where(latest_index >= 0, value[..., 0], np.nan)
+        return latest_index, latest_value
+
+    def development_factors(self,
+                            methods: Sequence[str] = LDF_METHODS,
+                            n_years: Optional[int] = None,
+                            selected: str = 'volume',
+                            tail: float = 1.0) -> pd.DataFrame:
+        """
+        Development factor table for every segment.
+
+        Parameters:
+        -----------
+        methods : sequence of str
+            LDF averaging methods to report ('volume', 'simple')
+        n_years : int, optional
+            Also report each method over the latest ``n_years`` origins
+        selected : str
+            Method used for the reported CDF (over the ``n_years`` window
+            when one is given)
+        tail : float
+            Tail factor applied beyond the last development year
+
+        Returns:
+        --------
+        pandas.DataFrame
+            One row per segment and development year with LDF_* columns,
+            Sample_Size and the selected CDF
+        """
+        n_seg, _, n_dev = self.cube.shape
+        n_links = max(n_dev - 1, 0)
+
+        table = self.segments.loc[np.repeat(np.arange(n_seg), n_links)].reset_index(drop=True)
+        table['Development_Year'] = np.tile(self.dev_years[:-1], n_seg)
+        table['To_Development_Year'] = np.tile(self.dev_years[1:], n_seg)
+        table['Sample_Size'] = self.sample_size().reshape(-1)
+
+        for method in methods:
+            label = METHOD_LABELS[method]
+            table[f'LDF_{label}'] = self.ldf(method).reshape(-1)
+            if n_years is not None:
+                table[f'LDF_{label}_{n_years}yr'] = self.ldf(method, n_years).reshape(-1)
+
+        table['CDF'] = self.cdf(selected, n_years, tail)[:, :-1].reshape(-1) if n_links else []
+        return table
+
+    def ultimates(self,
+                  method: str = 'volume',
+                  n_years: Optional[int] = None,
+                  tail: float = 1.0) -> pd.DataFrame:
+        """
+        Chain ladder ultimates and IBNR per segment and origin year.
+
+        Returns:
+        --------
+        pandas.DataFrame
+            Segment keys, origin, Latest_Development_Year, Latest_Value, CDF,
+            Ultimate and IBNR (Ultimate - Latest_Value) for every observed origin
+        """
+        n_seg, n_origin, _ = self.cube.shape
+        latest_index, latest_value = self.latest()
+        cdf = self.cdf(method, n_years, tail)
+
+        seg_idx, origin_idx = np.nonzero(latest_index >= 0)
+        dev_idx = latest_index[seg_idx, origin_idx]
+        latest_cdf = cdf[seg_idx, dev_idx]
+        value = latest_value[seg_idx, origin_idx]
+
+        table = self.segments.loc[seg_idx].reset_index(drop=True)
+        table[self.origin_col] = self.origins[origin_idx]
+        table['Latest_Development_Year'] = self.dev_years[dev_idx]
+        table['Latest_Value'] = value
+        table['CDF'] = latest_cdf
+        table['Ultimate'] = value * latest_cdf
+        table['IBNR'] = table['Ultimate'] - value
+        return table
+
+
+def run_chain_ladder(df: pd.DataFrame,
+                     value_col: str,
+                     segment_cols: Sequence[str] = (),
+                     origin_col: str = 'Year_of_Account',
+                     dev_col: str = 'Development_Year',
+                     method: str = 'volume',
+                     n_years: Optional[int] = None,
+                     tail: float = 1.0) -> Dict[str, pd.DataFrame]:
+    """
+    Run a batched chain ladder and return factors and ultimates.
+
+    Returns:
+    --------
+    dict
+        {'factors': development factor table, 'ultimates': ultimates table}
+    """
+    engine = ChainLadderEngine.from_frame(df, value_col, segment_cols, origin_col, dev_col)
+    return {
+        'factors': engine.development_factors(n_years=n_years, selected=method, tail=tail),
+        'ultimates': engine.ultimates(method, n_years, tail),
+    }
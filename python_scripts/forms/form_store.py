@@ -0,0 +1,235 @@
+"""
+Form Store - Shared Parsed Form Cache
+=====================================
+
+Process-wide cache of parsed RRA/RRQ form files.
+
+Every form processor used to call ``pd.read_csv(data_source)`` itself, and the
+summary helpers re-run the processors, so a single Power BI refresh could parse
+the same CSV many times. The store parses each file once and
+hands out copies, so callers remain free to add or overwrite columns.
+
+Files are loaded through the table storage layer when it is importable, so a
+converted Parquet copy (with its declared column types) is used in place of
+the CSV; plain CSVs keep pandas' parsed dtypes. Entries are keyed by the
+resolved path and the mtime and size of the file and of its Parquet sibling,
+so an edited file or a regenerated Parquet copy is re-read automatically.
+The least recently used entries are evicted once the total in-memory size of
+the cached frames exceeds the configured budget.
+
+Rows read are counted towards the enclosing instrumentation span
+(lloyds_reporting.instrumentation). Importing this module also makes the
+repository root importable, so form modules run as scripts can import
+lloyds_reporting after it.
+
+Usage:
+------
+    from python_scripts.forms.form_store import read_form
+    df = read_form('synthetic_data/rra_193_net_claims.csv')
+
+    # Inspect or reset the shared store
+    from python_scripts.forms.form_store import get_form_store
+    store = get_form_store()
+    print(store.stats())
+    store.clear()
+"""
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+
+try:
+    from lloyds_reporting.instrumentation import current_span
+except ImportError:
+    # Forms run as scripts from this directory: make the repository root importable
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from lloyds_reporting.instrumentation import current_span
+
+# Default memory budget for cached frames (bytes)
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Environment override for the default budget, in megabytes
+MAX_MB_ENV_VAR = 'LLOYDS_FORM_STORE_MAX_MB'
+
+CacheKey = Tuple[str, int, int, Optional[int], Optional[int]]
+
+
+class FormStore:
+    """
+    LRU cache of parsed form files bounded by memory budget.
+
+    Attributes:
+        max_bytes (int): Memory budget for all cached frames
+        hits (int): Number of reads served from the cache
+        misses (int): Number of reads that parsed the file
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize an empty store.
+
+        Args:
+            max_bytes: Memory budget for cached frames, in bytes
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[CacheKey, Tuple[pd.DataFrame, int]]' = OrderedDict()
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _make_key(path: Path) -> CacheKey:
+        """
+        Build the cache key for a file; raises FileNotFoundError if missing.
+
+        Includes the mtime and size of the ``.parquet`` sibling that
+        _load_table may read instead of the CSV (None when there is none).
+        """
+        resolved = path.resolve()
+        stat = os.stat(resolved)
+        try:
+            parquet = os.stat(resolved.with_suffix('.parquet'))
+        except (FileNotFoundError, ValueError):
+            return (str(resolved), stat.st_mtime_ns, stat.st_size, None, None)
+        return (str(resolved), stat.st_mtime_ns, stat.st_size, parquet.st_mtime_ns, parquet.st_size)
+
+    def read(self, data_source) -> pd.DataFrame:
+        """
+        Return the parsed contents of a form file.
+
+        Args:
+            data_source: Path to a CSV file. Non path-like sources (buffers,
+                URLs) are passed straight to ``pd.read_csv`` and not cached.
+
+        Returns:
+            A copy of the cached DataFrame, safe for the caller to modify
+        """
+        if not isinstance(data_source, (str, os.PathLike)) or str(data_source).startswith(
+            ('http://', 'https://')
+        ):
+            return pd.read_csv(data_source)
+
+        key = self._make_key(Path(data_source))
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0].copy()
+            self.misses += 1
+
+        df = _load_table(key[0])
+        self._insert(key, df)
+        return df.copy()
+
+    def _insert(self, key: CacheKey, df: pd.DataFrame) -> None:
+        """Add a parsed frame, dropping stale versions and evicting LRU entries."""
+        size = int(df.memory_usage(deep=True).sum())
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            # Drop any older version of the same file
+            for old_key in [k for k in self._entries if k[0] == key[0] and k != key]:
+                self._current_bytes -= self._entries.pop(old_key)[1]
+
+            if key in self._entries:
+                return
+
+            self._entries[key] = (df, size)
+            self._current_bytes += size
+
+            while self._current_bytes > self.max_bytes and self._entries:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._current_bytes -= evicted_size
+
+    def invalidate(self, data_source) -> None:
+        """Remove all cached versions of a file."""
+        resolved = str(Path(data_source).resolve())
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == resolved]:
+                self._current_bytes -= self._entries.pop(key)[1]
+
+    def clear(self) -> None:
+        """Remove every cached frame and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache statistics."""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+
+def _load_table(path: str) -> pd.DataFrame:
+    """Parse a form file via the table storage layer, or plain CSV standalone."""
+    try:
+        # Imported lazily: python_scripts.utils imports this module in turn
+        from ..utils.table_storage import read_table
+    except ImportError:
+        return pd.read_csv(path)
+    return read_table(path)
+
+
+def _default_max_bytes() -> int:
+    value = os.environ.get(MAX_MB_ENV_VAR)
+    if value:
+        try:
+            return int(float(value) * 1024 * 1024)
+        except ValueError:
+            pass
+    return DEFAULT_MAX_BYTES
+
+
+_STORE: Optional[FormStore] = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_form_store() -> FormStore:
+    """Return the process-wide form store, creating it on first use."""
+    global _STORE
+    if _STORE is None:
+        with _STORE_LOCK:
+            if _STORE is None:
+                _STORE = FormStore(_default_max_bytes())
+    return _STORE
+
+
+def read_form(data_source) -> pd.DataFrame:
+    """
+    Read a form file through the process-wide store.
+
+    Parameters:
+    -----------
+    data_source : str or Path
+        Path to the form CSV file
+
+    Returns:
+    --------
+    pandas.DataFrame
+        Parsed form data (a private copy for the caller)
+    """
+    df = get_form_store().read(data_source)
+    current_span().add_rows_in(len(df))
+    return df
+
+
+def clear_form_cache() -> None:
+    """Clear the process-wide form store."""
+    get_form_store().clear()
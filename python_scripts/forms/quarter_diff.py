@@ -0,0 +1,312 @@
+"""
+Quarter Diff - Keyed RRQ Quarter-over-Quarter Movements
+=======================================================
+
+Keyed diff engine for comparing consecutive RRQ submissions.
+
+Only the key columns and the measure columns of each form are carried through
+the comparison. Rows are hash-partitioned on the key so each partition is
+aligned independently, and only rows that are new, removed or changed are
+emitted together with their movement columns.
+
+A whole year can be chained in one pass: each quarter is read and partitioned
+once and reused as the prior side of the following comparison.
+
+Usage:
+------
+    from python_scripts.forms.quarter_diff import diff_quarters, chain_quarter_diffs
+
+    movements = diff_quarters(current_df, prior_df, form='193')
+
+    # Q1 -> Q2 -> Q3 -> Q4 across the synthetic_data_rrq_2024_q* directories
+    year_movements = chain_quarter_diffs(base_directory='../..', form='193')
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .form_store import read_form
+except ImportError:
+    from form_store import read_form
+
+# Key columns used to align rows between quarters
+DIFF_KEY_COLUMNS = ['Syndicate_Number', 'Year_of_Account', 'LOB_Code', 'Development_Year']
+
+# Measure columns per form and the name of their movement column
+FORM_DIFF_MEASURES: Dict[str, Dict[str, str]] = {
+    '193': {
+        'Cumulative_Paid_Claims': 'Paid_Movement',
+        'IBNR_Reserve': 'IBNR_Movement',
+        'Total_Incurred': 'Total_Incurred_Movement',
+    },
+    '291': {
+        'IBNR_Best_Estimate': 'IBNR_Movement',
+        'Gross_Written_Premium': 'Premium_Movement',
+    },
+}
+
+# Relative movement in Total_Incurred flagged as significant (Form 193)
+SIGNIFICANT_MOVEMENT_THRESHOLD = 0.10
+
+# Default number of hash partitions
+DEFAULT_PARTITIONS = 8
+
+# Directory pattern of the quarterly synthetic returns
+QUARTER_DIRECTORY_GLOB = 'synthetic_data_rrq_*_q*'
+
+CHANGE_NEW = 'New'
+CHANGE_REMOVED = 'Removed'
+CHANGE_CHANGED = 'Changed'
+
+
+def _period_label(df: pd.DataFrame) -> Optional[str]:
+    """Return the 'Qn YYYY' label of a quarterly return, if it can be determined."""
+    if 'Reporting_Quarter' not in df.columns or df.empty:
+        return None
+    quarter = df['Reporting_Quarter'].iloc[0]
+    if 'Reporting_Year' in df.columns:
+        year = df['Reporting_Year'].iloc[0]
+    elif 'As_At_Date' in df.columns:
+        year = pd.to_datetime(df['As_At_Date'].iloc[0]).year
+    else:
+        return str(quarter)
+    return f"{quarter} {int(year)}"
+
+
+class PartitionedQuarter:
+    """
+    Narrow, hash-partitioned view of one quarter of a form.
+
+    Attributes:
+        label (str): Reporting period label, e.g. 'Q2 2024'
+        keys (List[str]): Key columns present in the data
+        measures (List[str]): Measure columns present in the data
+        partitions (Dict[int, pd.DataFrame]): Key + measure rows by partition
+    """
+
+    def __init__(self, df: pd.DataFrame, keys: Sequence[str], measures: Sequence[str],
+                 n_partitions: int = DEFAULT_PARTITIONS, label: Optional[str] = None):
+        """
+        Partition a form DataFrame on its key columns.
+
+        Args:
+            df: Quarter data
+            keys: Candidate key columns (those missing from df are ignored)
+            measures: Candidate measure columns (those missing are ignored)
+            n_partitions: Number of hash partitions
+            label: Reporting period label; derived from the data if omitted
+        """
+        self.keys = [col for col in keys if col in df.columns]
+        self.measures = [col for col in measures if col in df.columns]
+        self.n_partitions = max(int(n_partitions), 1)
+        self.label = label if label is not None else _period_label(df)
+
+        narrow = df[self.keys + self.measures]
+        if self.n_partitions == 1 or narrow.empty:
+            self.partitions = {0: narrow}
+        else:
+            hashes = pd.util.hash_pandas_object(narrow[self.keys], index=False).to_numpy()
+            part_ids = hashes % np.uint64(self.n_partitions)
+            self.partitions = {
+                int(part): frame for part, frame in narrow.groupby(part_ids, sort=False)
+            }
+
+    def partition(self, part: int) -> pd.DataFrame:
+        """Return the rows of one partition (empty frame if none hashed there)."""
+        frame = self.partitions.get(part)
+        if frame is None:
+            return next(iter(self.partitions.values())).iloc[0:0]
+        return frame
+
+
+def _diff_partition(current: pd.DataFrame, prior: pd.DataFrame, keys: List[str],
+                    measures: Dict[str, str], tolerance: float) -> pd.DataFrame:
+    """Align one partition on the key and keep new, removed and changed rows."""
+    aligned = current.merge(prior, on=keys, how='outer',
+                            suffixes=('_Current', '_Prior'), indicator=True)
+    if aligned.empty:
+        return aligned.drop(columns='_merge')
+
+    side = aligned.pop('_merge').to_numpy()
+    is_new = side == 'left_only'
+    is_removed = side == 'right_only'
+
+    changed = np.zeros(len(aligned), dtype=bool)
+    for measure, movement in measures.items():
+        cur = aligned[f'{measure}_Current'].to_numpy(dtype=np.float64)
+        pri = aligned[f'{measure}_Prior'].to_numpy(dtype=np.float64)
+        delta = np.nan_to_num(cur) - np.nan_to_num(pri)
+        aligned[movement] = delta
+        changed |= np.abs(delta) > tolerance
+        changed |= np.isnan(cur) != np.isnan(pri)
+
+    keep = is_new | is_removed | changed
+    aligned['Change_Type'] = np.select([is_new, is_removed], [CHANGE_NEW, CHANGE_REMOVED],
+                                       default=CHANGE_CHANGED)
+    return aligned[keep]
+
+
+def diff_partitioned(current: PartitionedQuarter, prior: PartitionedQuarter,
+                     form: str = '193', tolerance: float = 0.0) -> pd.DataFrame:
+    """
+    Diff two partitioned quarters of the same form.
+
+    Args:
+        current: Current quarter
+        prior: Prior quarter
+        form: Form number selecting the measure/movement columns
+        tolerance: Absolute movement at or below which a measure is unchanged
+
+    Returns:
+        DataFrame of new, removed and changed rows with movement columns
+    """
+    if current.n_partitions != prior.n_partitions:
+        raise ValueError("Quarters must be partitioned with the same number of partitions")
+
+    keys = [col for col in current.keys if col in prior.keys]
+    measures = {m: mv for m, mv in FORM_DIFF_MEASURES.get(form, {}).items()
+                if m in current.measures and m in prior.measures}
+
+    parts = sorted(set(current.partitions) | set(prior.partitions))
+    pieces = [
+        _diff_partition(current.partition(p)[keys + list(measures)],
+                        prior.partition(p)[keys + list(measures)],
+                        keys, measures, tolerance)
+        for p in parts
+    ]
+    result = pd.concat(pieces, ignore_index=True) if pieces else pd.DataFrame()
+
+    if form == '193' and 'Total_Incurred_Movement' in result.columns:
+        prior_incurred = result['Total_Incurred_Prior'].to_numpy(dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.abs(result['Total_Incurred_Movement'].to_numpy() / prior_incurred)
+        # New rows (no prior) count as significant, matching a move from nothing
+        result['Significant_Movement'] = np.where(np.isnan(prior_incurred), True,
+                                                  ratio > SIGNIFICANT_MOVEMENT_THRESHOLD)
+
+    result['Current_Quarter'] = current.label
+    result['Prior_Quarter'] = prior.label
+
+    if keys and not result.empty:
+        result = result.sort_values(keys, ignore_index=True)
+    return result
+
+
+def diff_quarters(current: pd.DataFrame, prior: pd.DataFrame, form: str = '193',
+                  keys: Sequence[str] = DIFF_KEY_COLUMNS,
+                  n_partitions: int = DEFAULT_PARTITIONS,
+                  tolerance: float = 0.0) -> pd.DataFrame:
+    """
+    Keyed quarter-over-quarter diff of two form DataFrames
+
+    Parameters:
+    -----------
+    current : pandas.DataFrame
+        Current quarter data
+    prior : pandas.DataFrame
+        Prior quarter data
+    form : str
+        Form number ('193' or '291')
+    keys : sequence of str
+        Key columns (those not present in both frames are ignored)
+    n_partitions : int
+        Number of hash partitions
+    tolerance : float
+        Absolute movement at or below which a measure is treated as unchanged
+
+    Returns:
+    --------
+    pandas.DataFrame
+        Changed, new and removed rows with Change_Type, prior/current measure
+        values and movement columns
+    """
+    measures = list(FORM_DIFF_MEASURES.get(form, {}))
+    return diff_partitioned(
+        PartitionedQuarter(current, keys, measures, n_partitions),
+        PartitionedQuarter(prior, keys, measures, n_partitions),
+        form=form,
+        tolerance=tolerance
+    )
+
+
+def _quarter_sort_key(path: Path) -> Tuple[int, int]:
+    match = re.search(r'(\d{4})_q(\d)$', path.name, re.IGNORECASE)
+    return (int(match.group(1)), int(match.group(2))) if match else (0, 0)
+
+
+def find_quarter_directories(base_directory='../..', pattern: str = QUARTER_DIRECTORY_GLOB) -> List[Path]:
+    """
+    Find quarterly return directories in reporting order
+
+    Parameters:
+    -----------
+    base_directory : str
+        Directory containing the synthetic_data_rrq_<year>_q<n> folders
+    pattern : str
+        Glob pattern of the quarter directories
+
+    Returns:
+    --------
+    list of Path
+        Quarter directories ordered by (year, quarter)
+    """
+    dirs = [p for p in Path(base_directory).glob(pattern) if p.is_dir()]
+    return sorted(dirs, key=_quarter_sort_key)
+
+
+def chain_quarter_diffs(quarter_directories: Optional[Sequence] = None,
+                        form: str = '193',
+                        base_directory='../..',
+                        n_partitions: int = DEFAULT_PARTITIONS,
+                        tolerance: float = 0.0) -> pd.DataFrame:
+    """
+    Chain quarter-over-quarter diffs (Q1 -> Q2 -> Q3 -> Q4) in one pass
+
+    Each quarter file is read and partitioned once; the partitioned current
+    quarter becomes the prior side of the next comparison.
+
+    Parameters:
+    -----------
+    quarter_directories : sequence, optional
+        Quarter directories in reporting order. Defaults to the
+        synthetic_data_rrq_* directories found under base_directory.
+    form : str
+        Form number ('193' or '291')
+    base_directory : str
+        Where to look for quarter directories when none are given
+    n_partitions : int
+        Number of hash partitions
+    tolerance : float
+        Absolute movement at or below which a measure is treated as unchanged
+
+    Returns:
+    --------
+    pandas.DataFrame
+        Movements for every consecutive pair of quarters, labelled by
+        Prior_Quarter and Current_Quarter
+    """
+    if quarter_directories is None:
+        quarter_directories = find_quarter_directories(base_directory)
+
+    measures = list(FORM_DIFF_MEASURES.get(form, {}))
+    movements = []
+    prior = None
+
+    for directory in quarter_directories:
+        files = sorted(Path(directory).glob(f'rrq_{form}_*.csv'))
+        if not files:
+            raise FileNotFoundError(f"No RRQ Form {form} file in {directory}")
+
+        current = PartitionedQuarter(read_form(files[0]), DIFF_KEY_COLUMNS, measures, n_partitions)
+        if prior is not None:
+            movements.append(diff_partitioned(current, prior, form=form, tolerance=tolerance))
+        prior = current
+
+    if not movements:
+        return pd.DataFrame()
+    return pd.concat(movements, ignore_index=True)
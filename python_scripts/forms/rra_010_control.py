@@ -7,6 +7,17 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 
+try:
+    from .form_store import read_form
+    from .validation_rules import validate_form
+except ImportError:
+    from form_store import read_form
+    from validation_rules import validate_form
+
+from lloyds_reporting.instrumentation import traced
+
+
+@traced('form_processor')
 def process_rra_010(data_source='../../synthetic_data/rra_010_control.csv'):
     """
     Process RRA 010 Control data for Power BI
@@ -23,7 +34,7 @@ def process_rra_010(data_source='../../synthetic_data/rra_010_control.csv'):
     """
 
     # Load data
-    df = pd.read_csv(data_source)
+    df = read_form(data_source)
 
     # Add calculated fields
     df['Capacity_Millions'] = df['Capacity_GBP'] / 1000000
@@ -91,49 +102,7 @@ def validate_rra_010(data_source='../../synthetic_data/rra_010_control.csv'):
         Validation results
     """
 
-    df = pd.read_csv(data_source)
-
-    validations = []
-
-    # Check for missing syndicate numbers
-    if df['Syndicate_Number'].isnull().any():
-        validations.append({
-            'Rule': 'Syndicate Number Required',
-            'Status': 'FAIL',
-            'Records_Affected': df['Syndicate_Number'].isnull().sum()
-        })
-    else:
-        validations.append({
-            'Rule': 'Syndicate Number Required',
-            'Status': 'PASS',
-            'Records_Affected': 0
-        })
-
-    # Check for valid email addresses
-    invalid_emails = ~df['Contact_Email'].str.contains('@', na=False)
-    validations.append({
-        'Rule': 'Valid Email Address',
-        'Status': 'FAIL' if invalid_emails.any() else 'PASS',
-        'Records_Affected': invalid_emails.sum()
-    })
-
-    # Check that First YoA <= Final YoA
-    invalid_yoa = df['First_Pure_YoA'] > df['Final_Pure_YoA']
-    validations.append({
-        'Rule': 'First YoA <= Final YoA',
-        'Status': 'FAIL' if invalid_yoa.any() else 'PASS',
-        'Records_Affected': invalid_yoa.sum()
-    })
-
-    # Check capacity is positive
-    invalid_capacity = df['Capacity_GBP'] <= 0
-    validations.append({
-        'Rule': 'Capacity > 0',
-        'Status': 'FAIL' if invalid_capacity.any() else 'PASS',
-        'Records_Affected': invalid_capacity.sum()
-    })
-
-    return pd.DataFrame(validations)
+    return validate_form('010', data_source)
 
 
 # For use in Power BI - the 'dataset' variable will be provided by Power BI
@@ -13,12 +13,22 @@ import numpy as np
 from datetime import datetime
 from typing import Dict, List, Optional
 
+try:
+    from .form_store import read_form
+    from .validation_rules import validate_form
+except ImportError:
+    from form_store import read_form
+    from validation_rules import validate_form
+
+from lloyds_reporting.instrumentation import traced
+
 # Form metadata
 FORM_CODE = '020'
 FORM_NAME = 'Exchange Rates'
 FORM_VERSION = '2.0'
 
 
+@traced('form_processor')
 def process_rra_020(data_source: str = '../../synthetic_data/rra_020_exchange_rates.csv') -> pd.DataFrame:
     """
     Process RRA 020 Exchange Rates data for Power BI
@@ -43,7 +53,7 @@ def process_rra_020(data_source: str = '../../synthetic_data/rra_020_exchange_ra
     - Source: Rate source (Lloyd's, BoE, etc.)
     """
 
-    df = pd.read_csv(data_source)
+    df = read_form(data_source)
 
     # Add calculated fields
     df['Inverse_Rate'] = 1 / df['Exchange_Rate']
@@ -57,7 +67,7 @@ def get_exchange_rate_summary(data_source: str = '../../synthetic_data/rra_020_e
     """Generate summary of exchange rates by currency"""
     df = process_rra_020(data_source)
 
-    summary = df.groupby('Currency_Code').agg({
+    summary = df.groupby('Currency_Code', observed=True).agg({
         'Exchange_Rate': ['mean', 'min', 'max', 'std'],
         'Effective_Date': ['min', 'max']
     }).reset_index()
@@ -68,29 +78,7 @@ def get_exchange_rate_summary(data_source: str = '../../synthetic_data/rra_020_e
 
 def validate_rra_020(data_source: str = '../../synthetic_data/rra_020_exchange_rates.csv') -> pd.DataFrame:
     """Validate RRA 020 Exchange Rates data"""
-    df = pd.read_csv(data_source)
-
-    validations = []
-
-    # Check for missing currency codes
-    validations.append({
-        'Rule': 'Currency Code Required',
-        'Status': 'FAIL' if df['Currency_Code'].isnull().any() else 'PASS',
-        'Records_Affected': int(df['Currency_Code'].isnull().sum()),
-        'Severity': 'Critical'
-    })
-
-    # Check rates are positive
-    if 'Exchange_Rate' in df.columns:
-        invalid_rates = df['Exchange_Rate'] <= 0
-        validations.append({
-            'Rule': 'Exchange Rate > 0',
-            'Status': 'FAIL' if invalid_rates.any() else 'PASS',
-            'Records_Affected': int(invalid_rates.sum()),
-            'Severity': 'Critical'
-        })
-
-    return pd.DataFrame(validations)
+    return validate_form(FORM_CODE, data_source)
 
 
 if __name__ == "__main__":
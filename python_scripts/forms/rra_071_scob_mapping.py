@@ -13,12 +13,22 @@ import numpy as np
 from datetime import datetime
 from typing import Dict, List, Optional
 
+try:
+    from .form_store import read_form
+    from .validation_rules import validate_form
+except ImportError:
+    from form_store import read_form
+    from validation_rules import validate_form
+
+from lloyds_reporting.instrumentation import traced
+
 # Form metadata
 FORM_CODE = '071'
 FORM_NAME = 'SCOB Mapping'
 FORM_VERSION = '2.0'
 
 
+@traced('form_processor')
 def process_rra_071(data_source: str = '../../synthetic_data/rra_071_scob_mapping.csv') -> pd.DataFrame:
     """
     Process RRA 071 SCOB Mapping data for Power BI
@@ -34,7 +44,7 @@ def process_rra_071(data_source: str = '../../synthetic_data/rra_071_scob_mappin
     - Year_of_Account: Applicable YoA
     """
 
-    df = pd.read_csv(data_source)
+    df = read_form(data_source)
 
     # Add calculated fields
     df['Is_Full_Allocation'] = df['Allocation_Percentage'] == 100
@@ -59,21 +69,7 @@ def get_scob_summary(data_source: str = '../../synthetic_data/rra_071_scob_mappi
 
 def validate_rra_071(data_source: str = '../../synthetic_data/rra_071_scob_mapping.csv') -> pd.DataFrame:
     """Validate RRA 071 SCOB Mapping data"""
-    df = pd.read_csv(data_source)
-
-    validations = []
-
-    # Check allocation percentages sum to 100 per SCOB/Syndicate
-    grouped = df.groupby(['Syndicate_Number', 'SCOB_Code'])['Allocation_Percentage'].sum()
-    invalid_allocations = abs(grouped - 100) > 0.01
-    validations.append({
-        'Rule': 'Allocations Sum to 100%',
-        'Status': 'FAIL' if invalid_allocations.any() else 'PASS',
-        'Records_Affected': int(invalid_allocations.sum()),
-        'Severity': 'Critical'
-    })
-
-    return pd.DataFrame(validations)
+    return validate_form(FORM_CODE, data_source)
 
 
 if __name__ == "__main__":
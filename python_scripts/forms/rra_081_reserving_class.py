@@ -13,12 +13,22 @@ import numpy as np
 from datetime import datetime
 from typing import Dict, List, Optional
 
+try:
+    from .form_store import read_form
+    from .validation_rules import validate_form
+except ImportError:
+    from form_store import read_form
+    from validation_rules import validate_form
+
+from lloyds_reporting.instrumentation import traced
+
 # Form metadata
 FORM_CODE = '081'
 FORM_NAME = 'Reserving Class Information'
 FORM_VERSION = '2.0'
 
 
+@traced('form_processor')
 def process_rra_081(data_source: str = '../../synthetic_data/rra_081_reserving_class.csv') -> pd.DataFrame:
     """
     Process RRA 081 Reserving Class Information data for Power BI
@@ -34,7 +44,7 @@ def process_rra_081(data_source: str = '../../synthetic_data/rra_081_reserving_c
     - Year_of_Account: Applicable YoA
     """
 
-    df = pd.read_csv(data_source)
+    df = read_form(data_source)
 
     # Add calculated fields
     df['SCOB_Count'] = df['SCOB_Codes'].str.split(',').str.len()
@@ -58,22 +68,7 @@ def get_reserving_class_summary(data_source: str = '../../synthetic_data/rra_081
 
 def validate_rra_081(data_source: str = '../../synthetic_data/rra_081_reserving_class.csv') -> pd.DataFrame:
     """Validate RRA 081 Reserving Class Information data"""
-    df = pd.read_csv(data_source)
-
-    validations = []
-
-    # Check for valid development patterns
-    valid_patterns = ['Short Tail', 'Medium Tail', 'Long Tail']
-    if 'Development_Pattern' in df.columns:
-        invalid_patterns = ~df['Development_Pattern'].isin(valid_patterns)
-        validations.append({
-            'Rule': 'Valid Development Pattern',
-            'Status': 'FAIL' if invalid_patterns.any() else 'PASS',
-            'Records_Affected': int(invalid_patterns.sum()),
-            'Severity': 'Warning'
-        })
-
-    return pd.DataFrame(validations)
+    return validate_form(FORM_CODE, data_source)
 
 
 if __name__ == "__main__":
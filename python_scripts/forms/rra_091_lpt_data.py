@@ -13,12 +13,22 @@ import numpy as np
 from datetime import datetime
 from typing import Dict, List, Optional
 
+try:
+    from .form_store import read_form
+    from .validation_rules import validate_form
+except ImportError:
+    from form_store import read_form
+    from validation_rules import validate_form
+
+from lloyds_reporting.instrumentation import traced
+
 # Form metadata
 FORM_CODE = '091'
 FORM_NAME = 'LPT Data'
 FORM_VERSION = '2.0'
 
 
+@traced('form_processor')
 def process_rra_091(data_source: str = '../../synthetic_data/rra_091_lpt_data.csv') -> pd.DataFrame:
     """
     Process RRA 091 LPT Data for Power BI
@@ -36,7 +46,7 @@ def process_rra_091(data_source: str = '../../synthetic_data/rra_091_lpt_data.cs
     - Retention_GBP: Retention amount
     """
 
-    df = pd.read_csv(data_source)
+    df = read_form(data_source)
 
     # Add calculated fields
     df['Reserves_Millions'] = df['Gross_Reserves_Transferred_GBP'] / 1_000_000
@@ -57,7 +67,7 @@ def get_lpt_summary(data_source: str = '../../synthetic_data/rra_091_lpt_data.cs
     """Generate LPT summary by transaction type"""
     df = process_rra_091(data_source)
 
-    summary = df.groupby('Transaction_Type').agg({
+    summary = df.groupby('Transaction_Type', observed=True).agg({
         'Gross_Reserves_Transferred_GBP': 'sum',
         'Net_Premium_GBP': 'sum',
         'Syndicate_Number': 'nunique'
@@ -70,22 +80,7 @@ def get_lpt_summary(data_source: str = '../../synthetic_data/rra_091_lpt_data.cs
 
 def validate_rra_091(data_source: str = '../../synthetic_data/rra_091_lpt_data.csv') -> pd.DataFrame:
     """Validate RRA 091 LPT Data"""
-    df = pd.read_csv(data_source)
-
-    validations = []
-
-    # Check transaction types
-    valid_types = ['LPT', 'ADC', 'RITC', 'Other']
-    if 'Transaction_Type' in df.columns:
-        invalid = ~df['Transaction_Type'].isin(valid_types)
-        validations.append({
-            'Rule': 'Valid Transaction Type',
-            'Status': 'FAIL' if invalid.any() else 'PASS',
-            'Records_Affected': int(invalid.sum()),
-            'Severity': 'Warning'
-        })
-
-    return pd.DataFrame(validations)
+    return validate_form(FORM_CODE, data_source)
 
 
 if __name__ == "__main__":
@@ -6,7 +6,17 @@ This script processes and analyzes RRA 193 Net Claims development triangles
 import pandas as pd
 import numpy as np
 
+try:
+    from .form_store import read_form
+    from .chain_ladder import ChainLadderEngine
+except ImportError:
+    from form_store import read_form
+    from chain_ladder import ChainLadderEngine
 
+from lloyds_reporting.instrumentation import traced
+
+
+@traced('form_processor')
 def process_rra_193(data_source='../../synthetic_data/rra_193_net_claims.csv'):
     """
     Process RRA 193 Net Claims data for Power BI
@@ -23,7 +33,7 @@ def process_rra_193(data_source='../../synthetic_data/rra_193_net_claims.csv'):
     """
 
     # Load data
-    df = pd.read_csv(data_source)
+    df = read_form(data_source)
 
     # Calculate key metrics
     df['Incurred_Claims'] = df['Cumulative_Paid_Claims'] + df['Case_Reserves'] + df['IBNR_Reserve']
@@ -43,7 +53,7 @@ def process_rra_193(data_source='../../synthetic_data/rra_193_net_claims.csv'):
 
     # Calculate paid development
     df['Prior_Cumulative_Paid'] = df.groupby(
-        ['Syndicate_Number', 'Year_of_Account', 'LOB_Code']
+        ['Syndicate_Number', 'Year_of_Account', 'LOB_Code'], observed=True
     )['Cumulative_Paid_Claims'].shift(1)
 
     df['Paid_Development_Factor'] = np.where(
@@ -54,7 +64,7 @@ def process_rra_193(data_source='../../synthetic_data/rra_193_net_claims.csv'):
 
     # Calculate incurred development
     df['Prior_Total_Incurred'] = df.groupby(
-        ['Syndicate_Number', 'Year_of_Account', 'LOB_Code']
+        ['Syndicate_Number', 'Year_of_Account', 'LOB_Code'], observed=True
     )['Total_Incurred'].shift(1)
 
     df['Incurred_Development_Factor'] = np.where(
@@ -133,7 +143,7 @@ def create_development_triangle(data_source='../../synthetic_data/rra_193_net_cl
         Development triangle
     """
 
-    df = pd.read_csv(data_source)
+    df = read_form(data_source)
 
     # Apply filters
     if syndicate:
@@ -190,6 +200,16 @@ def calculate_chain_ladder(data_source='../../synthetic_data/rra_193_net_claims.
 
     dev_factors.columns = ['_'.join(col).strip('_') for col in dev_factors.columns.values]
 
+    # Volume-weighted factors on the aggregated triangle, keyed by the
+    # development year they develop to (same convention as the row factors)
+    for metric, prefix in [('Cumulative_Paid_Claims', 'Paid'), ('Total_Incurred', 'Incurred')]:
+        engine = ChainLadderEngine.from_frame(df, metric)
+        volume = pd.DataFrame({
+            'Development_Year': engine.dev_years[1:],
+            f'{prefix}_LDF_Volume_Weighted': engine.ldf('volume')[0] if engine.n_segments else [],
+        })
+        dev_factors = dev_factors.merge(volume, on='Development_Year', how='left')
+
     # Rename for clarity
     dev_factors = dev_factors.rename(columns={
         'Development_Year': 'Development_Year',
@@ -206,6 +226,47 @@ def calculate_chain_ladder(data_source='../../synthetic_data/rra_193_net_claims.
     return dev_factors
 
 
+def calculate_chain_ladder_by_segment(data_source='../../synthetic_data/rra_193_net_claims.csv',
+                                      metric='Cumulative_Paid_Claims',
+                                      segment_cols=('Syndicate_Number', 'LOB_Code'),
+                                      method='volume',
+                                      n_years=None,
+                                      tail=1.0):
+    """
+    Run the chain ladder for every syndicate / LOB triangle in one batched pass
+
+    Parameters:
+    -----------
+    data_source : str
+        Path to the data file
+    metric : str
+        Cumulative metric to project ('Cumulative_Paid_Claims', 'Total_Incurred')
+    segment_cols : sequence of str
+        Columns identifying each triangle
+    method : str
+        LDF averaging method used for CDFs and ultimates ('volume' or 'simple')
+    n_years : int, optional
+        Restrict LDFs to the latest n years of account
+    tail : float
+        Tail factor beyond the last development year
+
+    Returns:
+    --------
+    dict
+        'factors': LDFs (volume-weighted, simple and windowed) and CDFs per segment
+        'ultimates': Latest diagonal, CDF, ultimate and IBNR per segment and YoA
+    """
+
+    df = read_form(data_source)
+
+    engine = ChainLadderEngine.from_frame(df, metric, segment_cols)
+
+    return {
+        'factors': engine.development_factors(n_years=n_years, selected=method, tail=tail),
+        'ultimates': engine.ultimates(method, n_years, tail),
+    }
+
+
 def get_claims_summary_by_yoa(data_source='../../synthetic_data/rra_193_net_claims.csv'):
     """
     Generate claims summary by Year of Account
@@ -220,7 +281,7 @@ def get_claims_summary_by_yoa(data_source='../../synthetic_data/rra_193_net_clai
 
     # Get latest development year for each YoA
     latest = df.sort_values('Development_Year').groupby(
-        ['Syndicate_Number', 'Year_of_Account', 'LOB_Code']
+        ['Syndicate_Number', 'Year_of_Account', 'LOB_Code'], observed=True
     ).tail(1)
 
     summary = latest.groupby('Year_of_Account').agg({
@@ -269,10 +330,10 @@ def get_claims_summary_by_lob(data_source='../../synthetic_data/rra_193_net_clai
 
     # Get latest development year for each combination
     latest = df.sort_values('Development_Year').groupby(
-        ['Syndicate_Number', 'Year_of_Account', 'LOB_Code']
+        ['Syndicate_Number', 'Year_of_Account', 'LOB_Code'], observed=True
     ).tail(1)
 
-    summary = latest.groupby('LOB_Code').agg({
+    summary = latest.groupby('LOB_Code', observed=True).agg({
         'Gross_Premium_Written': 'sum',
         'Net_Premium_Written': 'sum',
         'Cumulative_Paid_Claims': 'sum',
@@ -6,7 +6,19 @@ This script processes RRA 291 Gross Premium and IBNR estimates
 import pandas as pd
 import numpy as np
 
+try:
+    from .form_store import read_form
+    from .stochastic_reserving import (DEFAULT_PERCENTILES, calculate_reserve_variability,
+                                       percentile_label)
+except ImportError:
+    from form_store import read_form
+    from stochastic_reserving import (DEFAULT_PERCENTILES, calculate_reserve_variability,
+                                      percentile_label)
 
+from lloyds_reporting.instrumentation import traced
+
+
+@traced('form_processor')
 def process_rra_291(data_source='../../synthetic_data/rra_291_gross_premium_ibnr.csv'):
     """
     Process RRA 291 Gross Premium and IBNR data for Power BI
@@ -23,7 +35,7 @@ def process_rra_291(data_source='../../synthetic_data/rra_291_gross_premium_ibnr
     """
 
     # Load data
-    df = pd.read_csv(data_source)
+    df = read_form(data_source)
 
     # Calculate total incurred
     df['Total_Incurred_Gross'] = (
@@ -162,7 +174,7 @@ def get_ibnr_summary_by_lob(data_source='../../synthetic_data/rra_291_gross_prem
 
     df = process_rra_291(data_source)
 
-    summary = df.groupby('LOB_Code').agg({
+    summary = df.groupby('LOB_Code', observed=True).agg({
         'Gross_Written_Premium': 'sum',
         'Gross_Earned_Premium': 'sum',
         'Paid_Claims_Gross': 'sum',
@@ -206,7 +218,7 @@ def get_ibnr_range_analysis(data_source='../../synthetic_data/rra_291_gross_prem
 
     df = process_rra_291(data_source)
 
-    analysis = df.groupby(['Year_of_Account', 'LOB_Code']).agg({
+    analysis = df.groupby(['Year_of_Account', 'LOB_Code'], observed=True).agg({
         'IBNR_Best_Estimate': 'sum',
         'IBNR_High': 'sum',
         'IBNR_Low': 'sum',
@@ -238,6 +250,84 @@ def get_ibnr_range_analysis(data_source='../../synthetic_data/rra_291_gross_prem
     return analysis
 
 
+def compare_ibnr_range_to_stochastic(data_source='../../synthetic_data/rra_291_gross_premium_ibnr.csv',
+                                     claims_source='../../synthetic_data/rra_193_net_claims.csv',
+                                     n_simulations=10000,
+                                     seed=42,
+                                     max_workers=None,
+                                     percentiles=DEFAULT_PERCENTILES,
+                                     flag_percentile=75.0):
+    """
+    Compare stated IBNR ranges with Mack and bootstrap reserve percentiles
+
+    Form 291 ranges are gross of reinsurance, while the only claims triangles
+    (Form 193) are net, so the two are on different bases. The stochastic
+    reserves are projected on Total_Incurred, so they are IBNR like the stated
+    ranges (a paid projection would add case reserves). The stochastic
+    columns carry a Net_ prefix and the flag compares the gross high estimate
+    with the net bootstrap flag_percentile. Gross reserves are at least the
+    net ones, so a flagged row is understated on either basis; an unflagged
+    row is not a like-for-like pass.
+
+    Parameters:
+    -----------
+    data_source : str
+        Path to the Form 291 data file
+    claims_source : str
+        Path to the Form 193 claims development data
+    n_simulations : int
+        Bootstrap simulations per syndicate / LOB
+    seed : int
+        Root seed for reproducible bootstrap streams
+    max_workers : int, optional
+        Process pool size for the bootstrap
+    percentiles : sequence of float
+        Reserve percentiles to report
+    flag_percentile : float
+        Bootstrap percentile the stated high estimate is checked against
+        (must be one of percentiles)
+
+    Returns:
+    --------
+    pandas.DataFrame
+        Stated gross IBNR Low / Best / High alongside net stochastic IBNR
+        percentiles (Net_ columns) by syndicate, year of account and LOB,
+        and a Gross_High_Below_Net_P<flag_percentile> flag
+    """
+
+    if flag_percentile not in percentiles:
+        raise ValueError(f"flag_percentile {flag_percentile} is not one of "
+                         f"percentiles {list(percentiles)}")
+
+    df = read_form(data_source)
+    ranges = calculate_reserve_variability(
+        claims_source,
+        metric='Total_Incurred',
+        n_simulations=n_simulations,
+        percentiles=percentiles,
+        seed=seed,
+        max_workers=max_workers,
+        by_origin=True
+    )
+
+    keys = ['Syndicate_Number', 'Year_of_Account', 'LOB_Code']
+    ranges = ranges.rename(columns={col: f'Net_{col}' for col in ranges.columns if col not in keys})
+
+    comparison = df[keys + ['IBNR_Low', 'IBNR_Best_Estimate', 'IBNR_High']].merge(
+        ranges,
+        on=keys,
+        how='left'
+    )
+
+    # Flag stated gross high estimates below the net stochastic flag percentile
+    label = percentile_label(flag_percentile)
+    comparison[f'Gross_High_Below_Net_{label}'] = (
+        comparison['IBNR_High'] < comparison[f'Net_Bootstrap_{label}']
+    )
+
+    return comparison
+
+
 def get_ultimate_loss_ratio_trend(data_source='../../synthetic_data/rra_291_gross_premium_ibnr.csv'):
     """
     Analyze ultimate loss ratio trends
@@ -250,7 +340,7 @@ def get_ultimate_loss_ratio_trend(data_source='../../synthetic_data/rra_291_gros
 
     df = process_rra_291(data_source)
 
-    trend = df.groupby(['Year_of_Account', 'LOB_Code']).agg({
+    trend = df.groupby(['Year_of_Account', 'LOB_Code'], observed=True).agg({
         'Gross_Earned_Premium': 'sum',
         'Total_Incurred_Gross': 'sum',
         'Ultimate_Loss_Ratio': 'mean',
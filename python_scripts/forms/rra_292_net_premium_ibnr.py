@@ -6,7 +6,15 @@ This script processes RRA 292 Net Premium and IBNR estimates (after reinsurance)
 import pandas as pd
 import numpy as np
 
+try:
+    from .form_store import read_form
+except ImportError:
+    from form_store import read_form
 
+from lloyds_reporting.instrumentation import traced
+
+
+@traced('form_processor')
 def process_rra_292(data_source='../../synthetic_data/rra_292_net_premium_ibnr.csv'):
     """
     Process RRA 292 Net Premium and IBNR data for Power BI
@@ -23,7 +31,7 @@ def process_rra_292(data_source='../../synthetic_data/rra_292_net_premium_ibnr.c
     """
 
     # Load data
-    df = pd.read_csv(data_source)
+    df = read_form(data_source)
 
     # Calculate total incurred (net)
     df['Total_Incurred_Net'] = (
@@ -110,7 +118,7 @@ def get_ri_recovery_analysis(data_source='../../synthetic_data/rra_292_net_premi
     """
 
     df_net = process_rra_292(data_source)
-    df_gross = pd.read_csv(gross_data_source)
+    df_gross = read_form(gross_data_source)
 
     # Merge on key dimensions
     df_merged = df_net.merge(
@@ -209,7 +217,7 @@ def get_net_summary_by_lob(data_source='../../synthetic_data/rra_292_net_premium
 
     df = process_rra_292(data_source)
 
-    summary = df.groupby('LOB_Code').agg({
+    summary = df.groupby('LOB_Code', observed=True).agg({
         'Net_Written_Premium': 'sum',
         'Net_Earned_Premium': 'sum',
         'Paid_Claims_Net': 'sum',
@@ -253,15 +261,15 @@ def compare_net_vs_gross(net_data_source='../../synthetic_data/rra_292_net_premi
     """
 
     df_net = process_rra_292(net_data_source)
-    df_gross = pd.read_csv(gross_data_source)
+    df_gross = read_form(gross_data_source)
 
     # Aggregate both
-    net_agg = df_net.groupby(['Year_of_Account', 'LOB_Code']).agg({
+    net_agg = df_net.groupby(['Year_of_Account', 'LOB_Code'], observed=True).agg({
         'Net_Earned_Premium': 'sum',
         'Total_Incurred_Net': 'sum'
     }).reset_index()
 
-    gross_agg = df_gross.groupby(['Year_of_Account', 'LOB_Code']).agg({
+    gross_agg = df_gross.groupby(['Year_of_Account', 'LOB_Code'], observed=True).agg({
         'Gross_Earned_Premium': 'sum',
         'Paid_Claims_Gross': 'sum',
         'Case_Reserves_Gross': 'sum',
@@ -13,12 +13,22 @@ import numpy as np
 from datetime import datetime
 from typing import Dict, List, Optional
 
+try:
+    from .form_store import read_form
+    from .validation_rules import validate_form
+except ImportError:
+    from form_store import read_form
+    from validation_rules import validate_form
+
+from lloyds_reporting.instrumentation import traced
+
 # Form metadata
 FORM_CODE = '293'
 FORM_NAME = 'Outstanding & IBNR by PYoA'
 FORM_VERSION = '2.0'
 
 
+@traced('form_processor')
 def process_rra_293(data_source: str = '../../synthetic_data/rra_293_outstanding_ibnr_pyoa.csv') -> pd.DataFrame:
     """
     Process RRA 293 Outstanding & IBNR by PYoA data for Power BI
@@ -36,7 +46,7 @@ def process_rra_293(data_source: str = '../../synthetic_data/rra_293_outstanding
     - Currency: Original currency
     """
 
-    df = pd.read_csv(data_source)
+    df = read_form(data_source)
 
     # Add calculated fields
     df['Gross_Total_GBP'] = df['Gross_Outstanding_GBP'] + df['Gross_IBNR_GBP']
@@ -71,30 +81,7 @@ def get_pyoa_summary(data_source: str = '../../synthetic_data/rra_293_outstandin
 
 def validate_rra_293(data_source: str = '../../synthetic_data/rra_293_outstanding_ibnr_pyoa.csv') -> pd.DataFrame:
     """Validate RRA 293 data"""
-    df = pd.read_csv(data_source)
-
-    validations = []
-
-    # Check Prior YoA <= Current YoA
-    if 'Prior_YoA' in df.columns and 'Year_of_Account' in df.columns:
-        invalid = df['Prior_YoA'] > df['Year_of_Account']
-        validations.append({
-            'Rule': 'Prior YoA <= Current YoA',
-            'Status': 'FAIL' if invalid.any() else 'PASS',
-            'Records_Affected': int(invalid.sum()),
-            'Severity': 'Critical'
-        })
-
-    # Check Net <= Gross
-    invalid_os = df['Net_Outstanding_GBP'] > df['Gross_Outstanding_GBP']
-    validations.append({
-        'Rule': 'Net Outstanding <= Gross',
-        'Status': 'FAIL' if invalid_os.any() else 'PASS',
-        'Records_Affected': int(invalid_os.sum()),
-        'Severity': 'Warning'
-    })
-
-    return pd.DataFrame(validations)
+    return validate_form(FORM_CODE, data_source)
 
 
 if __name__ == "__main__":
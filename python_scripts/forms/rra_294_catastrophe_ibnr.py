@@ -13,12 +13,22 @@ import numpy as np
 from datetime import datetime
 from typing import Dict, List, Optional
 
+try:
+    from .form_store import read_form
+    from .validation_rules import validate_form
+except ImportError:
+    from form_store import read_form
+    from validation_rules import validate_form
+
+from lloyds_reporting.instrumentation import traced
+
 # Form metadata
 FORM_CODE = '294'
 FORM_NAME = 'Catastrophe IBNR'
 FORM_VERSION = '2.0'
 
 
+@traced('form_processor')
 def process_rra_294(data_source: str = '../../synthetic_data/rra_294_catastrophe_ibnr.csv') -> pd.DataFrame:
     """
     Process RRA 294 Catastrophe IBNR data for Power BI
@@ -36,7 +46,7 @@ def process_rra_294(data_source: str = '../../synthetic_data/rra_294_catastrophe
     - Confidence_Level: Confidence in estimate (High/Medium/Low)
     """
 
-    df = pd.read_csv(data_source)
+    df = read_form(data_source)
 
     # Add calculated fields
     df['Gross_IBNR_Millions'] = df['Gross_IBNR_GBP'] / 1_000_000
@@ -71,31 +81,7 @@ def get_catastrophe_summary(data_source: str = '../../synthetic_data/rra_294_cat
 
 def validate_rra_294(data_source: str = '../../synthetic_data/rra_294_catastrophe_ibnr.csv') -> pd.DataFrame:
     """Validate RRA 294 Catastrophe IBNR data"""
-    df = pd.read_csv(data_source)
-
-    validations = []
-
-    # Check Net <= Gross
-    invalid = df['Net_IBNR_GBP'] > df['Gross_IBNR_GBP']
-    validations.append({
-        'Rule': 'Net IBNR <= Gross IBNR',
-        'Status': 'FAIL' if invalid.any() else 'PASS',
-        'Records_Affected': int(invalid.sum()),
-        'Severity': 'Warning'
-    })
-
-    # Check confidence levels
-    valid_levels = ['High', 'Medium', 'Low']
-    if 'Confidence_Level' in df.columns:
-        invalid_conf = ~df['Confidence_Level'].isin(valid_levels)
-        validations.append({
-            'Rule': 'Valid Confidence Level',
-            'Status': 'FAIL' if invalid_conf.any() else 'PASS',
-            'Records_Affected': int(invalid_conf.sum()),
-            'Severity': 'Warning'
-        })
-
-    return pd.DataFrame(validations)
+    return validate_form(FORM_CODE, data_source)
 
 
 if __name__ == "__main__":
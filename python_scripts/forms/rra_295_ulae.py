@@ -13,12 +13,22 @@ import numpy as np
 from datetime import datetime
 from typing import Dict, List, Optional
 
+try:
+    from .form_store import read_form
+    from .validation_rules import validate_form
+except ImportError:
+    from form_store import read_form
+    from validation_rules import validate_form
+
+from lloyds_reporting.instrumentation import traced
+
 # Form metadata
 FORM_CODE = '295'
 FORM_NAME = 'ULAE'
 FORM_VERSION = '2.0'
 
 
+@traced('form_processor')
 def process_rra_295(data_source: str = '../../synthetic_data/rra_295_ulae.csv') -> pd.DataFrame:
     """
     Process RRA 295 ULAE data for Power BI
@@ -35,7 +45,7 @@ def process_rra_295(data_source: str = '../../synthetic_data/rra_295_ulae.csv')
     - Basis_Premium_GBP: Premium base for ratio calculation
     """
 
-    df = pd.read_csv(data_source)
+    df = read_form(data_source)
 
     # Add calculated fields
     df['Gross_ULAE_Millions'] = df['Gross_ULAE_GBP'] / 1_000_000
@@ -70,31 +80,7 @@ def get_ulae_summary(data_source: str = '../../synthetic_data/rra_295_ulae.csv')
 
 def validate_rra_295(data_source: str = '../../synthetic_data/rra_295_ulae.csv') -> pd.DataFrame:
     """Validate RRA 295 ULAE data"""
-    df = pd.read_csv(data_source)
-
-    validations = []
-
-    # Check ULAE is non-negative
-    invalid = df['Gross_ULAE_GBP'] < 0
-    validations.append({
-        'Rule': 'Gross ULAE Non-Negative',
-        'Status': 'FAIL' if invalid.any() else 'PASS',
-        'Records_Affected': int(invalid.sum()),
-        'Severity': 'Warning'
-    })
-
-    # Check valid categories
-    valid_cats = ['Internal', 'External']
-    if 'ULAE_Category' in df.columns:
-        invalid_cat = ~df['ULAE_Category'].isin(valid_cats)
-        validations.append({
-            'Rule': 'Valid ULAE Category',
-            'Status': 'FAIL' if invalid_cat.any() else 'PASS',
-            'Records_Affected': int(invalid_cat.sum()),
-            'Severity': 'Warning'
-        })
-
-    return pd.DataFrame(validations)
+    return validate_form(FORM_CODE, data_source)
 
 
 if __name__ == "__main__":
@@ -13,12 +13,22 @@ import numpy as np
 from datetime import datetime
 from typing import Dict, List, Optional
 
+try:
+    from .form_store import read_form
+    from .validation_rules import validate_form
+except ImportError:
+    from form_store import read_form
+    from validation_rules import validate_form
+
+from lloyds_reporting.instrumentation import traced
+
 # Form metadata
 FORM_CODE = '391'
 FORM_NAME = 'IELR'
 FORM_VERSION = '2.0'
 
 
+@traced('form_processor')
 def process_rra_391(data_source: str = '../../synthetic_data/rra_391_ielr.csv') -> pd.DataFrame:
     """
     Process RRA 391 IELR data for Power BI
@@ -36,7 +46,7 @@ def process_rra_391(data_source: str = '../../synthetic_data/rra_391_ielr.csv')
     - Method: Selection method
     """
 
-    df = pd.read_csv(data_source)
+    df = read_form(data_source)
 
     # Add calculated fields
     df['Premium_Millions'] = df['Gross_Premium_GBP'] / 1_000_000
@@ -80,30 +90,7 @@ def get_ielr_summary(data_source: str = '../../synthetic_data/rra_391_ielr.csv')
 
 def validate_rra_391(data_source: str = '../../synthetic_data/rra_391_ielr.csv') -> pd.DataFrame:
     """Validate RRA 391 IELR data"""
-    df = pd.read_csv(data_source)
-
-    validations = []
-
-    # Check ELR in reasonable range (0-200%)
-    if 'Initial_ELR' in df.columns:
-        invalid = (df['Initial_ELR'] < 0) | (df['Initial_ELR'] > 200)
-        validations.append({
-            'Rule': 'Initial ELR 0-200%',
-            'Status': 'FAIL' if invalid.any() else 'PASS',
-            'Records_Affected': int(invalid.sum()),
-            'Severity': 'Warning'
-        })
-
-    if 'Current_ELR' in df.columns:
-        invalid = (df['Current_ELR'] < 0) | (df['Current_ELR'] > 200)
-        validations.append({
-            'Rule': 'Current ELR 0-200%',
-            'Status': 'FAIL' if invalid.any() else 'PASS',
-            'Records_Affected': int(invalid.sum()),
-            'Severity': 'Warning'
-        })
-
-    return pd.DataFrame(validations)
+    return validate_form(FORM_CODE, data_source)
 
 
 if __name__ == "__main__":
@@ -13,12 +13,22 @@ import numpy as np
 from datetime import datetime
 from typing import Dict, List, Optional
 
+try:
+    from .form_store import read_form
+    from .validation_rules import validate_form
+except ImportError:
+    from form_store import read_form
+    from validation_rules import validate_form
+
+from lloyds_reporting.instrumentation import traced
+
 # Form metadata
 FORM_CODE = '591'
 FORM_NAME = 'Syndicate Reinsurance Structure'
 FORM_VERSION = '2.0'
 
 
+@traced('form_processor')
 def process_rra_591(data_source: str = '../../synthetic_data/rra_591_reinsurance_structure.csv') -> pd.DataFrame:
     """
     Process RRA 591 Syndicate Reinsurance Structure data for Power BI
@@ -51,7 +61,7 @@ def process_rra_591(data_source: str = '../../synthetic_data/rra_591_reinsurance
     """
 
     # Load data
-    df = pd.read_csv(data_source)
+    df = read_form(data_source)
 
     # Add calculated fields
     df['Premium_Millions'] = df['Premium_GBP'] / 1_000_000
@@ -162,68 +172,7 @@ def validate_rra_591(data_source: str = '../../synthetic_data/rra_591_reinsuranc
         Validation results
     """
 
-    df = pd.read_csv(data_source)
-
-    validations = []
-
-    # Check for missing syndicate numbers
-    if df['Syndicate_Number'].isnull().any():
-        validations.append({
-            'Rule': 'Syndicate Number Required',
-            'Status': 'FAIL',
-            'Records_Affected': int(df['Syndicate_Number'].isnull().sum()),
-            'Severity': 'Critical'
-        })
-    else:
-        validations.append({
-            'Rule': 'Syndicate Number Required',
-            'Status': 'PASS',
-            'Records_Affected': 0,
-            'Severity': 'Critical'
-        })
-
-    # Check for valid reinsurer ratings
-    valid_ratings = ['AAA', 'AA+', 'AA', 'AA-', 'A+', 'A', 'A-', 'BBB+', 'BBB', 'BBB-', 'BB+', 'BB', 'NR']
-    invalid_ratings = ~df['Reinsurer_Rating'].isin(valid_ratings)
-    validations.append({
-        'Rule': 'Valid Reinsurer Rating',
-        'Status': 'FAIL' if invalid_ratings.any() else 'PASS',
-        'Records_Affected': int(invalid_ratings.sum()),
-        'Severity': 'Warning'
-    })
-
-    # Check attachment < exhaustion
-    if 'Attachment_Point_GBP' in df.columns and 'Limit_GBP' in df.columns:
-        invalid_layers = df['Limit_GBP'] <= 0
-        validations.append({
-            'Rule': 'Positive Limit Required',
-            'Status': 'FAIL' if invalid_layers.any() else 'PASS',
-            'Records_Affected': int(invalid_layers.sum()),
-            'Severity': 'Critical'
-        })
-
-    # Check dates are valid
-    df['Effective_Date'] = pd.to_datetime(df['Effective_Date'], errors='coerce')
-    df['Expiry_Date'] = pd.to_datetime(df['Expiry_Date'], errors='coerce')
-    invalid_dates = df['Effective_Date'] >= df['Expiry_Date']
-    validations.append({
-        'Rule': 'Effective Date < Expiry Date',
-        'Status': 'FAIL' if invalid_dates.any() else 'PASS',
-        'Records_Affected': int(invalid_dates.sum()),
-        'Severity': 'Critical'
-    })
-
-    # Check cession rate for proportional treaties
-    if 'Cession_Rate' in df.columns:
-        invalid_cession = (df['Cession_Rate'] < 0) | (df['Cession_Rate'] > 1)
-        validations.append({
-            'Rule': 'Cession Rate 0-100%',
-            'Status': 'FAIL' if invalid_cession.any() else 'PASS',
-            'Records_Affected': int(invalid_cession.sum()),
-            'Severity': 'Warning'
-        })
-
-    return pd.DataFrame(validations)
+    return validate_form(FORM_CODE, data_source)
 
 
 # For use in Power BI - the 'dataset' variable will be provided by Power BI
@@ -13,12 +13,22 @@ import numpy as np
 from datetime import datetime
 from typing import Dict, List, Optional
 
+try:
+    from .form_store import read_form
+    from .validation_rules import validate_form
+except ImportError:
+    from form_store import read_form
+    from validation_rules import validate_form
+
+from lloyds_reporting.instrumentation import traced
+
 # Form metadata
 FORM_CODE = '910'
 FORM_NAME = 'Additional Information'
 FORM_VERSION = '2.0'
 
 
+@traced('form_processor')
 def process_rra_910(data_source: str = '../../synthetic_data/rra_910_additional_info.csv') -> pd.DataFrame:
     """
     Process RRA 910 Additional Information data for Power BI
@@ -35,7 +45,7 @@ def process_rra_910(data_source: str = '../../synthetic_data/rra_910_additional_
     - Response_Date: Date of response
     """
 
-    df = pd.read_csv(data_source)
+    df = read_form(data_source)
 
     # Add calculated fields
     df['Response_Length'] = df['Response'].str.len()
@@ -61,36 +71,7 @@ def get_additional_info_summary(data_source: str = '../../synthetic_data/rra_910
 
 def validate_rra_910(data_source: str = '../../synthetic_data/rra_910_additional_info.csv') -> pd.DataFrame:
     """Validate RRA 910 Additional Information data"""
-    df = pd.read_csv(data_source)
-
-    validations = []
-
-    # Check for empty responses
-    empty_responses = df['Response'].isnull() | (df['Response'].str.strip() == '')
-    validations.append({
-        'Rule': 'Response Required',
-        'Status': 'FAIL' if empty_responses.any() else 'PASS',
-        'Records_Affected': int(empty_responses.sum()),
-        'Severity': 'Warning'
-    })
-
-    # Check syndicate number present
-    if df['Syndicate_Number'].isnull().any():
-        validations.append({
-            'Rule': 'Syndicate Number Required',
-            'Status': 'FAIL',
-            'Records_Affected': int(df['Syndicate_Number'].isnull().sum()),
-            'Severity': 'Critical'
-        })
-    else:
-        validations.append({
-            'Rule': 'Syndicate Number Required',
-            'Status': 'PASS',
-            'Records_Affected': 0,
-            'Severity': 'Critical'
-        })
-
-    return pd.DataFrame(validations)
+    return validate_form(FORM_CODE, data_source)
 
 
 if __name__ == "__main__":
@@ -7,169 +7,200 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 
+try:
+    from .form_store import read_form
+except ImportError:
+    from form_store import read_form
 
-def validate_all_forms(data_directory='../../synthetic_data'):
-    """
-    Perform comprehensive validation across all RRA forms
+from lloyds_reporting.instrumentation import traced
 
-    Parameters:
-    -----------
-    data_directory : str
-        Directory containing all RRA form CSV files
 
-    Returns:
-    --------
-    pandas.DataFrame
-        Validation results with status for each rule
+# Forms that must be present in a complete RRA submission
+REQUIRED_FORMS = ['010', '020', '071', '081', '091', '193', '291', '292',
+                  '293', '294', '295', '391', '910']
+
+# Key fields that must be populated, by form
+KEY_FIELDS = [('010', ['Syndicate_Number']),
+              ('193', ['Syndicate_Number', 'Year_of_Account', 'LOB_Code']),
+              ('291', ['Syndicate_Number', 'Year_of_Account', 'LOB_Code'])]
+
+SEVERITY_ORDER = {'Critical': 0, 'High': 1, 'Medium': 2, 'Low': 3}
+STATUS_ORDER = {'FAIL': 0, 'ERROR': 1, 'PASS': 2, 'SKIPPED': 3}
+
+
+class FormSet:
     """
+    The RRA forms of one data directory, each read at most once.
 
-    validation_results = []
-    data_dir = Path(data_directory)
-
-    # Rule 1: Check all required files exist
-    required_forms = ['010', '020', '071', '081', '091', '193', '291', '292',
-                     '293', '294', '295', '391', '910']
-
-    for form in required_forms:
-        file_path = data_dir / f'rra_{form}*.csv'
-        files = list(data_dir.glob(f'rra_{form}*.csv'))
-
-        validation_results.append({
-            'Rule_ID': f'FILE_{form}',
-            'Rule_Description': f'Form {form} file exists',
-            'Status': 'PASS' if len(files) > 0 else 'FAIL',
-            'Severity': 'Critical',
-            'Records_Affected': 0 if len(files) > 0 else 1,
-            'Details': f'Found {len(files)} file(s)' if len(files) > 0 else 'File not found'
-        })
-
-    # Rule 2: Cross-form consistency - Syndicate numbers
+    Files are located when the set is created; a form is parsed the first
+    time a rule asks for it and then shared by every other rule.
+    """
+
+    def __init__(self, data_directory='../../synthetic_data', forms=None):
+        self.data_dir = Path(data_directory)
+        self.files = {
+            form: sorted(self.data_dir.glob(f'rra_{form}*.csv'))
+            for form in (forms or REQUIRED_FORMS)
+        }
+        self._frames = {}
+
+    def has(self, form):
+        return len(self.files.get(form, [])) > 0
+
+    def get(self, form):
+        """Return the parsed form, raising FileNotFoundError if it is missing."""
+        if form not in self._frames:
+            if not self.has(form):
+                raise FileNotFoundError(f'Form {form} not found in {self.data_dir}')
+            self._frames[form] = read_form(self.files[form][0])
+        return self._frames[form]
+
+    def signature(self):
+        """Identify the exact file versions in the set, for memoizing results."""
+        entries = []
+        for form, paths in sorted(self.files.items()):
+            for path in paths:
+                stat = path.stat()
+                entries.append((form, str(path.resolve()), stat.st_mtime_ns, stat.st_size))
+        return (str(self.data_dir.resolve()), tuple(entries))
+
+
+def _result(rule_id, description, status, severity, records_affected, details):
+    return {
+        'Rule_ID': rule_id,
+        'Rule_Description': description,
+        'Status': status,
+        'Severity': severity,
+        'Records_Affected': records_affected,
+        'Details': details
+    }
+
+
+def rule_required_files(forms):
+    """Rule 1: Check all required files exist"""
+    results = []
+    for form, files in forms.files.items():
+        found = len(files)
+        results.append(_result(
+            f'FILE_{form}', f'Form {form} file exists',
+            'PASS' if found > 0 else 'FAIL', 'Critical',
+            0 if found > 0 else 1,
+            f'Found {found} file(s)' if found > 0 else 'File not found'
+        ))
+    return results
+
+
+def rule_syndicate_xref(forms):
+    """Rule 2: Cross-form consistency - Syndicate numbers"""
     try:
-        df_010 = pd.read_csv(data_dir / 'rra_010_control.csv')
-        df_193 = pd.read_csv(data_dir / 'rra_193_net_claims.csv')
-        df_291 = pd.read_csv(data_dir / 'rra_291_gross_premium_ibnr.csv')
-
-        syndicates_010 = set(df_010['Syndicate_Number'].unique())
-        syndicates_193 = set(df_193['Syndicate_Number'].unique())
-        syndicates_291 = set(df_291['Syndicate_Number'].unique())
-
-        # Check if all syndicates in 193 and 291 are in 010
-        orphan_193 = syndicates_193 - syndicates_010
-        orphan_291 = syndicates_291 - syndicates_010
-
-        validation_results.append({
-            'Rule_ID': 'XREF_SYN_193',
-            'Rule_Description': 'All syndicates in Form 193 must exist in Form 010',
-            'Status': 'PASS' if len(orphan_193) == 0 else 'FAIL',
-            'Severity': 'High',
-            'Records_Affected': len(orphan_193),
-            'Details': f'Orphan syndicates: {orphan_193}' if orphan_193 else 'All syndicates valid'
-        })
-
-        validation_results.append({
-            'Rule_ID': 'XREF_SYN_291',
-            'Rule_Description': 'All syndicates in Form 291 must exist in Form 010',
-            'Status': 'PASS' if len(orphan_291) == 0 else 'FAIL',
-            'Severity': 'High',
-            'Records_Affected': len(orphan_291),
-            'Details': f'Orphan syndicates: {orphan_291}' if orphan_291 else 'All syndicates valid'
-        })
+        syndicates_010 = set(forms.get('010')['Syndicate_Number'].unique())
+        results = []
+        for form in ('193', '291'):
+            # Check if all syndicates in the form are in 010
+            orphans = set(forms.get(form)['Syndicate_Number'].unique()) - syndicates_010
+            results.append(_result(
+                f'XREF_SYN_{form}', f'All syndicates in Form {form} must exist in Form 010',
+                'PASS' if len(orphans) == 0 else 'FAIL', 'High', len(orphans),
+                f'Orphan syndicates: {orphans}' if orphans else 'All syndicates valid'
+            ))
+        return results
 
     except Exception as e:
-        validation_results.append({
-            'Rule_ID': 'XREF_SYN',
-            'Rule_Description': 'Cross-form syndicate validation',
-            'Status': 'ERROR',
-            'Severity': 'Critical',
-            'Records_Affected': 0,
-            'Details': str(e)
-        })
-
-    # Rule 3: Net vs Gross consistency (Form 292 vs 291)
-    try:
-        df_291 = pd.read_csv(data_dir / 'rra_291_gross_premium_ibnr.csv')
-        df_292 = pd.read_csv(data_dir / 'rra_292_net_premium_ibnr.csv')
+        return [_result('XREF_SYN', 'Cross-form syndicate validation', 'ERROR', 'Critical', 0, str(e))]
 
-        # Merge on key dimensions
-        merged = df_291.merge(
-            df_292,
+
+def rule_net_le_gross(forms):
+    """Rule 3: Net vs Gross consistency (Form 292 vs 291)"""
+    try:
+        merged = forms.get('291').merge(
+            forms.get('292'),
             on=['Syndicate_Number', 'Year_of_Account', 'LOB_Code'],
             how='inner',
             suffixes=('_Gross', '_Net')
         )
+    except FileNotFoundError:
+        return [_result('NET_GROSS_CHECK', 'Net vs Gross validation', 'SKIPPED', 'High', 0,
+                        'Form 291 or 292 not found')]
+
+    # Check: Net amounts should be <= Gross amounts
+    invalid_premium = int((merged['Net_Written_Premium'] > merged['Gross_Written_Premium']).sum())
+    invalid_claims = int((merged['Paid_Claims_Net'] > merged['Paid_Claims_Gross']).sum())
+
+    return [
+        _result('NET_LE_GROSS_PREM', 'Net Premium must be ≤ Gross Premium',
+                'PASS' if invalid_premium == 0 else 'FAIL', 'Critical', invalid_premium,
+                f'{invalid_premium} violations found' if invalid_premium > 0 else 'All records valid'),
+        _result('NET_LE_GROSS_CLAIMS', 'Net Claims must be ≤ Gross Claims',
+                'PASS' if invalid_claims == 0 else 'FAIL', 'Critical', invalid_claims,
+                f'{invalid_claims} violations found' if invalid_claims > 0 else 'All records valid'),
+    ]
+
+
+def rule_ibnr_range(forms):
+    """Rule 4: IBNR range validation"""
+    if not forms.has('291'):
+        return []
+
+    df_291 = forms.get('291')
+    invalid_range = int((
+        (df_291['IBNR_Low'] > df_291['IBNR_Best_Estimate']) |
+        (df_291['IBNR_Best_Estimate'] > df_291['IBNR_High'])
+    ).sum())
+
+    return [_result('IBNR_RANGE', 'IBNR Low ≤ Best ≤ High',
+                    'PASS' if invalid_range == 0 else 'FAIL', 'High', invalid_range,
+                    f'{invalid_range} violations found' if invalid_range > 0 else 'All IBNR ranges valid')]
+
+
+def rule_key_completeness(forms):
+    """Rule 5: Data completeness - no null key fields"""
+    results = []
+    for form_num, key_fields in KEY_FIELDS:
+        if not forms.has(form_num):
+            continue
+        null_records = int(forms.get(form_num)[key_fields].isnull().any(axis=1).sum())
+        results.append(_result(
+            f'COMP_{form_num}', f'Form {form_num} key fields completeness',
+            'PASS' if null_records == 0 else 'FAIL', 'Critical', null_records,
+            f'{null_records} records with null key fields' if null_records > 0 else 'All key fields populated'
+        ))
+    return results
+
+
+# Rules evaluated by validate_all_forms, in order
+VALIDATION_RULES = [
+    rule_required_files,
+    rule_syndicate_xref,
+    rule_net_le_gross,
+    rule_ibnr_range,
+    rule_key_completeness,
+]
+
+# Memoized validation results keyed by FormSet.signature()
+_VALIDATION_CACHE = {}
+
+
+def validate_form_set(forms, rules=None):
+    """
+    Evaluate every validation rule against an already-loaded form set
 
-        # Check: Net amounts should be <= Gross amounts
-        invalid_premium = merged[merged['Net_Written_Premium'] > merged['Gross_Written_Premium']]
-        invalid_claims = merged[merged['Paid_Claims_Net'] > merged['Paid_Claims_Gross']]
-
-        validation_results.append({
-            'Rule_ID': 'NET_LE_GROSS_PREM',
-            'Rule_Description': 'Net Premium must be ≤ Gross Premium',
-            'Status': 'PASS' if len(invalid_premium) == 0 else 'FAIL',
-            'Severity': 'Critical',
-            'Records_Affected': len(invalid_premium),
-            'Details': f'{len(invalid_premium)} violations found' if len(invalid_premium) > 0 else 'All records valid'
-        })
-
-        validation_results.append({
-            'Rule_ID': 'NET_LE_GROSS_CLAIMS',
-            'Rule_Description': 'Net Claims must be ≤ Gross Claims',
-            'Status': 'PASS' if len(invalid_claims) == 0 else 'FAIL',
-            'Severity': 'Critical',
-            'Records_Affected': len(invalid_claims),
-            'Details': f'{len(invalid_claims)} violations found' if len(invalid_claims) > 0 else 'All records valid'
-        })
+    Parameters:
+    -----------
+    forms : FormSet
+        Forms of one submission, each read at most once
+    rules : list, optional
+        Rule functions taking the form set and returning result dicts
+        (defaults to VALIDATION_RULES)
 
-    except FileNotFoundError:
-        validation_results.append({
-            'Rule_ID': 'NET_GROSS_CHECK',
-            'Rule_Description': 'Net vs Gross validation',
-            'Status': 'SKIPPED',
-            'Severity': 'High',
-            'Records_Affected': 0,
-            'Details': 'Form 291 or 292 not found'
-        })
-
-    # Rule 4: IBNR range validation
-    try:
-        df_291 = pd.read_csv(data_dir / 'rra_291_gross_premium_ibnr.csv')
-
-        invalid_range = df_291[
-            (df_291['IBNR_Low'] > df_291['IBNR_Best_Estimate']) |
-            (df_291['IBNR_Best_Estimate'] > df_291['IBNR_High'])
-        ]
-
-        validation_results.append({
-            'Rule_ID': 'IBNR_RANGE',
-            'Rule_Description': 'IBNR Low ≤ Best ≤ High',
-            'Status': 'PASS' if len(invalid_range) == 0 else 'FAIL',
-            'Severity': 'High',
-            'Records_Affected': len(invalid_range),
-            'Details': f'{len(invalid_range)} violations found' if len(invalid_range) > 0 else 'All IBNR ranges valid'
-        })
+    Returns:
+    --------
+    pandas.DataFrame
+        Validation results with status for each rule
+    """
 
-    except FileNotFoundError:
-        pass
-
-    # Rule 5: Data completeness - no null key fields
-    for form_num, key_fields in [('010', ['Syndicate_Number']),
-                                   ('193', ['Syndicate_Number', 'Year_of_Account', 'LOB_Code']),
-                                   ('291', ['Syndicate_Number', 'Year_of_Account', 'LOB_Code'])]:
-        try:
-            df = pd.read_csv(data_dir / f'rra_{form_num}_*.csv')
-            null_records = df[key_fields].isnull().any(axis=1).sum()
-
-            validation_results.append({
-                'Rule_ID': f'COMP_{form_num}',
-                'Rule_Description': f'Form {form_num} key fields completeness',
-                'Status': 'PASS' if null_records == 0 else 'FAIL',
-                'Severity': 'Critical',
-                'Records_Affected': null_records,
-                'Details': f'{null_records} records with null key fields' if null_records > 0 else 'All key fields populated'
-            })
-
-        except FileNotFoundError:
-            pass
+    validation_results = []
+    for rule in (rules if rules is not None else VALIDATION_RULES):
+        validation_results.extend(rule(forms))
 
     # Convert to DataFrame
     df_validation = pd.DataFrame(validation_results)
@@ -178,11 +209,8 @@ def validate_all_forms(data_directory='../../synthetic_data'):
     df_validation['Validation_Timestamp'] = pd.Timestamp.now()
 
     # Sort by severity and status
-    severity_order = {'Critical': 0, 'High': 1, 'Medium': 2, 'Low': 3}
-    status_order = {'FAIL': 0, 'ERROR': 1, 'PASS': 2, 'SKIPPED': 3}
-
-    df_validation['Severity_Order'] = df_validation['Severity'].map(severity_order)
-    df_validation['Status_Order'] = df_validation['Status'].map(status_order)
+    df_validation['Severity_Order'] = df_validation['Severity'].map(SEVERITY_ORDER)
+    df_validation['Status_Order'] = df_validation['Status'].map(STATUS_ORDER)
 
     df_validation = df_validation.sort_values(['Severity_Order', 'Status_Order'])
     df_validation = df_validation.drop(columns=['Severity_Order', 'Status_Order'])
@@ -190,6 +218,44 @@ def validate_all_forms(data_directory='../../synthetic_data'):
     return df_validation
 
 
+@traced('validator')
+def validate_all_forms(data_directory='../../synthetic_data'):
+    """
+    Perform comprehensive validation across all RRA forms
+
+    Results are memoized on the exact versions of the form files, so repeated
+    calls (e.g. from get_validation_summary and export_validation_report)
+    reuse the same run until a file changes. Validation_Timestamp is the time
+    of each call, not of the memoized run.
+
+    Parameters:
+    -----------
+    data_directory : str
+        Directory containing all RRA form CSV files
+
+    Returns:
+    --------
+    pandas.DataFrame
+        Validation results with status for each rule
+    """
+
+    forms = FormSet(data_directory)
+    key = forms.signature()
+
+    if key not in _VALIDATION_CACHE:
+        _VALIDATION_CACHE.clear()
+        _VALIDATION_CACHE[key] = validate_form_set(forms)
+
+    df_validation = _VALIDATION_CACHE[key].copy()
+    df_validation['Validation_Timestamp'] = pd.Timestamp.now()
+    return df_validation
+
+
+def clear_validation_cache():
+    """Discard memoized validation results"""
+    _VALIDATION_CACHE.clear()
+
+
 def get_validation_summary(data_directory='../../synthetic_data'):
     """
     Get high-level validation summary statistics
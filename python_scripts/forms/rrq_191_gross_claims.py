@@ -13,12 +13,24 @@ import numpy as np
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
+try:
+    from .form_store import read_form
+    from .chain_ladder import ChainLadderEngine
+    from .validation_rules import validate_form
+except ImportError:
+    from form_store import read_form
+    from chain_ladder import ChainLadderEngine
+    from validation_rules import validate_form
+
+from lloyds_reporting.instrumentation import traced
+
 # Form metadata
 FORM_CODE = '191'
 FORM_NAME = 'Gross Claims Development'
 FORM_VERSION = '2.0'
 
 
+@traced('form_processor')
 def process_rrq_191(data_source: str = '../../synthetic_data/rrq_191_gross_claims.csv') -> pd.DataFrame:
     """
     Process RRQ 191 Gross Claims Development data for Power BI
@@ -48,7 +60,7 @@ def process_rrq_191(data_source: str = '../../synthetic_data/rrq_191_gross_claim
     """
 
     # Load data
-    df = pd.read_csv(data_source)
+    df = read_form(data_source)
 
     # Add calculated fields
     df['Gross_Paid_Millions'] = df['Gross_Paid_Claims'] / 1_000_000
@@ -139,25 +151,18 @@ def calculate_gross_development_factors(
     """
 
     triangle = create_gross_development_triangle(data_source, syndicate)
+    engine = ChainLadderEngine(triangle.to_numpy(dtype=float), dev_years=triangle.columns.to_numpy())
 
-    factors = []
-    for col_idx in range(len(triangle.columns) - 1):
-        col_current = triangle.columns[col_idx]
-        col_next = triangle.columns[col_idx + 1]
-
-        # Calculate weighted average factor
-        mask = triangle[col_next].notna() & (triangle[col_current] > 0)
-        if mask.any():
-            factor = (triangle.loc[mask, col_next].sum() /
-                     triangle.loc[mask, col_current].sum())
-            factors.append({
-                'From_Dev_Year': col_current,
-                'To_Dev_Year': col_next,
-                'Development_Factor': factor,
-                'YoA_Count': mask.sum()
-            })
+    # Volume-weighted factors, reported only where a link ratio was observed
+    yoa_count = engine.sample_size()[0]
+    observed = yoa_count > 0
 
-    return pd.DataFrame(factors)
+    return pd.DataFrame({
+        'From_Dev_Year': triangle.columns[:-1][observed],
+        'To_Dev_Year': triangle.columns[1:][observed],
+        'Development_Factor': engine.ldf('volume')[0][observed],
+        'YoA_Count': yoa_count[observed]
+    })
 
 
 def get_gross_claims_summary(data_source: str = '../../synthetic_data/rrq_191_gross_claims.csv') -> pd.DataFrame:
@@ -200,60 +205,7 @@ def validate_rrq_191(data_source: str = '../../synthetic_data/rrq_191_gross_clai
         Validation results
     """
 
-    df = pd.read_csv(data_source)
-
-    validations = []
-
-    # Check for missing syndicate numbers
-    if df['Syndicate_Number'].isnull().any():
-        validations.append({
-            'Rule': 'Syndicate Number Required',
-            'Status': 'FAIL',
-            'Records_Affected': int(df['Syndicate_Number'].isnull().sum()),
-            'Severity': 'Critical'
-        })
-    else:
-        validations.append({
-            'Rule': 'Syndicate Number Required',
-            'Status': 'PASS',
-            'Records_Affected': 0,
-            'Severity': 'Critical'
-        })
-
-    # Check gross incurred = paid + case + IBNR
-    if all(col in df.columns for col in ['Gross_Paid_Claims', 'Gross_Case_Reserves', 'Gross_IBNR', 'Gross_Incurred']):
-        calculated = df['Gross_Paid_Claims'] + df['Gross_Case_Reserves'] + df['Gross_IBNR']
-        tolerance = 0.01  # 1% tolerance for rounding
-        mismatch = abs(df['Gross_Incurred'] - calculated) > (df['Gross_Incurred'].abs() * tolerance)
-        validations.append({
-            'Rule': 'Incurred = Paid + Case + IBNR',
-            'Status': 'FAIL' if mismatch.any() else 'PASS',
-            'Records_Affected': int(mismatch.sum()),
-            'Severity': 'Critical'
-        })
-
-    # Check for negative values
-    for col in ['Gross_Paid_Claims', 'Gross_Case_Reserves', 'Gross_Incurred']:
-        if col in df.columns:
-            negative = df[col] < 0
-            validations.append({
-                'Rule': f'{col} Non-Negative',
-                'Status': 'FAIL' if negative.any() else 'PASS',
-                'Records_Affected': int(negative.sum()),
-                'Severity': 'Warning'
-            })
-
-    # Check development year is non-negative integer
-    if 'Development_Year' in df.columns:
-        invalid_dev = (df['Development_Year'] < 0) | (df['Development_Year'] != df['Development_Year'].astype(int))
-        validations.append({
-            'Rule': 'Valid Development Year',
-            'Status': 'FAIL' if invalid_dev.any() else 'PASS',
-            'Records_Affected': int(invalid_dev.sum()),
-            'Severity': 'Critical'
-        })
-
-    return pd.DataFrame(validations)
+    return validate_form(FORM_CODE, data_source)
 
 
 # For use in Power BI - the 'dataset' variable will be provided by Power BI
@@ -13,12 +13,24 @@ import numpy as np
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
+try:
+    from .form_store import read_form
+    from .triangle_matrix import TriangleMatrix
+    from .validation_rules import validate_form
+except ImportError:
+    from form_store import read_form
+    from triangle_matrix import TriangleMatrix
+    from validation_rules import validate_form
+
+from lloyds_reporting.instrumentation import traced
+
 # Form metadata
 FORM_CODE = '192'
 FORM_NAME = 'Claims Triangles Summary'
 FORM_VERSION = '2.0'
 
 
+@traced('form_processor')
 def process_rrq_192(data_source: str = '../../synthetic_data/rrq_192_claims_triangles.csv') -> pd.DataFrame:
     """
     Process RRQ 192 Claims Triangles Summary data for Power BI
@@ -49,19 +61,13 @@ def process_rrq_192(data_source: str = '../../synthetic_data/rrq_192_claims_tria
     """
 
     # Load data
-    df = pd.read_csv(data_source)
+    df = read_form(data_source)
 
-    # Identify development year columns
-    dev_cols = [col for col in df.columns if col.startswith('Dev_Year_')]
+    # Development year block as a 2-D array
+    triangle = TriangleMatrix.from_frame(df)
 
     # Calculate latest diagonal value
-    def get_latest_diagonal(row):
-        for col in reversed(dev_cols):
-            if pd.notna(row[col]) and row[col] != 0:
-                return row[col]
-        return 0
-
-    df['Latest_Diagonal'] = df.apply(get_latest_diagonal, axis=1)
+    df['Latest_Diagonal'] = triangle.latest_diagonal()
     df['Latest_Diagonal_M'] = df['Latest_Diagonal'] / 1_000_000
 
     # Add calculated fields
@@ -87,18 +93,8 @@ def process_rrq_192(data_source: str = '../../synthetic_data/rrq_192_claims_tria
     df['Report_Quarter'] = df['Reporting_Period'].dt.quarter
     df['Report_Year'] = df['Reporting_Period'].dt.year
 
-    # Add maturity classification
-    def classify_maturity(row):
-        # Count non-null development years
-        dev_count = sum(1 for col in dev_cols if pd.notna(row[col]) and row[col] != 0)
-        if dev_count <= 2:
-            return 'Immature'
-        elif dev_count <= 5:
-            return 'Developing'
-        else:
-            return 'Mature'
-
-    df['Maturity'] = df.apply(classify_maturity, axis=1)
+    # Add maturity classification from the count of populated development years
+    df['Maturity'] = triangle.maturity()
 
     return df
 
@@ -228,77 +224,7 @@ def validate_rrq_192(data_source: str = '../../synthetic_data/rrq_192_claims_tri
         Validation results
     """
 
-    df = pd.read_csv(data_source)
-
-    validations = []
-
-    # Check for missing syndicate numbers
-    if df['Syndicate_Number'].isnull().any():
-        validations.append({
-            'Rule': 'Syndicate Number Required',
-            'Status': 'FAIL',
-            'Records_Affected': int(df['Syndicate_Number'].isnull().sum()),
-            'Severity': 'Critical'
-        })
-    else:
-        validations.append({
-            'Rule': 'Syndicate Number Required',
-            'Status': 'PASS',
-            'Records_Affected': 0,
-            'Severity': 'Critical'
-        })
-
-    # Check valid triangle types
-    valid_types = ['Paid', 'Incurred', 'Case']
-    if 'Triangle_Type' in df.columns:
-        invalid_types = ~df['Triangle_Type'].isin(valid_types)
-        validations.append({
-            'Rule': 'Valid Triangle Type',
-            'Status': 'FAIL' if invalid_types.any() else 'PASS',
-            'Records_Affected': int(invalid_types.sum()),
-            'Severity': 'Warning'
-        })
-
-    # Check valid basis
-    valid_basis = ['Gross', 'Net']
-    if 'Basis' in df.columns:
-        invalid_basis = ~df['Basis'].isin(valid_basis)
-        validations.append({
-            'Rule': 'Valid Basis (Gross/Net)',
-            'Status': 'FAIL' if invalid_basis.any() else 'PASS',
-            'Records_Affected': int(invalid_basis.sum()),
-            'Severity': 'Warning'
-        })
-
-    # Check ultimate >= latest diagonal
-    dev_cols = [col for col in df.columns if col.startswith('Dev_Year_')]
-    if dev_cols and 'Ultimate_Estimate' in df.columns:
-        def get_latest(row):
-            for col in reversed(dev_cols):
-                if pd.notna(row[col]) and row[col] != 0:
-                    return row[col]
-            return 0
-
-        df['_latest'] = df.apply(get_latest, axis=1)
-        ultimate_less_than_diagonal = df['Ultimate_Estimate'] < df['_latest'] * 0.99  # 1% tolerance
-        validations.append({
-            'Rule': 'Ultimate >= Latest Diagonal',
-            'Status': 'FAIL' if ultimate_less_than_diagonal.any() else 'PASS',
-            'Records_Affected': int(ultimate_less_than_diagonal.sum()),
-            'Severity': 'Warning'
-        })
-
-    # Check IBNR is non-negative for most cases
-    if 'Selected_IBNR' in df.columns:
-        negative_ibnr = df['Selected_IBNR'] < 0
-        validations.append({
-            'Rule': 'IBNR Non-Negative',
-            'Status': 'FAIL' if negative_ibnr.any() else 'PASS',
-            'Records_Affected': int(negative_ibnr.sum()),
-            'Severity': 'Warning'
-        })
-
-    return pd.DataFrame(validations)
+    return validate_form(FORM_CODE, data_source)
 
 
 # For use in Power BI - the 'dataset' variable will be provided by Power BI
@@ -0,0 +1,428 @@
+"""
+Stochastic Reserving - Mack and ODP Bootstrap Reserve Variability
+=================================================================
+
+Puts a range around the deterministic chain ladder produced by
+``chain_ladder.ChainLadderEngine``.
+
+Methods:
+--------
+- Mack (1993): analytic standard errors of the chain ladder reserve for every
+  segment and origin year, computed for all segments at once on the
+  (segments x origins x development years) cube. Percentiles use a lognormal
+  approximation with the Mack mean and standard error.
+- ODP bootstrap (England & Verrall 2002): Pearson residual resampling of the
+  incremental triangle, chain ladder re-fit on each pseudo triangle and gamma
+  process error on future incrementals. Simulations are vectorized with NumPy
+  (simulations x origins x development years) and segments are spread across
+  a ``ProcessPoolExecutor``.
+
+Reproducibility:
+----------------
+Each segment draws from its own ``numpy.random.Generator`` spawned from a root
+``SeedSequence``, so results for a segment depend only on the root seed and the
+segment's position, not on the number of workers or scheduling order.
+
+Usage:
+------
+    from python_scripts.forms.stochastic_reserving import calculate_reserve_variability
+    ranges = calculate_reserve_variability('synthetic_data/rra_193_net_claims.csv',
+                                           n_simulations=10_000, max_workers=4)
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .form_store import read_form
+    from .chain_ladder import ChainLadderEngine
+except ImportError:
+    from form_store import read_form
+    from chain_ladder import ChainLadderEngine
+
+# Default reporting percentiles (75th and the Solvency II 1-in-200)
+DEFAULT_PERCENTILES: Tuple[float, ...] = (75.0, 99.5)
+
+# Default number of bootstrap simulations per segment
+DEFAULT_SIMULATIONS = 10_000
+
+# Default root seed for bootstrap streams
+DEFAULT_SEED = 42
+
+
+def percentile_label(pct: float) -> str:
+    """Column label for a percentile, e.g. 99.5 -> 'P99_5'."""
+    return 'P' + f'{pct:g}'.replace('.', '_')
+
+
+# =============================================================================
+# MACK
+# =============================================================================
+
+def _mack_sigma2(engine: ChainLadderEngine, ldf: np.ndarray) -> np.ndarray:
+    """Mack variance parameters sigma^2_k, shape (segments, dev years - 1)."""
+    valid = engine._valid
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratios = np.where(valid, engine._following / np.where(valid, engine._current, 1.0), 0.0)
+        weighted = np.where(valid, engine._current * (ratios - ldf[:, np.newaxis, :]) ** 2, 0.0)
+        n_obs = valid.sum(axis=1)
+        sigma2 = np.where(n_obs > 1, weighted.sum(axis=1) / (n_obs - 1), np.nan)
+
+    # Mack's extrapolation for development years with a single observation
+    for k in range(sigma2.shape[1]):
+        missing = np.isnan(sigma2[:, k])
+        if k >= 2 and missing.any():
+            s1, s2 = sigma2[:, k - 1], sigma2[:, k - 2]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                extrapolated = np.fmin(np.fmin(s1 ** 2 / s2, s2), s1)
+            sigma2[:, k] = np.where(missing, extrapolated, sigma2[:, k])
+
+    return np.nan_to_num(sigma2, nan=0.0, posinf=0.0)
+
+
+def _projected_cube(engine: ChainLadderEngine, ldf: np.ndarray,
+                    latest_index: np.ndarray, latest_value: np.ndarray) -> np.ndarray:
+    """Observed cube completed with chain ladder projections beyond the diagonal."""
+    n_seg, _, n_dev = engine.cube.shape
+    cum_factor = np.concatenate([np.ones((n_seg, 1)), np.cumprod(ldf, axis=1)], axis=1)
+    safe_index = np.maximum(latest_index, 0)
+    base = np.take_along_axis(cum_factor, safe_index, axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        projected = latest_value[..., np.newaxis] * cum_factor[:, np.newaxis, :] / base[..., np.newaxis]
+    future = np.arange(n_dev)[np.newaxis, np.newaxis, :] > latest_index[..., np.newaxis]
+    return np.where(future, projected, engine.cube)
+
+
+def mack_reserve_variability(engine: ChainLadderEngine,
+                             percentiles: Sequence[float] = DEFAULT_PERCENTILES
+                             ) -> Dict[str, pd.DataFrame]:
+    """
+    Mack standard errors for every segment in one vectorized pass.
+
+    Parameters:
+    -----------
+    engine : ChainLadderEngine
+        Engine holding the cumulative triangles
+    percentiles : sequence of float
+        Percentiles reported from a lognormal fitted to mean and standard error
+
+    Returns:
+    --------
+    dict
+        'by_origin': Reserve, Mack_SE and Mack_CV per segment and origin
+        'by_segment': Total reserve, Mack_SE (with covariance) and percentiles
+    """
+    n_seg, n_origin, n_dev = engine.cube.shape
+    ldf = engine.ldf('volume')
+    sigma2 = _mack_sigma2(engine, ldf)
+    latest_index, latest_value = engine.latest()
+    projected = _projected_cube(engine, ldf, latest_index, latest_value)
+
+    ultimate = projected[:, :, -1] if n_dev else np.zeros((n_seg, n_origin))
+    observed_origin = latest_index >= 0
+    reserve = np.where(observed_origin, ultimate - latest_value, 0.0)
+
+    # Link k contributes for origins whose latest development is at or before k
+    links = np.arange(max(n_dev - 1, 0))
+    future_link = links[np.newaxis, np.newaxis, :] >= latest_index[..., np.newaxis]
+    future_link &= observed_origin[..., np.newaxis]
+    column_sum = engine._current.sum(axis=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        param = np.where(ldf > 0, sigma2 / ldf ** 2, 0.0)
+        process_term = np.where(projected[:, :, :-1] > 0, 1.0 / projected[:, :, :-1], 0.0)
+        estimation_term = np.where(column_sum > 0, 1.0 / column_sum, 0.0)
+
+    terms = param[:, np.newaxis, :] * (process_term + estimation_term[:, np.newaxis, :])
+    mse = ultimate ** 2 * np.where(future_link, terms, 0.0).sum(axis=2)
+
+    # Covariance between origins: younger origins share estimation error
+    cov_link = np.where(future_link, 2.0 * param[:, np.newaxis, :] * estimation_term[:, np.newaxis, :], 0.0)
+    cov_weight = cov_link.sum(axis=2)
+    ult_observed = np.where(observed_origin, ultimate, 0.0)
+    younger_ultimate = np.cumsum(ult_observed[:, ::-1], axis=1)[:, ::-1] - ult_observed
+    total_mse = mse.sum(axis=1) + (ult_observed * younger_ultimate * cov_weight).sum(axis=1)
+
+    origin_se = np.sqrt(np.maximum(mse, 0.0))
+    seg_idx, origin_idx = np.nonzero(observed_origin)
+    by_origin = engine.segments.loc[seg_idx].reset_index(drop=True)
+    by_origin[engine.origin_col] = engine.origins[origin_idx]
+    by_origin['Ultimate'] = ultimate[seg_idx, origin_idx]
+    by_origin['Reserve'] = reserve[seg_idx, origin_idx]
+    by_origin['Mack_SE'] = origin_se[seg_idx, origin_idx]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        by_origin['Mack_CV'] = np.where(by_origin['Reserve'] > 0,
+                                        by_origin['Mack_SE'] / by_origin['Reserve'], 0.0)
+
+    total_reserve = reserve.sum(axis=1)
+    total_se = np.sqrt(np.maximum(total_mse, 0.0))
+    by_segment = engine.segments.reset_index(drop=True).copy()
+    by_segment['Reserve'] = total_reserve
+    by_segment['Mack_SE'] = total_se
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cv = np.where(total_reserve > 0, total_se / total_reserve, 0.0)
+    by_segment['Mack_CV'] = cv
+
+    # Lognormal percentiles matching the Mack mean and standard error
+    sigma_ln = np.sqrt(np.log1p(cv ** 2))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mu_ln = np.log(np.where(total_reserve > 0, total_reserve, np.nan)) - sigma_ln ** 2 / 2
+    for pct in percentiles:
+        z = NormalDist().inv_cdf(pct / 100)
+        value = np.exp(mu_ln + z * sigma_ln)
+        by_segment[f'Mack_{percentile_label(pct)}'] = np.where(total_reserve > 0, value, total_reserve)
+
+    return {'by_origin': by_origin, 'by_segment': by_segment}
+
+
+# =============================================================================
+# ODP BOOTSTRAP
+# =============================================================================
+
+def bootstrap_triangle(triangle: np.ndarray,
+                       n_simulations: int = DEFAULT_SIMULATIONS,
+                       rng: Optional[np.random.Generator] = None,
+                       process_error: bool = True) -> np.ndarray:
+    """
+    ODP bootstrap of one cumulative triangle, vectorized over simulations.
+
+    Parameters:
+    -----------
+    triangle : np.ndarray
+        Cumulative triangle, shape (origins, dev years); NaN beyond the diagonal
+    n_simulations : int
+        Number of pseudo triangles
+    rng : numpy.random.Generator, optional
+        Random stream for this triangle
+    process_error : bool
+        Add gamma process error to the projected future incrementals
+
+    Returns:
+    --------
+    np.ndarray
+        Simulated reserves by origin, shape (n_simulations, origins)
+    """
+    rng = rng if rng is not None else np.random.default_rng(DEFAULT_SEED)
+    engine = ChainLadderEngine(triangle)
+    n_origin, n_dev = engine.cube.shape[1:]
+    if n_origin == 0 or n_dev < 2:
+        return np.zeros((n_simulations, n_origin))
+
+    cube = engine.cube[0]
+    observed = ~np.isnan(cube)
+    ldf = engine.ldf('volume')[0]
+    latest_index, latest_value = (a[0] for a in engine.latest())
+    valid_link = engine._valid[0]
+
+    # Fitted cumulative values: back-project the latest diagonal with the LDFs
+    cum_factor = np.concatenate([[1.0], np.cumprod(ldf)])
+    base = cum_factor[np.maximum(latest_index, 0)]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fitted_cum = latest_value[:, np.newaxis] * cum_factor[np.newaxis, :] / base[:, np.newaxis]
+    fitted_cum = np.where(observed, fitted_cum, np.nan)
+
+    actual_inc = np.diff(cube, axis=1, prepend=0.0)
+    fitted_inc = np.diff(fitted_cum, axis=1, prepend=0.0)
+    inc_observed = observed & ~np.isnan(actual_inc) & ~np.isnan(fitted_inc)
+
+    # Unscaled Pearson residuals and the ODP scale parameter
+    scale_base = np.sqrt(np.abs(np.where(inc_observed, fitted_inc, 0.0)))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        residuals = np.where(inc_observed & (scale_base > 0),
+                             (actual_inc - fitted_inc) / scale_base, np.nan)
+    pool = residuals[~np.isnan(residuals)]
+    n_obs = pool.size
+    n_params = n_origin + n_dev - 1
+    dof = max(n_obs - n_params, 1)
+    phi = float((pool ** 2).sum() / dof) if n_obs else 0.0
+    pool = pool * np.sqrt(n_obs / dof) if n_obs else np.zeros(1)
+
+    # Pseudo incremental triangles (simulations x origins x dev years)
+    cells = np.argwhere(inc_observed)
+    sampled = rng.choice(pool, size=(n_simulations, len(cells)))
+    pseudo_inc = np.zeros((n_simulations, n_origin, n_dev))
+    pseudo_inc[:, cells[:, 0], cells[:, 1]] = (
+        fitted_inc[cells[:, 0], cells[:, 1]] + sampled * scale_base[cells[:, 0], cells[:, 1]]
+    )
+    pseudo_cum = np.cumsum(pseudo_inc, axis=2)
+
+    # Volume-weighted LDFs of every pseudo triangle over the original link pattern
+    numerator = np.where(valid_link, pseudo_cum[:, :, 1:], 0.0).sum(axis=1)
+    denominator = np.where(valid_link, pseudo_cum[:, :, :-1], 0.0).sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pseudo_ldf = np.where(denominator > 0, numerator / denominator, 1.0)
+
+    # Project future cumulative values from each pseudo latest diagonal
+    pseudo_cum_factor = np.concatenate(
+        [np.ones((n_simulations, 1)), np.cumprod(pseudo_ldf, axis=1)], axis=1
+    )
+    safe_index = np.maximum(latest_index, 0)
+    pseudo_latest = pseudo_cum[:, np.arange(n_origin), safe_index]
+    base = pseudo_cum_factor[:, safe_index]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        projected = (pseudo_latest / base)[:, :, np.newaxis] * pseudo_cum_factor[:, np.newaxis, :]
+    future_inc = np.diff(projected, axis=2, prepend=0.0)
+    future = np.arange(n_dev)[np.newaxis, :] > latest_index[:, np.newaxis]
+    future &= (latest_index >= 0)[:, np.newaxis]
+    future_inc = np.where(future[np.newaxis], np.nan_to_num(future_inc), 0.0)
+
+    # Gamma process error with mean m and variance phi * m
+    if process_error and phi > 0:
+        positive = future_inc > 0
+        shape = np.where(positive, future_inc / phi, 1.0)
+        future_inc = np.where(positive, rng.gamma(shape, phi), future_inc)
+
+    return future_inc.sum(axis=2)
+
+
+def _bootstrap_segment_batch(args) -> List[np.ndarray]:
+    """Process pool worker: bootstrap a batch of triangles with their own streams."""
+    triangles, seeds, n_simulations, process_error = args
+    return [
+        bootstrap_triangle(tri, n_simulations, np.random.default_rng(seed), process_error)
+        for tri, seed in zip(triangles, seeds)
+    ]
+
+
+def bootstrap_reserve_variability(engine: ChainLadderEngine,
+                                  n_simulations: int = DEFAULT_SIMULATIONS,
+                                  percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+                                  seed: int = DEFAULT_SEED,
+                                  max_workers: Optional[int] = None,
+                                  batch_size: int = 8,
+                                  process_error: bool = True) -> Dict[str, pd.DataFrame]:
+    """
+    ODP bootstrap reserve distribution for every segment.
+
+    Parameters:
+    -----------
+    engine : ChainLadderEngine
+        Engine holding the cumulative triangles
+    n_simulations : int
+        Simulations per segment
+    percentiles : sequence of float
+        Reserve percentiles to report
+    seed : int
+        Root seed; segment streams are spawned from it
+    max_workers : int, optional
+        Process pool size. 1 runs in-process; None uses the executor default.
+    batch_size : int
+        Segments per pool task
+    process_error : bool
+        Include gamma process error
+
+    Returns:
+    --------
+    dict
+        'by_origin': Mean, Std and percentiles per segment and origin
+        'by_segment': Mean, Std and percentiles of the total reserve per segment
+    """
+    n_seg, n_origin, _ = engine.cube.shape
+    child_seeds = np.random.SeedSequence(seed).spawn(n_seg)
+    batches = [
+        ([engine.cube[i] for i in range(start, min(start + batch_size, n_seg))],
+         child_seeds[start:start + batch_size], n_simulations, process_error)
+        for start in range(0, n_seg, batch_size)
+    ]
+
+    if max_workers == 1 or len(batches) <= 1:
+        results = [_bootstrap_segment_batch(batch) for batch in batches]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_bootstrap_segment_batch, batches))
+    simulations = [sims for batch in results for sims in batch]
+
+    latest_index, _ = engine.latest()
+    origin_rows = []
+    segment_rows = []
+    labels = [percentile_label(p) for p in percentiles]
+    for seg, sims in enumerate(simulations):
+        total = sims.sum(axis=1)
+        segment_rows.append([total.mean(), total.std(ddof=1) if len(total) > 1 else 0.0,
+                             *np.percentile(total, percentiles)])
+        observed = np.nonzero(latest_index[seg] >= 0)[0]
+        if observed.size:
+            stats = np.column_stack([
+                np.full(observed.size, seg),
+                observed,
+                sims[:, observed].mean(axis=0),
+                sims[:, observed].std(axis=0, ddof=1) if len(sims) > 1 else np.zeros(observed.size),
+                np.percentile(sims[:, observed], percentiles, axis=0).T,
+            ])
+            origin_rows.append(stats)
+
+    stat_cols = ['Bootstrap_Mean', 'Bootstrap_Std'] + [f'Bootstrap_{label}' for label in labels]
+
+    by_segment = engine.segments.reset_index(drop=True).copy()
+    by_segment[stat_cols] = np.array(segment_rows).reshape(n_seg, len(stat_cols))
+    by_segment['Simulations'] = n_simulations
+
+    origin_stats = (np.vstack(origin_rows) if origin_rows
+                    else np.empty((0, 2 + len(stat_cols))))
+    seg_idx = origin_stats[:, 0].astype(int)
+    by_origin = engine.segments.loc[seg_idx].reset_index(drop=True)
+    by_origin[engine.origin_col] = engine.origins[origin_stats[:, 1].astype(int)]
+    by_origin[stat_cols] = origin_stats[:, 2:]
+
+    return {'by_origin': by_origin, 'by_segment': by_segment}
+
+
+# =============================================================================
+# FORM-LEVEL ENTRY POINT
+# =============================================================================
+
+def calculate_reserve_variability(data_source: str = '../../synthetic_data/rra_193_net_claims.csv',
+                                  metric: str = 'Cumulative_Paid_Claims',
+                                  segment_cols: Sequence[str] = ('Syndicate_Number', 'LOB_Code'),
+                                  n_simulations: int = DEFAULT_SIMULATIONS,
+                                  percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+                                  seed: int = DEFAULT_SEED,
+                                  max_workers: Optional[int] = None,
+                                  by_origin: bool = False) -> pd.DataFrame:
+    """
+    Mack and bootstrap reserve ranges per syndicate / LOB from RRA/RRQ 193 data
+
+    Parameters:
+    -----------
+    data_source : str
+        Path to the net claims data CSV file
+    metric : str
+        Cumulative metric to project
+    segment_cols : sequence of str
+        Columns identifying each triangle
+    n_simulations : int
+        Bootstrap simulations per segment
+    percentiles : sequence of float
+        Reserve percentiles to report (default 75th and 99.5th)
+    seed : int
+        Root seed for reproducible bootstrap streams
+    max_workers : int, optional
+        Process pool size for the bootstrap
+    by_origin : bool
+        Return results per year of account instead of per segment
+
+    Returns:
+    --------
+    pandas.DataFrame
+        Chain ladder reserve, Mack standard error and percentiles, and
+        bootstrap mean, standard deviation and percentiles
+    """
+
+    df = read_form(data_source)
+    engine = ChainLadderEngine.from_frame(df, metric, segment_cols)
+
+    level = 'by_origin' if by_origin else 'by_segment'
+    keys = list(segment_cols) + ([engine.origin_col] if by_origin else [])
+
+    mack = mack_reserve_variability(engine, percentiles)[level]
+    boot = bootstrap_reserve_variability(
+        engine, n_simulations, percentiles, seed, max_workers
+    )[level]
+
+    if not keys:
+        return pd.concat([mack, boot], axis=1)
+    return mack.merge(boot, on=keys, how='left')
@@ -0,0 +1,126 @@
+"""
+Triangle Matrix - Vectorized Wide-Triangle Helper
+=================================================
+
+NumPy engine for triangle forms stored in wide layout, where each row holds one
+development history in ``Dev_Year_0`` .. ``Dev_Year_n`` columns (e.g. RRQ 192).
+
+All measures are computed over the whole development block as a 2-D array
+instead of looping over the columns of each row in Python.
+
+Usage:
+------
+    from python_scripts.forms.triangle_matrix import TriangleMatrix
+    tri = TriangleMatrix.from_frame(df)
+    df['Latest_Diagonal'] = tri.latest_diagonal()
+    df['Maturity'] = tri.maturity()
+"""
+
+import re
+from typing import List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Default prefix of wide development year columns
+DEV_COLUMN_PREFIX = 'Dev_Year_'
+
+# Maturity bands on the number of populated development years:
+# (upper bound inclusive, label); counts above the last bound are 'Mature'
+MATURITY_BANDS: Tuple[Tuple[int, str], ...] = ((2, 'Immature'), (5, 'Developing'))
+MATURITY_DEFAULT = 'Mature'
+
+
+def get_dev_columns(df: pd.DataFrame, prefix: str = DEV_COLUMN_PREFIX) -> List[str]:
+    """Return the development year columns of a frame ordered by development year."""
+    pattern = re.compile(rf'^{re.escape(prefix)}(\d+)$')
+    matches = [(int(m.group(1)), col) for col in df.columns
+               for m in [pattern.match(str(col))] if m]
+    return [col for _, col in sorted(matches)]
+
+
+class TriangleMatrix:
+    """
+    Dense (rows x development years) view of wide-format triangle data.
+
+    A cell counts as populated when it is neither missing nor zero, matching
+    the convention used by the RRQ 192 form.
+
+    Attributes:
+        values (np.ndarray): float64 array of shape (n_rows, n_dev)
+        columns (List[str]): Development column names in development order
+    """
+
+    def __init__(self, values: np.ndarray, columns: Sequence[str] = ()):
+        """
+        Wrap a 2-D array of development values.
+
+        Args:
+            values: Array of shape (n_rows, n_dev); NaN marks missing cells
+            columns: Optional names of the development columns
+        """
+        self.values = np.asarray(values, dtype=np.float64)
+        if self.values.ndim != 2:
+            raise ValueError("TriangleMatrix values must be a 2-D array")
+        self.columns = list(columns)
+        self._populated = None
+        self._latest_index = None
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, prefix: str = DEV_COLUMN_PREFIX) -> 'TriangleMatrix':
+        """Build a matrix from the ``Dev_Year_*`` columns of a DataFrame."""
+        dev_cols = get_dev_columns(df, prefix)
+        if not dev_cols:
+            return cls(np.empty((len(df), 0)), dev_cols)
+        values = df[dev_cols].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+        return cls(values, dev_cols)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.values.shape
+
+    @property
+    def populated(self) -> np.ndarray:
+        """Boolean mask of cells that are present and non-zero."""
+        if self._populated is None:
+            self._populated = ~np.isnan(self.values) & (self.values != 0)
+        return self._populated
+
+    def development_count(self) -> np.ndarray:
+        """Number of populated development years per row."""
+        return self.populated.sum(axis=1)
+
+    def latest_index(self) -> np.ndarray:
+        """
+        Index of the last populated development year per row.
+
+        Rows with no populated cell get -1.
+        """
+        if self._latest_index is None:
+            n_rows, n_dev = self.values.shape
+            if n_dev == 0:
+                self._latest_index = np.full(n_rows, -1, dtype=np.int64)
+            else:
+                mask = self.populated
+                # argmax on the reversed mask finds the last True in each row
+                last = n_dev - 1 - np.argmax(mask[:, ::-1], axis=1)
+                self._latest_index = np.where(mask.any(axis=1), last, -1)
+        return self._latest_index
+
+    def latest_diagonal(self) -> np.ndarray:
+        """Value on the latest populated diagonal per row (0 where none)."""
+        idx = self.latest_index()
+        if self.values.shape[1] == 0:
+            return np.zeros(len(idx))
+        rows = np.arange(len(idx))
+        latest = self.values[rows, np.maximum(idx, 0)]
+        return np.where(idx >= 0, latest, 0.0)
+
+    def maturity(self,
+                 bands: Sequence[Tuple[int, str]] = MATURITY_BANDS,
+                 default: str = MATURITY_DEFAULT) -> np.ndarray:
+        """Classify each row by its number of populated development years."""
+        counts = self.development_count()
+        conditions = [counts <= upper for upper, _ in bands]
+        labels = [label for _, label in bands]
+        return np.select(conditions, labels, default=default).astype(object)
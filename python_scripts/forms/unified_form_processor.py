@@ -3,25 +3,103 @@ Unified Form Processor for RRQ and RRA Data
 Automatically detects and processes both quarterly and annual Lloyd's returns
 """
 
+import importlib
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Literal
+
 import pandas as pd
 import numpy as np
-from pathlib import Path
-from typing import Optional, Literal
+
+try:
+    from .form_store import read_form
+    from .quarter_diff import diff_quarters, chain_quarter_diffs
+except ImportError:
+    from form_store import read_form
+    from quarter_diff import diff_quarters, chain_quarter_diffs
+
+
+# Form processor per (return prefix, form code): (module, function)
+FORM_PROCESSORS = {
+    ('rra', '010'): ('rra_010_control', 'process_rra_010'),
+    ('rra', '020'): ('rra_020_exchange_rates', 'process_rra_020'),
+    ('rra', '071'): ('rra_071_scob_mapping', 'process_rra_071'),
+    ('rra', '081'): ('rra_081_reserving_class', 'process_rra_081'),
+    ('rra', '091'): ('rra_091_lpt_data', 'process_rra_091'),
+    ('rra', '193'): ('rra_193_net_claims', 'process_rra_193'),
+    ('rra', '291'): ('rra_291_gross_premium_ibnr', 'process_rra_291'),
+    ('rra', '292'): ('rra_292_net_premium_ibnr', 'process_rra_292'),
+    ('rra', '293'): ('rra_293_outstanding_ibnr_pyoa', 'process_rra_293'),
+    ('rra', '294'): ('rra_294_catastrophe_ibnr', 'process_rra_294'),
+    ('rra', '295'): ('rra_295_ulae', 'process_rra_295'),
+    ('rra', '391'): ('rra_391_ielr', 'process_rra_391'),
+    ('rra', '591'): ('rra_591_reinsurance_structure', 'process_rra_591'),
+    ('rra', '910'): ('rra_910_additional_info', 'process_rra_910'),
+    ('rrq', '191'): ('rrq_191_gross_claims', 'process_rrq_191'),
+    ('rrq', '192'): ('rrq_192_claims_triangles', 'process_rrq_192'),
+}
+
+# Form files are named <rra|rrq>_<form code>_<description>.csv
+FORM_FILE_PATTERN = re.compile(r'^(rra|rrq)_(\d{3})_.*\.csv$', re.IGNORECASE)
+
+
+def _resolve_processor(prefix: str, code: str):
+    """
+    Return the processor function for a form file.
+
+    RRQ forms without a quarterly-specific processor share the RRA layout and
+    use the RRA processor for the same form code.
+    """
+    entry = FORM_PROCESSORS.get((prefix, code)) or FORM_PROCESSORS.get(('rra', code))
+    if entry is None:
+        return None
+    module_name, func_name = entry
+    if __package__:
+        module = importlib.import_module(f'.{module_name}', __package__)
+    else:
+        module = importlib.import_module(module_name)
+    return getattr(module, func_name)
+
+
+def _run_form(prefix: str, code: str, file_path: str) -> dict:
+    """Process one form file and time it (module-level so process pools can pickle it)."""
+    start_wall = time.perf_counter()
+    start_cpu = time.thread_time()
+    try:
+        df = _resolve_processor(prefix, code)(file_path)
+        status, error = 'OK', None
+    except Exception as e:
+        df, status, error = None, 'ERROR', f'{type(e).__name__}: {e}'
+
+    return {
+        'data': df,
+        'Form': code,
+        'Return_Type': prefix.upper(),
+        'File': Path(file_path).name,
+        'Rows': len(df) if df is not None else 0,
+        'Seconds': time.perf_counter() - start_wall,
+        'CPU_Seconds': time.thread_time() - start_cpu,
+        'Status': status,
+        'Error': error
+    }
 
 
 class UnifiedFormProcessor:
     """Process Lloyd's forms with automatic RRQ/RRA detection"""
 
-    def __init__(self, data_source: str):
+    def __init__(self, data_source: Optional[str] = None):
         """
         Initialize processor with data source
 
         Parameters:
         -----------
-        data_source : str
+        data_source : str, optional
             Path to CSV data file or directory containing multiple files
         """
-        self.data_source = Path(data_source)
+        self.data_source = Path(data_source) if data_source is not None else None
         self.return_type = None
         self.reporting_quarter = None
         self.reporting_year = None
@@ -71,9 +149,9 @@ class UnifiedFormProcessor:
             Processed claims development data
         """
         if data_source:
-            df = pd.read_csv(data_source)
+            df = read_form(data_source)
         else:
-            df = pd.read_csv(self.data_source)
+            df = read_form(self.data_source)
 
         # Detect return type
         meta = self._detect_return_type(df)
@@ -95,7 +173,7 @@ class UnifiedFormProcessor:
 
         # Calculate development factors
         df['Prior_Cumulative_Paid'] = df.groupby(
-            ['Syndicate_Number', 'Year_of_Account', 'LOB_Code']
+            ['Syndicate_Number', 'Year_of_Account', 'LOB_Code'], observed=True
         )['Cumulative_Paid_Claims'].shift(1)
 
         df['Paid_Development_Factor'] = np.where(
@@ -158,9 +236,9 @@ class UnifiedFormProcessor:
             Processed IBNR data
         """
         if data_source:
-            df = pd.read_csv(data_source)
+            df = read_form(data_source)
         else:
-            df = pd.read_csv(self.data_source)
+            df = read_form(self.data_source)
 
         # Detect return type
         meta = self._detect_return_type(df)
@@ -207,6 +285,98 @@ class UnifiedFormProcessor:
 
         return df
 
+    def find_form_files(self, data_path: Optional[str] = None) -> Dict[tuple, Path]:
+        """
+        Find the RRA/RRQ form files in a directory that have a processor
+
+        Parameters:
+        -----------
+        data_path : str, optional
+            Directory to scan (defaults to the processor's data source)
+
+        Returns:
+        --------
+        dict
+            {(prefix, form code): file path}, e.g. {('rra', '193'): Path(...)}
+        """
+        directory = Path(data_path) if data_path is not None else self.data_source
+        if directory is None:
+            raise ValueError("No data directory given")
+
+        files = {}
+        for path in sorted(directory.glob('*.csv')):
+            match = FORM_FILE_PATTERN.match(path.name)
+            if not match:
+                continue
+            key = (match.group(1).lower(), match.group(2))
+            if key not in files and (key in FORM_PROCESSORS or ('rra', key[1]) in FORM_PROCESSORS):
+                files[key] = path
+        return files
+
+    def process_all_forms(self, data_path: Optional[str] = None,
+                          max_workers: Optional[int] = None,
+                          executor: Literal['thread', 'process'] = 'thread') -> dict:
+        """
+        Process every RRA/RRQ form file in a directory concurrently
+
+        Each file is dispatched to its process_rra_* / process_rrq_* function.
+        A form that fails is reported in the timings with Status 'ERROR'
+        rather than stopping the batch.
+
+        Parameters:
+        -----------
+        data_path : str, optional
+            Directory containing the form CSV files (defaults to data_source)
+        max_workers : int, optional
+            Pool size (defaults to one worker per form, capped at CPU count)
+        executor : {'thread', 'process'}
+            Run forms in a thread pool or a process pool
+
+        Returns:
+        --------
+        dict
+            {
+                'return_type': 'RRQ', 'RRA' or 'Mixed',
+                'forms': {'010': DataFrame, '193': DataFrame, ...},
+                'timings': DataFrame of per-form rows, seconds and status
+            }
+            For a mixed directory the form keys are prefixed, e.g. 'rrq_193'.
+        """
+        files = self.find_form_files(data_path)
+        prefixes = {prefix for prefix, _ in files}
+        return_type = prefixes.pop().upper() if len(prefixes) == 1 else ('Mixed' if prefixes else None)
+
+        if max_workers is None:
+            max_workers = min(len(files), os.cpu_count() or 1)
+        pool_class = ProcessPoolExecutor if executor == 'process' else ThreadPoolExecutor
+
+        results = []
+        if files:
+            if max_workers <= 1:
+                results = [_run_form(prefix, code, str(path)) for (prefix, code), path in files.items()]
+            else:
+                with pool_class(max_workers=max_workers) as pool:
+                    futures = [pool.submit(_run_form, prefix, code, str(path))
+                               for (prefix, code), path in files.items()]
+                    results = [future.result() for future in futures]
+
+        forms = {}
+        for result in results:
+            df = result.pop('data')
+            if df is not None:
+                key = result['Form'] if return_type != 'Mixed' else f"{result['Return_Type'].lower()}_{result['Form']}"
+                forms[key] = df
+
+        timings = pd.DataFrame(results, columns=['Form', 'Return_Type', 'File', 'Rows', 'Seconds',
+                                                 'CPU_Seconds', 'Status', 'Error'])
+
+        self.return_type = return_type
+        return {
+            'return_type': return_type,
+            'forms': forms,
+            'timings': timings
+        }
+
     def compare_quarters(self, current_data: str, prior_data: str, form: str = '193') -> pd.DataFrame:
         """
         Compare current quarter vs prior quarter (RRQ only)
@@ -223,10 +393,10 @@ class UnifiedFormProcessor:
         Returns:
         --------
         pandas.DataFrame
-            Quarter-over-quarter movement analysis
+            New, removed and changed rows with Change_Type and movement columns
         """
-        current = pd.read_csv(current_data)
-        prior = pd.read_csv(prior_data)
+        current = read_form(current_data)
+        prior = read_form(prior_data)
 
         # Verify both are RRQ
         current_meta = self._detect_return_type(current)
@@ -235,55 +405,30 @@ class UnifiedFormProcessor:
         if not (current_meta['is_quarterly'] and prior_meta['is_quarterly']):
             raise ValueError("Both datasets must be RRQ for quarter comparison")
 
-        # Merge on key dimensions
-        key_cols = ['Syndicate_Number', 'Year_of_Account', 'LOB_Code', 'Development_Year']
-        available_keys = [col for col in key_cols if col in current.columns and col in prior.columns]
-
-        comparison = current.merge(
-            prior,
-            on=available_keys,
-            how='outer',
-            suffixes=('_Current', '_Prior'),
-            indicator=True
-        )
-
-        # Calculate movements for Form 193
-        if form == '193':
-            comparison['Paid_Movement'] = (
-                comparison.get('Cumulative_Paid_Claims_Current', 0) -
-                comparison.get('Cumulative_Paid_Claims_Prior', 0)
-            )
-
-            comparison['IBNR_Movement'] = (
-                comparison.get('IBNR_Reserve_Current', 0) -
-                comparison.get('IBNR_Reserve_Prior', 0)
-            )
-
-            comparison['Total_Incurred_Movement'] = (
-                comparison.get('Total_Incurred_Current', 0) -
-                comparison.get('Total_Incurred_Prior', 0)
-            )
-
-            # Flag significant movements (>10% change)
-            comparison['Significant_Movement'] = np.abs(
-                comparison['Total_Incurred_Movement'] / comparison.get('Total_Incurred_Prior', 1)
-            ) > 0.10
+        # Keyed diff on key + measure columns only; unchanged rows are dropped
+        return diff_quarters(current, prior, form=form)
 
-        elif form == '291':
-            comparison['IBNR_Movement'] = (
-                comparison.get('IBNR_Best_Estimate_Current', 0) -
-                comparison.get('IBNR_Best_Estimate_Prior', 0)
-            )
-
-            comparison['Premium_Movement'] = (
-                comparison.get('Gross_Written_Premium_Current', 0) -
-                comparison.get('Gross_Written_Premium_Prior', 0)
-            )
+    def compare_quarter_sequence(self, quarter_directories: Optional[list] = None,
+                                 form: str = '193', base_directory: str = '../..') -> pd.DataFrame:
+        """
+        Chain quarter-over-quarter comparisons across a year (Q1 -> Q4)
 
-        comparison['Current_Quarter'] = f"{current_meta['reporting_quarter']} {current_meta['reporting_year']}"
-        comparison['Prior_Quarter'] = f"{prior_meta['reporting_quarter']} {prior_meta['reporting_year']}"
+        Parameters:
+        -----------
+        quarter_directories : list, optional
+            Quarter data directories in reporting order. Defaults to the
+            synthetic_data_rrq_* directories under base_directory.
+        form : str
+            Form number to compare ('193', '291')
+        base_directory : str
+            Where to look for quarter directories
 
-        return comparison
+        Returns:
+        --------
+        pandas.DataFrame
+            Movements for each consecutive pair of quarters
+        """
+        return chain_quarter_diffs(quarter_directories, form=form, base_directory=base_directory)
 
 
 def process_unified_rrq_rra(data_path: str, form_number: str) -> pd.DataFrame:
@@ -388,7 +533,22 @@ if __name__ == "__main__":
         )
         print(f"Comparison records: {len(comparison)}")
         print(f"Significant movements: {comparison['Significant_Movement'].sum()}")
-        print(f"New in current quarter: {(comparison['_merge'] == 'left_only').sum()}")
-        print(f"Removed from prior quarter: {(comparison['_merge'] == 'right_only').sum()}")
+        print(f"New in current quarter: {(comparison['Change_Type'] == 'New').sum()}")
+        print(f"Removed from prior quarter: {(comparison['Change_Type'] == 'Removed').sum()}")
+
+        year = processor.compare_quarter_sequence(base_directory='../..')
+        print(f"Q1->Q4 chained movements: {len(year)}")
     except Exception as e:
         print(f"Comparison test failed: {e}")
+
+    # Test batch processing
+    print("\n" + "="*70)
+    print("Testing Batch Processing (all forms)...")
+    print("="*70)
+
+    try:
+        results = UnifiedFormProcessor().process_all_forms('../../synthetic_data')
+        print(f"Return Type: {results['return_type']}")
+        print(results['timings'].to_string(index=False))
+    except Exception as e:
+        print(f"Batch test failed: {e}")
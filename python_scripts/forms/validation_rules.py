@@ -0,0 +1,516 @@
+"""
+Validation Rules - Declarative Form Rule Registry
+=================================================
+
+Registry of validation rules for the RRA/RRQ forms, declared as data and
+evaluated as vectorized boolean masks.
+
+Each rule yields a mask that is True for failing rows. All rules of a form are
+stacked into one (rules x rows) array, so counts and failing row positions are
+taken in a single pass. Failing rows are reported as compact int32 position
+arrays instead of copied sub-DataFrames.
+
+A rule whose columns are not present in the form is reported with status
+ERROR, every row counted as affected and the missing columns named in
+Details, so a malformed form cannot pass. Rules wrapped in ``optional()``
+(columns the form may legitimately omit) and foreign key rules whose reference
+form is not loaded are left out of the results instead.
+
+Rule types:
+-----------
+- NotNullRule: value must be present (optionally non-blank)
+- RangeRule: numeric bounds, optional integer check
+- EnumRule: value must be one of an allowed set
+- PatternRule: value must match a regular expression
+- CompareRule: cross-field inequality, e.g. Net <= Gross
+- ForeignKeyRule: key must exist in another form
+- ExpressionRule: custom vectorized predicate
+
+Usage:
+------
+    from python_scripts.forms.validation_rules import validate_form, validate_forms
+    results = validate_form('591', 'synthetic_data/rra_591_reinsurance_structure.csv')
+
+    # Several forms in parallel, with cross-form foreign keys
+    outcome = validate_forms({'010': 'rra_010_control.csv', '193': 'rra_193_net_claims.csv'})
+    outcome['193'].summary
+    outcome['193'].failures['Syndicate In Form 010']   # int32 row positions
+"""
+
+import operator
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .form_store import read_form
+    from .triangle_matrix import TriangleMatrix, get_dev_columns
+except ImportError:
+    from form_store import read_form
+    from triangle_matrix import TriangleMatrix, get_dev_columns
+
+from lloyds_reporting.instrumentation import span, traced
+
+# Operators for CompareRule: the rule passes when ``left <op> right`` holds.
+# The failure mask uses the opposite comparison so missing values never fail.
+_VIOLATION_OPS = {
+    '<': operator.ge,
+    '<=': operator.gt,
+    '>': operator.le,
+    '>=': operator.lt,
+    '==': operator.ne,
+    '!=': operator.eq,
+}
+
+
+class Rule:
+    """
+    Base class for a declarative validation rule.
+
+    Attributes:
+        name (str): Rule label reported in the results
+        severity (str): 'Critical' or 'Warning'
+        columns (List[str]): Columns the rule reads
+        required (bool): Whether missing columns are an ERROR (True) or mean
+            the rule does not apply (False)
+    """
+
+    def __init__(self, name: str, columns: Sequence[str], severity: str = 'Critical'):
+        self.name = name
+        self.columns = list(columns)
+        self.severity = severity
+        self.required = True
+
+    def missing_columns(self, df: pd.DataFrame) -> List[str]:
+        return [col for col in self.columns if col not in df.columns]
+
+    def applies(self, df: pd.DataFrame, forms: Mapping[str, pd.DataFrame]) -> bool:
+        """Whether the rule applies once its columns are present."""
+        return True
+
+    def mask(self, df: pd.DataFrame, forms: Mapping[str, pd.DataFrame]) -> Optional[np.ndarray]:
+        """Boolean array, True where the row fails (None if not applicable)."""
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.name!r})'
+
+
+class NotNullRule(Rule):
+    """Column must be populated; with ``allow_blank=False`` blank strings fail too."""
+
+    def __init__(self, name: str, column: str, severity: str = 'Critical', allow_blank: bool = True):
+        super().__init__(name, [column], severity)
+        self.column = column
+        self.allow_blank = allow_blank
+
+    def mask(self, df, forms):
+        values = df[self.column]
+        missing = values.isnull().to_numpy()
+        if not self.allow_blank:
+            missing = missing | values.astype('string').str.strip().eq('').fillna(False).to_numpy(dtype=bool)
+        return missing
+
+
+class RangeRule(Rule):
+    """Numeric value must lie within [minimum, maximum]; missing values pass."""
+
+    def __init__(self, name: str, column: str, minimum: Optional[float] = None,
+                 maximum: Optional[float] = None, severity: str = 'Critical',
+                 min_inclusive: bool = True, max_inclusive: bool = True,
+                 integer: bool = False):
+        super().__init__(name, [column], severity)
+        self.column = column
+        self.minimum = minimum
+        self.maximum = maximum
+        self.min_inclusive = min_inclusive
+        self.max_inclusive = max_inclusive
+        self.integer = integer
+
+    def mask(self, df, forms):
+        values = pd.to_numeric(df[self.column], errors='coerce').to_numpy(dtype=np.float64)
+        failing = np.zeros(len(values), dtype=bool)
+        with np.errstate(invalid='ignore'):
+            if self.minimum is not None:
+                failing |= values < self.minimum if self.min_inclusive else values <= self.minimum
+            if self.maximum is not None:
+                failing |= values > self.maximum if self.max_inclusive else values >= self.maximum
+            if self.integer:
+                failing |= ~np.isnan(values) & (values != np.floor(values))
+        return failing
+
+
+class EnumRule(Rule):
+    """Value must be one of the allowed values; missing values fail."""
+
+    def __init__(self, name: str, column: str, allowed: Iterable, severity: str = 'Warning'):
+        super().__init__(name, [column], severity)
+        self.column = column
+        self.allowed = list(allowed)
+
+    def mask(self, df, forms):
+        return ~df[self.column].isin(self.allowed).to_numpy()
+
+
+class PatternRule(Rule):
+    """Value must contain a match for a regular expression; missing values fail."""
+
+    def __init__(self, name: str, column: str, pattern: str, severity: str = 'Warning'):
+        super().__init__(name, [column], severity)
+        self.column = column
+        self.pattern = pattern
+
+    def mask(self, df, forms):
+        return ~df[self.column].astype('string').str.contains(self.pattern, na=False).to_numpy(dtype=bool)
+
+
+class CompareRule(Rule):
+    """
+    Cross-field inequality ``left <op> right``.
+
+    Rows where either side is missing pass. ``dates=True`` parses both sides as
+    dates first.
+    """
+
+    def __init__(self, name: str, left: str, op: str, right: str,
+                 severity: str = 'Critical', dates: bool = False):
+        if op not in _VIOLATION_OPS:
+            raise ValueError(f"Unsupported comparison operator: {op}")
+        super().__init__(name, [left, right], severity)
+        self.left = left
+        self.op = op
+        self.right = right
+        self.dates = dates
+
+    def mask(self, df, forms):
+        if self.dates:
+            left = pd.to_datetime(df[self.left], errors='coerce')
+            right = pd.to_datetime(df[self.right], errors='coerce')
+        else:
+            left, right = df[self.left], df[self.right]
+        return _VIOLATION_OPS[self.op](left, right).fillna(False).to_numpy(dtype=bool)
+
+
+class ForeignKeyRule(Rule):
+    """Key columns must exist in a reference form (skipped if it is not loaded)."""
+
+    def __init__(self, name: str, columns: Sequence[str], ref_form: str,
+                 ref_columns: Optional[Sequence[str]] = None, severity: str = 'Critical'):
+        super().__init__(name, columns, severity)
+        self.ref_form = ref_form
+        self.ref_columns = list(ref_columns) if ref_columns is not None else list(columns)
+
+    def applies(self, df, forms):
+        ref = forms.get(self.ref_form)
+        return ref is not None and all(col in ref.columns for col in self.ref_columns)
+
+    def mask(self, df, forms):
+        ref = forms[self.ref_form]
+        if len(self.columns) == 1:
+            return ~df[self.columns[0]].isin(ref[self.ref_columns[0]].unique()).to_numpy()
+        keys = pd.MultiIndex.from_frame(df[self.columns])
+        ref_keys = pd.MultiIndex.from_frame(ref[self.ref_columns].drop_duplicates())
+        return ~keys.isin(ref_keys)
+
+
+class ExpressionRule(Rule):
+    """
+    Custom vectorized predicate.
+
+    ``func(df)`` returns a boolean array/Series of failing rows, or None when
+    the rule does not apply to the data.
+    """
+
+    def __init__(self, name: str, columns: Sequence[str], func: Callable, severity: str = 'Critical'):
+        super().__init__(name, columns, severity)
+        self.func = func
+
+    def mask(self, df, forms):
+        result = self.func(df)
+        if result is None:
+            return None
+        return np.asarray(result, dtype=bool)
+
+
+def optional(rule: Rule) -> Rule:
+    """Mark a rule as not applicable (rather than an ERROR) when its columns are absent."""
+    rule.required = False
+    return rule
+
+
+def _incurred_mismatch(df, tolerance=0.01):
+    # Gross incurred should equal paid + case + IBNR within 1% for rounding
+    calculated = df['Gross_Paid_Claims'] + df['Gross_Case_Reserves'] + df['Gross_IBNR']
+    return (df['Gross_Incurred'] - calculated).abs() > df['Gross_Incurred'].abs() * tolerance
+
+
+def _non_positive_limit(df):
+    return df['Limit_GBP'] <= 0
+
+
+def _allocation_not_100(df):
+    # Allocation percentages must sum to 100 per Syndicate / SCOB
+    totals = df.groupby(['Syndicate_Number', 'SCOB_Code'])['Allocation_Percentage'].transform('sum')
+    return (totals - 100).abs() > 0.01
+
+
+def _ultimate_below_diagonal(df):
+    # Ultimate must not be below the latest diagonal (1% tolerance)
+    if not get_dev_columns(df):
+        return None
+    return df['Ultimate_Estimate'].to_numpy() < TriangleMatrix.from_frame(df).latest_diagonal() * 0.99
+
+
+VALID_REINSURER_RATINGS = ['AAA', 'AA+', 'AA', 'AA-', 'A+', 'A', 'A-',
+                           'BBB+', 'BBB', 'BBB-', 'BB+', 'BB', 'NR']
+
+# Rules per form code, in reporting order
+RULE_REGISTRY: Dict[str, List[Rule]] = {
+    '010': [
+        NotNullRule('Syndicate Number Required', 'Syndicate_Number'),
+        PatternRule('Valid Email Address', 'Contact_Email', '@', severity='Critical'),
+        CompareRule('First YoA <= Final YoA', 'First_Pure_YoA', '<=', 'Final_Pure_YoA'),
+        RangeRule('Capacity > 0', 'Capacity_GBP', minimum=0, min_inclusive=False),
+    ],
+    '020': [
+        NotNullRule('Currency Code Required', 'Currency_Code'),
+        optional(RangeRule('Exchange Rate > 0', 'Exchange_Rate', minimum=0, min_inclusive=False)),
+    ],
+    '071': [
+        ExpressionRule('Allocations Sum to 100%',
+                       ['Syndicate_Number', 'SCOB_Code', 'Allocation_Percentage'], _allocation_not_100),
+    ],
+    '081': [
+        optional(EnumRule('Valid Development Pattern', 'Development_Pattern',
+                          ['Short Tail', 'Medium Tail', 'Long Tail'])),
+    ],
+    '091': [
+        optional(EnumRule('Valid Transaction Type', 'Transaction_Type', ['LPT', 'ADC', 'RITC', 'Other'])),
+    ],
+    '193': [
+        NotNullRule('Syndicate Number Required', 'Syndicate_Number'),
+        ForeignKeyRule('Syndicate In Form 010', ['Syndicate_Number'], '010', severity='High'),
+        CompareRule('Net Premium <= Gross Premium', 'Net_Premium_Written', '<=', 'Gross_Premium_Written',
+                    severity='Warning'),
+    ],
+    '291': [
+        NotNullRule('Syndicate Number Required', 'Syndicate_Number'),
+        ForeignKeyRule('Syndicate In Form 010', ['Syndicate_Number'], '010', severity='High'),
+        CompareRule('IBNR Low <= Best Estimate', 'IBNR_Low', '<=', 'IBNR_Best_Estimate', severity='High'),
+        CompareRule('IBNR Best Estimate <= High', 'IBNR_Best_Estimate', '<=', 'IBNR_High', severity='High'),
+    ],
+    '293': [
+        CompareRule('Prior YoA <= Current YoA', 'Prior_YoA', '<=', 'Year_of_Account'),
+        CompareRule('Net Outstanding <= Gross', 'Net_Outstanding_GBP', '<=', 'Gross_Outstanding_GBP',
+                    severity='Warning'),
+    ],
+    '294': [
+        CompareRule('Net IBNR <= Gross IBNR', 'Net_IBNR_GBP', '<=', 'Gross_IBNR_GBP', severity='Warning'),
+        EnumRule('Valid Confidence Level', 'Confidence_Level', ['High', 'Medium', 'Low']),
+    ],
+    '295': [
+        RangeRule('Gross ULAE Non-Negative', 'Gross_ULAE_GBP', minimum=0, severity='Warning'),
+        EnumRule('Valid ULAE Category', 'ULAE_Category', ['Internal', 'External']),
+    ],
+    '391': [
+        optional(RangeRule('Initial ELR 0-200%', 'Initial_ELR', minimum=0, maximum=200,
+                           severity='Warning')),
+        optional(RangeRule('Current ELR 0-200%', 'Current_ELR', minimum=0, maximum=200,
+                           severity='Warning')),
+    ],
+    '591': [
+        NotNullRule('Syndicate Number Required', 'Syndicate_Number'),
+        EnumRule('Valid Reinsurer Rating', 'Reinsurer_Rating', VALID_REINSURER_RATINGS),
+        # Only checked for layered programmes (with an attachment point)
+        optional(ExpressionRule('Positive Limit Required', ['Attachment_Point_GBP', 'Limit_GBP'],
+                                _non_positive_limit)),
+        CompareRule('Effective Date < Expiry Date', 'Effective_Date', '<', 'Expiry_Date', dates=True),
+        optional(RangeRule('Cession Rate 0-100%', 'Cession_Rate', minimum=0, maximum=1,
+                           severity='Warning')),
+    ],
+    '910': [
+        NotNullRule('Response Required', 'Response', severity='Warning', allow_blank=False),
+        NotNullRule('Syndicate Number Required', 'Syndicate_Number'),
+    ],
+    '191': [
+        NotNullRule('Syndicate Number Required', 'Syndicate_Number'),
+        optional(ExpressionRule('Incurred = Paid + Case + IBNR',
+                                ['Gross_Paid_Claims', 'Gross_Case_Reserves', 'Gross_IBNR',
+                                 'Gross_Incurred'],
+                                _incurred_mismatch)),
+        optional(RangeRule('Gross_Paid_Claims Non-Negative', 'Gross_Paid_Claims', minimum=0,
+                           severity='Warning')),
+        optional(RangeRule('Gross_Case_Reserves Non-Negative', 'Gross_Case_Reserves', minimum=0,
+                           severity='Warning')),
+        optional(RangeRule('Gross_Incurred Non-Negative', 'Gross_Incurred', minimum=0,
+                           severity='Warning')),
+        optional(RangeRule('Valid Development Year', 'Development_Year', minimum=0, integer=True)),
+    ],
+    '192': [
+        NotNullRule('Syndicate Number Required', 'Syndicate_Number'),
+        optional(EnumRule('Valid Triangle Type', 'Triangle_Type', ['Paid', 'Incurred', 'Case'])),
+        optional(EnumRule('Valid Basis (Gross/Net)', 'Basis', ['Gross', 'Net'])),
+        optional(ExpressionRule('Ultimate >= Latest Diagonal', ['Ultimate_Estimate'],
+                                _ultimate_below_diagonal, severity='Warning')),
+        optional(RangeRule('IBNR Non-Negative', 'Selected_IBNR', minimum=0, severity='Warning')),
+    ],
+}
+
+
+def register_rules(form_code: str, rules: Sequence[Rule], replace: bool = False) -> None:
+    """Add rules for a form (or replace its rule list)."""
+    if replace or form_code not in RULE_REGISTRY:
+        RULE_REGISTRY[form_code] = list(rules)
+    else:
+        RULE_REGISTRY[form_code].extend(rules)
+
+
+class ValidationResult:
+    """
+    Outcome of evaluating a form's rules.
+
+    Attributes:
+        form (str): Form code
+        summary (pd.DataFrame): Rule, Status, Records_Affected, Severity, Details
+        failures (Dict[str, np.ndarray]): int32 positions of failing rows per rule
+    """
+
+    def __init__(self, form: str, summary: pd.DataFrame, failures: Dict[str, np.ndarray]):
+        self.form = form
+        self.summary = summary
+        self.failures = failures
+
+    def failing_rows(self, df: pd.DataFrame, rule: str) -> pd.DataFrame:
+        """Materialize the failing rows of one rule from the validated frame."""
+        return df.iloc[self.failures[rule]]
+
+
+def evaluate_rules(df: pd.DataFrame, rules: Sequence[Rule],
+                   forms: Optional[Mapping[str, pd.DataFrame]] = None,
+                   form: str = '') -> ValidationResult:
+    """
+    Evaluate a set of rules against one form in a single pass
+
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        Form data
+    rules : sequence of Rule
+        Rules to evaluate
+    forms : mapping, optional
+        Other loaded forms by code, for foreign key rules
+    form : str
+        Form code recorded on the result
+
+    Returns:
+    --------
+    ValidationResult
+        Summary table and failing row positions per rule
+    """
+    forms = forms or {}
+    applied, masks, details = [], [], []
+    all_rows = np.ones(len(df), dtype=bool)
+    for rule in rules:
+        missing = rule.missing_columns(df)
+        if missing:
+            if rule.required:
+                # The form cannot be checked: every row counts as affected
+                applied.append(rule)
+                masks.append(all_rows)
+                details.append(f"Missing columns: {', '.join(missing)}")
+            continue
+        if not rule.applies(df, forms):
+            continue
+        mask = rule.mask(df, forms)
+        if mask is None:
+            continue
+        applied.append(rule)
+        masks.append(mask)
+        details.append('')
+
+    if masks:
+        matrix = np.vstack(masks)
+        counts = matrix.sum(axis=1)
+        failures = {rule.name: np.flatnonzero(row).astype(np.int32)
+                    for rule, row in zip(applied, matrix)}
+    else:
+        counts = np.zeros(0, dtype=np.int64)
+        failures = {}
+
+    errors = np.array([bool(detail) for detail in details], dtype=bool)
+    summary = pd.DataFrame({
+        'Rule': [rule.name for rule in applied],
+        'Status': np.where(errors, 'ERROR', np.where(counts > 0, 'FAIL', 'PASS')),
+        'Records_Affected': counts.astype(int),
+        'Severity': [rule.severity for rule in applied],
+        'Details': details,
+    })
+    return ValidationResult(form, summary, failures)
+
+
+def validate_form(form_code: str, data_source,
+                  forms: Optional[Mapping[str, pd.DataFrame]] = None) -> pd.DataFrame:
+    """
+    Validate one form against its registered rules
+
+    Parameters:
+    -----------
+    form_code : str
+        Form code, e.g. '591'
+    data_source : str or pandas.DataFrame
+        Path to the form CSV file, or the loaded form
+    forms : mapping, optional
+        Other loaded forms by code, for foreign key rules
+
+    Returns:
+    --------
+    pandas.DataFrame
+        Validation results (Rule, Status, Records_Affected, Severity, Details)
+    """
+    with span(f'validate_form_{form_code}', 'validator') as s:
+        df = data_source if isinstance(data_source, pd.DataFrame) else read_form(data_source)
+        s.rows_in = len(df)
+        summary = evaluate_rules(df, RULE_REGISTRY.get(form_code, []), forms, form_code).summary
+        s.rows_out = len(summary)
+    return summary
+
+
+@traced('validator')
+def validate_forms(sources: Mapping[str, object],
+                   max_workers: Optional[int] = None) -> Dict[str, ValidationResult]:
+    """
+    Validate several forms in parallel
+
+    All forms are loaded first so that foreign key rules can reference each
+    other; each form's rules are then evaluated independently in a thread pool.
+
+    Parameters:
+    -----------
+    sources : mapping
+        {form code: path or DataFrame}
+    max_workers : int, optional
+        Thread pool size (defaults to one per form, capped at CPU count)
+
+    Returns:
+    --------
+    dict
+        {form code: ValidationResult}
+    """
+    if not sources:
+        return {}
+    if max_workers is None:
+        max_workers = min(len(sources), os.cpu_count() or 1)
+
+    def load(source):
+        return source if isinstance(source, pd.DataFrame) else read_form(source)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        frames = dict(zip(sources, pool.map(load, sources.values())))
+        results = pool.map(
+            lambda code: evaluate_rules(frames[code], RULE_REGISTRY.get(code, []), frames, code),
+            frames
+        )
+        return dict(zip(frames, results))
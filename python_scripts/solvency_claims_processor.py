@@ -9,12 +9,43 @@ Usage in Power BI:
 1. Use 'Get Data' -> 'Python script'
 2. Copy this script or reference the file
 3. Specify the input data source
+
+Large claim files (CSV, Parquet or xlsx) can be processed in bounded memory
+with process_claims_data(input_file, chunksize=...), which streams the rows
+and merges partial aggregations instead of loading the full file.
 """
 
+import os
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+
+# Amount columns summed in every aggregation
+CLAIM_AMOUNT_COLUMNS = [
+    'Outstanding Claims Amount as at beginning of period',
+    'Paid to Date Amount',
+    'Paid in Year amount',
+    'Outstanding Claim amount as at end of period',
+    'Total Incurred as at end of period',
+    'Movement in Year',
+    'Reserve Movement'
+]
+
+# Grouping keys of the streamed aggregations
+AGGREGATION_KEYS = {
+    'by_syndicate': ['Syndicate Number', 'Year of Account'],
+    'by_risk_code': ['Syndicate Number', 'Year of Account', 'Risk Code'],
+    'by_claim_status': ['Syndicate Number', 'Year of Account', 'Claim status at end of period'],
+}
+
+DEFAULT_CHUNKSIZE = 100_000
 
 
 def validate_claim_data(df: pd.DataFrame) -> pd.DataFrame:
@@ -227,17 +258,154 @@ def create_summary_report(df: pd.DataFrame) -> pd.DataFrame:
     return summary
 
 
-def process_claims_data(input_file: str, sheet_name: str = 'input Sheet') -> Dict[str, pd.DataFrame]:
+def iter_claim_chunks(input_file: str, chunksize: int = DEFAULT_CHUNKSIZE,
+                      sheet_name: str = 'input Sheet') -> Iterator[pd.DataFrame]:
+    """
+    Read a claims file in chunks of at most ``chunksize`` rows.
+
+    CSV is read with pandas' chunked reader and Parquet by row batches
+    (requires pyarrow). Excel files are read row by row through openpyxl's
+    read-only mode, so the workbook is never fully materialized.
+
+    Args:
+        input_file: Path to a .csv, .parquet or .xlsx claims file
+        chunksize: Maximum number of rows per chunk
+        sheet_name: Sheet containing claims data (Excel only)
+
+    Yields:
+        Claims dataframes in file order
+    """
+    extension = os.path.splitext(str(input_file))[1].lower()
+
+    if extension in ('.csv', '.txt'):
+        yield from pd.read_csv(input_file, chunksize=chunksize)
+
+    elif extension in ('.parquet', '.pq'):
+        if pq is None:
+            raise ImportError("Reading Parquet claims files requires pyarrow. Install with: pip install pyarrow")
+        for batch in pq.ParquetFile(input_file).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+
+    elif extension in ('.xlsx', '.xlsm'):
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(input_file, read_only=True, data_only=True)
+        try:
+            rows = workbook[sheet_name].iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            columns = [str(col) if col is not None else f'Unnamed: {i}' for i, col in enumerate(header)]
+            buffer = []
+            for row in rows:
+                if all(value is None for value in row):
+                    continue
+                buffer.append(row)
+                if len(buffer) == chunksize:
+                    yield pd.DataFrame.from_records(buffer, columns=columns)
+                    buffer = []
+            if buffer:
+                yield pd.DataFrame.from_records(buffer, columns=columns)
+        finally:
+            workbook.close()
+
+    else:
+        # Other spreadsheet formats have no streaming reader; slice the full sheet
+        df = pd.read_excel(input_file, sheet_name=sheet_name)
+        for start in range(0, len(df), chunksize):
+            yield df.iloc[start:start + chunksize]
+
+
+def _partial_aggregate(df: pd.DataFrame, keys: List[str]) -> pd.DataFrame:
+    """Claim count and amount sums of one chunk, indexed by the grouping keys."""
+    agg_dict = {'Claim Reference': 'count'}
+    agg_dict.update({col: 'sum' for col in CLAIM_AMOUNT_COLUMNS})
+    return df.groupby(keys).agg(agg_dict)
+
+
+def _merge_partials(accumulated: Optional[pd.DataFrame], partial: pd.DataFrame) -> pd.DataFrame:
+    """Fold a chunk's partial sums into the running totals (one row per group)."""
+    if accumulated is None:
+        return partial
+    combined = pd.concat([accumulated, partial])
+    return combined.groupby(level=list(range(combined.index.nlevels))).sum()
+
+
+def process_claims_data_streaming(input_file: str, sheet_name: str = 'input Sheet',
+                                  chunksize: int = DEFAULT_CHUNKSIZE,
+                                  detail_file: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+    """
+    Process a claims file chunk by chunk in bounded memory.
+
+    Each chunk is validated and has its incurred amounts calculated, then
+    contributes partial group sums that are merged into the running totals.
+    Peak memory is bounded by the chunk size plus the number of groups.
+
+    Args:
+        input_file: Path to a .csv, .parquet or .xlsx claims file
+        sheet_name: Sheet containing claims data (Excel only)
+        chunksize: Maximum number of claim rows held in memory at once
+        detail_file: Optional CSV path; the detailed claims are appended to it
+            chunk by chunk instead of being returned
+
+    Returns:
+        Dictionary with 'by_syndicate', 'by_risk_code', 'by_claim_status' and
+        'summary' tables (same layout as process_claims_data)
+    """
+    totals = {name: None for name in AGGREGATION_KEYS}
+    claim_count = 0
+    amount_totals = pd.Series(0.0, index=CLAIM_AMOUNT_COLUMNS)
+    syndicates = set()
+
+    for chunk_number, chunk in enumerate(iter_claim_chunks(input_file, chunksize, sheet_name)):
+        chunk = calculate_incurred_amounts(validate_claim_data(chunk))
+
+        for name, keys in AGGREGATION_KEYS.items():
+            totals[name] = _merge_partials(totals[name], _partial_aggregate(chunk, keys))
+
+        claim_count += int(chunk['Claim Reference'].count())
+        amount_totals += chunk[CLAIM_AMOUNT_COLUMNS].sum()
+        syndicates.update(chunk['Syndicate Number'].dropna().unique())
+
+        if detail_file is not None:
+            chunk.to_csv(detail_file, mode='w' if chunk_number == 0 else 'a',
+                         header=chunk_number == 0, index=False)
+
+    output_tables = {}
+    for name, keys in AGGREGATION_KEYS.items():
+        grouped = totals[name]
+        if grouped is None:
+            grouped = pd.DataFrame(columns=keys + ['Claim Reference'] + CLAIM_AMOUNT_COLUMNS)
+        else:
+            grouped = grouped.reset_index()
+        output_tables[name] = grouped.rename(columns={'Claim Reference': 'Number of Claims'})
+
+    summary = {'Total Number of Claims': claim_count, 'Number of Syndicates': len(syndicates)}
+    summary.update(amount_totals.to_dict())
+    output_tables['summary'] = pd.DataFrame([summary])
+
+    return output_tables
+
+
+def process_claims_data(input_file: str, sheet_name: str = 'input Sheet',
+                        chunksize: Optional[int] = None) -> Dict[str, pd.DataFrame]:
     """
     Main processing function for claims data.
 
     Args:
-        input_file: Path to the Excel input file
+        input_file: Path to the Excel input file (CSV and Parquet are also
+            accepted when streaming)
         sheet_name: Name of the sheet containing claims data
+        chunksize: If given, stream the file in chunks of this many rows via
+            process_claims_data_streaming. The aggregated tables are the same,
+            but 'detailed_claims' is not held in memory or returned.
 
     Returns:
         Dictionary containing all output tables
     """
+    if chunksize is not None:
+        return process_claims_data_streaming(input_file, sheet_name=sheet_name, chunksize=chunksize)
+
     # Read the data
     df = pd.read_excel(input_file, sheet_name=sheet_name)
 
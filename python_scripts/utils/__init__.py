@@ -7,6 +7,7 @@ Utility modules for data aggregation and analysis.
 Available Modules:
 ------------------
 - rra_aggregator: Multi-form aggregation and portfolio analysis
+- table_storage: Typed, partitioned Parquet storage with CSV fallback (read_table)
 
 Usage:
 ------
@@ -16,7 +17,12 @@ Usage:
 """
 
 from .rra_aggregator import RRADataAggregator
+from .table_storage import read_table, write_table, convert_csv_directory, apply_schema
 
 __all__ = [
     'RRADataAggregator',
+    'read_table',
+    'write_table',
+    'convert_csv_directory',
+    'apply_schema',
 ]
@@ -7,6 +7,12 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 
+try:
+    from ..forms.form_store import read_form
+except ImportError:
+    # Standalone use without the package: fall back to uncached reads
+    read_form = pd.read_csv
+
 
 class RRADataAggregator:
     """Aggregates all RRA form data for comprehensive reporting"""
@@ -38,7 +44,7 @@ class RRADataAggregator:
         for form_name, file_name in form_files.items():
             file_path = self.data_dir / file_name
             if file_path.exists():
-                self.forms[form_name] = pd.read_csv(file_path)
+                self.forms[form_name] = read_form(file_path)
                 print(f"✓ Loaded {form_name}: {len(self.forms[form_name])} records")
             else:
                 print(f"✗ Warning: {file_name} not found")
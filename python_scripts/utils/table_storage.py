@@ -0,0 +1,370 @@
+"""
+Table Storage - Typed, Partitioned Parquet Storage
+==================================================
+
+Storage layer for the synthetic forms, raw transaction feeds and reporting
+inputs. CSV files are converted once to partitioned Parquet with declared
+column types. ``read_table`` loads the Parquet copy with those types and a
+plain CSV as pandas parses it, unless ``typed=True`` asks for the same schema.
+
+Declared types:
+---------------
+- Categorical: LOB_Code, Currency, Status and the other low-cardinality labels
+  in CATEGORICAL_COLUMNS
+- int32: year columns (Year_of_Account, *_YoA, Development_Year, ...)
+- float64: amounts (every other numeric column except identifiers and counts)
+- datetime64: *_Date / date columns and reporting_period
+
+Parquet datasets are partitioned by syndicate, year of account and reporting
+period (whichever of those columns a table has) so readers can prune with
+``filters``. The sidecar schema records the partition columns' dtypes and a
+row order column is stored, so a dataset reads back with the frame's column
+types and row order rather than as categoricals grouped by partition. Parquet
+support needs pyarrow; without it ``read_table`` reads the
+CSV.
+
+Usage:
+------
+    from python_scripts.utils.table_storage import read_table, convert_csv_directory
+
+    # One-off conversion: writes raw_data/<table>.parquet/ next to each CSV
+    convert_csv_directory('raw_data')
+
+    # Loads the Parquet copy when present and up to date, else the CSV
+    claims = read_table('raw_data/claim_transactions.csv',
+                        filters=[('Syndicate_Number', '==', 2987)])
+
+Command line:
+-------------
+    python -m python_scripts.utils.table_storage raw_data synthetic_data data
+"""
+
+import json
+import re
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Low-cardinality label columns stored as categoricals
+CATEGORICAL_COLUMNS = frozenset([
+    'LOB_Code', 'LOB_Name', 'Currency', 'Currency_Code', 'Reporting_Currency',
+    'Status', 'Return_Type', 'Reporting_Quarter', 'Quarter', 'Transaction_Type',
+    'Reserve_Type', 'Movement_Type', 'Asset_Type', 'Asset_Category', 'Rate_Type',
+    'Risk_Type', 'Risk_Category', 'Claim_Type', 'Country',
+])
+
+# Year columns stored as int32
+YEAR_PATTERN = re.compile(
+    r'(?i)^(year_of_account|.*_yoa|.*_year|calendar_period|year)$'
+)
+
+# Integer identifiers and counts that keep their integer type
+IDENTIFIER_PATTERN = re.compile(r'(?i)(number|syndicate$|_id$|^id$|code|count|days)')
+
+# Date columns parsed to datetime64
+DATE_PATTERN = re.compile(r'(?i)(date$|^reporting_period$)')
+
+# Partition columns, in nesting order; the first present from each group is used
+PARTITION_CANDIDATES = (
+    ('Syndicate_Number', 'syndicate_number', 'Syndicate'),
+    ('Year_of_Account',),
+    ('reporting_period', 'Reporting_Period', 'Reporting_Quarter', 'Quarter', 'Reporting_Date'),
+)
+
+PARQUET_SUFFIX = '.parquet'
+SCHEMA_FILE = '_schema.json'
+
+# Position of each row in the written frame (partitioned datasets only)
+ROW_ORDER_COLUMN = '__row_order__'
+
+
+def infer_schema(df: pd.DataFrame) -> Dict[str, str]:
+    """
+    Derive the declared storage type of each column.
+
+    Args:
+        df: Frame as parsed from CSV
+
+    Returns:
+        Dict of column name -> dtype name ('category', 'int32', 'float64',
+        'datetime64[ns]'); columns that keep their parsed type are omitted
+    """
+    schema = {}
+    for col in df.columns:
+        series = df[col]
+        name = str(col)
+        if name in CATEGORICAL_COLUMNS:
+            schema[name] = 'category'
+        elif pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            if YEAR_PATTERN.match(name) and not series.isna().any():
+                schema[name] = 'int32'
+            elif pd.api.types.is_integer_dtype(series) and IDENTIFIER_PATTERN.search(name):
+                continue
+            else:
+                schema[name] = 'float64'
+        elif DATE_PATTERN.search(name) and not pd.api.types.is_datetime64_any_dtype(series):
+            parsed = pd.to_datetime(series, errors='coerce')
+            # Only declare a date type when every populated value parses
+            if parsed.notna().sum() == series.notna().sum():
+                schema[name] = 'datetime64[ns]'
+    return schema
+
+
+def apply_schema(df: pd.DataFrame, schema: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Cast a frame to its declared column types (in place where possible).
+
+    Args:
+        df: Frame to cast
+        schema: Column -> dtype mapping; inferred when omitted
+
+    Returns:
+        The typed frame
+    """
+    schema = infer_schema(df) if schema is None else schema
+    for col, dtype in schema.items():
+        if col not in df.columns or str(df[col].dtype) == dtype:
+            continue
+        if dtype.startswith('datetime64'):
+            df[col] = pd.to_datetime(df[col], errors='coerce')
+        elif dtype in ('int32', 'float64'):
+            values = df[col]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                values = pd.to_numeric(values.astype(str), errors='coerce')
+            df[col] = values.astype(dtype)
+        else:
+            df[col] = df[col].astype(dtype)
+    return df
+
+
+def partition_columns_for(df: pd.DataFrame) -> List[str]:
+    """Pick the syndicate / year of account / reporting period columns present."""
+    columns = []
+    for group in PARTITION_CANDIDATES:
+        for col in group:
+            if col in df.columns:
+                columns.append(col)
+                break
+    return columns
+
+
+def _require_pyarrow():
+    if not HAS_PYARROW:
+        raise ImportError(
+            "Parquet storage requires pyarrow. Install with: pip install pyarrow"
+        )
+
+
+def parquet_path_for(source) -> Optional[Path]:
+    """
+    Return the Parquet copy of a CSV file if it exists and is up to date.
+
+    ``data/table.csv`` is stored as ``data/table.parquet`` (a partitioned
+    directory or a single file).
+    """
+    path = Path(source)
+    if path.suffix == PARQUET_SUFFIX:
+        return path if path.exists() else None
+
+    candidate = path.with_suffix(PARQUET_SUFFIX)
+    if not candidate.exists():
+        return None
+    marker = candidate / SCHEMA_FILE if candidate.is_dir() else candidate
+    if path.exists() and marker.exists() and marker.stat().st_mtime < path.stat().st_mtime:
+        return None
+    return candidate
+
+
+def write_table(df: pd.DataFrame, destination, partition_cols: Optional[Sequence[str]] = None,
+                schema: Optional[Dict[str, str]] = None) -> Path:
+    """
+    Write a frame as a typed, partitioned Parquet dataset.
+
+    Args:
+        df: Frame to store
+        destination: Dataset directory (conventionally ``<table>.parquet``)
+        partition_cols: Partition columns; defaults to partition_columns_for(df)
+        schema: Declared column types; inferred when omitted
+
+    Returns:
+        Path of the written dataset
+    """
+    _require_pyarrow()
+    destination = Path(destination)
+    schema = infer_schema(df) if schema is None else schema
+    typed = apply_schema(df.copy(), schema)
+    partition_cols = list(partition_columns_for(typed) if partition_cols is None else partition_cols)
+    partition_dtypes = {col: str(typed[col].dtype) for col in partition_cols}
+    if partition_cols:
+        typed[ROW_ORDER_COLUMN] = np.arange(len(typed), dtype=np.int64)
+
+    # Date partition keys are written as plain YYYY-MM-DD directory names
+    for col in partition_cols:
+        if pd.api.types.is_datetime64_any_dtype(typed[col]):
+            typed[col] = typed[col].dt.strftime('%Y-%m-%d')
+        elif isinstance(typed[col].dtype, pd.CategoricalDtype):
+            typed[col] = typed[col].astype(str)
+
+    if destination.exists():
+        shutil.rmtree(destination) if destination.is_dir() else destination.unlink()
+
+    typed.to_parquet(destination, engine='pyarrow', index=False,
+                     partition_cols=partition_cols or None)
+
+    if destination.is_dir():
+        sidecar = {'columns': [str(c) for c in df.columns], 'schema': schema,
+                   'partition_cols': partition_cols, 'partition_dtypes': partition_dtypes}
+        (destination / SCHEMA_FILE).write_text(json.dumps(sidecar, indent=2))
+    return destination
+
+
+_FILTER_OPS = {
+    '==': lambda s, v: s == v,
+    '=': lambda s, v: s == v,
+    '!=': lambda s, v: s != v,
+    '<': lambda s, v: s < v,
+    '<=': lambda s, v: s <= v,
+    '>': lambda s, v: s > v,
+    '>=': lambda s, v: s >= v,
+    'in': lambda s, v: s.isin(v),
+    'not in': lambda s, v: ~s.isin(v),
+}
+
+
+def _restore_partition_dtypes(df: pd.DataFrame, dtypes: Dict[str, str]) -> pd.DataFrame:
+    """Cast partition columns (read back as categoricals of the directory keys) to their dtypes."""
+    for col, dtype in dtypes.items():
+        if col not in df.columns or str(df[col].dtype) == dtype:
+            continue
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype) and dtype != 'category':
+            values = values.astype(values.cat.categories.dtype)
+        if dtype.startswith('datetime64'):
+            df[col] = pd.to_datetime(values.astype(str), errors='coerce').astype(dtype)
+        elif pd.api.types.is_integer_dtype(dtype) and values.isna().any():
+            df[col] = pd.to_numeric(values, errors='coerce')
+        elif pd.api.types.is_numeric_dtype(dtype):
+            df[col] = pd.to_numeric(values, errors='coerce').astype(dtype)
+        else:
+            df[col] = values.astype(dtype)
+    return df
+
+
+def _apply_filters(df: pd.DataFrame, filters) -> pd.DataFrame:
+    """Apply pyarrow-style [(column, op, value), ...] filters to a frame."""
+    mask = np.ones(len(df), dtype=bool)
+    for col, op, value in filters:
+        mask &= _FILTER_OPS[op](df[col], value).to_numpy(dtype=bool)
+    return df[mask].reset_index(drop=True)
+
+
+def read_table(source, columns: Optional[Sequence[str]] = None, filters=None,
+               typed: bool = False) -> pd.DataFrame:
+    """
+    Read a table from its Parquet copy if available, else from CSV
+
+    Parameters:
+    -----------
+    source : str or Path
+        CSV path (``.parquet`` sibling used when present) or a Parquet path
+    columns : sequence of str, optional
+        Columns to load
+    filters : list of tuple, optional
+        [(column, op, value), ...] row filters; pushed down to Parquet
+        partitions when reading Parquet
+    typed : bool
+        Apply the declared column types to a CSV read (Parquet is always
+        typed). Off by default so CSV callers keep pandas' parsed dtypes.
+
+    Returns:
+    --------
+    pandas.DataFrame
+        Table
+    """
+    parquet = parquet_path_for(source) if HAS_PYARROW else None
+
+    if parquet is not None:
+        sidecar_path = parquet / SCHEMA_FILE
+        sidecar = json.loads(sidecar_path.read_text()) if sidecar_path.exists() else None
+        # Datasets written before the row order column have no partition_dtypes
+        ordered = sidecar is not None and 'partition_dtypes' in sidecar and sidecar['partition_cols']
+        if columns is not None:
+            columns = list(columns) + ([ROW_ORDER_COLUMN] if ordered else [])
+
+        df = pd.read_parquet(parquet, engine='pyarrow', columns=columns, filters=filters)
+        if sidecar is not None:
+            if ordered:
+                df = df.sort_values(ROW_ORDER_COLUMN, kind='stable', ignore_index=True)
+            apply_schema(df, sidecar['schema'])
+            _restore_partition_dtypes(df, sidecar.get('partition_dtypes', {}))
+            order = [c for c in sidecar['columns'] if c in df.columns]
+            df = df[order]
+        return df
+
+    path = Path(source)
+    if path.suffix == PARQUET_SUFFIX:
+        _require_pyarrow()
+
+    df = pd.read_csv(path, usecols=list(columns) if columns is not None else None)
+    if typed:
+        apply_schema(df)
+    if filters:
+        df = _apply_filters(df, filters)
+    return df
+
+
+def convert_csv_directory(source_dir, destination_dir=None, pattern: str = '*.csv',
+                          partition_cols: Optional[Sequence[str]] = None) -> Dict[str, Path]:
+    """
+    Convert every CSV in a directory to a typed, partitioned Parquet dataset
+
+    Parameters:
+    -----------
+    source_dir : str or Path
+        Directory containing CSV files
+    destination_dir : str or Path, optional
+        Output directory (defaults to source_dir, so read_table picks the
+        Parquet copies up automatically)
+    pattern : str
+        Glob pattern of files to convert
+    partition_cols : sequence of str, optional
+        Override the default syndicate / YoA / reporting period partitioning
+
+    Returns:
+    --------
+    dict
+        {csv file name: written dataset path}
+    """
+    _require_pyarrow()
+    source_dir = Path(source_dir)
+    destination_dir = Path(destination_dir) if destination_dir is not None else source_dir
+    destination_dir.mkdir(parents=True, exist_ok=True)
+
+    written = {}
+    for csv_path in sorted(source_dir.glob(pattern)):
+        df = pd.read_csv(csv_path)
+        target = destination_dir / (csv_path.stem + PARQUET_SUFFIX)
+        written[csv_path.name] = write_table(df, target, partition_cols)
+    return written
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Convert CSV inputs to typed, partitioned Parquet')
+    parser.add_argument('directories', nargs='+', help='Directories containing CSV files')
+    parser.add_argument('--pattern', default='*.csv', help='Glob pattern of files to convert')
+    args = parser.parse_args()
+
+    for directory in args.directories:
+        for name, path in convert_csv_directory(directory, pattern=args.pattern).items():
+            print(f"{name} -> {path}")
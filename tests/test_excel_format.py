@@ -0,0 +1,36 @@
+"""Tests for integrations.shared.excel_format.write_workbook"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from integrations.shared.excel_format import HAS_XLSXWRITER, write_workbook
+
+openpyxl = pytest.importorskip('openpyxl')
+
+ENGINES = [
+    pytest.param('xlsxwriter', marks=pytest.mark.skipif(not HAS_XLSXWRITER,
+                                                        reason='xlsxwriter not installed')),
+    'openpyxl',
+]
+
+
+def read_back(path):
+    """Sheet values of the first worksheet, header row included"""
+    return list(openpyxl.load_workbook(path).active.values)
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_inf_and_nan_cells_match_to_excel(tmp_path, engine):
+    df = pd.DataFrame({
+        'solvency_ratio': [1.5, np.inf, -np.inf, np.nan],
+        'label': ['a', np.inf, None, 'd'],
+        'count': [1, 2, 3, 4],
+    })
+
+    written = write_workbook(tmp_path / 'out.xlsx', {'ratios': df}, engine=engine)
+    df.to_excel(tmp_path / 'expected.xlsx', sheet_name='ratios', index=False)
+
+    assert read_back(written) == read_back(tmp_path / 'expected.xlsx')
+    assert read_back(written)[2] == ('inf', 'inf', 2)
+    assert read_back(written)[4] == (None, 'd', 4)